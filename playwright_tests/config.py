@@ -25,11 +25,144 @@ class ReportsConfig(BaseModel):
     screenshots: str = "reports/screenshots"
 
 
+class ArrivalConfig(BaseModel):
+    """Open-Loop Ankunftsprofil für Massentests (Raten in Bestellungen/Minute)."""
+    enabled: bool = False  # Open-Loop auch ohne --arrival-profile
+    profile: str = "constant"  # constant, ramp, step, poisson (--arrival-profile überschreibt)
+    rate_per_minute: float = 20.0
+    start_rate_per_minute: float = 2.0
+    ramp_seconds: float = 120.0
+    step_rate_per_minute: float = 5.0
+    step_seconds: float = 60.0
+    max_in_flight: int = 0  # 0 = keine Sicherheitsgrenze
+
+
 class MassTestConfig(BaseModel):
     """Massentest-Standardwerte."""
     default_orders: int = 100
     default_parallel: int = 5
     success_rate_threshold: float = 0.95
+    keep_order_results: bool = True  # False: nur Zähler/Histogramme (konstanter Speicher)
+    step_timing: bool = False  # Dauer, Requests und Navigation-Timing pro Checkout-Schritt
+    arrival: ArrivalConfig = Field(default_factory=ArrivalConfig)
+
+
+class ContextPoolConfig(BaseModel):
+    """Pool vorgewärmter Browser-Kontexte für Massen- und Performance-Tests."""
+    enabled: bool = False
+    size: int = 0  # 0 = Anzahl paralleler Worker
+    max_uses: int = 25  # Kontext nach n Bestellungen ersetzen
+    max_consecutive_failures: int = 2  # Kontext nach n Fehlern in Folge ersetzen
+    warm_up: bool = True
+
+
+class RunManifestConfig(BaseModel):
+    """Lauf-Manifest für Checkpoint und --resume (siehe utils/run_manifest.py)."""
+    enabled: bool = True
+    directory: str = "reports/runs"
+
+
+class NetworkTraceConfig(BaseModel):
+    """Netzwerk-Aufzeichnung pro Bestellung (siehe utils/network_trace.py)."""
+    enabled: bool = True
+    capacity: int = 300  # Requests im Ringpuffer pro Bestellung
+    directory: str = "reports/network"
+    slow_order_seconds: float = 90.0  # 0 = langsame Bestellungen nicht speichern
+    sample_rate: float = 0.0  # Anteil gespeicherter erfolgreicher Bestellungen
+
+
+class WebVitalsBudget(BaseModel):
+    """Obergrenzen für Core Web Vitals (None = nicht geprüft)."""
+    lcp_ms: Optional[float] = None
+    cls: Optional[float] = None
+    inp_ms: Optional[float] = None
+    tbt_ms: Optional[float] = None
+    fcp_ms: Optional[float] = None
+    js_heap_mb: Optional[float] = None
+
+
+class WebVitalsConfig(BaseModel):
+    """Core Web Vitals für Smoke-/Regressionstests (siehe utils/web_vitals.py)."""
+    enabled: bool = False  # auf jeder Seite des pytest-playwright ``page`` messen
+    database: str = "reports/web_vitals.sqlite"
+    fail_on_budget: bool = True
+    # Budgets pro Seitentyp (default, home, pdp, listing, checkout, page); Typ überschreibt default
+    budgets: dict[str, WebVitalsBudget] = Field(default_factory=lambda: {
+        "default": WebVitalsBudget(lcp_ms=4000, cls=0.25, tbt_ms=600, fcp_ms=3000, inp_ms=500, js_heap_mb=150),
+    })
+
+
+class ResultsHistoryConfig(BaseModel):
+    """Lauf-Historie mit Regressionserkennung (siehe utils/results_history.py)."""
+    enabled: bool = True
+    database: str = "reports/history.sqlite"
+    baseline_runs: int = 10  # gleitende Baseline: so viele Läufe gleicher Art davor
+    min_baseline_runs: int = 3  # darunter kein Vergleich
+    z_threshold: float = 3.0
+    min_relative_change: float = 0.1  # Durchsatz/p95/Web Vitals: mind. 10% Abweichung
+    min_error_rate_change: float = 0.01  # Fehlerrate: mind. 1 Prozentpunkt
+
+
+class AdaptiveConcurrencyConfig(BaseModel):
+    """AIMD-Regelung der Parallelität (siehe utils/adaptive_concurrency.py)."""
+    enabled: bool = False
+    min_workers: int = 1
+    max_workers: int = 0  # 0 = 3 x parallel_workers
+    window_orders: int = 5  # Bestellungen pro Bewertung
+    error_rate_threshold: float = 0.1  # Fehlerquote im Fenster, ab der abgesenkt wird
+    latency_tolerance: float = 1.5  # erlaubter Faktor der Median-Latenz gegenüber der Basis
+    decrease_factor: float = 0.7
+
+
+class CartSeedingConfig(BaseModel):
+    """Warenkorb per Request befüllen statt per Klick auf der Produktseite."""
+    enabled: bool = False
+    store_api_access_key: str = ""  # Sales-Channel-Zugangsschlüssel (leer: IDs aus der Produktseite)
+
+
+class RequestBlockingConfig(BaseModel):
+    """Blockier-Profile für Drittanbieter-Requests (Profile siehe utils/request_blocking.py)."""
+    enabled: bool = False
+    default_profile: str = "none"  # für Tests ohne passenden Marker
+    marker_profiles: dict[str, str] = Field(default_factory=lambda: {"massentest": "load", "performance": "load"})
+    allow_hosts: list[str] = Field(default_factory=list)  # zusätzlich zur Shop-Origin nie blockieren
+
+
+class ResultStreamConfig(BaseModel):
+    """Einzelergebnisse als JSONL streamen und live auswerten (siehe utils/result_stream.py)."""
+    enabled: bool = True
+    directory: str = "reports/stream"
+    fsync: bool = False  # jede Zeile auf Platte erzwingen
+    live_interval_seconds: float = 10.0  # 0 = keine Live-Ausgabe
+    window_seconds: float = 60.0  # Zeitfenster für Live-Durchsatz und -Perzentile
+
+
+class ShippingSweepConfig(BaseModel):
+    """PLZ-Sweep für Speditionsregeln in einer Session pro Land (utils/plz_sweep.py)."""
+    samples_per_rule: int = 0  # zusätzliche PLZ zwischen Min und Max jeder Regel (0 = nur Grenzen)
+    boundary_neighbours: bool = False  # zusätzlich PLZ direkt neben jeder Regel (Min-1, Max+1)
+
+
+class RaceTestConfig(BaseModel):
+    """Race-Condition-Tests mit synchronisiertem Versand (utils/race_dispatch.py)."""
+    mode: str = "last_byte"  # last_byte (HTTP/1.1, Mikrosekunden) oder barrier (Playwright)
+    participants: int = 10  # gleichzeitige Anfragen pro Race
+    max_release_spread_ms: float = 10.0  # größere Streuung = Race nicht aussagekräftig
+    timeout_seconds: float = 30.0
+    payment_method: str = "Rechnung"
+    product_path: str = ""  # leer = erstes Testprodukt
+    single_use_coupon: str = ""  # Einmal-Gutschein (leer = Test wird übersprungen)
+    stock_product_path: str = ""  # Produkt mit kleinem Lagerbestand (leer = Test wird übersprungen)
+    stock_quantity: int = 1  # verfügbarer Bestand von stock_product_path
+    max_sessions_per_customer: int = 0  # 0 = kein Limit erwartet, nur berichten
+
+
+class AuthStateConfig(BaseModel):
+    """Login-Storage-State registrierter Kunden einmal pro Lauf (utils/auth_state.py)."""
+    enabled: bool = True  # False = jeder Test/jede Bestellung meldet sich neu an
+    directory: str = "reports/auth_state"
+    max_age_minutes: int = 30  # ältere States werden verworfen (Speicher und Platte)
+    persist: bool = True  # States über Läufe hinweg auf Platte speichern
 
 
 class PerformanceTestDistribution(BaseModel):
@@ -41,13 +174,100 @@ class PerformanceTestDistribution(BaseModel):
     multi_product: int = 15
 
 
+class DistributedConfig(BaseModel):
+    """Verteilte Performance-Tests mit Koordinator und Agenten (siehe utils/distributed.py)."""
+    host: str = "0.0.0.0"  # Bind-Adresse des Koordinators
+    port: int = 8765
+    min_agents: int = 2  # Vergabe erst, wenn so viele Agenten angemeldet sind ...
+    register_timeout_seconds: float = 120.0  # ... oder spätestens nach dieser Wartezeit
+    distribution_factor: int = 1  # performance_test.distribution vervielfachen (Sale-Day)
+    rate_per_minute: float = 0.0  # globale Startrate über alle Agenten (0 = unbegrenzt)
+    burst: int = 5
+    batch_size: int = 5  # Bestellungen pro Vergabe
+    stop_error_rate: float = 0.5  # Vergabe für alle Agenten stoppen (0 = nie)
+    stop_min_orders: int = 20
+    agent_timeout_seconds: float = 120.0  # ohne Meldung: offene Bestellungen zählen als Fehler
+
+
+class ProtocolLoadConfig(BaseModel):
+    """Checkout auf Protokoll-Ebene ohne Browser (siehe utils/http_checkout.py)."""
+    virtual_users: int = 100  # parallele HTTP-Sitzungen
+    distribution_factor: int = 5  # performance_test.distribution vervielfachen
+    max_session_uses: int = 50  # Sitzung danach verwerfen (0 = unbegrenzt)
+    timeout_ms: int = 30000  # pro Request
+    redirect_payment_methods: list[str] = Field(default_factory=lambda: ["Kreditkarte"])  # nicht per HTTP nutzbar
+    browser_workers: int = 3  # Browser-Kohorte parallel zum HTTP-Lauf
+    browser_distribution: PerformanceTestDistribution = Field(default_factory=lambda: PerformanceTestDistribution(
+        guest_post=6, guest_spedition=2, registered_post=2, registered_spedition=0, multi_product=0,
+    ))
+
+
+class HybridUsers(BaseModel):
+    """Virtuelle Nutzer pro Kohorte im hybriden Lastprofil."""
+    browser: int = 5  # Checkout im Browser (CheckoutPage)
+    protocol: int = 50  # Checkout per HTTP (utils/http_checkout.py)
+    browse: int = 20  # nur Stöbern per HTTP (utils/browse_traffic.py)
+
+
+class HybridLoadConfig(BaseModel):
+    """Browser-, Protokoll- und Stöber-Nutzer in einem Lauf mit gemeinsamem Report."""
+    users: HybridUsers = Field(default_factory=HybridUsers)
+    distribution_factor: int = 2  # performance_test.distribution vervielfachen
+    think_time_seconds: float = 3.0  # mittlere Pause der Stöber-Nutzer ohne Nutzerpfade
+
+
+class JourneyPageConfig(BaseModel):
+    """Seitentyp im Nutzerpfad-Modell: Denkpause und Folgeseiten."""
+    think_seconds: float = 5.0  # Median der Denkpause
+    think_sigma: float = 0.5  # Streuung (Log-Normalverteilung, 0 = feste Pause)
+    next: dict[str, float] = Field(default_factory=dict)  # Folgeseite -> Gewicht, "exit" beendet die Sitzung
+
+
+def _default_journey_pages() -> dict[str, "JourneyPageConfig"]:
+    return {
+        "home": JourneyPageConfig(think_seconds=4, next={"listing": 55, "suggest": 25, "pdp": 10, "exit": 10}),
+        "listing": JourneyPageConfig(think_seconds=8, next={
+            "listing_page": 20, "listing_sort": 10, "listing_filter": 15, "pdp": 35, "listing": 5, "exit": 15,
+        }),
+        "listing_page": JourneyPageConfig(think_seconds=6, next={"listing_page": 25, "pdp": 45, "exit": 30}),
+        "listing_sort": JourneyPageConfig(think_seconds=6, next={"listing_page": 20, "pdp": 55, "exit": 25}),
+        "listing_filter": JourneyPageConfig(think_seconds=7, next={"listing_sort": 15, "pdp": 55, "exit": 30}),
+        "suggest": JourneyPageConfig(think_seconds=1.5, think_sigma=0.3, next={"search": 70, "pdp": 20, "exit": 10}),
+        "search": JourneyPageConfig(think_seconds=7, next={"pdp": 55, "suggest": 15, "listing": 10, "exit": 20}),
+        "pdp": JourneyPageConfig(think_seconds=20, think_sigma=0.8, next={
+            "pdp": 20, "listing": 25, "suggest": 10, "exit": 45,
+        }),
+    }
+
+
+class JourneyConfig(BaseModel):
+    """Stöber-Traffic nach Nutzerpfaden (gewichtete Markow-Kette, utils/journey_model.py)."""
+    enabled: bool = True  # False: Stöber-Nutzer rufen zufällige Seiten auf
+    users: int = 500  # gleichzeitige Sitzungen in test_staging_browse_journeys
+    duration_seconds: float = 600
+    max_session_pages: int = 50  # Obergrenze pro Sitzung
+    max_error_rate: float = 0.02
+    listing_paths: list[str] = Field(default_factory=lambda: ["/moebel/", "/sale/"])
+    search_terms: list[str] = Field(default_factory=lambda: ["kissen", "bett", "decke"])
+    entry: dict[str, float] = Field(default_factory=lambda: {"home": 40, "listing": 35, "suggest": 15, "pdp": 10})
+    pages: dict[str, JourneyPageConfig] = Field(default_factory=_default_journey_pages)
+
+
 class PerformanceTestConfig(BaseModel):
     """Performance-Test Konfiguration (150 Bestellungen)."""
     target_orders: int = 150
     parallel_workers: int = 15
     success_rate_threshold: float = 0.95
     max_duration_minutes: int = 15
+    shards: int = 1  # Anzahl Worker-Prozesse mit eigenem Browser
+    keep_order_results: bool = True  # False: nur Zähler/Histogramme (konstanter Speicher)
+    step_timing: bool = False  # Dauer, Requests und Navigation-Timing pro Checkout-Schritt
+    response_metrics: bool = True  # TTFB, Server-Timing und Cache-Status pro Seitentyp
     distribution: PerformanceTestDistribution = Field(default_factory=PerformanceTestDistribution)
+    distributed: DistributedConfig = Field(default_factory=DistributedConfig)
+    protocol: ProtocolLoadConfig = Field(default_factory=ProtocolLoadConfig)
+    hybrid: HybridLoadConfig = Field(default_factory=HybridLoadConfig)
+    journeys: JourneyConfig = Field(default_factory=JourneyConfig)
 
 
 class TestCustomer(BaseModel):
@@ -143,6 +363,42 @@ class TestConfig(BaseSettings):
     # Performance-Test (150 Bestellungen)
     performance_test: PerformanceTestConfig = Field(default_factory=PerformanceTestConfig)
 
+    # Browser-Kontext-Pool (Massen-/Performance-Tests)
+    context_pool: ContextPoolConfig = Field(default_factory=ContextPoolConfig)
+
+    # Lauf-Manifest für Checkpoint/Fortsetzen (Massen-/Performance-Tests)
+    run_manifest: RunManifestConfig = Field(default_factory=RunManifestConfig)
+
+    # Netzwerk-Aufzeichnung pro Bestellung (Massen-/Performance-Tests)
+    network_trace: NetworkTraceConfig = Field(default_factory=NetworkTraceConfig)
+
+    # Core Web Vitals mit Budgets (Smoke-/Regressionstests)
+    web_vitals: WebVitalsConfig = Field(default_factory=WebVitalsConfig)
+
+    # Lauf-Historie mit Regressionserkennung (Massen-/Performance-/Web-Vitals-Läufe)
+    results_history: ResultsHistoryConfig = Field(default_factory=ResultsHistoryConfig)
+
+    # Adaptive Parallelität (Massen-/Performance-Tests)
+    adaptive_concurrency: AdaptiveConcurrencyConfig = Field(default_factory=AdaptiveConcurrencyConfig)
+
+    # Warenkorb-Befüllung per Request (Massen-/Performance-Tests, Versandtests)
+    cart_seeding: CartSeedingConfig = Field(default_factory=CartSeedingConfig)
+
+    # Blockieren von Bildern/Fonts/Trackern (Last-/Performance-Läufe)
+    request_blocking: RequestBlockingConfig = Field(default_factory=RequestBlockingConfig)
+
+    # Ergebnis-Stream und Live-Auswertung (Massen-/Performance-Tests)
+    result_stream: ResultStreamConfig = Field(default_factory=ResultStreamConfig)
+
+    # PLZ-Sweep für Speditionsregeln (test_shipping_plz.py)
+    shipping_sweep: ShippingSweepConfig = Field(default_factory=ShippingSweepConfig)
+
+    # Race-Condition-Tests (Pentest Business Logic / Session)
+    race_tests: RaceTestConfig = Field(default_factory=RaceTestConfig)
+
+    # Login-Cache für registrierte Testkunden (Account-/Merkliste-Tests, Bestellungen)
+    auth_state: AuthStateConfig = Field(default_factory=AuthStateConfig)
+
     # Testkunden
     test_customers: TestCustomersConfig = Field(default_factory=TestCustomersConfig)
 
@@ -271,3 +527,15 @@ def get_config() -> TestConfig:
     if not hasattr(get_config, "_instance"):
         get_config._instance = TestConfig.load()
     return get_config._instance
+
+
+def load_config(profile: Optional[str] = None) -> TestConfig:
+    """
+    Gibt die Testkonfiguration für ein Profil zurück (z.B. aus ``--profile``).
+
+    Ohne Profil die gecachte Standardkonfiguration (``get_config``).
+    """
+    if not profile:
+        return get_config()
+    os.environ["TEST_PROFILE"] = profile
+    return TestConfig.load()
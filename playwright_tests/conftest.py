@@ -5,104 +5,16 @@ Nutzt pytest-playwright's eingebaute Fixtures und erweitert sie.
 """
 import pytest
 from pathlib import Path
-from typing import Generator
+from typing import Generator, Optional
 
-from playwright.sync_api import Page, BrowserContext
+from playwright.sync_api import BrowserContext
 
-from .config import TestConfig, get_config
+from .config import TestConfig, get_config, load_config
+from .utils.cookie_banner import accept_cookie_banner, accept_cookie_banner_async  # noqa: F401 (Re-Export für Tests)
 
 
-# =============================================================================
-# Cookie-Banner Hilfsfunktionen
-# =============================================================================
-
-def accept_cookie_banner(page: Page, timeout: int = 3000) -> bool:
-    """
-    Akzeptiert das Cookie-Banner, falls sichtbar (sync Version).
-
-    Unterstützt:
-    - Usercentrics Banner (#accept.uc-accept-button)
-    - Shopware 6 Standard Banner (.js-cookie-accept-all-button)
-
-    Args:
-        page: Playwright Page-Instanz
-        timeout: Timeout in ms für die Sichtbarkeitsprüfung
-
-    Returns:
-        True wenn Banner akzeptiert wurde, False wenn nicht vorhanden
-    """
-    # Selektoren für verschiedene Cookie-Banner
-    cookie_selectors = [
-        "button#accept",  # Usercentrics (primär)
-        "#accept",  # Usercentrics (alternativ)
-        "button[data-action-type='accept']",  # Usercentrics data-attribute
-        ".js-cookie-accept-all-button",  # Shopware 6
-        "[data-cookie-accept-all]",  # Shopware 6 alternativ
-    ]
-
-    for selector in cookie_selectors:
-        try:
-            button = page.locator(selector)
-            if button.is_visible(timeout=timeout):
-                button.click()
-                # Warten bis Banner verschwindet
-                page.wait_for_timeout(1000)
-                # Prüfen ob Banner weg ist
-                banner = page.locator("#usercentrics-cmp-ui")
-                try:
-                    banner.wait_for(state="hidden", timeout=5000)
-                except Exception:
-                    pass  # Banner evtl. anders strukturiert
-                return True
-        except Exception:
-            continue
-
-    return False
-
-
-async def accept_cookie_banner_async(page, timeout: int = 3000) -> bool:
-    """
-    Akzeptiert das Cookie-Banner, falls sichtbar (async Version).
-
-    Unterstützt:
-    - Usercentrics Banner (#accept.uc-accept-button)
-    - Shopware 6 Standard Banner (.js-cookie-accept-all-button)
-
-    Args:
-        page: Playwright async Page-Instanz
-        timeout: Timeout in ms für die Sichtbarkeitsprüfung
-
-    Returns:
-        True wenn Banner akzeptiert wurde, False wenn nicht vorhanden
-    """
-    # Selektoren für verschiedene Cookie-Banner
-    cookie_selectors = [
-        "button#accept",  # Usercentrics (primär)
-        "#accept",  # Usercentrics (alternativ)
-        "button[data-action-type='accept']",  # Usercentrics data-attribute
-        ".js-cookie-accept-all-button",  # Shopware 6
-        "[data-cookie-accept-all]",  # Shopware 6 alternativ
-    ]
-
-    for selector in cookie_selectors:
-        try:
-            button = page.locator(selector)
-            if await button.is_visible(timeout=timeout):
-                await button.click()
-                # Warten bis Banner verschwindet
-                await page.wait_for_timeout(1000)
-                # Prüfen ob Banner weg ist
-                banner = page.locator("#usercentrics-cmp-ui")
-                try:
-                    await banner.wait_for(state="hidden", timeout=5000)
-                except Exception:
-                    pass  # Banner evtl. anders strukturiert
-                return True
-        except Exception:
-            continue
-
-    return False
-
+# Web-Vitals-Messungen des Laufs (für die Auswertung in pytest_sessionfinish)
+WEB_VITALS_KEY = pytest.StashKey[object]()
 
 # =============================================================================
 # Pytest Hooks
@@ -136,6 +48,65 @@ def pytest_addoption(parser):
         default=None,
         help="Komma-separierte Liste von Produkt-IDs"
     )
+    parser.addoption(
+        "--shards",
+        action="store",
+        type=int,
+        default=None,
+        help="Anzahl Worker-Prozesse (je eigener Browser) für Performance-Tests"
+    )
+    parser.addoption(
+        "--coordinator",
+        action="store",
+        default=None,
+        help="URL des Koordinators, z.B. http://coordinator:8765 (Prozess läuft als Agent)"
+    )
+    parser.addoption(
+        "--agent-name",
+        action="store",
+        default=None,
+        help="Name des Agenten beim Koordinator (Standard: Hostname-PID)"
+    )
+    parser.addoption(
+        "--arrival-profile",
+        action="store",
+        default=None,
+        choices=["constant", "ramp", "step", "poisson"],
+        help="Open-Loop Ankunftsprofil für Massentests (statt fester Parallelität)"
+    )
+    parser.addoption(
+        "--arrival-rate",
+        action="store",
+        type=float,
+        default=None,
+        help="Ziel-Ankunftsrate in Bestellungen pro Minute (Open-Loop)"
+    )
+    parser.addoption(
+        "--block-profile",
+        action="store",
+        default=None,
+        choices=["none", "assets", "trackers", "load"],
+        help="Blockier-Profil für Drittanbieter-Requests (überschreibt request_blocking)"
+    )
+    parser.addoption(
+        "--resume",
+        action="store",
+        default=None,
+        metavar="RUN_ID",
+        help="Abgebrochenen Massen-/Performance-Lauf fortsetzen (nur fehlende Bestellungen)"
+    )
+    parser.addoption(
+        "--web-vitals",
+        action="store_true",
+        default=False,
+        help="Core Web Vitals auf jeder Seite messen und gegen Budgets prüfen (wie web_vitals.enabled)"
+    )
+    parser.addoption(
+        "--lint-sleeps",
+        action="store_true",
+        default=False,
+        help="Feste Pausen (wait_for_timeout/sleep) auflisten und ohne Testlauf beenden"
+    )
 
 
 def pytest_configure(config):
@@ -148,23 +119,56 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "wishlist: Merkliste/Wishlist-Tests")
 
 
+def pytest_sessionfinish(session, exitstatus):
+    """Web Vitals in die Lauf-Historie übernehmen; Budget-Verstöße ausgeben und den Lauf fehlschlagen lassen."""
+    vitals_session = session.config.stash.get(WEB_VITALS_KEY, None)
+    if vitals_session is None:
+        return
+
+    from .utils.results_history import RunKind, record_run, web_vitals_metrics
+
+    record_run(
+        get_config().results_history,
+        vitals_session.run_id,
+        RunKind.WEB_VITALS,
+        "web_vitals",
+        web_vitals_metrics(vitals_session.measurements),
+    )
+    if not vitals_session.violations:
+        return
+
+    print(f"\nCORE WEB VITALS: {len(vitals_session.violations)} Seite(n) über Budget")
+    for vitals in vitals_session.violations:
+        print(f"  [{vitals.page_kind} {vitals.viewport}] {vitals.url}: {', '.join(vitals.violations)}")
+    if get_config().web_vitals.fail_on_budget and exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_sessionstart(session):
+    """Lint-Modus: listet verbliebene feste Pausen auf (``--lint-sleeps``)."""
+    if not session.config.getoption("--lint-sleeps"):
+        return
+
+    from .utils.readiness import find_fixed_sleeps
+
+    root = Path(__file__).parent
+    paths = sorted(p for p in root.rglob("*.py") if "__pycache__" not in p.parts)
+    findings = find_fixed_sleeps(paths)
+
+    for finding in findings:
+        print(finding)
+    print(f"\n{len(findings)} feste Pause(n) gefunden")
+    pytest.exit("Lint-Modus beendet", returncode=1 if findings else 0)
+
+
 # =============================================================================
 # Konfiguration Fixtures
 # =============================================================================
 
 @pytest.fixture(scope="session")
 def config(request) -> TestConfig:
-    """Lädt die Testkonfiguration."""
-    cfg = get_config()
-
-    # CLI-Optionen überschreiben Konfiguration
-    profile = request.config.getoption("--profile")
-    if profile:
-        import os
-        os.environ["TEST_PROFILE"] = profile
-        cfg = TestConfig.load()
-
-    return cfg
+    """Lädt die Testkonfiguration (--profile überschreibt das Standardprofil)."""
+    return load_config(request.config.getoption("--profile"))
 
 
 @pytest.fixture(scope="session")
@@ -232,6 +236,173 @@ def products(request, config: TestConfig) -> list[str]:
     return config.get_all_products()
 
 
+@pytest.fixture(scope="session")
+def shards(request, config: TestConfig) -> int:
+    """Anzahl Worker-Prozesse für Performance-Tests."""
+    cli_value = request.config.getoption("--shards")
+    if cli_value is not None:
+        return cli_value
+    return config.performance_test.shards
+
+
+@pytest.fixture(scope="session")
+def coordinator_url(request) -> Optional[str]:
+    """Koordinator-URL aus --coordinator (None: kein Agent-Prozess)."""
+    return request.config.getoption("--coordinator")
+
+
+@pytest.fixture(scope="session")
+def agent_name(request) -> str:
+    """Eindeutiger Agent-Name (in Docker-Replikas ist der Hostname die Container-ID)."""
+    import os
+    import socket
+
+    return request.config.getoption("--agent-name") or f"{socket.gethostname()}-{os.getpid()}"
+
+
+@pytest.fixture(scope="session")
+def resume_run_id(request) -> Optional[str]:
+    """Lauf-ID aus --resume (None: neuer Lauf)."""
+    return request.config.getoption("--resume")
+
+
+@pytest.fixture(scope="session")
+def cart_seeder(config: TestConfig, base_url: str):
+    """
+    Warenkorb-Befüllung per Request für Tests, die nicht das Hinzufügen selbst prüfen.
+
+    None, wenn ``cart_seeding.enabled`` in der Konfiguration deaktiviert ist.
+    Produkt-IDs werden über die gesamte Session gecacht.
+    """
+    from .utils.cart_seeding import CartSeeder
+
+    if not config.cart_seeding.enabled:
+        return None
+    return CartSeeder(base_url, access_key=config.cart_seeding.store_api_access_key)
+
+
+@pytest.fixture(scope="session")
+def auth_state(config: TestConfig):
+    """
+    Login-Cache für registrierte Testkunden (ein Login pro Kunde und Lauf).
+
+    Bei deaktiviertem ``auth_state.enabled`` meldet jeder Aufruf neu an;
+    Tests verwenden den Cache trotzdem gleich.
+    """
+    from .utils.auth_state import AuthStateCache
+
+    return AuthStateCache.from_config(config)
+
+
+@pytest.fixture
+def request_blocker(request, config: TestConfig, base_url: str):
+    """
+    Blockier-Profil für den aktuellen Test (per --block-profile, Marker oder Konfiguration).
+
+    Massen-/Performance-Runner hängen den Blocker an ihre eigenen Kontexte;
+    für pytest-playwright-Tests übernimmt das ``_apply_request_blocking``.
+    """
+    from .utils.request_blocking import RequestBlocker, get_profile, resolve_profile_name
+
+    cfg = config.request_blocking
+    name = resolve_profile_name(
+        cli_profile=request.config.getoption("--block-profile"),
+        markers=[m.name for m in request.node.iter_markers()],
+        enabled=cfg.enabled,
+        default_profile=cfg.default_profile,
+        marker_profiles=cfg.marker_profiles,
+    )
+    return RequestBlocker.for_base_url(get_profile(name), base_url, cfg.allow_hosts)
+
+
+@pytest.fixture(autouse=True)
+def _apply_request_blocking(request):
+    """Aktiviert das Blockier-Profil für den pytest-playwright ``context`` (falls genutzt)."""
+    if "context" not in request.fixturenames:
+        yield
+        return
+
+    blocker = request.getfixturevalue("request_blocker")
+    if not blocker.active:
+        yield
+        return
+
+    context = request.getfixturevalue("context")
+    blocker.attach(context)
+    yield
+    request.node.user_properties.append(("request_blocking", blocker.report()))
+
+
+@pytest.fixture(scope="session")
+def web_vitals(request, config: TestConfig):
+    """
+    Messung der Core Web Vitals für den Lauf (Datenbank, Budgets, Verstöße).
+
+    Tests messen explizit mit ``web_vitals.capture(page)``; mit
+    ``web_vitals.enabled``/``--web-vitals`` misst ``_capture_web_vitals``
+    zusätzlich jede Seite des pytest-playwright ``page``.
+    """
+    from .utils.result_stream import new_run_id
+    from .utils.web_vitals import WebVitalsSession, WebVitalsStore
+
+    cfg = config.web_vitals
+    session = WebVitalsSession(WebVitalsStore(Path(cfg.database)), new_run_id("web-vitals"), cfg.budgets)
+    request.config.stash[WEB_VITALS_KEY] = session
+    return session
+
+
+@pytest.fixture(autouse=True)
+def _capture_web_vitals(request, config: TestConfig):
+    """Injiziert das Messskript in den ``context`` und misst am Testende alle offenen Seiten."""
+    enabled = config.web_vitals.enabled or request.config.getoption("--web-vitals")
+    if not enabled or "page" not in request.fixturenames:
+        yield
+        return
+
+    from .utils.web_vitals import install_web_vitals
+
+    session = request.getfixturevalue("web_vitals")
+    context = request.getfixturevalue("context")
+    install_web_vitals(context)
+    yield
+    for page in context.pages:
+        if page.is_closed():
+            continue
+        try:
+            vitals = session.capture(page, test=request.node.nodeid)
+        except Exception:
+            continue  # Seite mitten in Navigation oder ohne Skript (about:blank)
+        if vitals:
+            request.node.user_properties.append(("web_vitals", vitals.to_dict()))
+
+
+@pytest.fixture(scope="session")
+def arrival_profile(request, config: TestConfig):
+    """
+    Open-Loop Ankunftsprofil für Massentests.
+
+    Aktiv mit --arrival-profile oder ``mass_test.arrival.enabled``; sonst None
+    (Closed-Loop). Ohne CLI-Option gilt ``mass_test.arrival.profile``.
+    """
+    from .utils.arrival_scheduler import ArrivalProfile
+
+    arrival = config.mass_test.arrival
+    profile_name = request.config.getoption("--arrival-profile")
+    if not profile_name and not arrival.enabled:
+        return None
+
+    profile_name = profile_name or arrival.profile
+    rate = request.config.getoption("--arrival-rate") or arrival.rate_per_minute
+    return ArrivalProfile.from_name(
+        profile_name,
+        rate_per_minute=rate,
+        start_rate_per_minute=arrival.start_rate_per_minute,
+        ramp_seconds=arrival.ramp_seconds,
+        step_rate_per_minute=arrival.step_rate_per_minute,
+        step_seconds=arrival.step_seconds,
+    )
+
+
 # =============================================================================
 # pytest-playwright Konfiguration
 # =============================================================================
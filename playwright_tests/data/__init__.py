@@ -3,22 +3,30 @@ Testdaten fuer Playwright E2E Tests.
 """
 from .shipping_rules import (
     PLZRule,
+    PLZRuleIndex,
+    PLZSegment,
     AT_SPEDITION_RULES,
     DE_SPEDITION_RULES,
     CH_SPEDITION_RULES,
     ALL_SPEDITION_RULES,
+    SHIPPING_RULE_INDEX,
     SHIPPING_TEST_CASES,
+    generate_boundary_cases,
     get_test_plz_for_rule,
     get_city_for_plz,
 )
 
 __all__ = [
     "PLZRule",
+    "PLZRuleIndex",
+    "PLZSegment",
     "AT_SPEDITION_RULES",
     "DE_SPEDITION_RULES",
     "CH_SPEDITION_RULES",
     "ALL_SPEDITION_RULES",
+    "SHIPPING_RULE_INDEX",
     "SHIPPING_TEST_CASES",
+    "generate_boundary_cases",
     "get_test_plz_for_rule",
     "get_city_for_plz",
 ]
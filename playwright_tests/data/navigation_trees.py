@@ -0,0 +1,112 @@
+"""
+Soll-Kategoriebaeume des Mega-Menues (3 Ebenen: UK1 > UK2 > UK3).
+
+Struktur pro Hauptkategorie:
+    UK1 = Hauptkategorie im Flyout (z.B. Betten, Sofas)
+    UK2 = Unterkategorie (z.B. Betten und Nachttische, Schlafsofas)
+    UK3 = Sub-Unterkategorie (z.B. Nachttische, Bettzubehoer)
+
+"subcategories" auf UK2-Ebene = UK3-Eintraege (sofern vorhanden).
+URLs sind Pfad-Suffixe (Vergleich mit ``path_matches``).
+
+Neue Hauptkategorien werden in ``EXPECTED_NAVIGATION_TREES`` eingetragen
+(Schluessel = Name in der Hauptnavigation) und dann automatisch von
+``test_content_navigation.py`` geprueft.
+"""
+
+EXPECTED_MOEBEL_TREE = [
+    {
+        "name": "Betten",
+        "url": "/betten",
+        "subcategories": [
+            {
+                "name": "Betten und Nachttische",
+                "url": "/betten-und-nachttische",
+                "subcategories": [
+                    {"name": "Nachttische", "url": "/nachttische"},
+                    {"name": "Bettzubehör", "url": "/bettzubehoer"},
+                ],
+            },
+        ],
+    },
+    {
+        "name": "Sofas",
+        "url": "/sofas",
+        "subcategories": [
+            {"name": "Schlafsofas", "url": "/schlafsofas"},
+            {"name": "Hocker", "url": "/hocker"},
+            {"name": "Sofakissen", "url": "/sofakissen"},
+            {"name": "Ecksofas", "url": "/ecksofas"},
+            {"name": "Einzelsofas", "url": "/einzelsofas"},
+            {"name": "Sofatische", "url": "/sofatische"},
+        ],
+    },
+    {
+        "name": "Wohnschränke & Vitrinen",
+        "url": "/wohnschraenke-vitrinen",
+        "subcategories": [
+            {"name": "Wohnschränke", "url": "/wohnschraenke"},
+            {"name": "Vitrinen", "url": "/vitrinen"},
+        ],
+    },
+    {
+        "name": "Schränke",
+        "url": "/schraenke",
+        "subcategories": [
+            {"name": "Sideboards & Kommoden", "url": "/sideboards-kommoden"},
+            {"name": "Schrankzubehör", "url": "/schrankzubehoer"},
+            {"name": "Kleiderschränke", "url": "/kleiderschraenke"},
+        ],
+    },
+    {
+        "name": "Regale",
+        "url": "/regale",
+        "subcategories": [
+            {"name": "Regalsysteme", "url": "/regalsysteme"},
+            {"name": "Regalzubehör", "url": "/regalzubehoer"},
+        ],
+    },
+    {
+        "name": "Tische",
+        "url": "/tische",
+        "subcategories": [
+            {"name": "Esstische & Ausziehtische", "url": "/esstische-ausziehtische"},
+            {"name": "Schreibtische", "url": "/schreibtische"},
+        ],
+    },
+    {
+        "name": "Stühle & Bänke",
+        "url": "/stuehle-baenke",
+        "subcategories": [
+            {"name": "Sitzbänke", "url": "/sitzbaenke"},
+            {"name": "Stühle", "url": "/stuehle"},
+        ],
+    },
+    {
+        "name": "Polstersessel",
+        "url": "/polstersessel",
+        "subcategories": [],
+    },
+    {
+        "name": "Lampen & Leuchten",
+        "url": "/lampen-leuchten",
+        "subcategories": [
+            {"name": "Hängeleuchten", "url": "/haengeleuchten"},
+            {"name": "Stehleuchten", "url": "/stehleuchten"},
+            {"name": "Tischleuchten", "url": "/tischleuchten"},
+            {"name": "Bodenleuchten", "url": "/bodenleuchten"},
+            {"name": "Leuchtmittel", "url": "/leuchtmittel"},
+        ],
+    },
+    {
+        "name": "Teppiche",
+        "url": "/teppiche",
+        "subcategories": [],
+    },
+]
+
+
+# Hauptkategorie (Name in der Hauptnavigation) -> Soll-Baum
+EXPECTED_NAVIGATION_TREES = {
+    "Möbel": EXPECTED_MOEBEL_TREE,
+}
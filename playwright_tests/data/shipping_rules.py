@@ -10,8 +10,10 @@ wie Moebel, Matratzen etc.), NICHT fuer Paketversand!
 
 Quelle: test-concept.md - 98 Versandarten-Tests
 """
+from bisect import bisect_right
+from collections import Counter
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Union
 
 
 @dataclass
@@ -128,6 +130,212 @@ CH_SPEDITION_RULES = [
 ALL_SPEDITION_RULES = AT_SPEDITION_RULES + DE_SPEDITION_RULES + CH_SPEDITION_RULES
 
 
+# =============================================================================
+# Intervall-Index (Offline-Orakel fuer den gesamten PLZ-Raum)
+# =============================================================================
+
+FALLBACK_CARRIER_CODE = "POST"
+
+
+@dataclass
+class PLZSegment:
+    """Zusammenhaengender PLZ-Bereich, fuer den dieselben Speditionsregeln gelten."""
+    country: str
+    start: int
+    end: int  # inklusiv
+    digits: int
+    rules: tuple[PLZRule, ...] = ()
+
+    @property
+    def size(self) -> int:
+        return self.end - self.start + 1
+
+    @property
+    def carriers(self) -> list[str]:
+        """Verschiedene Speditionen des Bereichs (mehr als eine = Ueberschneidung)."""
+        return sorted({rule.carrier for rule in self.rules})
+
+    def __str__(self) -> str:
+        start, end = str(self.start).zfill(self.digits), str(self.end).zfill(self.digits)
+        carriers = ", ".join(self.carriers) or "keine Spedition"
+        return f"{self.country} {start}-{end} ({self.size} PLZ): {carriers}"
+
+
+class PLZRuleIndex:
+    """
+    Kompilierter Intervall-Index ueber die Speditionsregeln.
+
+    Pro Land wird der gesamte PLZ-Raum (0000-9999 bzw. 00000-99999) an allen
+    Regelgrenzen in Segmente zerlegt; jedes Segment kennt die Regeln, die es
+    abdecken. Eine Abfrage ist eine Binaersuche ueber die Segmentanfaenge
+    (O(log n)). Die POST-Regeln sind Fallback und nicht Teil der Segmente.
+
+    Beispiel:
+        index = PLZRuleIndex(ALL_SPEDITION_RULES)
+        index.expected_carrier("AT", "6020").carrier  # "Wetsch AT"
+        index.overlaps()  # Bereiche mit mehreren Speditionen
+    """
+
+    def __init__(self, rules: list[PLZRule]):
+        self.rules = list(rules)
+        self.digits: dict[str, int] = {}
+        self.fallback: dict[str, PLZRule] = {}
+        self._starts: dict[str, list[int]] = {}
+        self._segments: dict[str, list[PLZSegment]] = {}
+
+        by_country: dict[str, list[PLZRule]] = {}
+        for rule in rules:
+            digits = self.digits.setdefault(rule.country, len(rule.plz_min))
+            for plz in (rule.plz_min, rule.plz_max):
+                if len(plz) != digits or not plz.isdigit():
+                    raise ValueError(f"Ungueltige PLZ '{plz}' in Regel {rule.carrier} ({rule.country})")
+            if rule.plz_min > rule.plz_max:
+                raise ValueError(f"Regel {rule.carrier} ({rule.country}): {rule.plz_min} > {rule.plz_max}")
+            if rule.carrier_code == FALLBACK_CARRIER_CODE:
+                self.fallback.setdefault(rule.country, rule)
+            else:
+                by_country.setdefault(rule.country, []).append(rule)
+
+        for country, digits in self.digits.items():
+            self._compile(country, by_country.get(country, []), digits)
+
+    def _compile(self, country: str, rules: list[PLZRule], digits: int) -> None:
+        last = 10 ** digits - 1
+        bounds = {0}
+        for rule in rules:
+            bounds.add(int(rule.plz_min))
+            if int(rule.plz_max) < last:
+                bounds.add(int(rule.plz_max) + 1)
+        starts = sorted(bounds)
+        ends = [start - 1 for start in starts[1:]] + [last]
+
+        segments = []
+        for start, end in zip(starts, ends):
+            covering = tuple(
+                rule for rule in rules if int(rule.plz_min) <= start and end <= int(rule.plz_max)
+            )
+            segments.append(PLZSegment(country, start, end, digits, covering))
+        self._starts[country] = starts
+        self._segments[country] = segments
+
+    @property
+    def countries(self) -> list[str]:
+        return list(self._segments)
+
+    def _value(self, country: str, plz: Union[str, int]) -> int:
+        if country not in self._segments:
+            raise ValueError(f"Keine Regeln fuer Land '{country}'")
+        digits = self.digits[country]
+        if isinstance(plz, int):
+            value = plz
+        else:
+            value = int(plz) if len(plz) == digits and plz.isdigit() else -1
+        if not 0 <= value < 10 ** digits:
+            raise ValueError(f"Ungueltige PLZ '{plz}' fuer {country}")
+        return value
+
+    def segment(self, country: str, plz: Union[str, int]) -> PLZSegment:
+        """Segment, in dem die PLZ liegt."""
+        value = self._value(country, plz)
+        return self._segments[country][bisect_right(self._starts[country], value) - 1]
+
+    def expected_carrier(self, country: str, plz: Union[str, int]) -> Optional[PLZRule]:
+        """
+        Zustaendige Speditionsregel fuer eine PLZ.
+
+        Ohne Spedition wird die Fallback-Regel (Post) des Landes geliefert
+        (``None`` ausserhalb ihres Bereichs), bei mehreren verschiedenen
+        Speditionen ein ``ValueError``.
+        """
+        found = self.segment(country, plz)
+        if len(found.carriers) > 1:
+            raise ValueError(f"PLZ {plz} mehrdeutig: {found}")
+        return found.rules[0] if found.rules else self._fallback_for(country, found.start)
+
+    def _fallback_for(self, country: str, value: int) -> Optional[PLZRule]:
+        """Fallback-Regel des Landes, sofern ihr PLZ-Bereich den Wert enthaelt."""
+        fallback = self.fallback.get(country)
+        if fallback and int(fallback.plz_min) <= value <= int(fallback.plz_max):
+            return fallback
+        return None
+
+    def segments(self, country: Optional[str] = None) -> list[PLZSegment]:
+        countries = [country] if country else self.countries
+        return [found for name in countries for found in self._segments[name]]
+
+    def gaps(self, country: Optional[str] = None) -> list[PLZSegment]:
+        """Bereiche ohne Spedition (dort gilt hoechstens der Fallback)."""
+        return [found for found in self.segments(country) if not found.rules]
+
+    def overlaps(self, country: Optional[str] = None) -> list[PLZSegment]:
+        """Bereiche, die von mehr als einer Regel abgedeckt werden."""
+        return [found for found in self.segments(country) if len(found.rules) > 1]
+
+    def conflicts(self, country: Optional[str] = None) -> list[PLZSegment]:
+        """Ueberschneidungen verschiedener Speditionen (Ergebnis im Shop nicht eindeutig)."""
+        return [found for found in self.overlaps(country) if len(found.carriers) > 1]
+
+    def label_table(self, country: str) -> list[str]:
+        """
+        Erwartete Versandart-Anzeige fuer jede PLZ des Landes (Listenindex = PLZ).
+
+        Wird segmentweise per Slice-Zuweisung befuellt; mehrdeutige PLZ
+        erhalten alle Anzeigen mit " | " getrennt.
+        """
+        table = [""] * (10 ** self.digits[country])
+        for found in self._segments[country]:
+            labels = sorted({rule.expected_label or rule.carrier for rule in found.rules})
+            table[found.start:found.end + 1] = [" | ".join(labels)] * found.size
+            if not labels:
+                self._fill_fallback(table, country, found.start, found.end)
+        return table
+
+    def _fill_fallback(self, table: list[str], country: str, start: int, end: int) -> None:
+        fallback = self.fallback.get(country)
+        if fallback:
+            start, end = max(start, int(fallback.plz_min)), min(end, int(fallback.plz_max))
+            if start <= end:
+                table[start:end + 1] = [fallback.expected_label or fallback.carrier] * (end - start + 1)
+
+    def coverage(self, country: str) -> Counter:
+        """Anzahl PLZ pro Spedition ("" = weder Spedition noch Fallback)."""
+        coverage: Counter = Counter()
+        for found in self._segments[country]:
+            if found.rules:
+                coverage[" | ".join(found.carriers)] += found.size
+                continue
+            fallback = self.fallback.get(country)
+            inside = 0
+            if fallback:
+                inside = max(0, min(found.end, int(fallback.plz_max)) - max(found.start, int(fallback.plz_min)) + 1)
+                if inside:
+                    coverage[fallback.carrier] += inside
+            if found.size - inside:
+                coverage[""] += found.size - inside
+        return coverage
+
+    def check_test_cases(self, cases: list[tuple]) -> list[str]:
+        """
+        Vergleicht Testfaelle mit dem Orakel ueber alle PLZ.
+
+        Returns:
+            Meldungen fuer Testfaelle, deren erwartete Anzeige nicht zur
+            Anzeige laut Regeln passt (leer = konsistent)
+        """
+        tables: dict[str, list[str]] = {}
+        problems = []
+        for test_id, country, _, plz, _, expected_label in cases:
+            if country not in tables:
+                tables[country] = self.label_table(country)
+            actual = tables[country][self._value(country, plz)]
+            if actual != expected_label:
+                problems.append(f"{test_id}: erwartet '{expected_label}', laut Regeln '{actual}'")
+        return problems
+
+
+SHIPPING_RULE_INDEX = PLZRuleIndex(ALL_SPEDITION_RULES)
+
+
 def get_test_plz_for_rule(rule: PLZRule, position: str = "min") -> str:
     """
     Generiert eine Test-PLZ fuer eine Regel.
@@ -334,6 +542,93 @@ def generate_test_cases() -> list[tuple]:
     return test_cases
 
 
+def generate_boundary_cases(index: Optional[PLZRuleIndex] = None) -> list[tuple]:
+    """
+    Testfaelle direkt neben jeder Regel (Min-1, Max+1).
+
+    Die erwartete Versandart kommt aus dem Intervall-Index: die
+    Nachbar-Spedition oder der Post-Fallback. PLZ, die schon Min/Max einer
+    Regel sind, sowie PLZ ohne eindeutige Erwartung werden uebersprungen.
+
+    Returns:
+        Liste von Tupeln wie ``generate_test_cases``
+    """
+    index = index or SHIPPING_RULE_INDEX
+    rules = [rule for rule in index.rules if rule.carrier_code != FALLBACK_CARRIER_CODE]
+    known = {(rule.country, plz) for rule in rules for plz in (rule.plz_min, rule.plz_max)}
+    test_cases = []
+
+    for rule in rules:
+        digits = len(rule.plz_min)
+        for position, value in (("BELOW", int(rule.plz_min) - 1), ("ABOVE", int(rule.plz_max) + 1)):
+            if not 0 <= value < 10 ** digits:
+                continue
+            plz = str(value).zfill(digits)
+            if (rule.country, plz) in known:
+                continue
+            try:
+                expected = index.expected_carrier(rule.country, plz)
+            except ValueError:
+                continue
+            if expected is None:
+                continue
+            known.add((rule.country, plz))
+            test_cases.append((
+                f"TC-SHIP-{rule.country}-{rule.carrier_code}-{position}-{plz}",
+                rule.country,
+                expected.carrier,
+                plz,
+                get_city_for_plz(rule.country, plz),
+                expected.expected_label,
+            ))
+
+    return test_cases
+
+
+def generate_sweep_cases(samples_per_rule: int = 0, boundary_neighbours: bool = False) -> list[tuple]:
+    """
+    Testfaelle fuer den PLZ-Sweep: Min/Max jeder Regel plus gleichmaessig verteilte PLZ dazwischen.
+
+    Args:
+        samples_per_rule: Zusaetzliche PLZ pro Regel zwischen Min und Max (0 = nur Grenzen)
+        boundary_neighbours: Zusaetzlich die PLZ direkt neben jeder Regel
+            (``generate_boundary_cases``)
+
+    Returns:
+        Liste von Tupeln wie ``generate_test_cases``
+    """
+    test_cases = generate_test_cases()
+    if boundary_neighbours:
+        test_cases += generate_boundary_cases()
+    if samples_per_rule <= 0 and not boundary_neighbours:
+        return test_cases
+
+    known = {tc[0] for tc in test_cases}
+    for rule in ALL_SPEDITION_RULES:
+        if rule.carrier_code == "POST":
+            continue
+        min_val, max_val = int(rule.plz_min), int(rule.plz_max)
+        step = (max_val - min_val) / (samples_per_rule + 1)
+        for sample in range(1, samples_per_rule + 1):
+            plz = str(min_val + round(step * sample)).zfill(len(rule.plz_min))
+            test_id = f"TC-SHIP-{rule.country}-{rule.carrier_code}-S{sample}-{plz}"
+            if plz in (rule.plz_min, rule.plz_max) or test_id in known:
+                continue
+            known.add(test_id)
+            test_cases.append((
+                test_id,
+                rule.country,
+                rule.carrier,
+                plz,
+                get_city_for_plz(rule.country, plz),
+                rule.expected_label,
+            ))
+
+    # Nach Land gruppiert (eine Sweep-Session pro Land)
+    order = {"AT": 0, "DE": 1, "CH": 2}
+    return sorted(test_cases, key=lambda tc: order.get(tc[1], 99))
+
+
 # Vorgenerierte Testfaelle fuer schnellen Import
 SHIPPING_TEST_CASES = generate_test_cases()
 
@@ -356,3 +651,13 @@ if __name__ == "__main__":
     for tc in SHIPPING_TEST_CASES:
         if tc[1] == "CH":
             print(f"  {tc[0]}: PLZ {tc[3]} ({tc[4]}) -> {tc[5]}")
+    print()
+    print("=== Regel-Abdeckung ===")
+    for country in SHIPPING_RULE_INDEX.countries:
+        coverage = ", ".join(f"{carrier or 'ohne Versand'}: {count}"
+                             for carrier, count in SHIPPING_RULE_INDEX.coverage(country).most_common())
+        print(f"  {country}: {coverage}")
+    for segment in SHIPPING_RULE_INDEX.gaps():
+        print(f"  Luecke: {segment}")
+    for segment in SHIPPING_RULE_INDEX.overlaps():
+        print(f"  Ueberschneidung: {segment}")
@@ -9,6 +9,7 @@ from typing import Optional
 
 from playwright.async_api import Page
 
+from ..utils.dom_extract import DomField
 from .base_page import BasePage
 
 
@@ -204,7 +205,7 @@ class AccountPage(BasePage):
         register_btn = self.page.locator(self.REGISTER_COLLAPSE_BUTTON)
         if await register_btn.count() > 0 and await register_btn.is_visible():
             await register_btn.click()
-            await self.page.wait_for_timeout(500)  # Warten auf Animation
+            await self.wait_for_dom_settle()  # Warten auf Collapse-Animation
 
     async def goto_profile(self) -> None:
         """Navigiert zur Profil-Übersicht."""
@@ -239,12 +240,9 @@ class AccountPage(BasePage):
         # Submit
         submit_btn = self.page.locator(self.LOGIN_SUBMIT)
         if await submit_btn.count() > 0:
-            await submit_btn.first.click()
+            await self.submit_and_wait(submit_btn.first)
         else:
-            await self.page.locator(self.LOGIN_SUBMIT_ALT).click()
-
-        await self.page.wait_for_load_state("domcontentloaded")
-        await self.page.wait_for_timeout(1000)
+            await self.submit_and_wait(self.page.locator(self.LOGIN_SUBMIT_ALT))
 
         # Prüfen ob erfolgreich (nicht mehr auf Login-Seite)
         return not await self.is_on_login_page()
@@ -268,20 +266,18 @@ class AccountPage(BasePage):
         """Meldet den Kunden ab."""
         # Erst zum Profil navigieren
         await self.goto_profile()
-        await self.page.wait_for_timeout(500)
+        await self.wait_for_ready()
 
         # Logout-Button klicken
         logout_btn = self.page.locator(self.LOGOUT_BUTTON)
         if await logout_btn.count() > 0 and await logout_btn.first.is_visible():
-            await logout_btn.first.click()
-            await self.page.wait_for_load_state("domcontentloaded")
+            await self.submit_and_wait(logout_btn.first)
             return
 
         # Fallback
         logout_link = self.page.locator(self.LOGOUT_LINK)
         if await logout_link.count() > 0:
-            await logout_link.first.click()
-            await self.page.wait_for_load_state("domcontentloaded")
+            await self.submit_and_wait(logout_link.first)
 
     # =========================================================================
     # Registrierung
@@ -347,14 +343,11 @@ class AccountPage(BasePage):
         # Submit
         submit_btn = self.page.locator(self.REGISTER_SUBMIT)
         if await submit_btn.count() > 0 and await submit_btn.first.is_visible():
-            await submit_btn.first.click()
+            await self.submit_and_wait(submit_btn.first)
         else:
             submit_alt = self.page.locator(self.REGISTER_SUBMIT_ALT)
             if await submit_alt.count() > 0:
-                await submit_alt.first.click()
-
-        await self.page.wait_for_load_state("domcontentloaded")
-        await self.page.wait_for_timeout(1000)
+                await self.submit_and_wait(submit_alt.first)
 
         # Erfolgreich wenn auf Profil-Seite
         return await self.is_logged_in()
@@ -375,14 +368,8 @@ class AccountPage(BasePage):
 
     async def get_form_errors(self) -> list[str]:
         """Gibt alle Formular-Fehlermeldungen zurück."""
-        errors = []
-        error_elements = self.page.locator(self.FORM_ERROR)
-        count = await error_elements.count()
-        for i in range(count):
-            text = await error_elements.nth(i).text_content()
-            if text and text.strip():
-                errors.append(text.strip())
-        return errors
+        rows = await self.extract_all(self.FORM_ERROR, {"text": DomField()})
+        return [row["text"] for row in rows if row["text"]]
 
     async def has_form_errors(self) -> bool:
         """Prüft ob Formular-Fehler vorhanden sind."""
@@ -470,9 +457,7 @@ class AccountPage(BasePage):
         # Speichern
         save_btn = self.page.locator(self.PROFILE_SAVE_BUTTON)
         if await save_btn.count() > 0:
-            await save_btn.first.click()
-            await self.page.wait_for_load_state("domcontentloaded")
-            await self.page.wait_for_timeout(1000)
+            await self.submit_and_wait(save_btn.first)
 
         # Erfolgsmeldung prüfen
         success = self.page.locator(self.PROFILE_SUCCESS_MESSAGE)
@@ -505,10 +490,7 @@ class AccountPage(BasePage):
 
         # Speichern-Button des E-Mail-Formulars klicken
         save_btn = self.page.locator(self.PROFILE_EMAIL_SAVE)
-        await save_btn.click()
-
-        await self.page.wait_for_load_state("domcontentloaded")
-        await self.page.wait_for_timeout(1000)
+        await self.submit_and_wait(save_btn)
 
         # Erfolgsmeldung prüfen
         success = self.page.locator(self.PROFILE_SUCCESS_MESSAGE)
@@ -523,6 +505,11 @@ class AccountPage(BasePage):
         addresses = self.page.locator(self.ADDRESS_CARD)
         return await addresses.count()
 
+    async def get_addresses(self) -> list[str]:
+        """Gibt die Texte aller Adress-Karten zurück (eine Browser-Runde)."""
+        rows = await self.extract_all(self.ADDRESS_CARD, {"text": DomField()})
+        return [" ".join(row["text"].split()) for row in rows if row["text"]]
+
     async def add_address(
         self,
         first_name: str,
@@ -542,7 +529,7 @@ class AccountPage(BasePage):
         add_btn = self.page.locator(self.ADD_ADDRESS_BUTTON)
         if await add_btn.count() > 0:
             await add_btn.first.click()
-            await self.page.wait_for_timeout(1000)
+            await self.wait_for_settled()
 
         # Formular ausfüllen
         await self.fill(self.ADDRESS_FORM_FIRST_NAME, first_name)
@@ -559,9 +546,7 @@ class AccountPage(BasePage):
         # Speichern
         save_btn = self.page.locator(self.ADDRESS_FORM_SAVE)
         if await save_btn.count() > 0:
-            await save_btn.first.click()
-            await self.page.wait_for_load_state("domcontentloaded")
-            await self.page.wait_for_timeout(1000)
+            await self.submit_and_wait(save_btn.first)
 
         # Erfolgsmeldung
         success = self.page.locator(self.PROFILE_SUCCESS_MESSAGE)
@@ -591,7 +576,7 @@ class AccountPage(BasePage):
             return False
 
         await edit_btn.first.click()
-        await self.page.wait_for_timeout(1000)
+        await self.wait_for_settled()
 
         # Felder ausfüllen
         field_map = {
@@ -615,9 +600,7 @@ class AccountPage(BasePage):
         # Speichern
         save_btn = self.page.locator(self.ADDRESS_FORM_SAVE)
         if await save_btn.count() > 0:
-            await save_btn.first.click()
-            await self.page.wait_for_load_state("domcontentloaded")
-            await self.page.wait_for_timeout(1000)
+            await self.submit_and_wait(save_btn.first)
 
         # Erfolgsmeldung
         success = self.page.locator(self.PROFILE_SUCCESS_MESSAGE)
@@ -644,7 +627,7 @@ class AccountPage(BasePage):
 
         if await delete_btn.count() > 0:
             await delete_btn.first.click()
-            await self.page.wait_for_timeout(500)
+            await self.wait_for_dom_settle()
 
             # Bestätigungsdialog
             confirm_btn = self.page.locator(self.CONFIRM_DELETE_BUTTON)
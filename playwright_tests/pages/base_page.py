@@ -1,10 +1,37 @@
 """
 Basis Page Object - gemeinsame Funktionalität für alle Seiten.
 """
+import functools
 from typing import Optional
 
 from playwright.async_api import Page, expect
 
+from ..utils.dom_extract import DomField, extract, extract_all
+from ..utils.readiness import (
+    click_and_wait_for_cart_async,
+    close_offcanvas_cart_async,
+    submit_and_wait_for_page_async,
+    wait_for_dom_settle_async,
+    wait_for_page_ready_async,
+    wait_for_settled_async,
+)
+from ..utils.step_timing import StepTimer
+
+
+def timed_step(name: str):
+    """
+    Dekorator für Page-Object-Methoden: misst den Aufruf als Checkout-Schritt.
+
+    Ohne aktivierten Timer (siehe ``BasePage.use_timer``) ohne Overhead.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            async with self.timer.span(name):
+                return await func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
 
 class BasePage:
     """
@@ -31,6 +58,16 @@ class BasePage:
         """
         self.page = page
         self.base_url = base_url.rstrip("/")
+        self.timer = StepTimer(enabled=False)
+
+    def use_timer(self, timer: StepTimer) -> None:
+        """
+        Aktiviert die Schritt-Messung mit einem (pro Bestellung geteilten) Timer.
+
+        Der Timer muss per ``timer.attach(context)`` am Kontext hängen,
+        damit Requests und Navigationen gezählt werden.
+        """
+        self.timer = timer
 
     # =========================================================================
     # Navigation
@@ -73,8 +110,11 @@ class BasePage:
         # Warten bis Seite vollständig geladen ist
         await self.page.wait_for_load_state("networkidle")
 
-        # Kurz warten, damit Usercentrics-Banner Zeit hat zu erscheinen
-        await self.page.wait_for_timeout(2000)
+        # Warten bis das (Usercentrics-)Banner eingehängt ist - höchstens 2s
+        try:
+            await self.page.locator(self.COOKIE_BANNER).first.wait_for(state="attached", timeout=2000)
+        except Exception:
+            pass  # Kein Banner - die Fallbacks unten prüfen trotzdem
 
         # Methode 1: Usercentrics Shadow DOM - per JavaScript klicken
         try:
@@ -100,7 +140,7 @@ class BasePage:
             """)
             if clicked:
                 print("   Cookie-Banner akzeptiert (via Shadow DOM)")
-                await self.page.wait_for_timeout(1500)
+                await self._wait_for_cookie_banner_hidden()
                 return True
         except Exception as e:
             pass
@@ -118,7 +158,7 @@ class BasePage:
                     if await button.first.is_visible(timeout=timeout):
                         print(f"   Cookie-Banner gefunden: {selector}")
                         await button.first.click()
-                        await self.page.wait_for_timeout(1500)
+                        await self._wait_for_cookie_banner_hidden()
                         return True
             except Exception:
                 continue
@@ -126,6 +166,13 @@ class BasePage:
         print("   Kein Cookie-Banner gefunden")
         return False
 
+    async def _wait_for_cookie_banner_hidden(self, timeout: int = 5000) -> None:
+        """Wartet bis das Cookie-Banner nach dem Akzeptieren verschwunden ist."""
+        try:
+            await self.page.locator(self.COOKIE_BANNER).first.wait_for(state="hidden", timeout=timeout)
+        except Exception:
+            pass  # Banner evtl. anders strukturiert
+
     # =========================================================================
     # Formular-Interaktionen
     # =========================================================================
@@ -176,6 +223,80 @@ class BasePage:
         if await checkbox.is_checked():
             await checkbox.uncheck()
 
+    # =========================================================================
+    # Readiness (ereignisbasiertes Warten statt fester Pausen)
+    # =========================================================================
+
+    async def wait_for_ready(self, timeout: int = 10000) -> None:
+        """Wartet nach einer Navigation auf DOMContentLoaded, Netzwerk- und DOM-Ruhe."""
+        await wait_for_page_ready_async(self.page, timeout_ms=timeout)
+
+    async def submit_and_wait(self, locator, timeout: int = 15000) -> bool:
+        """Klickt einen Absenden-Button/Link und wartet auf die neue Seite (False ohne Navigation)."""
+        return await submit_and_wait_for_page_async(self.page, locator, timeout_ms=timeout)
+
+    async def wait_for_settled(self, timeout: int = 3000) -> None:
+        """Wartet nach einer Interaktion (AJAX, Varianten-Wechsel) auf Ruhe."""
+        await wait_for_settled_async(self.page, timeout_ms=timeout)
+
+    async def wait_for_dom_settle(self, quiet: int = 300, timeout: int = 3000) -> bool:
+        """Wartet bis das DOM für ``quiet`` ms keine Struktur-Änderungen mehr hat."""
+        return await wait_for_dom_settle_async(self.page, quiet_ms=quiet, timeout_ms=timeout)
+
+    async def click_and_wait_for_cart(self, selector: str, timeout: int = 15000) -> bool:
+        """
+        Klickt einen Warenkorb-Button und wartet auf die Shopware-Warenkorb-Antwort.
+
+        Returns:
+            True wenn der Warenkorb aktualisiert wurde
+        """
+        return await click_and_wait_for_cart_async(
+            self.page, self.page.locator(selector).first, timeout_ms=timeout
+        )
+
+    async def close_offcanvas_cart(self, timeout: int = 3000) -> bool:
+        """Schließt den Offcanvas-Cart (falls offen) und wartet bis er weg ist."""
+        return await close_offcanvas_cart_async(self.page, timeout_ms=timeout)
+
+    # =========================================================================
+    # Login-Cache
+    # =========================================================================
+
+    async def restore_login(self, auth_state, email: str, password: str) -> None:
+        """
+        Übernimmt den gecachten Login eines Kunden in den Kontext dieser Seite.
+
+        Ersetzt die bisherige Session (auch einen Gast-Warenkorb); für den
+        Login im Checkout mit Warenkorb-Übernahme weiterhin ``login`` verwenden.
+
+        Args:
+            auth_state: ``AuthStateCache`` (Fixture ``auth_state``)
+            email: E-Mail-Adresse
+            password: Passwort (nur für den ersten Login im Lauf)
+        """
+        await auth_state.apply_async(self.page.context, email, password)
+
+    # =========================================================================
+    # Gebündeltes Auslesen (eine Browser-Runde pro Ansicht)
+    # =========================================================================
+
+    async def extract_all(self, selector: str, fields: dict[str, DomField]) -> list[dict]:
+        """
+        Liest ``fields`` für jedes Element von ``selector`` in einem ``evaluate_all``.
+
+        Args:
+            selector: Playwright-Selektor der Elemente (z.B. Warenkorb-Positionen)
+            fields: Feldname -> ``DomField`` (reines CSS relativ zum Element)
+
+        Returns:
+            Ein Dict pro Element
+        """
+        return await extract_all(self.page.locator(selector), fields)
+
+    async def extract(self, fields: dict[str, DomField], root: str = "html") -> dict:
+        """Liest eine ganze Ansicht (auch verschachtelte Listen) in einem ``evaluate_all``."""
+        return await extract(self.page, fields, root)
+
     # =========================================================================
     # Warten & Assertions
     # =========================================================================
@@ -11,7 +11,10 @@ from dataclasses import dataclass
 from typing import Optional
 
 from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
+from ..utils.dom_extract import DomField
+from ..utils.readiness import OFFCANVAS_OPEN, click_and_wait_for_cart_async, is_cart_update_response
 from .base_page import BasePage
 
 
@@ -25,6 +28,14 @@ class CartItem:
     index: int
 
 
+@dataclass
+class CartView:
+    """Warenkorb-Seite auf einmal gelesen: Positionen und Summen."""
+    items: list[CartItem]
+    subtotal: float
+    total: float
+
+
 class CartPage(BasePage):
     """
     Page Object für den Shopware 6 Warenkorb.
@@ -70,6 +81,14 @@ class CartPage(BasePage):
     CART_ITEM_TOTAL_PRICE = ".line-item-total-price, .line-item-total"
     CART_ITEM_REMOVE = ".line-item-remove, .line-item-remove-button"
 
+    # Felder einer Position für das gebündelte Auslesen (eine Browser-Runde)
+    CART_ITEM_FIELDS = {
+        "name": DomField(CART_ITEM_NAME),
+        "quantity": DomField(CART_ITEM_QUANTITY, read="value"),
+        "unit_price": DomField(CART_ITEM_UNIT_PRICE),
+        "total_price": DomField(CART_ITEM_TOTAL_PRICE),
+    }
+
     # Cart Summary
     CART_SUBTOTAL = ".checkout-aside-summary-value"
     CART_SHIPPING = ".checkout-aside-summary-list dt:has-text('Versand') + dd"
@@ -111,14 +130,18 @@ class CartPage(BasePage):
     async def navigate_to_cart(self) -> None:
         """Navigiert zur Warenkorb-Seite."""
         await self.navigate(self.CART_PATH)
-        await self.page.wait_for_timeout(1000)
+        await self.wait_for_ready()
 
     async def open_cart_offcanvas(self) -> None:
         """Öffnet den Offcanvas-Warenkorb durch Klick auf das Cart-Widget."""
         cart_widget = self.page.locator(self.CART_WIDGET)
         if await cart_widget.count() > 0:
             await cart_widget.first.click()
-            await self.page.wait_for_timeout(1000)
+            try:
+                await self.page.locator(OFFCANVAS_OPEN).first.wait_for(state="visible", timeout=5000)
+            except Exception:
+                pass
+            await self.wait_for_dom_settle()
 
     async def close_cart_offcanvas(self) -> None:
         """Schließt den Offcanvas-Warenkorb."""
@@ -127,7 +150,7 @@ class CartPage(BasePage):
             try:
                 if await close_btn.first.is_visible(timeout=2000):
                     await close_btn.first.click()
-                    await self.page.wait_for_timeout(500)
+                    await self.page.locator(OFFCANVAS_OPEN).first.wait_for(state="hidden", timeout=3000)
             except Exception:
                 pass
 
@@ -173,48 +196,37 @@ class CartPage(BasePage):
         """
         Gibt alle Produkte im Warenkorb zurück.
 
+        Alle Positionen werden in einer Browser-Runde gelesen.
+
         Returns:
             Liste von CartItem-Objekten
         """
-        items = []
-        item_elements = self.page.locator(self.CART_ITEM)
-        count = await item_elements.count()
-
-        for i in range(count):
-            item = item_elements.nth(i)
-
-            # Name
-            name_el = item.locator(self.CART_ITEM_NAME)
-            name = await name_el.first.text_content() if await name_el.count() > 0 else ""
-
-            # Menge
-            qty_input = item.locator(self.CART_ITEM_QUANTITY)
-            quantity = 1
-            if await qty_input.count() > 0:
-                qty_value = await qty_input.first.input_value()
-                quantity = int(qty_value) if qty_value else 1
-
-            # Einzelpreis
-            unit_price_el = item.locator(self.CART_ITEM_UNIT_PRICE)
-            unit_price = 0.0
-            if await unit_price_el.count() > 0:
-                unit_price = await self._parse_price(await unit_price_el.first.text_content())
-
-            # Gesamtpreis
-            total_price_el = item.locator(self.CART_ITEM_TOTAL_PRICE)
-            total_price = 0.0
-            if await total_price_el.count() > 0:
-                total_price = await self._parse_price(await total_price_el.first.text_content())
-
-            items.append(CartItem(
-                name=name.strip() if name else "",
-                quantity=quantity,
-                unit_price=unit_price,
-                total_price=total_price,
-                index=i
-            ))
-
-        return items
+        rows = await self.extract_all(self.CART_ITEM, self.CART_ITEM_FIELDS)
+        return [await self._cart_item(row, i) for i, row in enumerate(rows)]
+
+    async def read_cart(self) -> CartView:
+        """Liest Positionen, Zwischensumme und Gesamtsumme in einer Browser-Runde."""
+        view = await self.extract({
+            "items": DomField(self.CART_ITEM, fields=self.CART_ITEM_FIELDS, all=True),
+            "subtotal": DomField(self.CART_SUBTOTAL),
+            "total": DomField(self.CART_TOTAL),
+        })
+        return CartView(
+            items=[await self._cart_item(row, i) for i, row in enumerate(view["items"] or [])],
+            subtotal=await self._parse_price(view["subtotal"]),
+            total=await self._parse_price(view["total"]),
+        )
+
+    async def _cart_item(self, row: dict, index: int) -> CartItem:
+        """Baut ein CartItem aus einem gebündelt gelesenen Datensatz."""
+        quantity = row["quantity"]
+        return CartItem(
+            name=row["name"] or "",
+            quantity=int(quantity) if quantity else 1,
+            unit_price=await self._parse_price(row["unit_price"]),
+            total_price=await self._parse_price(row["total_price"]),
+            index=index
+        )
 
     async def get_item_by_index(self, index: int) -> Optional[CartItem]:
         """Gibt ein bestimmtes Produkt anhand des Index zurück."""
@@ -240,8 +252,12 @@ class CartPage(BasePage):
 
         if await qty_input.count() > 0:
             await qty_input.first.fill(str(quantity))
-            await qty_input.first.press("Enter")
-            await self.page.wait_for_timeout(2000)  # Warten auf AJAX-Update
+            try:
+                async with self.page.expect_response(is_cart_update_response, timeout=15000):
+                    await qty_input.first.press("Enter")
+            except PlaywrightTimeoutError:
+                pass
+            await self.wait_for_ready()
 
     async def remove_item(self, index: int) -> None:
         """
@@ -254,8 +270,8 @@ class CartPage(BasePage):
         remove_btn = item.locator(self.CART_ITEM_REMOVE)
 
         if await remove_btn.count() > 0:
-            await remove_btn.first.click()
-            await self.page.wait_for_timeout(2000)  # Warten auf AJAX-Update
+            await click_and_wait_for_cart_async(self.page, remove_btn.first)
+            await self.wait_for_ready()
 
     async def clear_cart(self) -> None:
         """Entfernt alle Produkte aus dem Warenkorb."""
@@ -264,7 +280,6 @@ class CartPage(BasePage):
             if await items.count() == 0:
                 break
             await self.remove_item(0)
-            await self.page.wait_for_timeout(500)
 
     # =========================================================================
     # Prices & Totals
@@ -330,8 +345,7 @@ class CartPage(BasePage):
         """
         # Zur Produktseite navigieren
         await self.navigate(f"/{product_path}")
-        await self.page.wait_for_load_state("domcontentloaded")
-        await self.page.wait_for_timeout(1000)
+        await self.wait_for_ready()
 
         # Cookie-Banner akzeptieren
         await self.accept_cookies_if_visible()
@@ -347,8 +361,8 @@ class CartPage(BasePage):
         if await add_btn.count() == 0:
             return False
 
-        await add_btn.first.click()
-        await self.page.wait_for_timeout(3000)  # Warten auf AJAX
+        if not await self.click_and_wait_for_cart(self.ADD_TO_CART_BUTTON):
+            return False
 
         # Offcanvas schließen
         await self.close_cart_offcanvas()
@@ -378,15 +392,18 @@ class CartPage(BasePage):
             return False
 
         await number_input.fill(product_number)
-        await self.page.wait_for_timeout(300)
 
         submit_btn = self.page.locator(self.PRODUCT_NUMBER_SUBMIT)
-        if await submit_btn.count() > 0:
-            await submit_btn.click()
-        else:
-            await number_input.press("Enter")
+        try:
+            async with self.page.expect_response(is_cart_update_response, timeout=15000):
+                if await submit_btn.count() > 0:
+                    await submit_btn.click()
+                else:
+                    await number_input.press("Enter")
+        except PlaywrightTimeoutError:
+            return False
 
-        await self.page.wait_for_timeout(3000)
+        await self.wait_for_ready()
 
         items_after = await self.get_cart_item_count()
         return items_after > items_before
@@ -411,7 +428,7 @@ class CartPage(BasePage):
             try:
                 if await toggle.first.is_visible():
                     await toggle.first.click()
-                    await self.page.wait_for_timeout(500)
+                    await self.page.locator(self.PROMOTION_CODE_INPUT).first.wait_for(state="visible", timeout=3000)
             except Exception:
                 pass
 
@@ -422,17 +439,19 @@ class CartPage(BasePage):
 
         # Code eingeben
         await code_input.first.fill(code)
-        await self.page.wait_for_timeout(300)
 
-        # Code absenden
+        # Code absenden und auf Server-Antwort warten
         submit_btn = self.page.locator(self.PROMOTION_CODE_SUBMIT)
-        if await submit_btn.count() > 0:
-            await submit_btn.first.click()
-        else:
-            # Fallback: Enter drücken
-            await code_input.first.press("Enter")
-
-        await self.page.wait_for_timeout(2000)  # Warten auf Server-Antwort
+        try:
+            async with self.page.expect_response(is_cart_update_response, timeout=15000):
+                if await submit_btn.count() > 0:
+                    await submit_btn.first.click()
+                else:
+                    # Fallback: Enter drücken
+                    await code_input.first.press("Enter")
+        except PlaywrightTimeoutError:
+            pass
+        await self.wait_for_ready()
 
         # Prüfe ob erfolgreich
         success = self.page.locator(self.PROMOTION_SUCCESS_MESSAGE)
@@ -466,8 +485,8 @@ class CartPage(BasePage):
 
         remove_btn = promo_line.locator(self.CART_ITEM_REMOVE)
         if await remove_btn.count() > 0:
-            await remove_btn.first.click()
-            await self.page.wait_for_timeout(2000)
+            await click_and_wait_for_cart_async(self.page, remove_btn.first)
+            await self.wait_for_ready()
             return True
         return False
 
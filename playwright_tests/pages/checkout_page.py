@@ -5,12 +5,13 @@ Gescannte Selektoren von: grueneerde.scalecommerce.cloud
 Letzte Aktualisierung: 2026-01-17
 """
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Optional
 
 from playwright.async_api import Page, expect
 
-from .base_page import BasePage
+from .base_page import BasePage, timed_step
 from ..config import get_config
+from ..utils.dom_extract import DomField
 
 
 @dataclass
@@ -54,6 +55,31 @@ class CheckoutResult:
     order_number: Optional[str] = None
     error_message: Optional[str] = None
     duration_seconds: float = 0.0
+    # Dauer pro Checkout-Schritt (Sekunden), sofern gemessen
+    step_durations: dict[str, float] = field(default_factory=dict)
+    # Details pro Schritt (Requests, Navigation-Timing), siehe StepSpan
+    steps: list[dict] = field(default_factory=list)
+    # Gespeicherte Netzwerk-Aufzeichnung (nur fehlgeschlagene/langsame/Stichprobe)
+    network_trace: Optional[str] = None
+
+
+@dataclass
+class ConfirmSummary:
+    """Confirm-Seite auf einmal gelesen (siehe ``CheckoutPage.read_confirm_summary``)."""
+    shipping_address: Optional[str] = None
+    billing_address: Optional[str] = None
+    payment_methods: list[str] = field(default_factory=list)
+    selected_payment_method: Optional[str] = None  # value (ID) der gewählten Zahlungsart
+    shipping_methods: list[str] = field(default_factory=list)
+    selected_shipping_method: Optional[str] = None  # Label der gewählten Versandart
+    subtotal: Optional[str] = None
+    total: Optional[str] = None
+    form_errors: list[str] = field(default_factory=list)
+
+
+def _payment_label(text: str) -> str:
+    """Erste Zeile eines Zahlungsart-Labels (ohne Beschreibungstext)."""
+    return text.strip().split("\n")[0].strip()
 
 
 class CheckoutPage(BasePage):
@@ -208,6 +234,22 @@ class CheckoutPage(BasePage):
     FORM_ERROR = ".invalid-feedback"
     ALERT_DANGER = ".alert-danger"
     FIELD_ERROR = ".is-invalid"
+
+    # =========================================================================
+    # Confirm-Seite gebündelt auslesen (eine Browser-Runde)
+    # =========================================================================
+
+    CONFIRM_SUMMARY_FIELDS = {
+        "shipping_address": DomField(CONFIRM_SHIPPING_ADDRESS),
+        "billing_address": DomField(CONFIRM_BILLING_ADDRESS),
+        "payment_methods": DomField(PAYMENT_METHOD_RADIO, read="label", all=True),
+        "selected_payment_method": DomField(f"{PAYMENT_METHOD_RADIO}:checked", read="attr", attr="value"),
+        "shipping_methods": DomField(SHIPPING_METHOD_RADIO, read="label", all=True),
+        "selected_shipping_method": DomField(f"{SHIPPING_METHOD_RADIO}:checked", read="label"),
+        "subtotal": DomField(SUBTOTAL),
+        "total": DomField(TOTAL),
+        "form_errors": DomField(FORM_ERROR, all=True),
+    }
     
     # =========================================================================
     # Mappings
@@ -241,11 +283,22 @@ class CheckoutPage(BasePage):
         self.checkout_path = "/checkout/register"
         self.checkout_confirm_path = "/checkout/confirm"
         self.checkout_finish_path = "/checkout/finish"
+        self._submit_callback: Optional[Callable[[], None]] = None
+
+    def on_submit(self, callback: Callable[[], None]) -> None:
+        """
+        Registriert einen Callback direkt vor dem Absenden der Bestellung.
+
+        Das Lauf-Manifest merkt sich damit, welche Bestellungen im Shop
+        angelegt sein könnten (kein erneutes Absenden beim Fortsetzen).
+        """
+        self._submit_callback = callback
 
     # =========================================================================
     # Navigation
     # =========================================================================
 
+    @timed_step("goto_checkout")
     async def goto_checkout(self) -> None:
         """Navigiert direkt zum Checkout (Register-Seite)."""
         await self.navigate(self.checkout_path)
@@ -259,6 +312,7 @@ class CheckoutPage(BasePage):
     # Login (bestehender Kunde)
     # =========================================================================
 
+    @timed_step("login")
     async def login(self, email: str, password: str) -> None:
         """
         Meldet einen bestehenden Kunden an.
@@ -276,6 +330,7 @@ class CheckoutPage(BasePage):
     # Gast-Checkout
     # =========================================================================
 
+    @timed_step("start_guest_checkout")
     async def start_guest_checkout(self) -> None:
         """Startet den Gast-Checkout."""
         # Primärer Selektor: "Als Gast bestellen" Button
@@ -297,6 +352,7 @@ class CheckoutPage(BasePage):
         if await guest_radio.count() > 0 and await guest_radio.is_visible():
             await guest_radio.check()
 
+    @timed_step("start_registration")
     async def start_registration(self) -> None:
         """Startet die Kunden-Registrierung."""
         register_button = self.page.locator(self.REGISTER_BUTTON)
@@ -320,7 +376,7 @@ class CheckoutPage(BasePage):
         if address.account_type == "business":
             await self.select_option_by_label(self.ACCOUNT_TYPE_SELECT, "Gewerblich")
             # Warte auf Geschäftskunde-Felder
-            await self.page.wait_for_timeout(500)
+            await self.page.locator(self.COMPANY_INPUT).wait_for(state="visible", timeout=5000)
 
         # Anrede
         salutation_label = self.SALUTATION_MAP.get(address.salutation, address.salutation)
@@ -367,7 +423,7 @@ class CheckoutPage(BasePage):
         checkbox = self.page.locator(self.DIFFERENT_SHIPPING_CHECKBOX)
         if not await checkbox.is_checked():
             await checkbox.check()
-            await self.page.wait_for_timeout(500)  # Warte auf Felder
+            await self.page.locator(self.SHIPPING_FIRST_NAME_INPUT).wait_for(state="visible", timeout=5000)
 
         # Anrede
         salutation_label = self.SALUTATION_MAP.get(shipping.salutation, shipping.salutation)
@@ -390,6 +446,7 @@ class CheckoutPage(BasePage):
         if shipping.company:
             await self.fill(self.SHIPPING_COMPANY_INPUT, shipping.company)
 
+    @timed_step("fill_guest_address")
     async def fill_guest_address(self, address: Address) -> None:
         """Füllt alle Adressdaten für Gast-Checkout aus."""
         await self.fill_personal_data(address)
@@ -399,6 +456,7 @@ class CheckoutPage(BasePage):
     # Zahlungsart
     # =========================================================================
 
+    @timed_step("select_payment_method")
     async def select_payment_method(self, method: str) -> None:
         """
         Wählt eine Zahlungsart aus.
@@ -486,26 +544,14 @@ class CheckoutPage(BasePage):
         Returns:
             Liste der Zahlungsarten-Labels
         """
-        methods = []
-        radios = self.page.locator(self.PAYMENT_METHOD_RADIO)
-        count = await radios.count()
-
-        for i in range(count):
-            radio = radios.nth(i)
-            radio_id = await radio.get_attribute("id")
-            if radio_id:
-                label_elem = self.page.locator(f"label[for='{radio_id}']")
-                if await label_elem.count() > 0:
-                    text = await label_elem.text_content()
-                    if text:
-                        # Bereinigen (Whitespace entfernen)
-                        methods.append(text.strip().split("\n")[0].strip())
-        return methods
+        rows = await self.extract_all(self.PAYMENT_METHOD_RADIO, {"label": DomField(read="label")})
+        return [_payment_label(row["label"]) for row in rows if row["label"]]
 
     # =========================================================================
     # Versandart
     # =========================================================================
 
+    @timed_step("select_shipping_method")
     async def select_shipping_method(self, method: str) -> None:
         """
         Wählt eine Versandart aus.
@@ -543,25 +589,14 @@ class CheckoutPage(BasePage):
 
     async def get_available_shipping_methods(self) -> list[str]:
         """Gibt alle verfügbaren Versandarten zurück."""
-        methods = []
-        radios = self.page.locator(self.SHIPPING_METHOD_RADIO)
-        count = await radios.count()
-
-        for i in range(count):
-            radio = radios.nth(i)
-            radio_id = await radio.get_attribute("id")
-            if radio_id:
-                label_elem = self.page.locator(f"label[for='{radio_id}']")
-                if await label_elem.count() > 0:
-                    text = await label_elem.text_content()
-                    if text:
-                        methods.append(text.strip())
-        return methods
+        rows = await self.extract_all(self.SHIPPING_METHOD_RADIO, {"label": DomField(read="label")})
+        return [row["label"] for row in rows if row["label"]]
 
     # =========================================================================
     # AGB & Bestellung abschließen
     # =========================================================================
 
+    @timed_step("accept_terms")
     async def accept_terms(self) -> None:
         """Akzeptiert AGB auf der Confirm-Seite."""
         tos = self.page.locator(self.TOS_CHECKBOX)
@@ -569,8 +604,11 @@ class CheckoutPage(BasePage):
             if not await tos.is_checked():
                 await tos.check()
 
+    @timed_step("place_order")
     async def place_order(self) -> None:
         """Klickt auf den Bestellen-Button."""
+        if self._submit_callback:
+            self._submit_callback()
         submit_btn = self.page.locator(self.SUBMIT_ORDER_BUTTON)
         if await submit_btn.count() > 0 and await submit_btn.first.is_visible():
             await submit_btn.first.click()
@@ -581,6 +619,7 @@ class CheckoutPage(BasePage):
         if await submit_btn_alt.count() > 0:
             await submit_btn_alt.click()
 
+    @timed_step("wait_for_confirmation")
     async def wait_for_confirmation(self, timeout: int = 30000) -> None:
         """Wartet auf die Bestellbestätigung."""
         await self.page.wait_for_url("**/checkout/finish**", timeout=timeout)
@@ -619,6 +658,7 @@ class CheckoutPage(BasePage):
     # Kompletter Checkout-Flow
     # =========================================================================
 
+    @timed_step("accept_privacy_and_continue")
     async def accept_privacy_and_continue(self) -> None:
         """Akzeptiert Datenschutz und navigiert zur Confirm-Seite."""
         # Datenschutz-Checkbox akzeptieren
@@ -706,7 +746,8 @@ class CheckoutPage(BasePage):
         email: str,
         password: str,
         payment_method: str = "invoice",
-        shipping_method: Optional[str] = None
+        shipping_method: Optional[str] = None,
+        auth_state=None,
     ) -> CheckoutResult:
         """
         Führt einen Checkout für registrierte Kunden durch.
@@ -716,6 +757,8 @@ class CheckoutPage(BasePage):
             password: Kunden-Passwort
             payment_method: Zahlungsart
             shipping_method: Versandart (optional)
+            auth_state: ``AuthStateCache`` statt Login-Formular (Warenkorb
+                muss dann schon in der Kunden-Session liegen)
 
         Returns:
             CheckoutResult mit Erfolg/Misserfolg und Details
@@ -725,7 +768,11 @@ class CheckoutPage(BasePage):
 
         try:
             # Login
-            await self.login(email, password)
+            if auth_state:
+                await self.restore_login(auth_state, email, password)
+                await self.goto_confirm()
+            else:
+                await self.login(email, password)
 
             # Falls nicht automatisch auf Confirm-Seite
             if "confirm" not in self.page.url:
@@ -807,11 +854,23 @@ class CheckoutPage(BasePage):
 
     async def get_form_errors(self) -> list[str]:
         """Gibt alle Formularfehler zurück."""
-        errors = []
-        error_elements = self.page.locator(self.FORM_ERROR)
-        count = await error_elements.count()
-        for i in range(count):
-            text = await error_elements.nth(i).text_content()
-            if text and text.strip():
-                errors.append(text.strip())
-        return errors
+        rows = await self.extract_all(self.FORM_ERROR, {"text": DomField()})
+        return [row["text"] for row in rows if row["text"]]
+
+    async def read_confirm_summary(self) -> ConfirmSummary:
+        """
+        Liest Adressen, Zahlungs-/Versandarten, Summen und Fehler der
+        Confirm-Seite in einer Browser-Runde.
+        """
+        view = await self.extract(self.CONFIRM_SUMMARY_FIELDS)
+        return ConfirmSummary(
+            shipping_address=view["shipping_address"],
+            billing_address=view["billing_address"],
+            payment_methods=[_payment_label(text) for text in view["payment_methods"] or [] if text],
+            selected_payment_method=view["selected_payment_method"],
+            shipping_methods=[text for text in view["shipping_methods"] or [] if text],
+            selected_shipping_method=view["selected_shipping_method"],
+            subtotal=view["subtotal"],
+            total=view["total"],
+            form_errors=[text for text in view["form_errors"] or [] if text],
+        )
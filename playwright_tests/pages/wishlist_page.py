@@ -10,6 +10,8 @@ from typing import Optional
 
 from playwright.async_api import Page
 
+from ..utils.dom_extract import DomField
+from ..utils.readiness import click_and_wait_for_cart_async
 from .base_page import BasePage
 
 
@@ -58,7 +60,7 @@ class WishlistPage(BasePage):
         wishlist_btn = self.page.locator(self.WISHLIST_BUTTON)
         if await wishlist_btn.count() > 0:
             await wishlist_btn.first.click()
-            await self.page.wait_for_timeout(2000)
+            await self.wait_for_settled()
 
     async def is_product_on_wishlist(self) -> bool:
         """Prueft ob das aktuelle Produkt auf der Merkliste ist (Herz aktiv)."""
@@ -79,8 +81,7 @@ class WishlistPage(BasePage):
             True wenn erfolgreich
         """
         await self.navigate(f"/{product_path}")
-        await self.page.wait_for_load_state("domcontentloaded")
-        await self.page.wait_for_timeout(1000)
+        await self.wait_for_ready()
         await self.accept_cookies_if_visible()
 
         # Falls bereits auf Merkliste, nichts tun
@@ -97,7 +98,7 @@ class WishlistPage(BasePage):
     async def navigate_to_wishlist(self) -> None:
         """Navigiert zur Merklisten-Seite."""
         await self.navigate(self.WISHLIST_PATH)
-        await self.page.wait_for_timeout(1000)
+        await self.wait_for_ready()
 
     async def get_wishlist_count(self) -> int:
         """Gibt die Anzahl der Produkte auf der Merkliste zurueck."""
@@ -111,18 +112,8 @@ class WishlistPage(BasePage):
         Returns:
             Liste von Produktnamen
         """
-        names = []
-        products = self.page.locator(self.WISHLIST_PRODUCT)
-        count = await products.count()
-
-        for i in range(count):
-            product = products.nth(i)
-            name_el = product.locator(self.WISHLIST_PRODUCT_NAME)
-            if await name_el.count() > 0:
-                text = await name_el.first.text_content()
-                if text:
-                    names.append(text.strip())
-        return names
+        rows = await self.extract_all(self.WISHLIST_PRODUCT, {"name": DomField(self.WISHLIST_PRODUCT_NAME)})
+        return [row["name"] for row in rows if row["name"]]
 
     async def is_wishlist_empty(self) -> bool:
         """Prueft ob die Merkliste leer ist."""
@@ -147,12 +138,12 @@ class WishlistPage(BasePage):
         """
         forms = self.page.locator(".product-wishlist-form")
         if index < await forms.count():
-            await self.page.evaluate(f"""(idx) => {{
-                const forms = document.querySelectorAll('.product-wishlist-form');
-                if (forms[idx]) forms[idx].submit();
-            }}""", index)
-            await self.page.wait_for_load_state("domcontentloaded")
-            await self.page.wait_for_timeout(1000)
+            async with self.page.expect_navigation(wait_until="domcontentloaded", timeout=15000):
+                await self.page.evaluate(f"""(idx) => {{
+                    const forms = document.querySelectorAll('.product-wishlist-form');
+                    if (forms[idx]) forms[idx].submit();
+                }}""", index)
+            await self.wait_for_settled()
 
     async def add_item_to_cart(self, index: int = 0) -> None:
         """
@@ -166,8 +157,7 @@ class WishlistPage(BasePage):
             product = products.nth(index)
             cart_btn = product.locator(self.WISHLIST_ADD_TO_CART)
             if await cart_btn.count() > 0:
-                await cart_btn.first.click()
-                await self.page.wait_for_timeout(3000)
+                await click_and_wait_for_cart_async(self.page, cart_btn.first)
 
     async def clear_wishlist(self) -> None:
         """Entfernt alle Produkte von der Merkliste."""
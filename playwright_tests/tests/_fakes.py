@@ -0,0 +1,35 @@
+"""Gemeinsame Test-Doubles für die Unit-Tests ohne Browser."""
+import contextlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+
+class FakeEmitter:
+    """Minimaler Ersatz für Playwrights Event-Emitter (Kontext, Seite)."""
+
+    def __init__(self):
+        self.listeners = {}
+
+    def on(self, event, callback):
+        self.listeners.setdefault(event, []).append(callback)
+
+    def remove_listener(self, event, callback):
+        self.listeners[event].remove(callback)
+
+    def emit(self, event, *args):
+        for callback in list(self.listeners.get(event, [])):
+            callback(*args)
+
+
+@contextlib.contextmanager
+def serve_stub(handler_cls: type[BaseHTTPRequestHandler]) -> Iterator[str]:
+    """Startet einen lokalen Stub-Server auf freiem Port und liefert seine Basis-URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler_cls)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -11,10 +11,18 @@ Tests für:
 ⚠️ WARNING: Diese Tests dürfen NUR auf autorisierten Systemen ausgeführt werden!
 """
 
+import asyncio
+import functools
+
 import pytest
-from playwright.async_api import Page, BrowserContext
+from playwright.async_api import Page, BrowserContext, async_playwright
 from typing import Dict, List
 
+from playwright_tests.config import TestConfig
+from playwright_tests.utils.http_checkout import ACCOUNT_LOGIN
+from playwright_tests.utils.race_dispatch import format_race, race_barrier
+from playwright_tests.utils.storefront_html import StorefrontHtml
+
 
 @pytest.mark.pentest
 @pytest.mark.session
@@ -307,7 +315,8 @@ async def test_logout_invalidates_session(
 
 @pytest.mark.pentest
 @pytest.mark.session
-async def test_concurrent_session_limit(browser, base_url: str):
+@pytest.mark.asyncio
+async def test_concurrent_session_limit(config: TestConfig, base_url: str):
     """
     Testet, ob gleichzeitige Sessions limitiert sind.
 
@@ -315,11 +324,46 @@ async def test_concurrent_session_limit(browser, base_url: str):
     OWASP: A07:2021 - Identification and Authentication Failures
 
     Test-Ablauf:
-    1. Login in 5 verschiedenen Browser-Contexts
-    2. Prüfen, ob alle 5 Sessions aktiv sind
-    3. Erwartung: Alte Sessions sollten invalidiert werden
+    1. ``race_tests.participants`` Request-Kontexte laden das Login-Formular
+    2. Alle Logins desselben Kunden gleichzeitig absenden (Barriere)
+    3. Prüfen, wie viele Sessions danach /account erreichen
+    4. Erwartung: Höchstens ``race_tests.max_sessions_per_customer`` (0 = nur berichten)
     """
-    pytest.skip("Test requires login credentials - implementation template")
+    customer = config.get_registered_customer(0)
+    password = config.get_customer_password(customer) if customer else ""
+    if not customer or not password:
+        pytest.skip("Kein registrierter Testkunde mit Passwort konfiguriert")
+
+    race = config.race_tests
+    options = {}
+    if config.htaccess_user and config.htaccess_password:
+        options["http_credentials"] = {"username": config.htaccess_user, "password": config.htaccess_password}
+    login_url = f"{base_url.rstrip('/')}{ACCOUNT_LOGIN}"
+
+    async with async_playwright() as p:
+        contexts = [await p.request.new_context(**options) for _ in range(race.participants)]
+        try:
+            actions = []
+            for context in contexts:
+                form = StorefrontHtml(await (await context.get(login_url)).text()).form(ACCOUNT_LOGIN)
+                data = {"username": customer.email, "password": password}
+                actions.append(functools.partial(context.post, login_url, form=form.data(data) if form else data))
+            report = await race_barrier(actions, timeout=race.timeout_seconds)
+            logged_in = report.count(lambda r: r.ok and ACCOUNT_LOGIN not in r.url)
+
+            account_url = f"{base_url.rstrip('/')}/account"
+            responses = await asyncio.gather(*(context.get(account_url) for context in contexts))
+            active = sum(1 for response in responses if response.ok and ACCOUNT_LOGIN not in response.url)
+        finally:
+            await asyncio.gather(*(context.dispose() for context in contexts))
+
+    print(f"\n{format_race(report)}")
+    print(f"Logins erfolgreich: {logged_in}/{race.participants}, danach aktive Sessions: {active}")
+    if race.max_sessions_per_customer:
+        assert active <= race.max_sessions_per_customer, (
+            f"{active} gleichzeitige Sessions für {customer.email} aktiv "
+            f"(erlaubt: {race.max_sessions_per_customer})"
+        )
 
 
 @pytest.mark.pentest
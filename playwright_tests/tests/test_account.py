@@ -522,7 +522,7 @@ async def test_login_wrong_credentials_fails(config, request):
 @pytest.mark.asyncio
 @pytest.mark.account
 @pytest.mark.feature
-async def test_profile_view_and_edit(config, request):
+async def test_profile_view_and_edit(config, request, auth_state):
     """
     TC-ACC-007: Profil anzeigen und bearbeiten.
 
@@ -549,7 +549,8 @@ async def test_profile_view_and_edit(config, request):
                 "password": config.htaccess_password,
             }
 
-        context = await browser.new_context(**context_args)
+        # Bereits angemeldet: Storage-State aus dem Login-Cache (ein UI-Login pro Kunde und Lauf)
+        context = await auth_state.new_context_async(browser, email, password, **context_args)
         page = await context.new_page()
 
         try:
@@ -557,10 +558,8 @@ async def test_profile_view_and_edit(config, request):
 
             # Login
             print("[1] Login...")
-            await account.goto_login()
-            await accept_cookie_banner_async(page)
-            success = await account.login(email, password)
-            assert success, "Login fehlgeschlagen"
+            await account.goto_profile()
+            assert not await account.is_on_login_page(), "Login fehlgeschlagen"
 
             # Zur Profil-Übersicht navigieren
             print("[2] Profil anzeigen...")
@@ -604,7 +603,7 @@ async def test_profile_view_and_edit(config, request):
 @pytest.mark.asyncio
 @pytest.mark.account
 @pytest.mark.feature
-async def test_address_management(config, request):
+async def test_address_management(config, request, auth_state):
     """
     TC-ACC-008: Adressverwaltung - hinzufügen, bearbeiten, löschen.
 
@@ -631,7 +630,8 @@ async def test_address_management(config, request):
                 "password": config.htaccess_password,
             }
 
-        context = await browser.new_context(**context_args)
+        # Bereits angemeldet: Storage-State aus dem Login-Cache (ein UI-Login pro Kunde und Lauf)
+        context = await auth_state.new_context_async(browser, email, password, **context_args)
         page = await context.new_page()
 
         try:
@@ -639,10 +639,8 @@ async def test_address_management(config, request):
 
             # Login
             print("[1] Login...")
-            await account.goto_login()
-            await accept_cookie_banner_async(page)
-            success = await account.login(email, password)
-            assert success, "Login fehlgeschlagen"
+            await account.goto_profile()
+            assert not await account.is_on_login_page(), "Login fehlgeschlagen"
 
             # Zur Adressverwaltung
             print("[2] Zur Adressverwaltung navigieren...")
@@ -707,7 +705,7 @@ async def test_address_management(config, request):
 @pytest.mark.asyncio
 @pytest.mark.account
 @pytest.mark.feature
-async def test_email_change_to_existing_email(config, request):
+async def test_email_change_to_existing_email(config, request, auth_state):
     """
     TC-ACCOUNT-011: E-Mail-Änderung auf bereits registrierte Adresse wird abgelehnt.
 
@@ -745,7 +743,8 @@ async def test_email_change_to_existing_email(config, request):
                 "password": config.htaccess_password,
             }
 
-        context = await browser.new_context(**context_args)
+        # Bereits angemeldet: Storage-State aus dem Login-Cache (ein UI-Login pro Kunde und Lauf)
+        context = await auth_state.new_context_async(browser, email_at, password_at, **context_args)
         page = await context.new_page()
 
         try:
@@ -753,10 +752,8 @@ async def test_email_change_to_existing_email(config, request):
 
             # Login als AT-Kunde
             print("[1] Login als AT-Kunde...")
-            await account.goto_login()
-            await accept_cookie_banner_async(page)
-            success = await account.login(email_at, password_at)
-            assert success, "Login als AT-Kunde fehlgeschlagen"
+            await account.goto_profile()
+            assert not await account.is_on_login_page(), "Login als AT-Kunde fehlgeschlagen"
 
             # Zur Profil-Bearbeitungsseite navigieren
             print("[2] Navigiere zur Profil-Seite...")
@@ -806,7 +803,7 @@ async def test_email_change_to_existing_email(config, request):
 @pytest.mark.asyncio
 @pytest.mark.account
 @pytest.mark.feature
-async def test_address_edit_checkout_display(config, request):
+async def test_address_edit_checkout_display(config, request, auth_state):
     """
     TC-ACCOUNT-012: Adresse bearbeiten und im Checkout verifizieren.
 
@@ -837,7 +834,8 @@ async def test_address_edit_checkout_display(config, request):
                 "password": config.htaccess_password,
             }
 
-        context = await browser.new_context(**context_args)
+        # Bereits angemeldet: Storage-State aus dem Login-Cache (ein UI-Login pro Kunde und Lauf)
+        context = await auth_state.new_context_async(browser, email, password, **context_args)
         page = await context.new_page()
 
         try:
@@ -847,10 +845,8 @@ async def test_address_edit_checkout_display(config, request):
 
             # [1] Login
             print("[1] Login als AT-Kunde...")
-            await account.goto_login()
-            await accept_cookie_banner_async(page)
-            success = await account.login(email, password)
-            assert success, "Login fehlgeschlagen"
+            await account.goto_profile()
+            assert not await account.is_on_login_page(), "Login fehlgeschlagen"
 
             # [2] Zur Adressverwaltung und aktuelle Straße merken
             print("[2] Zur Adressverwaltung navigieren...")
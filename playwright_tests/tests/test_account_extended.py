@@ -6,17 +6,19 @@ import pytest
 from playwright.sync_api import Page, expect
 
 from ..conftest import accept_cookie_banner
+from ..utils.auth_state import AuthStateError
 
 
 # =============================================================================
 # Hilfsfunktionen
 # =============================================================================
 
-def _perform_login(page: Page, base_url: str, config) -> bool:
+def _perform_login(page: Page, base_url: str, config, auth_state, fresh: bool = False) -> bool:
     """
     Hilfsfunktion: Login mit Test-Account durchfuehren.
 
-    Verwendet die Konfiguration aus config.yaml.
+    Verwendet die Konfiguration aus config.yaml und den Login-Cache
+    (ein UI-Login pro Kunde und Lauf). ``fresh`` verwirft den gecachten State.
     Returns True bei Erfolg, False bei Fehler.
     """
     # Zugangsdaten aus config holen
@@ -31,30 +33,16 @@ def _perform_login(page: Page, base_url: str, config) -> bool:
     except Exception:
         return False
 
-    # Login-Seite aufrufen
-    page.goto(f"{base_url}/account/login")
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1000)
-    accept_cookie_banner(page)
-
-    # Login-Formular ausfuellen
-    email_field = page.locator("#loginMail")
-    password_field = page.locator("#loginPassword")
-
-    if email_field.count() == 0 or password_field.count() == 0:
+    if fresh:
+        auth_state.invalidate(email)
+    try:
+        auth_state.apply(page.context, email, password)
+    except AuthStateError:
         return False
 
-    email_field.fill(email)
-    password_field.fill(password)
-
-    # Login-Button klicken
-    login_btn = page.locator("button[type='submit'].login-submit-btn, .login-submit-btn")
-    if login_btn.count() > 0:
-        login_btn.first.click()
-    else:
-        password_field.press("Enter")
-
-    page.wait_for_timeout(3000)
+    page.goto(f"{base_url}/account")
+    page.wait_for_load_state("domcontentloaded")
+    accept_cookie_banner(page)
 
     # Pruefen ob Login erfolgreich
     return "/account" in page.url and "/login" not in page.url
@@ -156,7 +144,7 @@ def test_password_reset_request(page: Page, base_url: str):
 
 @pytest.mark.account
 @pytest.mark.feature
-def test_order_history(page: Page, base_url: str, config):
+def test_order_history(page: Page, base_url: str, config, auth_state):
     """
     TC-ACCOUNT-010: Bestellhistorie einsehen.
 
@@ -167,7 +155,7 @@ def test_order_history(page: Page, base_url: str, config):
 
     # Schritt 1: Login durchfuehren
     print("[1] Login durchfuehren...")
-    login_success = _perform_login(page, base_url, config)
+    login_success = _perform_login(page, base_url, config, auth_state)
 
     if not login_success:
         pytest.skip("Login fehlgeschlagen - Keine Test-Zugangsdaten konfiguriert")
@@ -188,7 +176,7 @@ def test_order_history(page: Page, base_url: str, config):
     # Falls auf Login-Seite umgeleitet, Login erneut versuchen
     if "/login" in current_url:
         print("   Auf Login-Seite umgeleitet, erneuter Login...")
-        login_success = _perform_login(page, base_url, config)
+        login_success = _perform_login(page, base_url, config, auth_state, fresh=True)
         if not login_success:
             pytest.skip("Login nach Umleitung fehlgeschlagen")
         page.goto(f"{base_url}/account/order")
@@ -0,0 +1,109 @@
+"""Tests für die adaptive Parallelität (AIMD-Regelung, ohne Browser)."""
+import asyncio
+
+import pytest
+
+from playwright_tests.config import AdaptiveConcurrencyConfig
+from playwright_tests.utils.adaptive_concurrency import (
+    AdaptiveLimiter,
+    format_concurrency,
+    merge_concurrency_reports,
+)
+
+
+def feed(limiter: AdaptiveLimiter, windows: int, success: bool = True, seconds: float = 20.0) -> None:
+    for _ in range(windows * limiter.window):
+        limiter.record(success, seconds)
+
+
+def test_additive_increase_until_max():
+    limiter = AdaptiveLimiter(initial=3, max_limit=5, window=2)
+
+    feed(limiter, windows=4)
+
+    assert limiter.limit == 5
+    assert limiter.stats.peak_limit == 5
+    assert limiter.stats.knee_point is None
+    assert limiter.stats.sustainable_concurrency == 5  # gesundes Fenster bei Limit 5
+
+
+def test_errors_back_off_and_mark_knee():
+    limiter = AdaptiveLimiter(initial=10, window=4, decrease_factor=0.5)
+
+    feed(limiter, windows=2)  # 10 -> 11 -> 12
+    feed(limiter, windows=1, success=False)  # 12 -> 6
+
+    assert limiter.limit == 6
+    assert limiter.stats.knee_point == 12
+    assert limiter.stats.sustainable_concurrency == 11
+
+
+def test_latency_growth_counts_as_saturation():
+    limiter = AdaptiveLimiter(initial=4, window=3, latency_tolerance=1.5, decrease_factor=0.5)
+
+    feed(limiter, windows=1, seconds=20.0)  # Basis 20s, 4 -> 5
+    feed(limiter, windows=1, seconds=29.0)  # unter 30s: gesund, 5 -> 6
+    feed(limiter, windows=1, seconds=45.0)  # über 30s: Absenkung 6 -> 3
+
+    assert limiter.stats.baseline_seconds == 20.0
+    assert limiter.limit == 3
+    report = limiter.stats.to_dict()
+    assert (report["knee_point"], report["sustainable_concurrency"], report["backoffs"]) == (6, 5, 1)
+    assert "Knie bei 6" in format_concurrency(report)
+
+
+def test_min_limit_is_respected():
+    limiter = AdaptiveLimiter(initial=2, min_limit=2, window=1, decrease_factor=0.5)
+
+    feed(limiter, windows=3, success=False)
+
+    assert limiter.limit == 2
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(initial=5, min_limit=10, max_limit=5)
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(initial=5, decrease_factor=1.0)
+
+
+def test_from_config_defaults_max_to_three_times_workers():
+    limiter = AdaptiveLimiter.from_config(AdaptiveConcurrencyConfig(enabled=True), parallel_workers=4)
+
+    assert (limiter.limit, limiter.min_limit, limiter.max_limit) == (4, 1, 12)
+
+
+@pytest.mark.asyncio
+async def test_limiter_bounds_in_flight_and_grows():
+    limiter = AdaptiveLimiter(initial=2, max_limit=4, window=2)
+    peak = 0
+
+    async def order() -> None:
+        nonlocal peak
+        async with limiter:
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)  # readiness: allow-sleep (simulierte Bestellung)
+        limiter.record(True, 1.0)
+
+    await asyncio.gather(*[order() for _ in range(12)])
+
+    assert limiter.in_flight == 0
+    assert peak > 2  # Limit wurde während des Laufs erhöht
+    assert peak <= limiter.stats.peak_limit
+    await asyncio.sleep(0)  # readiness: allow-sleep (Weck-Tasks abschliessen lassen)
+    assert not limiter._wake_tasks
+
+
+def test_merge_reports_sums_shards():
+    first = AdaptiveLimiter(initial=4, window=1)
+    second = AdaptiveLimiter(initial=6, window=1)
+    feed(first, windows=1)
+    feed(second, windows=1)
+
+    merged = merge_concurrency_reports([first.stats.to_dict(), second.stats.to_dict(), None])
+
+    assert merged["initial_limit"] == 10
+    assert merged["sustainable_concurrency"] == 10
+    assert merged["knee_point"] is None
+    assert len(merged["shards"]) == 2
+    assert merge_concurrency_reports([]) is None
@@ -0,0 +1,116 @@
+"""Tests für den Open-Loop Ankunftsraten-Scheduler."""
+import asyncio
+
+import pytest
+
+from playwright_tests.utils.arrival_scheduler import (
+    ArrivalProfile,
+    ArrivalProfileType,
+    OpenLoopScheduler,
+)
+
+
+def test_constant_profile_evenly_spaced():
+    """Konstante Rate: 60/min ergibt 1s Abstand."""
+    offsets = ArrivalProfile.from_name("constant", 60).schedule(4)
+    assert offsets == pytest.approx([0.0, 1.0, 2.0, 3.0], abs=0.002)
+
+
+def test_ramp_profile_gaps_shrink():
+    """Rampe: Abstände werden mit steigender Rate kleiner."""
+    profile = ArrivalProfile(
+        profile_type=ArrivalProfileType.RAMP,
+        rate_per_minute=120,
+        start_rate_per_minute=10,
+        ramp_seconds=60,
+    )
+    offsets = profile.schedule(20)
+    gaps = [b - a for a, b in zip(offsets, offsets[1:])]
+    assert gaps[0] > gaps[-1]
+    assert profile.rate_at(0) == 10
+    assert profile.rate_at(120) == 120
+
+
+def test_step_profile_caps_at_target_rate():
+    """Stufen: Rate steigt pro Stufe und bleibt bei der Zielrate stehen."""
+    profile = ArrivalProfile(
+        profile_type=ArrivalProfileType.STEP,
+        rate_per_minute=20,
+        start_rate_per_minute=10,
+        step_rate_per_minute=5,
+        step_seconds=30,
+    )
+    assert profile.rate_at(0) == 10
+    assert profile.rate_at(31) == 15
+    assert profile.rate_at(300) == 20
+
+
+def test_poisson_profile_reproducible_with_seed():
+    """Poisson-Ankünfte sind mit Seed reproduzierbar und monoton."""
+    a = ArrivalProfile.from_name("poisson", 30, seed=42).schedule(10)
+    b = ArrivalProfile.from_name("poisson", 30, seed=42).schedule(10)
+    assert a == b
+    assert all(x < y for x, y in zip(a, a[1:]))
+
+
+def test_unknown_profile_raises():
+    """Unbekannter Profilname liefert verständlichen Fehler."""
+    with pytest.raises(ValueError, match="Ankunftsprofil"):
+        ArrivalProfile.from_name("burst", 10)
+
+
+def test_invalid_durations_raise():
+    """Stufendauer 0 bzw. negative Rampendauer werden vor der Planung abgelehnt."""
+    with pytest.raises(ValueError, match="step_seconds"):
+        ArrivalProfile.from_name("step", 20, step_seconds=0).schedule(3)
+    with pytest.raises(ValueError, match="ramp_seconds"):
+        ArrivalProfile.from_name("ramp", 20, ramp_seconds=-5).schedule(3)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_starts_independent_of_completion():
+    """Open-Loop: langsame Bestellungen verzögern spätere Starts nicht."""
+    scheduler = OpenLoopScheduler(ArrivalProfile.from_name("constant", 1200))  # 50 ms Abstand
+
+    async def slow_order(i: int) -> int:
+        await asyncio.sleep(0.3)  # readiness: allow-sleep (simulierte Bestellung)
+        return i
+
+    results = await scheduler.run(5, slow_order)
+
+    assert results == [0, 1, 2, 3, 4]
+    assert scheduler.stats.peak_in_flight == 5
+    assert scheduler.stats.max_lag_seconds < 0.1
+    assert scheduler.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_records_lag_when_capped():
+    """Mit Sicherheitsgrenze wird die Verspätung als Lag sichtbar."""
+    scheduler = OpenLoopScheduler(ArrivalProfile.from_name("constant", 6000), max_in_flight=1)
+
+    async def slow_order(i: int) -> int:
+        await asyncio.sleep(0.1)  # readiness: allow-sleep (simulierte Bestellung)
+        return i
+
+    await scheduler.run(3, slow_order)
+
+    assert scheduler.stats.peak_in_flight == 1
+    assert scheduler.stats.max_lag_seconds >= 0.1
+    assert scheduler.stats.to_dict()["started_orders"] == 3
+
+
+@pytest.mark.asyncio
+async def test_scheduler_returns_exceptions():
+    """Fehler einzelner Bestellungen brechen den Lauf nicht ab."""
+    scheduler = OpenLoopScheduler(ArrivalProfile.from_name("constant", 6000))
+
+    async def order(i: int) -> int:
+        if i == 1:
+            raise RuntimeError("kaputt")
+        return i
+
+    results = await scheduler.run(3, order)
+
+    assert results[0] == 0
+    assert isinstance(results[1], RuntimeError)
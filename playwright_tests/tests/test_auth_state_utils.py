@@ -0,0 +1,150 @@
+"""Tests für den Login-Cache registrierter Kunden (ohne Browser)."""
+import asyncio
+import json
+import os
+import time
+
+import pytest
+
+from playwright_tests.utils.auth_state import (
+    AuthStateCache,
+    AuthStateError,
+    format_auth_stats,
+    is_fresh,
+    state_path,
+)
+
+
+SESSION = {"name": "session-", "value": "abc", "domain": "shop.example", "path": "/", "expires": -1}
+CONSENT = {"name": "cookie-preference", "value": "1", "domain": "shop.example", "path": "/", "expires": -1}
+
+
+class FakeBrowser:
+    """Zählt Logins und Session-Prüfungen; ``account_status`` ist die Antwort auf GET /account."""
+
+    def __init__(self, password: str = "geheim", account_status: int = 200):
+        self.password = password
+        self.account_status = account_status
+        self.logins = 0
+        self.checks = 0
+
+    async def new_context(self, **options):
+        return FakeContext(self, options)
+
+
+class FakeContext:
+    def __init__(self, browser: FakeBrowser, options: dict):
+        self.browser = browser
+        self.options = options
+        self.cookies: list[dict] = []
+        self.request = self
+
+    async def get(self, url, max_redirects=None):
+        assert url.endswith("/account") and max_redirects == 0
+        self.browser.checks += 1
+        return type("Response", (), {"status": self.browser.account_status})()
+
+    async def new_page(self):
+        return FakePage(self)
+
+    async def add_cookies(self, cookies):
+        self.cookies.extend(cookies)
+
+    async def storage_state(self):
+        return {"cookies": [SESSION, CONSENT], "origins": []}
+
+    async def close(self):
+        pass
+
+
+class FakePage:
+    def __init__(self, context: FakeContext):
+        self.context = context
+        self.url = ""
+        self.password = ""
+
+    async def goto(self, url, timeout=None):
+        self.url = url
+
+    async def wait_for_load_state(self, state):
+        await asyncio.sleep(0.01)  # readiness: allow-sleep (simuliertes Laden)
+
+    async def fill(self, selector, value):
+        self.password = value
+
+    async def click(self, selector):
+        self.context.browser.logins += 1
+        if self.password == self.context.browser.password:
+            self.url = "https://shop.example/account"
+
+
+def test_state_freshness_and_path(tmp_path):
+    now = time.time()
+    state = {"cookies": [SESSION, CONSENT]}
+
+    assert is_fresh(state, now - 60, 1800, now)
+    assert not is_fresh(state, now - 1800, 1800, now)
+    assert not is_fresh({"cookies": [CONSENT]}, now, 1800, now)
+    assert not is_fresh({"cookies": [{**SESSION, "expires": now - 1}]}, now, 1800, now)
+
+    path = state_path(tmp_path, "staging", " Ge-AT-1+x@Example.com ")
+    assert path == tmp_path / "staging" / "ge-at-1_x@example.com.json"
+
+
+@pytest.mark.asyncio
+async def test_customer_logs_in_once_per_run_and_reuses_saved_state(tmp_path):
+    browser = FakeBrowser()
+    cache = AuthStateCache("https://shop.example/", profile="staging", directory=tmp_path)
+
+    # Parallele Worker: nur einer meldet sich an
+    states = await asyncio.gather(*[cache.state_for_async(browser, "kunde@example.com", "geheim") for _ in range(5)])
+    assert browser.logins == 1 and all(state is states[0] for state in states)
+    assert cache.stats.memory_hits == 4
+
+    context = await browser.new_context()
+    await cache.apply_async(context, "kunde@example.com", "geheim")
+    assert context.cookies == [SESSION, CONSENT]
+    clone = await cache.new_context_async(browser, "kunde@example.com", "geheim", locale="de-AT")
+    assert clone.options == {"locale": "de-AT", "storage_state": states[0]}
+    assert browser.logins == 1
+
+    # Nächster Lauf: gespeicherter State wird mit einem GET geprüft und übernommen
+    saved = state_path(tmp_path, "staging", "kunde@example.com")
+    assert json.loads(saved.read_text())["cookies"] == [SESSION, CONSENT]
+    next_run = AuthStateCache("https://shop.example", profile="staging", directory=tmp_path)
+    await next_run.state_for_async(browser, "kunde@example.com", "geheim")
+    assert (browser.logins, browser.checks, next_run.stats.disk_hits) == (1, 1, 1)
+
+    # Abgemeldete Session auf dem Server: neu anmelden
+    browser.account_status = 302
+    stale = AuthStateCache("https://shop.example", profile="staging", directory=tmp_path)
+    await stale.state_for_async(browser, "kunde@example.com", "geheim")
+    assert (browser.logins, stale.stats.rejected) == (2, 1)
+
+    # Zu alter State: ohne Prüfung verworfen
+    os.utime(saved, (time.time() - 3600, time.time() - 3600))
+    old = AuthStateCache("https://shop.example", profile="staging", directory=tmp_path)
+    await old.state_for_async(browser, "kunde@example.com", "geheim")
+    assert (browser.logins, browser.checks) == (3, 2)
+    assert format_auth_stats(old.stats.to_dict()) == "1 Logins, 0 wiederverwendet (0 von Platte), 1 verworfen, 0 ungültig geworden"
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_and_failed_login(tmp_path):
+    browser = FakeBrowser()
+    cache = AuthStateCache("https://shop.example", directory=tmp_path, enabled=False)
+    await cache.state_for_async(browser, "kunde@example.com", "geheim")
+    await cache.state_for_async(browser, "kunde@example.com", "geheim")
+    assert browser.logins == 2
+    assert not any(tmp_path.iterdir())
+
+    cache = AuthStateCache("https://shop.example", directory=tmp_path)
+    with pytest.raises(AuthStateError, match="kunde@example.com"):
+        await cache.state_for_async(browser, "kunde@example.com", "falsch")
+    assert not any(tmp_path.iterdir())
+
+    await cache.state_for_async(browser, "kunde@example.com", "geheim")
+    cache.invalidate("kunde@example.com")
+    assert not state_path(tmp_path, "", "kunde@example.com").exists()
+    await cache.state_for_async(browser, "kunde@example.com", "geheim")
+    assert browser.logins == 5
@@ -0,0 +1,119 @@
+"""Tests für den Stöber-Traffic (gegen einen lokalen Stub-Server, ohne Browser)."""
+import asyncio
+from collections import Counter
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+from playwright.async_api import async_playwright
+
+from playwright_tests.tests._fakes import serve_stub
+from playwright_tests.utils.browse_traffic import (
+    BrowseStats,
+    BrowseTarget,
+    BrowseTraffic,
+    browse_targets,
+    format_browse_stats,
+)
+from playwright_tests.utils.journey_model import JourneyModel, JourneyPage
+
+
+@pytest.fixture
+def shop():
+    """Liefert Listing und Produktseite; die Suche ist kaputt (500)."""
+    hits: Counter = Counter()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            hits[self.path] += 1
+            status = 500 if self.path.startswith("/search") else 200
+            self.send_response(status)
+            self.send_header("Content-Type", "text/html")
+            self.end_headers()
+            self.wfile.write(b"<html></html>")
+
+    with serve_stub(Handler) as base_url:
+        yield base_url, hits
+
+
+def test_browse_targets_and_stats():
+    targets = browse_targets(["/moebel/"], ["bett decke"], ["p/duftkissen/ge-p-49415"])
+    assert targets == [
+        BrowseTarget("listing", "/moebel/"),
+        BrowseTarget("search", "/search?search=bett+decke"),
+        BrowseTarget("pdp", "p/duftkissen/ge-p-49415"),
+    ]
+
+    stats = BrowseStats(users=2, duration_seconds=2.0)
+    stats.record("pdp", 0.2, ok=True)
+    stats.record("pdp", 0.4, ok=True)
+    stats.record("search", 1.0, ok=False)
+    data = stats.to_dict()
+    assert data["requests"] == 3
+    assert data["errors"] == 1
+    assert data["requests_per_second"] == 1.5
+    assert data["by_kind"]["pdp"]["count"] == 2
+    assert data["by_kind"]["search"] == {"requests": 1, "errors": 1, "requests_per_second": 0.5}
+    assert format_browse_stats(data)[0] == "2 Nutzer, 3 Seiten (1.5/s), 1 Fehler"
+
+    with pytest.raises(ValueError):
+        BrowseTraffic(None, "http://shop", [], users=1)
+
+
+@pytest.mark.asyncio
+async def test_browse_traffic_runs_until_stopped(shop):
+    base_url, hits = shop
+    targets = browse_targets(["/moebel/"], ["kissen"], ["p/duftkissen/ge-p-49415"])
+
+    async with async_playwright() as p:
+        traffic = BrowseTraffic(p.request, base_url, targets, users=3, think_time_seconds=0.02, seed=7)
+        stop = asyncio.Event()
+        task = asyncio.create_task(traffic.run(stop))
+        await asyncio.sleep(1.0)  # readiness: allow-sleep (Laufzeit der Hintergrundlast)
+        stop.set()
+        stats = await asyncio.wait_for(task, timeout=5)
+
+    data = stats.to_dict()
+    assert data["users"] == 3
+    assert data["requests"] == sum(hits.values()) > 10
+    assert set(data["by_kind"]) <= {"listing", "search", "pdp"}
+    # Fehler nur bei der Suche
+    assert data["errors"] == data["by_kind"].get("search", {}).get("requests", 0)
+    assert stats.duration_seconds >= 1.0
+
+
+@pytest.mark.asyncio
+async def test_browse_traffic_follows_journeys(shop):
+    base_url, hits = shop
+    targets = browse_targets(["/moebel/"], ["kissen"], ["p/duftkissen/ge-p-49415"])
+    journey = JourneyModel(
+        {"listing": 1},
+        {
+            "listing": JourneyPage(think_seconds=0.01, think_sigma=0, next={"listing_page": 1}),
+            "listing_page": JourneyPage(think_seconds=0.01, think_sigma=0, next={"suggest": 1}),
+            "suggest": JourneyPage(think_seconds=0.01, think_sigma=0, next={"pdp": 1}),
+            "pdp": JourneyPage(think_seconds=0.01, think_sigma=0, next={"exit": 1}),
+        },
+    )
+
+    async with async_playwright() as p:
+        traffic = BrowseTraffic(
+            p.request, base_url, targets, users=4, think_time_seconds=0.02, seed=5, journey=journey,
+        )
+        stop = asyncio.Event()
+        task = asyncio.create_task(traffic.run(stop))
+        await asyncio.sleep(1.0)  # readiness: allow-sleep (Laufzeit der Hintergrundlast)
+        stop.set()
+        stats = await asyncio.wait_for(task, timeout=5)
+
+    data = stats.to_dict()
+    assert data["sessions"] > 4
+    assert data["pages_per_session"] == 4.0
+    assert set(data["by_kind"]) == {"listing", "listing_page", "suggest", "pdp"}
+    assert data["errors"] == 0
+    assert data["by_kind"]["pdp"]["requests_per_second"] > 0
+    # Jede Sitzung blättert in ihrer eigenen Kategorie ab Seite 2
+    assert hits["/moebel/?p=2"] == data["by_kind"]["listing_page"]["requests"]
+    assert any(path.startswith("/suggest?search=ki") for path in hits)
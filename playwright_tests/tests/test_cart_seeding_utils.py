@@ -0,0 +1,200 @@
+"""Tests für die Warenkorb-Befüllung per Request (gegen einen lokalen Stub-Server, ohne Browser)."""
+import json
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs
+
+import pytest
+from playwright.async_api import async_playwright
+from playwright.sync_api import sync_playwright
+
+from playwright_tests.tests._fakes import serve_stub
+from playwright_tests.utils.cart_seeding import (
+    CartSeeder,
+    CartSeedingError,
+    line_item_form,
+    parse_product_id,
+    product_number_from_path,
+)
+
+
+PRODUCT_ID = "0123456789abcdef0123456789abcdef"
+STORE_API_ID = "fedcba9876543210fedcba9876543210"
+ACCESS_KEY = "SWSCTESTKEY"
+
+PDP_HTML = f"""
+<form action="/checkout/line-item/add" method="post" class="buy-widget">
+    <input type="hidden" name="lineItems[{PRODUCT_ID}][id]" value="{PRODUCT_ID}">
+    <input type="hidden" name="lineItems[{PRODUCT_ID}][type]" value="product">
+    <button class="btn-buy">In den Warenkorb</button>
+</form>
+"""
+
+
+class StubShop:
+    """Minimaler Shopware-Ersatz: Produktseite, Store-API-Suche und Warenkorb pro Session."""
+
+    def __init__(self):
+        self.carts: dict[str, dict[str, int]] = {}
+        self.pdp_requests = 0
+        self.store_api_requests = 0
+        self.max_quantity = 10
+        shop = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _session(self) -> str:
+                cookie = self.headers.get("Cookie", "")
+                for part in cookie.split(";"):
+                    name, _, value = part.strip().partition("=")
+                    if name == "session-":
+                        return value
+                return ""
+
+            def _send(self, status: int, body: str, content_type: str = "text/html", cookie: str = ""):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                if cookie:
+                    self.send_header("Set-Cookie", cookie)
+                self.end_headers()
+                self.wfile.write(body.encode())
+
+            def do_GET(self):
+                if self.path.startswith("/p/"):
+                    shop.pdp_requests += 1
+                    html = PDP_HTML if "ge-p-" in self.path else "<p>Kein Produkt</p>"
+                    self._send(200, html)
+                else:
+                    self._send(404, "")
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode()
+                if self.path == "/store-api/product":
+                    shop.store_api_requests += 1
+                    if self.headers.get("sw-access-key") != ACCESS_KEY:
+                        self._send(401, "{}", "application/json")
+                        return
+                    number = json.loads(body)["filter"][0]["value"]
+                    elements = [{"id": STORE_API_ID, "productNumber": number}] if number == "49415" else []
+                    self._send(200, json.dumps({"elements": elements}), "application/json")
+                elif self.path == "/checkout/line-item/add":
+                    form = {k: v[0] for k, v in parse_qs(body).items()}
+                    product_id = next(v for k, v in form.items() if k.endswith("[id]"))
+                    if product_id not in (PRODUCT_ID, STORE_API_ID):
+                        self._send(400, "")
+                        return
+                    session = self._session() or f"s{len(shop.carts) + 1}"
+                    cart = shop.carts.setdefault(session, {})
+                    quantity = int(next(v for k, v in form.items() if k.endswith("[quantity]")))
+                    if cart.get(product_id, 0) + quantity > shop.max_quantity:
+                        # Wie Shopware: 200 mit Flash-Meldung im Offcanvas-Warenkorb
+                        alert = "<div class='alert alert-danger'><div class='alert-content'>Das Produkt ist nicht mehr verfuegbar.</div></div>"
+                        self._send(200, f"<div class='offcanvas-cart'>{alert}</div>", cookie=f"session-={session}; Path=/")
+                        return
+                    cart[product_id] = cart.get(product_id, 0) + quantity
+                    self._send(200, "<div class='offcanvas-cart'></div>", cookie=f"session-={session}; Path=/")
+                else:
+                    self._send(404, "")
+
+        self.handler = Handler
+        self.base_url = ""
+
+
+@pytest.fixture
+def shop():
+    stub = StubShop()
+    with serve_stub(stub.handler) as base_url:
+        stub.base_url = base_url
+        yield stub
+
+
+@pytest.fixture
+def request_context():
+    with sync_playwright() as p:
+        context = p.request.new_context()
+        yield context
+        context.dispose()
+
+
+def test_parse_helpers():
+    assert parse_product_id(PDP_HTML) == PRODUCT_ID
+    assert parse_product_id("<form></form>") is None
+    assert product_number_from_path("p/duftkissen-lavendel/ge-p-49415") == "49415"
+    assert product_number_from_path("p/ohne-nummer") is None
+
+    form = line_item_form(PRODUCT_ID, 3)
+    assert form[f"lineItems[{PRODUCT_ID}][referencedId]"] == PRODUCT_ID
+    assert form[f"lineItems[{PRODUCT_ID}][quantity]"] == "3"
+
+
+def test_seed_reads_id_from_product_page_and_caches_it(shop, request_context):
+    seeder = CartSeeder(shop.base_url)
+    paths = ["p/duftkissen-lavendel/ge-p-49415", "p/duftkissen-lavendel/ge-p-49415"]
+
+    result = seeder.seed(request_context, paths)
+    seeder.seed(request_context, paths[:1])
+
+    assert result.line_items == {PRODUCT_ID: 2}
+    assert result.quantity == 2
+    assert shop.pdp_requests == 1  # ID aus dem Cache
+    # Beide Aufrufe landen in derselben Session (Cookies des Request-Kontexts)
+    assert list(shop.carts.values()) == [{PRODUCT_ID: 3}]
+
+
+def test_seed_prefers_store_api_with_access_key(shop, request_context):
+    seeder = CartSeeder(shop.base_url, access_key=ACCESS_KEY)
+
+    result = seeder.seed(request_context, ["p/duftkissen-lavendel/ge-p-49415"])
+
+    assert result.line_items == {STORE_API_ID: 1}
+    assert shop.store_api_requests == 1
+    assert shop.pdp_requests == 0
+
+
+def test_store_api_miss_falls_back_to_product_page(shop, request_context):
+    seeder = CartSeeder(shop.base_url, access_key=ACCESS_KEY)
+
+    assert seeder.resolve(request_context, "p/polsterbett-almeno/ge-p-693278") == PRODUCT_ID
+    assert shop.store_api_requests == 1
+    assert shop.pdp_requests == 1
+
+
+def test_seed_raises_without_buy_form(shop, request_context):
+    seeder = CartSeeder(shop.base_url)
+
+    with pytest.raises(CartSeedingError):
+        seeder.seed(request_context, ["p/ohne-kaufformular"])
+
+
+def test_seed_raises_on_rejected_line_item(shop, request_context):
+    """Abgelehnte Position: HTTP 200, aber Flash-Meldung im Offcanvas-Warenkorb."""
+    shop.max_quantity = 2
+    seeder = CartSeeder(shop.base_url)
+
+    with pytest.raises(CartSeedingError, match="nicht mehr verfuegbar"):
+        seeder.seed(request_context, ["p/duftkissen-lavendel/ge-p-49415"], quantity=3)
+    assert list(shop.carts.values()) == [{}]
+
+
+@pytest.mark.asyncio
+async def test_seed_async(shop):
+    async with async_playwright() as p:
+        context = await p.request.new_context()
+        try:
+            seeder = CartSeeder(shop.base_url)
+            result = await seeder.seed_async(context, ["p/duftkissen-lavendel/ge-p-49415"], quantity=2)
+        finally:
+            await context.dispose()
+
+    assert result.line_items == {PRODUCT_ID: 2}
+    assert result.duration_seconds >= 0
+
+    shop.max_quantity = 0
+    async with async_playwright() as p:
+        context = await p.request.new_context()
+        try:
+            with pytest.raises(CartSeedingError, match="abgelehnt"):
+                await CartSeeder(shop.base_url).seed_async(context, ["p/duftkissen-lavendel/ge-p-49415"])
+        finally:
+            await context.dispose()
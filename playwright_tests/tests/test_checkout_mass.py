@@ -7,22 +7,56 @@ und wertet die Ergebnisse statistisch aus.
 Basiert auf dem funktionierenden Single-Checkout-Flow.
 """
 import asyncio
+import contextlib
+import functools
 import random
 import time
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from typing import Optional
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
 
 import pytest
 from playwright.async_api import Browser, BrowserContext, Page, async_playwright
 
+from playwright_tests.config import (
+    AdaptiveConcurrencyConfig,
+    CartSeedingConfig,
+    ContextPoolConfig,
+    NetworkTraceConfig,
+    ResultStreamConfig,
+    RunManifestConfig,
+)
 from playwright_tests.conftest import accept_cookie_banner_async
 from playwright_tests.pages.checkout_page import Address, CheckoutPage, CheckoutResult
+from playwright_tests.utils.adaptive_concurrency import AdaptiveLimiter, format_concurrency
+from playwright_tests.utils.arrival_scheduler import ArrivalProfile, OpenLoopScheduler, SchedulerStats
+from playwright_tests.utils.cart_seeding import CartSeeder, CartSeedingError
+from playwright_tests.utils.context_pool import BrowserContextPool, order_context
+from playwright_tests.utils.latency_histogram import LatencyHistogram, LatencyHistogramSet, format_percentiles
+from playwright_tests.utils.network_trace import NetworkTracer, format_network_trace
+from playwright_tests.utils.readiness import (
+    click_and_wait_for_cart_async,
+    close_offcanvas_cart_async,
+    submit_and_wait_for_page_async,
+    wait_for_page_ready_async,
+    wait_for_settled_async,
+)
+from playwright_tests.utils.request_blocking import RequestBlocker, format_blocking
+from playwright_tests.utils.result_stream import new_run_id, start_run_stream
+from playwright_tests.utils.results_history import RunKind, mass_metrics, record_run
+from playwright_tests.utils.run_manifest import OrderState, RunManifest
+from playwright_tests.utils.step_timing import StepStats, StepTimer
 
 
 @dataclass
 class MassTestResult:
-    """Aggregiertes Ergebnis eines Massentests."""
+    """
+    Aggregiertes Ergebnis eines Massentests.
+
+    Einzelergebnisse werden über ``record()`` inkrementell erfasst; mit
+    ``keep_order_results=False`` bleiben nur Zähler und Histogramme im Speicher.
+    """
     total_orders: int = 0
     successful_orders: int = 0
     failed_orders: int = 0
@@ -36,32 +70,139 @@ class MassTestResult:
     end_time: Optional[datetime] = None
     total_duration_seconds: float = 0.0
 
+    # Latenz-Verteilung erfolgreicher Bestellungen (gesamt und pro Checkout-Schritt)
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    latency_by_step: LatencyHistogramSet = field(default_factory=LatencyHistogramSet)
+    # Requests/Navigationen pro Checkout-Schritt (nur mit Schritt-Messung)
+    step_stats: StepStats = field(default_factory=StepStats)
+
+    keep_order_results: bool = True
     order_results: list[CheckoutResult] = field(default_factory=list)
     errors: list[dict] = field(default_factory=list)
 
-    def calculate_stats(self) -> None:
-        """Berechnet Statistiken aus den Einzelergebnissen."""
-        if not self.order_results:
-            return
+    # Open-Loop-Modus: Start-Verspätung (Coordinated Omission) und In-Flight
+    scheduler_stats: Optional[SchedulerStats] = None
+    corrected_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    avg_corrected_duration_seconds: float = 0.0
+    max_corrected_duration_seconds: float = 0.0
 
-        self.total_orders = len(self.order_results)
-        self.successful_orders = len([r for r in self.order_results if r.success])
-        self.failed_orders = self.total_orders - self.successful_orders
+    # Browser-Kontext-Pool (falls aktiviert)
+    context_pool_stats: Optional[dict] = None
 
-        if self.total_orders > 0:
-            self.success_rate = self.successful_orders / self.total_orders
+    # Blockier-Profil für Drittanbieter-Requests (falls aktiv)
+    request_blocking_stats: Optional[dict] = None
 
-        durations = [r.duration_seconds for r in self.order_results if r.success]
-        if durations:
-            self.avg_duration_seconds = sum(durations) / len(durations)
-            self.min_duration_seconds = min(durations)
-            self.max_duration_seconds = max(durations)
+    # Adaptive Parallelität: nachhaltige Parallelität und Knie-Punkt (falls aktiv)
+    concurrency_stats: Optional[dict] = None
 
-        self.errors = [
-            {"order_num": i, "error": r.error_message}
-            for i, r in enumerate(self.order_results)
-            if not r.success
-        ]
+    # Netzwerk-Aufzeichnung: gespeicherte Traces (falls aktiv)
+    network_trace_stats: Optional[dict] = None
+
+    # Ergebnis-Stream (JSONL mit allen Einzelergebnissen)
+    run_id: str = ""
+    stream_path: Optional[str] = None
+
+    # Fortgesetzter Lauf: aus früheren Durchgängen übernommene Bestellungen
+    carried_over_orders: int = 0
+    unresolved_orders: list[int] = field(default_factory=list)
+
+    def record(self, res: CheckoutResult, order_num: int, lag_seconds: float = 0.0) -> None:
+        """
+        Übernimmt ein Einzelergebnis.
+
+        Args:
+            res: Ergebnis der Bestellung
+            order_num: Laufende Nummer der Bestellung
+            lag_seconds: Start-Verspätung im Open-Loop-Modus
+        """
+        self.total_orders += 1
+        if res.success:
+            self.successful_orders += 1
+            self.latency.record(res.duration_seconds)
+            # Antwortzeit ab geplantem Start = Start-Lag + Bestelldauer
+            self.corrected_latency.record(res.duration_seconds + lag_seconds)
+            for step, seconds in res.step_durations.items():
+                self.latency_by_step.record(step, seconds)
+        else:
+            self.failed_orders += 1
+            self.errors.append({"order_num": order_num, "error": res.error_message, "trace": res.network_trace})
+        self.step_stats.record(res.steps)
+
+        if self.keep_order_results:
+            self.order_results.append(res)
+
+    def calculate_stats(self) -> None:
+        """Berechnet die abgeleiteten Kennzahlen aus Zählern und Histogrammen."""
+        # Direkt angehängte Einzelergebnisse (ohne record()) nachträglich übernehmen
+        if not self.total_orders and self.order_results:
+            lags = {}
+            if self.scheduler_stats:
+                lags = {s.order_num: s.lag_seconds for s in self.scheduler_stats.starts}
+            pending, self.order_results = self.order_results, []
+            for i, res in enumerate(pending):
+                self.record(res, i, lags.get(i, 0.0))
+
+        if not self.total_orders:
+            return
+
+        self.success_rate = self.successful_orders / self.total_orders
+
+        if self.latency.count:
+            self.avg_duration_seconds = self.latency.mean_seconds
+            self.min_duration_seconds = self.latency.min_seconds
+            self.max_duration_seconds = self.latency.max_seconds
+
+        if self.scheduler_stats and self.corrected_latency.count:
+            self.avg_corrected_duration_seconds = self.corrected_latency.mean_seconds
+            self.max_corrected_duration_seconds = self.corrected_latency.max_seconds
+
+    def to_dict(self) -> dict:
+        """Konvertiert das Ergebnis in ein Dictionary für JSON-Export."""
+        return {
+            "summary": {
+                "total_orders": self.total_orders,
+                "successful_orders": self.successful_orders,
+                "failed_orders": self.failed_orders,
+                "success_rate": round(self.success_rate * 100, 2),
+            },
+            "timing": {
+                "start_time": self.start_time.isoformat() if self.start_time else None,
+                "end_time": self.end_time.isoformat() if self.end_time else None,
+                "total_duration_seconds": round(self.total_duration_seconds, 2),
+            },
+            "latency": self.latency.to_dict(),
+            "latency_by_step": self.latency_by_step.to_dict(),
+            "steps": self.step_stats.summary(),
+            "corrected_latency": self.corrected_latency.to_dict() if self.scheduler_stats else None,
+            "scheduler": self.scheduler_stats.to_dict() if self.scheduler_stats else None,
+            "context_pool": self.context_pool_stats,
+            "request_blocking": self.request_blocking_stats,
+            "adaptive_concurrency": self.concurrency_stats,
+            "network_trace": self.network_trace_stats,
+            "errors": self.errors[:20],
+            "error_count": len(self.errors),
+            "run_id": self.run_id,
+            "stream": self.stream_path,
+            "resume": {
+                "carried_over_orders": self.carried_over_orders,
+                "unresolved_orders": self.unresolved_orders,
+            },
+        }
+
+
+def carried_result(state: str, data: Optional[dict]) -> CheckoutResult:
+    """
+    Baut das Ergebnis einer aus dem Manifest übernommenen Bestellung.
+
+    Abgeschickte Bestellungen ohne Bestätigung zählen als fehlgeschlagen und
+    werden nicht wiederholt (sie könnten im Shop bereits existieren).
+    """
+    if state == OrderState.SUCCEEDED and data:
+        return CheckoutResult(**data)
+    return CheckoutResult(
+        success=False,
+        error_message="Unklar: Bestellung abgeschickt, aber keine Bestätigung (nicht wiederholt)",
+    )
 
 
 def generate_test_address(order_num: int, prefix: str = "Bestellung") -> Address:
@@ -92,6 +233,9 @@ async def run_single_checkout(
     product_path: str,
     order_num: int,
     payment_method: str = "Rechnung",
+    timer: Optional[StepTimer] = None,
+    cart_seeder: Optional[CartSeeder] = None,
+    on_submit: Optional[Callable[[], None]] = None,
 ) -> CheckoutResult:
     """
     Führt einen einzelnen Checkout durch - basiert auf test_single_checkout.py.
@@ -110,80 +254,102 @@ async def run_single_checkout(
     11. Bestellung abschließen
     12. Bestätigung abwarten
 
+    Mit ``cart_seeder`` ersetzt eine Warenkorb-Befüllung per Request die
+    Schritte 1 und 3; das Cookie-Banner wird dann auf der Warenkorbseite akzeptiert.
+
     Args:
         context: Browser-Context mit HTTP-Credentials
         base_url: Shop-URL
         product_path: Produktpfad (z.B. "p/kurzarmshirt/ge-p-862990")
         order_num: Laufende Nummer für eindeutige Testdaten
         payment_method: Zahlungsart (Standard: "Rechnung")
+        timer: Optionale Schritt-Messung (Übernahme ins Ergebnis per ``timer.apply_to``)
+        cart_seeder: Warenkorb per Request befüllen statt über die Produktseite
+        on_submit: Wird direkt vor dem Absenden der Bestellung aufgerufen (Lauf-Manifest)
 
     Returns:
         CheckoutResult mit Erfolg/Misserfolg
     """
+    timer = timer or StepTimer(enabled=False)
+    timer.attach(context)
     start_time = time.time()
     page = await context.new_page()
 
     try:
-        # [1] Produkt laden
-        product_url = f"{base_url}/{product_path}"
-        await page.goto(product_url, timeout=60000)
-        await page.wait_for_load_state("networkidle")
-
-        # [2] Cookie-Banner akzeptieren
-        await accept_cookie_banner_async(page)
-
-        # [3] In den Warenkorb
-        add_btn = page.locator("button.btn-buy")
-        if await add_btn.count() == 0:
-            return CheckoutResult(
-                success=False,
-                error_message="Kein 'In den Warenkorb' Button gefunden",
-                duration_seconds=time.time() - start_time,
-            )
-        await add_btn.first.click()
-        await page.wait_for_timeout(3000)
-
-        # Offcanvas-Cart schließen falls offen
-        offcanvas_close = page.locator(".offcanvas-close, .btn-close, [data-bs-dismiss='offcanvas']")
-        if await offcanvas_close.count() > 0:
-            try:
-                if await offcanvas_close.first.is_visible(timeout=2000):
-                    await offcanvas_close.first.click()
-                    await page.wait_for_timeout(500)
-            except:
-                pass
-
-        # [4] Zum Warenkorb navigieren
-        await page.goto(f"{base_url}/checkout/cart")
-        await page.wait_for_load_state("domcontentloaded")
-        await page.wait_for_timeout(1000)
-
-        # Prüfen ob Warenkorb leer
-        empty_cart = page.locator(".cart-empty, :has-text('Ihr Warenkorb ist leer')")
-        if await empty_cart.count() > 0:
-            try:
-                if await empty_cart.first.is_visible(timeout=2000):
+        if cart_seeder:
+            # [1-3] Warenkorb per Request befüllen (ohne Produktseite)
+            async with timer.span("cart_seed"):
+                try:
+                    await cart_seeder.seed_async(context.request, [product_path])
+                except CartSeedingError as e:
+                    return CheckoutResult(
+                        success=False,
+                        error_message=str(e),
+                        duration_seconds=time.time() - start_time,
+                    )
+        else:
+            # [1] Produkt laden
+            async with timer.span("pdp_load"):
+                product_url = f"{base_url}/{product_path}"
+                await page.goto(product_url, timeout=60000)
+                await page.wait_for_load_state("networkidle")
+
+            # [2] Cookie-Banner akzeptieren
+            async with timer.span("cookie_banner"):
+                await accept_cookie_banner_async(page)
+
+            # [3] In den Warenkorb
+            async with timer.span("add_to_cart"):
+                add_btn = page.locator("button.btn-buy")
+                if await add_btn.count() == 0:
                     return CheckoutResult(
                         success=False,
-                        error_message="Warenkorb ist leer",
+                        error_message="Kein 'In den Warenkorb' Button gefunden",
                         duration_seconds=time.time() - start_time,
                     )
-            except:
-                pass
+                await click_and_wait_for_cart_async(page, add_btn.first)
+
+                # Offcanvas-Cart schließen falls offen
+                await close_offcanvas_cart_async(page)
+
+        # [4] Zum Warenkorb navigieren
+        async with timer.span("cart_load"):
+            await page.goto(f"{base_url}/checkout/cart")
+            await wait_for_page_ready_async(page)
+
+            # Prüfen ob Warenkorb leer
+            empty_cart = page.locator(".cart-empty, :has-text('Ihr Warenkorb ist leer')")
+            if await empty_cart.count() > 0:
+                try:
+                    if await empty_cart.first.is_visible(timeout=2000):
+                        return CheckoutResult(
+                            success=False,
+                            error_message="Warenkorb ist leer",
+                            duration_seconds=time.time() - start_time,
+                        )
+                except:
+                    pass
+
+        # Bei Befüllung per Request wurde noch keine Seite mit Cookie-Banner geöffnet
+        if cart_seeder:
+            async with timer.span("cookie_banner"):
+                await accept_cookie_banner_async(page)
 
         # [5] "Zur Kasse" Button klicken
-        checkout_btn = page.locator("a:has-text('Zur Kasse'), button:has-text('Zur Kasse'), .begin-checkout-btn, .checkout-btn")
-        if await checkout_btn.count() == 0:
-            return CheckoutResult(
-                success=False,
-                error_message="Kein 'Zur Kasse' Button gefunden",
-                duration_seconds=time.time() - start_time,
-            )
-        await checkout_btn.first.click()
-        await page.wait_for_load_state("domcontentloaded")
-        await page.wait_for_timeout(1000)
+        async with timer.span("proceed_to_checkout"):
+            checkout_btn = page.locator("a:has-text('Zur Kasse'), button:has-text('Zur Kasse'), .begin-checkout-btn, .checkout-btn")
+            if await checkout_btn.count() == 0:
+                return CheckoutResult(
+                    success=False,
+                    error_message="Kein 'Zur Kasse' Button gefunden",
+                    duration_seconds=time.time() - start_time,
+                )
+            await submit_and_wait_for_page_async(page, checkout_btn.first)
 
         checkout = CheckoutPage(page, base_url)
+        checkout.use_timer(timer)
+        if on_submit:
+            checkout.on_submit(on_submit)
 
         # [6] Gast-Checkout starten
         await checkout.start_guest_checkout()
@@ -196,13 +362,14 @@ async def run_single_checkout(
         await checkout.accept_privacy_and_continue()
 
         # [9] Zahlungsmethode wählen (via Label - robuster)
-        payment_label = page.locator(f".payment-method-label:has-text('{payment_method}'), label:has-text('{payment_method}')")
-        if await payment_label.count() > 0:
-            await payment_label.first.click()
-            await page.wait_for_timeout(500)
-        else:
-            # Fallback: via checkout method
-            await checkout.select_payment_method("invoice")
+        async with timer.span("select_payment_method"):
+            payment_label = page.locator(f".payment-method-label:has-text('{payment_method}'), label:has-text('{payment_method}')")
+            if await payment_label.count() > 0:
+                await payment_label.first.click()
+                await wait_for_settled_async(page)
+            else:
+                # Fallback: via checkout method
+                await checkout.select_payment_method("invoice")
 
         # [10] AGB akzeptieren
         await checkout.accept_terms()
@@ -230,6 +397,7 @@ async def run_single_checkout(
         )
 
     finally:
+        timer.detach()
         await page.close()
 
 
@@ -241,6 +409,10 @@ async def run_multi_product_checkout(
     order_num: int,
     payment_method: str = "Rechnung",
     name_prefix: str = "Bestellung",
+    timer: Optional[StepTimer] = None,
+    cart_seeder: Optional[CartSeeder] = None,
+    selected_products: Optional[list[str]] = None,
+    on_submit: Optional[Callable[[], None]] = None,
 ) -> CheckoutResult:
     """
     Führt einen Checkout mit mehreren Produkten im Warenkorb durch.
@@ -253,86 +425,107 @@ async def run_multi_product_checkout(
         order_num: Laufende Nummer für eindeutige Testdaten
         payment_method: Zahlungsart (Standard: "Rechnung")
         name_prefix: Präfix für den Nachnamen (Standard: "Bestellung")
+        timer: Optionale Schritt-Messung (Übernahme ins Ergebnis per ``timer.apply_to``)
+        cart_seeder: Warenkorb per Request befüllen statt über die Produktseiten
+        selected_products: Bereits ausgewählte Produkte (z.B. aus dem Lauf-Manifest);
+            ohne werden ``num_products`` zufällig aus ``product_paths`` gewählt
+        on_submit: Wird direkt vor dem Absenden der Bestellung aufgerufen (Lauf-Manifest)
 
     Returns:
         CheckoutResult mit Erfolg/Misserfolg
     """
+    timer = timer or StepTimer(enabled=False)
+    timer.attach(context)
     start_time = time.time()
     page = await context.new_page()
 
     try:
         # Zufällige Produkte auswählen (mit Duplikaten möglich)
-        selected_products = random.choices(product_paths, k=num_products)
-
-        # Erstes Produkt laden und Cookie-Banner behandeln
-        first_product = selected_products[0]
-        await page.goto(f"{base_url}/{first_product}", timeout=90000)
-        await page.wait_for_load_state("domcontentloaded")
-        await page.wait_for_timeout(2000)
-
-        # Cookie-Banner akzeptieren (nur einmal nötig)
-        await accept_cookie_banner_async(page)
-
-        # Alle Produkte zum Warenkorb hinzufügen
-        for i, product_path in enumerate(selected_products):
-            if i > 0:
-                # Zu weiteren Produktseiten navigieren
-                await page.goto(f"{base_url}/{product_path}", timeout=90000)
-                await page.wait_for_load_state("domcontentloaded")
-                await page.wait_for_timeout(1500)
-
-            # In den Warenkorb
-            add_btn = page.locator("button.btn-buy")
-            if await add_btn.count() == 0:
-                return CheckoutResult(
-                    success=False,
-                    error_message=f"Kein 'In den Warenkorb' Button für Produkt {i+1}",
-                    duration_seconds=time.time() - start_time,
-                )
-            await add_btn.first.click()
-            await page.wait_for_timeout(3000)
+        if not selected_products:
+            selected_products = random.choices(product_paths, k=num_products)
 
-            # Offcanvas-Cart schließen falls offen
-            offcanvas_close = page.locator(".offcanvas-close, .btn-close, [data-bs-dismiss='offcanvas']")
-            if await offcanvas_close.count() > 0:
+        if cart_seeder:
+            # Alle Produkte per Request in den Warenkorb (ohne Produktseiten)
+            async with timer.span("cart_seed"):
                 try:
-                    if await offcanvas_close.first.is_visible(timeout=3000):
-                        await offcanvas_close.first.click()
-                        await page.wait_for_timeout(1000)
-                except:
-                    pass
-
-        # Zum Warenkorb navigieren
-        await page.goto(f"{base_url}/checkout/cart")
-        await page.wait_for_load_state("domcontentloaded")
-        await page.wait_for_timeout(1000)
-
-        # Prüfen ob Warenkorb leer
-        empty_cart = page.locator(".cart-empty, :has-text('Ihr Warenkorb ist leer')")
-        if await empty_cart.count() > 0:
-            try:
-                if await empty_cart.first.is_visible(timeout=2000):
+                    await cart_seeder.seed_async(context.request, selected_products)
+                except CartSeedingError as e:
                     return CheckoutResult(
                         success=False,
-                        error_message="Warenkorb ist leer nach Hinzufügen",
+                        error_message=str(e),
                         duration_seconds=time.time() - start_time,
                     )
-            except:
-                pass
+        else:
+            # Erstes Produkt laden und Cookie-Banner behandeln
+            async with timer.span("pdp_load"):
+                first_product = selected_products[0]
+                await page.goto(f"{base_url}/{first_product}", timeout=90000)
+                await wait_for_page_ready_async(page)
+
+            # Cookie-Banner akzeptieren (nur einmal nötig)
+            async with timer.span("cookie_banner"):
+                await accept_cookie_banner_async(page)
+
+            # Alle Produkte zum Warenkorb hinzufügen
+            for i, product_path in enumerate(selected_products):
+                if i > 0:
+                    # Zu weiteren Produktseiten navigieren
+                    async with timer.span("pdp_load"):
+                        await page.goto(f"{base_url}/{product_path}", timeout=90000)
+                        await wait_for_page_ready_async(page)
+
+                # In den Warenkorb
+                async with timer.span("add_to_cart"):
+                    add_btn = page.locator("button.btn-buy")
+                    if await add_btn.count() == 0:
+                        return CheckoutResult(
+                            success=False,
+                            error_message=f"Kein 'In den Warenkorb' Button für Produkt {i+1}",
+                            duration_seconds=time.time() - start_time,
+                        )
+                    await click_and_wait_for_cart_async(page, add_btn.first)
+
+                    # Offcanvas-Cart schließen falls offen
+                    await close_offcanvas_cart_async(page)
+
+        # Zum Warenkorb navigieren
+        async with timer.span("cart_load"):
+            await page.goto(f"{base_url}/checkout/cart")
+            await wait_for_page_ready_async(page)
+
+            # Prüfen ob Warenkorb leer
+            empty_cart = page.locator(".cart-empty, :has-text('Ihr Warenkorb ist leer')")
+            if await empty_cart.count() > 0:
+                try:
+                    if await empty_cart.first.is_visible(timeout=2000):
+                        return CheckoutResult(
+                            success=False,
+                            error_message="Warenkorb ist leer nach Hinzufügen",
+                            duration_seconds=time.time() - start_time,
+                        )
+                except:
+                    pass
+
+        # Bei Befüllung per Request wurde noch keine Seite mit Cookie-Banner geöffnet
+        if cart_seeder:
+            async with timer.span("cookie_banner"):
+                await accept_cookie_banner_async(page)
 
         # "Zur Kasse" Button klicken
-        checkout_btn = page.locator("a:has-text('Zur Kasse'), button:has-text('Zur Kasse'), .begin-checkout-btn, .checkout-btn")
-        if await checkout_btn.count() == 0:
-            return CheckoutResult(
-                success=False,
-                error_message="Kein 'Zur Kasse' Button gefunden",
-                duration_seconds=time.time() - start_time,
-            )
-        await checkout_btn.first.click()
-        await page.wait_for_load_state("domcontentloaded")
-        await page.wait_for_timeout(1000)
+        async with timer.span("proceed_to_checkout"):
+            checkout_btn = page.locator("a:has-text('Zur Kasse'), button:has-text('Zur Kasse'), .begin-checkout-btn, .checkout-btn")
+            if await checkout_btn.count() == 0:
+                return CheckoutResult(
+                    success=False,
+                    error_message="Kein 'Zur Kasse' Button gefunden",
+                    duration_seconds=time.time() - start_time,
+                )
+            await submit_and_wait_for_page_async(page, checkout_btn.first)
 
         checkout = CheckoutPage(page, base_url)
+        checkout.use_timer(timer)
+        if on_submit:
+            checkout.on_submit(on_submit)
 
         # Gast-Checkout starten
         await checkout.start_guest_checkout()
@@ -345,16 +538,17 @@ async def run_multi_product_checkout(
         await checkout.accept_privacy_and_continue()
 
         # Zahlungsmethode wählen (via Label - robuster)
-        payment_label = page.locator(f".payment-method-label:has-text('{payment_method}'), label:has-text('{payment_method}')")
-        if await payment_label.count() > 0:
-            await payment_label.first.click()
-            await page.wait_for_timeout(500)
-        else:
-            # Fallback
-            if "Vorkasse" in payment_method.lower() or "vorkasse" in payment_method.lower():
-                await checkout.select_payment_method("prepayment")
+        async with timer.span("select_payment_method"):
+            payment_label = page.locator(f".payment-method-label:has-text('{payment_method}'), label:has-text('{payment_method}')")
+            if await payment_label.count() > 0:
+                await payment_label.first.click()
+                await wait_for_settled_async(page)
             else:
-                await checkout.select_payment_method("invoice")
+                # Fallback
+                if "Vorkasse" in payment_method.lower() or "vorkasse" in payment_method.lower():
+                    await checkout.select_payment_method("prepayment")
+                else:
+                    await checkout.select_payment_method("invoice")
 
         # AGB akzeptieren
         await checkout.accept_terms()
@@ -382,6 +576,7 @@ async def run_multi_product_checkout(
         )
 
     finally:
+        timer.detach()
         await page.close()
 
 
@@ -400,15 +595,81 @@ class MassOrderRunner:
         payment_methods: Optional[list[str]] = None,
         htaccess_user: Optional[str] = None,
         htaccess_password: Optional[str] = None,
+        arrival_profile: Optional[ArrivalProfile] = None,
+        max_in_flight: Optional[int] = None,
+        context_pool: Optional[ContextPoolConfig] = None,
+        keep_order_results: bool = True,
+        step_timing: bool = False,
+        cart_seeding: Optional[CartSeedingConfig] = None,
+        request_blocker: Optional[RequestBlocker] = None,
+        result_stream: Optional[ResultStreamConfig] = None,
+        adaptive_concurrency: Optional[AdaptiveConcurrencyConfig] = None,
+        run_manifest: Optional[RunManifestConfig] = None,
+        resume_run_id: Optional[str] = None,
+        seed: Optional[int] = None,
+        network_trace: Optional[NetworkTraceConfig] = None,
     ):
+        """
+        Args:
+            arrival_profile: Aktiviert den Open-Loop-Modus - Bestellungen starten
+                nach Ankunftsprofil statt gedrosselt durch ``parallel_workers``
+            max_in_flight: Optionale Sicherheitsgrenze im Open-Loop-Modus
+            context_pool: Pool-Konfiguration; wenn aktiviert, werden vorgewärmte
+                Kontexte wiederverwendet statt pro Bestellung neu erstellt
+            keep_order_results: Einzelergebnisse aufbewahren (False: nur Histogramme)
+            step_timing: Dauer, Requests und Navigation-Timing pro Checkout-Schritt messen
+            cart_seeding: Wenn aktiviert, wird der Warenkorb per Request befüllt
+                statt über Produktseite und "In den Warenkorb"
+            request_blocker: Blockiert Bilder/Tracker/Drittanbieter in jedem Bestell-Kontext
+            result_stream: Wenn aktiviert, wird jedes Einzelergebnis sofort als
+                JSONL-Zeile geschrieben und der Fortschritt live ausgegeben
+            adaptive_concurrency: Wenn aktiviert, regelt ein AIMD-Limiter die
+                Parallelität ab ``parallel_workers`` (nur Closed-Loop)
+            run_manifest: Wenn aktiviert, werden Plan und Fortschritt als
+                Lauf-Manifest geschrieben (Checkpoint für ``--resume``)
+            resume_run_id: Setzt den Lauf mit dieser ID fort statt neu zu planen
+            seed: Seed für Produkt- und Zahlungsauswahl (Standard: zufällig)
+            network_trace: Wenn aktiviert, werden die Requests jeder Bestellung
+                aufgezeichnet und bei Fehlern/Langsamkeit gespeichert
+        """
         self.browser = browser
         self.base_url = base_url
         self.parallel_workers = parallel_workers
         self.payment_methods = payment_methods or ["Rechnung"]
         self.htaccess_user = htaccess_user
         self.htaccess_password = htaccess_password
+        self.arrival_profile = arrival_profile
+        self.max_in_flight = max_in_flight
+        self.context_pool_config = context_pool
+        self.keep_order_results = keep_order_results
+        self.step_timing = step_timing
+        self.pool: Optional[BrowserContextPool] = None
+        self.cart_seeder: Optional[CartSeeder] = None
+        if cart_seeding and cart_seeding.enabled:
+            self.cart_seeder = CartSeeder(base_url, access_key=cart_seeding.store_api_access_key)
+        self.request_blocker = request_blocker
+        self.result_stream_config = result_stream
+        self.run_manifest_config = run_manifest
+        self.resume_run_id = resume_run_id
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
+        self.network_trace_config = network_trace
+        self.tracer = NetworkTracer()  # pro Lauf in _execute() mit Lauf-ID ersetzt
+
+        self.limiter: Optional[AdaptiveLimiter] = None
+        if adaptive_concurrency and adaptive_concurrency.enabled and not arrival_profile:
+            self.limiter = AdaptiveLimiter.from_config(adaptive_concurrency, parallel_workers)
+        self.semaphore = self.limiter or asyncio.Semaphore(parallel_workers)
+
+    def _order_slot(self):
+        """
+        Gibt den Kontext zurück, der die Parallelität einer Bestellung begrenzt.
 
-        self.semaphore = asyncio.Semaphore(parallel_workers)
+        Im Open-Loop-Modus steuert der Scheduler die Starts, daher kein Semaphore.
+        """
+        if self.arrival_profile:
+            return contextlib.nullcontext()
+        return self.semaphore
 
     def _get_context_options(self) -> dict:
         """Gibt die Context-Optionen mit HTTP-Credentials zurück."""
@@ -420,75 +681,106 @@ class MassOrderRunner:
             }
         return options
 
+    def _order_context(self):
+        """Browser-Kontext für eine Bestellung (Pool oder neu, mit Blockier-Profil)."""
+        return order_context(self.pool, self.browser, self._get_context_options(), self.request_blocker)
+
+    async def _start_pool(self) -> None:
+        """Startet den Kontext-Pool, falls in der Konfiguration aktiviert."""
+        cfg = self.context_pool_config
+        if not cfg or not cfg.enabled:
+            return
+
+        size = cfg.size or self.parallel_workers
+        if self.arrival_profile:
+            max_size = self.max_in_flight
+        else:
+            max_size = max(size, self.parallel_workers)
+
+        self.pool = BrowserContextPool(
+            browser=self.browser,
+            base_url=self.base_url,
+            size=size,
+            context_options=self._get_context_options(),
+            max_size=max_size,
+            max_uses=cfg.max_uses,
+            max_consecutive_failures=cfg.max_consecutive_failures,
+            warm_up=cfg.warm_up,
+        )
+        await self.pool.start()
+
     async def _run_single_order(
         self,
-        order_num: int,
-        product_path: str,
+        entry: dict,
+        on_submit: Optional[Callable[[], None]] = None,
     ) -> CheckoutResult:
         """
         Führt eine einzelne Bestellung durch (mit Semaphore für Parallelität).
 
         Nutzt den bewährten Flow aus run_single_checkout().
-        """
-        async with self.semaphore:
-            context = await self.browser.new_context(**self._get_context_options())
 
-            try:
-                payment_method = random.choice(self.payment_methods)
-
-                result = await run_single_checkout(
-                    context=context,
-                    base_url=self.base_url,
-                    product_path=product_path,
-                    order_num=order_num,
-                    payment_method=payment_method,
-                )
+        Args:
+            entry: Plan-Eintrag mit ``order_num``, ``product_path`` und ``payment_method``
+            on_submit: Wird direkt vor dem Absenden aufgerufen (Lauf-Manifest)
+        """
+        async with self._order_slot():
+            async with self._order_context() as lease:
+                timer = StepTimer(enabled=self.step_timing)
+
+                with self.tracer.record(lease.context) as recorder:
+                    result = await run_single_checkout(
+                        context=lease.context,
+                        base_url=self.base_url,
+                        product_path=entry["product_path"],
+                        order_num=entry["order_num"],
+                        payment_method=entry["payment_method"],
+                        timer=timer,
+                        cart_seeder=self.cart_seeder,
+                        on_submit=on_submit,
+                    )
+                timer.apply_to(result)
+                self.tracer.finish(recorder, entry["order_num"], result)
 
+                lease.healthy = result.success
                 return result
 
-            finally:
-                await context.close()
-
     async def _run_multi_product_order(
         self,
-        order_num: int,
-        product_paths: list[str],
-        min_products: int = 1,
-        max_products: int = 5,
-        name_prefix: str = "Bestellung",
+        entry: dict,
+        on_submit: Optional[Callable[[], None]] = None,
     ) -> CheckoutResult:
         """
         Führt eine Bestellung mit mehreren Produkten durch.
 
         Args:
-            order_num: Laufende Nummer
-            product_paths: Liste aller verfügbaren Produktpfade
-            min_products: Minimum Produkte im Warenkorb
-            max_products: Maximum Produkte im Warenkorb
-            name_prefix: Präfix für den Nachnamen
+            entry: Plan-Eintrag mit ``order_num``, ``product_paths``,
+                ``payment_method`` und ``name_prefix``
+            on_submit: Wird direkt vor dem Absenden aufgerufen (Lauf-Manifest)
         """
-        async with self.semaphore:
-            context = await self.browser.new_context(**self._get_context_options())
-
-            try:
-                payment_method = random.choice(self.payment_methods)
-                num_products = random.randint(min_products, max_products)
-
-                result = await run_multi_product_checkout(
-                    context=context,
-                    base_url=self.base_url,
-                    product_paths=product_paths,
-                    num_products=num_products,
-                    order_num=order_num,
-                    payment_method=payment_method,
-                    name_prefix=name_prefix,
-                )
+        async with self._order_slot():
+            async with self._order_context() as lease:
+                timer = StepTimer(enabled=self.step_timing)
+
+                with self.tracer.record(lease.context) as recorder:
+                    result = await run_multi_product_checkout(
+                        context=lease.context,
+                        base_url=self.base_url,
+                        product_paths=entry["product_paths"],
+                        num_products=len(entry["product_paths"]),
+                        order_num=entry["order_num"],
+                        payment_method=entry["payment_method"],
+                        name_prefix=entry["name_prefix"],
+                        timer=timer,
+                        cart_seeder=self.cart_seeder,
+                        selected_products=entry["product_paths"],
+                        on_submit=on_submit,
+                    )
+                timer.apply_to(result)
+                self.tracer.finish(recorder, entry["order_num"], result)
 
+                lease.healthy = result.success
                 return result
 
-            finally:
-                await context.close()
-
     async def run_mass_orders(
         self,
         num_orders: int,
@@ -504,35 +796,15 @@ class MassOrderRunner:
         Returns:
             MassTestResult mit aggregierten Statistiken
         """
-        result = MassTestResult(start_time=datetime.now())
-
-        # Alle Orders als Tasks erstellen
-        tasks = [
-            self._run_single_order(
-                order_num=i,
-                product_path=random.choice(product_paths),
-            )
+        plan = [
+            {
+                "order_num": i,
+                "product_path": self.rng.choice(product_paths),
+                "payment_method": self.rng.choice(self.payment_methods),
+            }
             for i in range(num_orders)
         ]
-
-        # Parallel ausführen
-        order_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Ergebnisse verarbeiten
-        for i, res in enumerate(order_results):
-            if isinstance(res, Exception):
-                result.order_results.append(CheckoutResult(
-                    success=False,
-                    error_message=str(res)
-                ))
-            else:
-                result.order_results.append(res)
-
-        result.end_time = datetime.now()
-        result.total_duration_seconds = (result.end_time - result.start_time).total_seconds()
-        result.calculate_stats()
-
-        return result
+        return await self._execute("massentest", plan, self._run_single_order)
 
     async def run_mass_orders_multi_product(
         self,
@@ -555,40 +827,207 @@ class MassOrderRunner:
         Returns:
             MassTestResult mit aggregierten Statistiken
         """
-        result = MassTestResult(start_time=datetime.now())
-
-        # Alle Orders als Tasks erstellen
-        tasks = [
-            self._run_multi_product_order(
-                order_num=i,
-                product_paths=product_paths,
-                min_products=min_products,
-                max_products=max_products,
-                name_prefix=name_prefix,
-            )
+        plan = [
+            {
+                "order_num": i,
+                "product_paths": self.rng.choices(product_paths, k=self.rng.randint(min_products, max_products)),
+                "payment_method": self.rng.choice(self.payment_methods),
+                "name_prefix": name_prefix,
+            }
             for i in range(num_orders)
         ]
+        return await self._execute("massentest-multi", plan, self._run_multi_product_order)
 
-        # Parallel ausführen
-        order_results = await asyncio.gather(*tasks, return_exceptions=True)
+    def _open_manifest(self, kind: str, plan: list[dict]) -> Optional[RunManifest]:
+        """
+        Legt das Lauf-Manifest an bzw. lädt es beim Fortsetzen.
 
-        # Ergebnisse verarbeiten
-        for i, res in enumerate(order_results):
-            if isinstance(res, Exception):
-                result.order_results.append(CheckoutResult(
-                    success=False,
-                    error_message=str(res)
-                ))
+        Raises:
+            ManifestError: Wenn der fortzusetzende Lauf fehlt oder von anderer Art ist
+        """
+        cfg = self.run_manifest_config
+        if self.resume_run_id:
+            directory = cfg.directory if cfg else RunManifestConfig().directory
+            return RunManifest.load(Path(directory), self.resume_run_id, kind=kind)
+        if not cfg or not cfg.enabled:
+            return None
+        return RunManifest.create(Path(cfg.directory), new_run_id(kind), kind, self.seed, plan, meta={
+            "base_url": self.base_url,
+            "parallel_workers": self.parallel_workers,
+        })
+
+    async def _execute(
+        self,
+        kind: str,
+        plan: list[dict],
+        order_factory: Callable[[dict, Optional[Callable[[], None]]], Awaitable[CheckoutResult]],
+    ) -> MassTestResult:
+        """
+        Führt die geplanten Bestellungen aus und aggregiert die Ergebnisse.
+
+        Ohne Ankunftsprofil (Closed-Loop) werden alle Bestellungen sofort
+        angelegt und durch den Semaphore gedrosselt. Mit Ankunftsprofil
+        (Open-Loop) startet der Scheduler sie zur geplanten Zeit.
+
+        Beim Fortsetzen (``resume_run_id``) gilt der Plan aus dem Manifest;
+        es laufen nur nie abgeschickte Bestellungen, die übrigen werden mit
+        ihrem früheren Ergebnis übernommen.
+        """
+        result = MassTestResult(start_time=datetime.now(), keep_order_results=self.keep_order_results)
+        scheduler: Optional[OpenLoopScheduler] = None
+
+        manifest = self._open_manifest(kind, plan)
+        to_run = plan
+        if manifest:
+            result.run_id = manifest.run_id
+            to_run = manifest.orders_to_run()
+            for entry, state, data in manifest.carried_over():
+                result.record(carried_result(state, data), entry["order_num"])
+                result.carried_over_orders += 1
+                if state == OrderState.UNRESOLVED:
+                    result.unresolved_orders.append(entry["order_num"])
+            print(f"Lauf-ID:           {manifest.run_id} (fortsetzen mit --resume {manifest.run_id})")
+            if self.resume_run_id:
+                print(f"Fortsetzen:        {len(to_run)} offen, {result.carried_over_orders} übernommen "
+                      f"({len(result.unresolved_orders)} unklar)")
+
+        stream, live, live_task = None, None, None
+        if self.result_stream_config and self.result_stream_config.enabled:
+            stream, live = start_run_stream(self.result_stream_config, kind, len(to_run), meta={
+                "base_url": self.base_url,
+                "parallel_workers": self.parallel_workers,
+                "arrival_profile": self.arrival_profile.describe() if self.arrival_profile else None,
+            }, run_id=result.run_id or None)
+            result.run_id, result.stream_path = stream.run_id, str(stream.path)
+            live_task = asyncio.create_task(live.run_periodic())
+        self.tracer = NetworkTracer(self.network_trace_config, result.run_id or new_run_id(kind))
+
+        async def recorded(index: int) -> None:
+            """Führt eine Bestellung aus und erfasst das Ergebnis beim Abschluss."""
+            entry = to_run[index]
+            order_num = entry["order_num"]
+            on_submit = None
+            if manifest:
+                manifest.mark_started(order_num)
+                on_submit = functools.partial(manifest.mark_submitted, order_num)
+            try:
+                res = await order_factory(entry, on_submit)
+            except Exception as e:
+                res = CheckoutResult(success=False, error_message=str(e))
+            lag = 0.0
+            if scheduler and index < len(scheduler.stats.starts):
+                lag = scheduler.stats.starts[index].lag_seconds
+            result.record(res, order_num, lag)
+            data = asdict(res)
+            if manifest:
+                manifest.mark_finished(order_num, res.success, res.order_number, data)
+            if self.limiter:
+                self.limiter.record(res.success, res.duration_seconds)
+            if stream:
+                stream.write({"order_num": order_num, "lag_seconds": lag, **data})
+            if live:
+                live.record(res.success, res.duration_seconds)
+
+        await self._start_pool()
+
+        try:
+            if self.arrival_profile:
+                scheduler = OpenLoopScheduler(self.arrival_profile, max_in_flight=self.max_in_flight)
+                result.scheduler_stats = scheduler.stats
+                await scheduler.run(len(to_run), recorded)
             else:
-                result.order_results.append(res)
+                # Alle Orders als Tasks erstellen und parallel ausführen
+                await asyncio.gather(*[recorded(i) for i in range(len(to_run))])
+        except BaseException:
+            if stream:
+                stream.close()  # ohne Zusammenfassung: als abgebrochen erkennbar
+            raise
+        finally:
+            if live_task:
+                live_task.cancel()
+            if self.pool:
+                result.context_pool_stats = self.pool.stats.to_dict()
+                await self.pool.close()
+                self.pool = None
+            if self.request_blocker and self.request_blocker.active:
+                result.request_blocking_stats = self.request_blocker.report()
+            if self.limiter:
+                result.concurrency_stats = self.limiter.stats.to_dict()
+            if self.tracer.enabled:
+                result.network_trace_stats = self.tracer.stats.to_dict()
 
         result.end_time = datetime.now()
         result.total_duration_seconds = (result.end_time - result.start_time).total_seconds()
         result.calculate_stats()
+        if stream:
+            stream.close(summary=result.to_dict())
 
         return result
 
 
+def print_load_report(result: MassTestResult) -> None:
+    """Gibt Perzentile sowie Kennzahlen aktiver Zusatzfunktionen (Open-Loop, Pool, Blockieren, Parallelität) aus."""
+    if result.latency.count:
+        print(f"Perzentile:       {format_percentiles(result.latency)}")
+        print(f"{'='*60}")
+
+    if len(result.latency_by_step):
+        step_summary = result.step_stats.summary()
+        for step, hist in result.latency_by_step:
+            print(f"  {step:22} {format_percentiles(hist)}")
+            if step in step_summary:
+                info = step_summary[step]
+                ttfb = f", TTFB Ø {info['avg_ttfb_ms']:.0f}ms" if info["avg_ttfb_ms"] is not None else ""
+                print(f"  {'':22} Ø {info['avg_requests']} Requests{ttfb}")
+        print(f"{'='*60}")
+
+    pool = result.context_pool_stats
+    if pool:
+        print(f"Kontext-Pool:     {pool['created']} erstellt, {pool['reused']} wiederverwendet, "
+              f"{pool['evicted']} ersetzt (Warm-up {pool['warm_up_seconds']:.1f}s)")
+        print(f"{'='*60}")
+
+    if result.request_blocking_stats:
+        print(f"Requests:         {format_blocking(result.request_blocking_stats)}")
+        print(f"{'='*60}")
+
+    if result.concurrency_stats:
+        print(f"Parallelität:     {format_concurrency(result.concurrency_stats)}")
+        print(f"{'='*60}")
+
+    if result.network_trace_stats:
+        print(f"Netzwerk-Traces:  {format_network_trace(result.network_trace_stats)}")
+        print(f"{'='*60}")
+
+    if result.stream_path:
+        print(f"Ergebnis-Stream:  {result.stream_path}")
+        print(f"{'='*60}")
+
+    if result.carried_over_orders:
+        print(f"Fortgesetzt:      {result.carried_over_orders} übernommen, "
+              f"davon {len(result.unresolved_orders)} unklar (nicht wiederholt)")
+        print(f"{'='*60}")
+
+    stats = result.scheduler_stats
+    if not stats:
+        return
+    print(f"Ankunftsprofil:   {stats.profile}")
+    print(f"Startrate (ist):  {stats.achieved_start_rate_per_minute:.1f}/min")
+    print(f"Max. in Flight:   {stats.peak_in_flight}")
+    print(f"Start-Lag Ø/Max:  {stats.avg_lag_seconds:.2f}s / {stats.max_lag_seconds:.2f}s")
+    print(f"Ø ab Plan-Start:  {result.avg_corrected_duration_seconds:.1f}s "
+          f"(Max {result.max_corrected_duration_seconds:.1f}s)")
+    print(f"Perzentile (ab Plan-Start): {format_percentiles(result.corrected_latency)}")
+    print(f"{'='*60}")
+
+
+def record_history(config, name: str, result: MassTestResult) -> None:
+    """Legt das Ergebnis in der Lauf-Historie ab und meldet Abweichungen zur Baseline."""
+    record_run(
+        config.results_history, result.run_id or new_run_id(name), RunKind.MASS, name, mass_metrics(result.to_dict())
+    )
+
+
 # =============================================================================
 # Pytest Tests
 # =============================================================================
@@ -600,10 +1039,16 @@ async def test_mass_orders_basic(
     mass_orders: int,
     parallel: int,
     products: list[str],
+    arrival_profile,
+    request_blocker,
+    resume_run_id,
 ):
     """
     Basis-Massentest: Führt n Bestellungen parallel aus.
 
+    Mit --arrival-profile/--arrival-rate läuft der Test im Open-Loop-Modus
+    (Bestellungen starten nach Ankunftsrate statt nach freien Workern).
+
     Erfolgskriterium: Mindestens 95% Erfolgsrate.
     """
     async with async_playwright() as p:
@@ -616,6 +1061,18 @@ async def test_mass_orders_basic(
                 parallel_workers=parallel,
                 htaccess_user=config.htaccess_user,
                 htaccess_password=config.htaccess_password,
+                arrival_profile=arrival_profile,
+                max_in_flight=config.mass_test.arrival.max_in_flight or None,
+                context_pool=config.context_pool,
+                keep_order_results=config.mass_test.keep_order_results,
+                step_timing=config.mass_test.step_timing,
+                cart_seeding=config.cart_seeding,
+                request_blocker=request_blocker,
+                result_stream=config.result_stream,
+                adaptive_concurrency=config.adaptive_concurrency,
+                run_manifest=config.run_manifest,
+                network_trace=config.network_trace,
+                resume_run_id=resume_run_id,
             )
 
             result = await runner.run_mass_orders(
@@ -637,6 +1094,8 @@ async def test_mass_orders_basic(
             print(f"Min:             {result.min_duration_seconds:.1f}s")
             print(f"Max:             {result.max_duration_seconds:.1f}s")
             print(f"{'='*60}")
+            print_load_report(result)
+            record_history(config, "massentest-basic", result)
 
             if result.errors:
                 print(f"\nFEHLER ({len(result.errors)}):")
@@ -661,6 +1120,7 @@ async def test_mass_orders_payment_matrix(
     config,
     parallel: int,
     products: list[str],
+    request_blocker,
 ):
     """
     Testet Massenbestellungen mit verschiedenen Zahlungsarten.
@@ -705,6 +1165,15 @@ async def test_mass_orders_payment_matrix(
                     payment_methods=[payment_method],
                     htaccess_user=config.htaccess_user,
                     htaccess_password=config.htaccess_password,
+                    context_pool=config.context_pool,
+                    keep_order_results=config.mass_test.keep_order_results,
+                    step_timing=config.mass_test.step_timing,
+                    cart_seeding=config.cart_seeding,
+                    request_blocker=request_blocker,
+                    result_stream=config.result_stream,
+                    adaptive_concurrency=config.adaptive_concurrency,
+                    run_manifest=config.run_manifest,
+                    network_trace=config.network_trace,
                 )
 
                 result = await runner.run_mass_orders(
@@ -713,6 +1182,7 @@ async def test_mass_orders_payment_matrix(
                 )
 
                 all_results[payment_method] = result
+                record_history(config, f"massentest-payment-{display_name}", result)
 
                 print(f"\n{display_name.upper()}: "
                       f"{result.successful_orders}/{result.total_orders} "
@@ -739,10 +1209,16 @@ async def test_mass_orders_payment_matrix(
 async def test_mass_orders_stress(
     config,
     products: list[str],
+    arrival_profile,
+    request_blocker,
+    resume_run_id,
 ):
     """
     Stresstest: 200 Bestellungen mit hoher Parallelität.
 
+    Mit --arrival-profile läuft der Stresstest als Open-Loop-Test mit
+    vorgegebener Ankunftsrate.
+
     Dieser Test ist als "slow" markiert und läuft nur bei expliziter Anforderung.
     """
     async with async_playwright() as p:
@@ -755,6 +1231,18 @@ async def test_mass_orders_stress(
                 parallel_workers=20,  # Hohe Parallelität
                 htaccess_user=config.htaccess_user,
                 htaccess_password=config.htaccess_password,
+                arrival_profile=arrival_profile,
+                max_in_flight=config.mass_test.arrival.max_in_flight or None,
+                context_pool=config.context_pool,
+                keep_order_results=config.mass_test.keep_order_results,
+                step_timing=config.mass_test.step_timing,
+                cart_seeding=config.cart_seeding,
+                request_blocker=request_blocker,
+                result_stream=config.result_stream,
+                adaptive_concurrency=config.adaptive_concurrency,
+                run_manifest=config.run_manifest,
+                network_trace=config.network_trace,
+                resume_run_id=resume_run_id,
             )
 
             result = await runner.run_mass_orders(
@@ -764,6 +1252,8 @@ async def test_mass_orders_stress(
 
             print(f"\nSTRESSTEST: {result.successful_orders}/{result.total_orders} "
                   f"({result.success_rate:.1%}) in {result.total_duration_seconds:.1f}s")
+            print_load_report(result)
+            record_history(config, "massentest-stress", result)
 
             # Etwas niedrigere Schwelle für Stresstest
             assert result.success_rate >= 0.90, (
@@ -779,6 +1269,8 @@ async def test_mass_orders_stress(
 async def test_mass_orders_multi_product_50(
     config,
     products: list[str],
+    request_blocker,
+    resume_run_id,
 ):
     """
     Massentest mit Multi-Produkt-Warenkorb: 50 Bestellungen.
@@ -803,6 +1295,16 @@ async def test_mass_orders_multi_product_50(
                 payment_methods=["Vorkasse", "Rechnung"],
                 htaccess_user=config.htaccess_user,
                 htaccess_password=config.htaccess_password,
+                context_pool=config.context_pool,
+                keep_order_results=config.mass_test.keep_order_results,
+                step_timing=config.mass_test.step_timing,
+                cart_seeding=config.cart_seeding,
+                request_blocker=request_blocker,
+                result_stream=config.result_stream,
+                adaptive_concurrency=config.adaptive_concurrency,
+                run_manifest=config.run_manifest,
+                network_trace=config.network_trace,
+                resume_run_id=resume_run_id,
             )
 
             result = await runner.run_mass_orders_multi_product(
@@ -831,6 +1333,8 @@ async def test_mass_orders_multi_product_50(
             print(f"Min:               {result.min_duration_seconds:.1f}s")
             print(f"Max:               {result.max_duration_seconds:.1f}s")
             print(f"{'='*60}")
+            print_load_report(result)
+            record_history(config, "massentest-multi_product_50", result)
 
             if result.errors:
                 print(f"\nFEHLER ({len(result.errors)}):")
@@ -0,0 +1,60 @@
+"""
+Content-Navigation-Audit: alle Hauptkategorien des Mega-Menues.
+
+Liest Hauptnavigation und alle Flyouts (UK1/UK2/UK3) einmal pro Lauf in
+einem ``evaluate`` aus (``utils/navigation_tree.py``) und prueft:
+
+- jede Hauptkategorie mit Soll-Baum (``data/navigation_trees.py``):
+  fehlende Kategorien, URL-Abweichungen, Duplikate, leere Eintraege
+  (ausser Kategorien mit eigenem Testfall, z.B. Moebel in
+  ``test_content_navigation_moebel.py``)
+- alle Hauptkategorien: Flyout vorhanden (falls ausgeloest), keine
+  Duplikate, keine leeren Eintraege
+
+Ausfuehrung:
+    pytest playwright_tests/tests/test_content_navigation.py -v -s
+"""
+import pytest
+from playwright.sync_api import Page
+
+from ..config import TestConfig
+from ..data.navigation_trees import EXPECTED_NAVIGATION_TREES
+from ..utils.navigation_tree import diff_category, format_navigation_diff, load_navigation
+
+
+# Hauptkategorien mit eigenem Testfall (nicht doppelt pruefen)
+OWN_TEST_CASES = {"Möbel": "TC-NAV-006"}
+
+
+@pytest.mark.parametrize(
+    "category_name", [name for name in EXPECTED_NAVIGATION_TREES if name not in OWN_TEST_CASES]
+)
+def test_content_navigation_tree(page: Page, base_url: str, config: TestConfig, category_name: str):
+    """Vergleicht eine Hauptkategorie mit ihrem Soll-Baum."""
+    navigation = load_navigation(page, base_url, config.locale)
+
+    category = navigation.category(category_name)
+    assert category is not None, f"'{category_name}' nicht in der Hauptnavigation gefunden."
+
+    diff = diff_category(category, EXPECTED_NAVIGATION_TREES[category_name])
+    print("\n" + format_navigation_diff(diff))
+
+    assert not diff.errors, "\n\n".join(diff.errors)
+
+
+def test_content_navigation_audit(page: Page, base_url: str, config: TestConfig):
+    """Prueft alle Hauptkategorien auf fehlende Flyouts, Duplikate und leere Eintraege."""
+    navigation = load_navigation(page, base_url, config.locale)
+    assert navigation.categories, "Keine Navigations-Links gefunden"
+
+    print(f"\n=== Navigation ({navigation.lang or config.locale}): "
+          f"{len(navigation.categories)} Hauptkategorien in {navigation.duration_seconds:.2f}s ===")
+    errors = []
+    for category in navigation.categories:
+        diff = diff_category(category)
+        status = "FEHLER" if diff.errors else "OK"
+        print(f"    [{status}] {category.name}: {len(category.entries)} Eintraege, "
+              f"{len(category.tree)} UK1")
+        errors += [f"{category.name}: {error}" for error in diff.errors]
+
+    assert not errors, "\n\n".join(errors)
@@ -0,0 +1,130 @@
+"""Tests für den Browser-Kontext-Pool (mit Fake-Browser, ohne Playwright)."""
+import pytest
+
+from playwright_tests.tests._fakes import FakeEmitter
+from playwright_tests.utils.context_pool import BrowserContextPool, is_session_cookie, order_context
+from playwright_tests.utils.request_blocking import RequestBlocker, get_profile
+
+
+class FakeContext(FakeEmitter):
+    """Minimaler Ersatz für BrowserContext."""
+
+    def __init__(self):
+        super().__init__()
+        self.pages = []
+        self.closed = False
+        self.routes = []
+        self._cookies = [
+            {"name": "session-abc", "value": "cart"},
+            {"name": "cookie-preference", "value": "1"},
+        ]
+
+    async def cookies(self):
+        return list(self._cookies)
+
+    async def clear_cookies(self):
+        self._cookies = []
+
+    async def add_cookies(self, cookies):
+        self._cookies.extend(cookies)
+
+    async def route(self, pattern, handler):
+        self.routes.append(pattern)
+
+    async def unroute(self, pattern, handler):
+        self.routes.remove(pattern)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    async def new_context(self, **options):
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+
+def make_pool(browser, **kwargs) -> BrowserContextPool:
+    pool = BrowserContextPool(browser, "https://shop.example", warm_up=False, **kwargs)
+    pool.storage_state = {"cookies": [], "origins": []}
+    return pool
+
+
+def test_is_session_cookie():
+    """Session-/Warenkorb-Cookies werden erkannt, Consent-Cookies nicht."""
+    assert is_session_cookie({"name": "session-1234"})
+    assert is_session_cookie({"name": "sw-context-token"})
+    assert not is_session_cookie({"name": "cookie-preference"})
+    assert not is_session_cookie({"name": "uc_user_interaction"})
+
+
+@pytest.mark.asyncio
+async def test_release_resets_session_and_reuses_context():
+    """Nach einer Bestellung wird der Kontext ohne Session-Cookie wiederverwendet."""
+    browser = FakeBrowser()
+    pool = make_pool(browser, size=1, max_size=1)
+
+    async with pool.lease() as lease:
+        first = lease.context
+    async with pool.lease() as lease:
+        second = lease.context
+
+    assert first is second
+    assert [c["name"] for c in await first.cookies()] == ["cookie-preference"]
+    assert pool.stats.reused == 1
+    assert pool.stats.created == 1
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_context_is_evicted_and_replaced():
+    """Fehlerserie führt zur Eviction und einem Ersatz-Kontext."""
+    browser = FakeBrowser()
+    pool = make_pool(browser, size=1, max_size=1, max_consecutive_failures=1)
+
+    async with pool.lease() as lease:
+        first = lease.context
+        lease.healthy = False
+
+    async with pool.lease() as lease:
+        second = lease.context
+
+    assert first.closed
+    assert second is not first
+    assert pool.stats.evicted == 1
+
+
+@pytest.mark.asyncio
+async def test_context_replaced_after_max_uses():
+    """Kontexte werden nach max_uses Bestellungen ersetzt."""
+    browser = FakeBrowser()
+    pool = make_pool(browser, size=1, max_size=1, max_uses=2)
+
+    for _ in range(3):
+        async with pool.lease():
+            pass
+
+    assert pool.stats.evicted == 1
+    assert len(browser.contexts) == 2
+    await pool.close()
+    assert all(c.closed for c in browser.contexts)
+
+
+@pytest.mark.asyncio
+async def test_order_context_with_and_without_pool():
+    """Blockier-Profil gilt nur während der Bestellung; ohne Pool wird der Kontext geschlossen."""
+    browser = FakeBrowser()
+    blocker = RequestBlocker.for_base_url(get_profile("load"), "https://shop.example")
+
+    async with order_context(None, browser, {"locale": "de-AT"}, blocker) as lease:
+        assert lease.context.routes == ["**/*"]
+    assert lease.context.closed and lease.context.routes == []
+
+    pool = make_pool(browser, size=1, max_size=1)
+    async with order_context(pool, browser, {}, blocker) as lease:
+        assert lease.context.routes == ["**/*"]
+    assert not lease.context.closed and lease.context.routes == []
+    assert pool.stats.created == 1
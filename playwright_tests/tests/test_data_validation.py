@@ -18,6 +18,7 @@ import pytest
 from playwright.sync_api import Page, expect
 
 from ..conftest import accept_cookie_banner
+from ..utils.readiness import click_and_wait_for_cart, wait_for_page_ready
 
 
 # =============================================================================
@@ -171,15 +172,13 @@ def get_cart_total(page: Page) -> float | None:
 def add_product_to_cart(page: Page, base_url: str, product_path: str) -> bool:
     """Fügt ein Produkt zum Warenkorb hinzu."""
     page.goto(f"{base_url}/{product_path}")
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1000)
+    wait_for_page_ready(page)
 
     accept_cookie_banner(page)
 
     buy_btn = page.locator("button.btn-buy, .btn-buy")
     if buy_btn.count() > 0 and buy_btn.first.is_visible():
-        buy_btn.first.click()
-        page.wait_for_timeout(2000)
+        click_and_wait_for_cart(page, buy_btn.first)
         return True
     return False
 
@@ -187,15 +186,14 @@ def add_product_to_cart(page: Page, base_url: str, product_path: str) -> bool:
 def clear_cart(page: Page, base_url: str) -> None:
     """Leert den Warenkorb."""
     page.goto(f"{base_url}/checkout/cart")
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1000)
+    wait_for_page_ready(page)
 
     # Alle "Entfernen"-Buttons klicken
     remove_btns = page.locator(".line-item-remove, .cart-item-remove, button:has-text('Entfernen')")
     while remove_btns.count() > 0:
         try:
-            remove_btns.first.click()
-            page.wait_for_timeout(1000)
+            click_and_wait_for_cart(page, remove_btns.first)
+            wait_for_page_ready(page)
             remove_btns = page.locator(".line-item-remove, .cart-item-remove, button:has-text('Entfernen')")
         except Exception:
             break
@@ -216,8 +214,7 @@ def test_product_price_pdp_equals_cart(page: Page, base_url: str, product_id: st
 
     # 1. PDP öffnen und Preis lesen
     page.goto(f"{base_url}/{product['path']}")
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1500)
+    wait_for_page_ready(page)
     accept_cookie_banner(page)
 
     pdp_price = get_product_price_from_pdp(page)
@@ -228,13 +225,11 @@ def test_product_price_pdp_equals_cart(page: Page, base_url: str, product_id: st
     # 2. Produkt in Warenkorb legen
     buy_btn = page.locator("button.btn-buy")
     assert buy_btn.count() > 0, "Kein Warenkorb-Button gefunden"
-    buy_btn.first.click()
-    page.wait_for_timeout(2000)
+    click_and_wait_for_cart(page, buy_btn.first)
 
     # 3. Zum Warenkorb navigieren
     page.goto(f"{base_url}/checkout/cart")
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1500)
+    wait_for_page_ready(page)
 
     # 4. Preis im Warenkorb prüfen
     cart_price = get_cart_line_item_price(page, product_id)
@@ -275,18 +270,15 @@ def test_subtotal_calculation(page: Page, base_url: str):
 
     # 2. Produkt hinzufügen
     page.goto(f"{base_url}/{product['path']}")
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1000)
+    wait_for_page_ready(page)
     accept_cookie_banner(page)
 
     buy_btn = page.locator("button.btn-buy")
-    buy_btn.first.click()
-    page.wait_for_timeout(2000)
+    click_and_wait_for_cart(page, buy_btn.first)
 
     # 3. Zum Warenkorb
     page.goto(f"{base_url}/checkout/cart")
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1500)
+    wait_for_page_ready(page)
 
     # 4. Zwischensumme prüfen
     subtotal = get_cart_subtotal(page)
@@ -321,19 +313,16 @@ def test_vat_calculation_at(page: Page, base_url: str):
 
     # Produkt hinzufügen
     page.goto(f"{base_url}/{product['path']}")
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1000)
+    wait_for_page_ready(page)
     accept_cookie_banner(page)
 
     buy_btn = page.locator("button.btn-buy")
     if buy_btn.count() > 0:
-        buy_btn.first.click()
-        page.wait_for_timeout(2000)
+        click_and_wait_for_cart(page, buy_btn.first)
 
     # Checkout aufrufen (MwSt. wird dort angezeigt)
     page.goto(f"{base_url}/checkout/cart")
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1500)
+    wait_for_page_ready(page)
 
     # MwSt. aus Warenkorb lesen
     vat_selectors = [
@@ -393,18 +382,15 @@ def test_shipping_cost_post(page: Page, base_url: str):
     clear_cart(page, base_url)
 
     page.goto(f"{base_url}/{product['path']}")
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1000)
+    wait_for_page_ready(page)
     accept_cookie_banner(page)
 
     buy_btn = page.locator("button.btn-buy")
-    buy_btn.first.click()
-    page.wait_for_timeout(2000)
+    click_and_wait_for_cart(page, buy_btn.first)
 
     # Warenkorb prüfen
     page.goto(f"{base_url}/checkout/cart")
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1500)
+    wait_for_page_ready(page)
 
     shipping = get_cart_shipping(page)
     print(f"    Versandkosten: {shipping} €" if shipping is not None else "    Versandkosten: N/A")
@@ -438,19 +424,16 @@ def test_shipping_cost_spedition(page: Page, base_url: str):
     clear_cart(page, base_url)
 
     page.goto(f"{base_url}/{product['path']}")
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1000)
+    wait_for_page_ready(page)
     accept_cookie_banner(page)
 
     buy_btn = page.locator("button.btn-buy")
     if buy_btn.count() > 0:
-        buy_btn.first.click()
-        page.wait_for_timeout(2000)
+        click_and_wait_for_cart(page, buy_btn.first)
 
     # Warenkorb prüfen
     page.goto(f"{base_url}/checkout/cart")
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1500)
+    wait_for_page_ready(page)
 
     shipping = get_cart_shipping(page)
     print(f"    Versandkosten: {shipping} €" if shipping is not None else "    Versandkosten: N/A")
@@ -485,18 +468,15 @@ def test_total_calculation(page: Page, base_url: str):
     clear_cart(page, base_url)
 
     page.goto(f"{base_url}/{product['path']}")
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1000)
+    wait_for_page_ready(page)
     accept_cookie_banner(page)
 
     buy_btn = page.locator("button.btn-buy")
-    buy_btn.first.click()
-    page.wait_for_timeout(2000)
+    click_and_wait_for_cart(page, buy_btn.first)
 
     # Warenkorb prüfen
     page.goto(f"{base_url}/checkout/cart")
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1500)
+    wait_for_page_ready(page)
 
     subtotal = get_cart_subtotal(page)
     shipping = get_cart_shipping(page) or 0
@@ -533,8 +513,7 @@ def test_availability_displayed(page: Page, base_url: str, product_id: str):
     print(f"\n[Test] Verfügbarkeitsanzeige: {product['name']}")
 
     page.goto(f"{base_url}/{product['path']}")
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1500)
+    wait_for_page_ready(page)
     accept_cookie_banner(page)
 
     # Verfügbarkeit suchen
@@ -578,8 +557,7 @@ def test_currency_consistent(page: Page, base_url: str):
 
     # PDP prüfen
     page.goto(f"{base_url}/{product['path']}")
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1000)
+    wait_for_page_ready(page)
     accept_cookie_banner(page)
 
     # Euro-Symbol auf PDP
@@ -612,8 +590,7 @@ def test_sku_displayed(page: Page, base_url: str, product_id: str):
     print(f"\n[Test] Artikelnummer: {product['name']}")
 
     page.goto(f"{base_url}/{product['path']}")
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1000)
+    wait_for_page_ready(page)
     accept_cookie_banner(page)
 
     # Artikelnummer suchen
@@ -646,8 +623,7 @@ def test_price_matches_expected(page: Page, base_url: str, product_id: str, expe
     print(f"    Erwarteter Preis: {expected_price} €")
 
     page.goto(f"{base_url}/{product['path']}")
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1500)
+    wait_for_page_ready(page)
     accept_cookie_banner(page)
 
     actual_price = get_product_price_from_pdp(page)
@@ -0,0 +1,137 @@
+"""Tests für Koordinator und Agenten-Client der verteilten Lasterzeugung (ohne Playwright)."""
+import threading
+
+from playwright_tests.utils.distributed import AgentClient, Coordinator, CoordinatorServer, format_distributed
+from playwright_tests.utils.sharding import ShardMessage
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_plan(count: int) -> list[dict]:
+    return [
+        {"order_num": i, "order_type": "guest_post", "product_ids": ["49415"], "customer_email": None}
+        for i in range(count)
+    ]
+
+
+def result_item(order_num: int, success: bool = True) -> dict:
+    return {
+        "order_num": order_num,
+        "result": {"success": success, "order_type": "guest_post", "duration_seconds": 30.0},
+        "finished_at": 1000.0 + order_num,
+    }
+
+
+def drain(coordinator: Coordinator) -> list[tuple]:
+    events = []
+    while not coordinator._events.empty():
+        events.append(coordinator._events.get())
+    return events
+
+
+def test_waits_for_agents_then_hands_out_batches():
+    clock = FakeClock()
+    coordinator = Coordinator(make_plan(12), batch_size=5, min_agents=2, register_timeout_seconds=60, clock=clock)
+
+    coordinator.register("a", capacity=10)
+    assert coordinator.lease("a", 10) == {"orders": [], "retry_after": 1.0, "finished": False}
+
+    coordinator.register("b", capacity=10)
+    first = coordinator.lease("a", 10)["orders"]
+    second = coordinator.lease("b", 3)["orders"]
+    assert [e["order_num"] for e in first] == [0, 1, 2, 3, 4]
+    assert [e["order_num"] for e in second] == [5, 6, 7]
+    assert coordinator.lease("b", 0)["orders"] == []  # Heartbeat ohne Vergabe
+    assert [kind for kind, _, _ in drain(coordinator)] == [ShardMessage.STARTED, ShardMessage.STARTED]
+
+
+def test_global_rate_limits_starts_across_agents():
+    clock = FakeClock()
+    coordinator = Coordinator(make_plan(100), rate_per_minute=60, burst=2, batch_size=10, clock=clock)
+    coordinator.register("a", capacity=10)
+    coordinator.register("b", capacity=10)
+
+    assert len(coordinator.lease("a", 10)["orders"]) == 2  # Burst aufgebraucht
+    reply = coordinator.lease("b", 10)
+    assert reply["orders"] == [] and reply["retry_after"] == 1.0
+
+    clock.now = 1.5
+    assert len(coordinator.lease("b", 10)["orders"]) == 1
+    clock.now = 10.0
+    assert len(coordinator.lease("a", 10)["orders"]) == 2  # nie mehr als burst
+
+
+def test_error_rate_stops_all_agents():
+    coordinator = Coordinator(make_plan(50), batch_size=10, stop_error_rate=0.3, stop_min_orders=5, clock=FakeClock())
+    coordinator.register("a", capacity=10)
+    coordinator.register("b", capacity=10)
+    leased = [e["order_num"] for e in coordinator.lease("a", 10)["orders"]]
+
+    reply = coordinator.report("a", [result_item(n, success=n % 2 == 0) for n in leased[:6]])
+    assert reply["finished"] is True
+    assert coordinator.lease("b", 10) == {"orders": [], "retry_after": 0.0, "finished": True}
+
+    coordinator.report("a", [result_item(n) for n in leased[6:]])
+    coordinator.finish("a", None)
+    assert not coordinator.finished  # Agent b hat sich noch nicht abgemeldet
+    coordinator.finish("b", None)
+    assert coordinator.finished
+
+    stats = coordinator.status()
+    assert (stats["finished"], stats["failed"], stats["not_started"]) == (10, 3, 40)
+    assert "gestoppt: Fehlerrate 50% über 30% (40 nicht gestartet)" in format_distributed(stats)
+
+
+def test_silent_agent_orders_count_as_failed():
+    clock = FakeClock()
+    coordinator = Coordinator(make_plan(4), batch_size=2, agent_timeout_seconds=30, clock=clock)
+    coordinator.register("a", capacity=2)
+    coordinator.register("b", capacity=2)
+    coordinator.lease("a", 2)
+    coordinator.lease("b", 2)
+    drain(coordinator)
+
+    clock.now = 20.0
+    coordinator.report("b", [result_item(2), result_item(3)])
+    clock.now = 40.0
+    coordinator.expire_agents()
+    coordinator.report("a", [result_item(0)])  # zu spät: bereits als verloren gewertet
+    coordinator.finish("b", None)
+
+    events = drain(coordinator)
+    lost = [p for kind, agent, p in events if kind == ShardMessage.RESULT and agent == "a"]
+    assert [p["result"]["success"] for p in lost] == [False, False]
+    assert "ausgefallen" in lost[0]["result"]["error_message"]
+    assert any(kind == ShardMessage.ERROR for kind, _, _ in events)
+    assert coordinator.finished
+    assert coordinator.status()["agents"]["a"]["state"] == "lost"
+
+
+def test_http_round_trip():
+    coordinator = Coordinator(make_plan(3), batch_size=2, settings={"run_id": "distributed-1"})
+    with CoordinatorServer(coordinator, host="127.0.0.1", port=0) as server:
+        client = AgentClient(server.url, "agent-1")
+
+        def agent():
+            assert client.register(capacity=2)["settings"] == {"run_id": "distributed-1"}
+            while True:
+                reply = client.lease(2)
+                if reply["finished"]:
+                    break
+                client.report([result_item(e["order_num"]) for e in reply["orders"]])
+            client.finish({"backend": {}})
+
+        thread = threading.Thread(target=agent)
+        thread.start()
+        events = list(coordinator.messages(timeout_seconds=10, poll_seconds=0.05))
+        thread.join()
+
+    kinds = [kind for kind, _, _ in events]
+    assert kinds == [ShardMessage.STARTED] + [ShardMessage.RESULT] * 3 + [ShardMessage.DONE]
+    assert coordinator.status()["agents"]["agent-1"] == {"capacity": 2, "reported": 3, "state": "done"}
@@ -0,0 +1,99 @@
+"""Tests für das gebündelte Auslesen des DOM (ohne Browser)."""
+import pytest
+
+from playwright_tests.pages.cart_page import CartItem, CartPage
+from playwright_tests.pages.checkout_page import CheckoutPage
+from playwright_tests.utils.dom_extract import EXTRACT_SCRIPT, DomField
+
+
+class RecordingPage:
+    """Minimale Page: beantwortet jedes ``evaluate_all`` mit vorbereiteten Daten und zählt die Runden."""
+
+    def __init__(self, results: dict[str, list[dict]]):
+        self.results = results
+        self.calls: list[tuple[str, dict]] = []
+        self.url = "https://shop.example/checkout/cart"
+
+    def locator(self, selector: str):
+        page = self
+
+        class Locator:
+            async def evaluate_all(self, script: str, spec: dict):
+                assert script == EXTRACT_SCRIPT
+                page.calls.append((selector, spec))
+                return page.results.get(selector, [])
+
+        return Locator()
+
+
+def test_dom_field_spec_and_validation():
+    spec = DomField(fields={
+        "name": DomField(".line-item-label"),
+        "prices": DomField(".price", all=True),
+        "id": DomField(read="attr", attr="data-id"),
+    }).to_js()
+
+    assert spec["fields"]["name"] == {"selector": ".line-item-label", "read": "text", "attr": "", "all": False}
+    assert spec["fields"]["prices"]["all"] is True
+    assert spec["fields"]["id"]["attr"] == "data-id"
+
+    with pytest.raises(ValueError, match="Leseart"):
+        DomField(".x", read="inner_html")
+    with pytest.raises(ValueError, match="Attributname"):
+        DomField(".x", read="attr")
+    with pytest.raises(ValueError, match="kein reines CSS"):
+        DomField("button:has-text('Kasse')")
+
+
+@pytest.mark.asyncio
+async def test_cart_items_are_read_in_one_round_trip():
+    page = RecordingPage({CartPage.CART_ITEM: [
+        {"name": "Kurzarmshirt", "quantity": "2", "unit_price": "€ 29,90", "total_price": "€ 59,80"},
+        {"name": "Polsterbett", "quantity": "", "unit_price": "1299,00 €", "total_price": None},
+    ]})
+
+    items = await CartPage(page, "https://shop.example").get_cart_items()
+
+    assert len(page.calls) == 1
+    assert items == [
+        CartItem("Kurzarmshirt", 2, 29.90, 59.80, 0),
+        CartItem("Polsterbett", 1, 1299.0, 0.0, 1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_views_are_read_in_one_round_trip():
+    page = RecordingPage({"html": [{
+        "items": [{"name": "Kurzarmshirt", "quantity": "1", "unit_price": "€ 29,90", "total_price": "€ 29,90"}],
+        "subtotal": "€ 29,90",
+        "total": "€ 34,80",
+    }]})
+    view = await CartPage(page, "https://shop.example").read_cart()
+
+    assert len(page.calls) == 1
+    assert page.calls[0][1]["fields"]["items"]["all"] is True
+    assert [item.name for item in view.items] == ["Kurzarmshirt"]
+    assert (view.subtotal, view.total) == (29.90, 34.80)
+
+    page = RecordingPage({"html": [{
+        "shipping_address": "Test Kunde Teststraße 1 4020 Linz",
+        "billing_address": None,
+        "payment_methods": ["Rechnung\n  Zahlung innerhalb von 14 Tagen", "Kreditkarte", None],
+        "selected_payment_method": "0195abc",
+        "shipping_methods": ["Postversand", "Speditionsversand (Fink AT)"],
+        "selected_shipping_method": "Speditionsversand (Fink AT)",
+        "subtotal": "€ 29,90",
+        "total": "€ 34,80",
+        "form_errors": [],
+    }]})
+    summary = await CheckoutPage(page, "https://shop.example").read_confirm_summary()
+
+    assert len(page.calls) == 1
+    assert summary.payment_methods == ["Rechnung", "Kreditkarte"]
+    assert summary.selected_shipping_method == "Speditionsversand (Fink AT)"
+    assert summary.billing_address is None and summary.form_errors == []
+
+    # Ohne Treffer für den Wurzel-Selektor sind alle Felder None
+    page = RecordingPage({})
+    empty = await CartPage(page, "https://shop.example").read_cart()
+    assert (empty.items, empty.subtotal, empty.total) == ([], 0.0, 0.0)
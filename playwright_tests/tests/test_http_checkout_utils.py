@@ -0,0 +1,312 @@
+"""Tests für den Checkout auf Protokoll-Ebene (gegen einen lokalen Stub-Shop, ohne Browser)."""
+import itertools
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs
+
+import pytest
+from playwright.async_api import async_playwright
+
+from playwright_tests.pages.checkout_page import Address
+from playwright_tests.tests._fakes import serve_stub
+from playwright_tests.utils.http_checkout import (
+    HttpCheckout,
+    HttpCheckoutError,
+    HttpSessionPool,
+    StorefrontHtml,
+    parse_order_id,
+    parse_order_number,
+)
+
+
+PRODUCT_ID = "0123456789abcdef0123456789abcdef"
+SALUTATION_MR = "aaaa0000aaaa0000aaaa0000aaaa0001"
+COUNTRY_AT = "cccc0000cccc0000cccc0000cccc0043"
+PAYMENT_PREPAYMENT = "bbbb0000bbbb0000bbbb0000bbbb0001"
+PAYMENT_INVOICE = "bbbb0000bbbb0000bbbb0000bbbb0002"
+CUSTOMER = ("kunde@example.com", "geheim")
+
+PDP_HTML = f"""
+<form action="/checkout/line-item/add" method="post">
+    <input type="hidden" name="_csrf_token" value="tok-cart">
+    <input type="hidden" name="lineItems[{PRODUCT_ID}][id]" value="{PRODUCT_ID}">
+    <button class="btn-buy">In den Warenkorb</button>
+</form>
+"""
+
+REGISTER_HTML = f"""
+<form action="/account/register" method="post">
+    <input type="hidden" name="_csrf_token" value="tok-register">
+    <input type="hidden" name="redirectTo" value="frontend.checkout.confirm.page">
+    <select name="salutationId" id="personalSalutation">
+        <option disabled selected value="">Anrede</option>
+        <option value="aaaa0000aaaa0000aaaa0000aaaa0002">Frau</option>
+        <option value="{SALUTATION_MR}">Herr</option>
+    </select>
+    <input type="checkbox" name="createCustomerAccount" value="1" checked>
+    <select name="billingAddress[countryId]">
+        <option value="cccc0000cccc0000cccc0000cccc0049">Deutschland</option>
+        <option value="{COUNTRY_AT}">&Ouml;sterreich</option>
+    </select>
+    <button type="submit">Weiter</button>
+</form>
+"""
+
+LOGIN_HTML = """
+<form action="/account/login" method="post">
+    <input type="hidden" name="_csrf_token" value="tok-login">
+    <input type="email" name="username"><input type="password" name="password">
+</form>
+"""
+
+
+def confirm_html(payment_id: str) -> str:
+    def radio(value: str, label: str) -> str:
+        checked = " checked" if value == payment_id else ""
+        return (f'<input type="radio" id="paymentMethod{value}" name="paymentMethodId" value="{value}" '
+                f'form="changePaymentForm"{checked}><label for="paymentMethod{value}">'
+                f'<strong>{label}</strong> <span>Beschreibung</span></label>')
+
+    return f"""
+    <form id="changePaymentForm" action="/checkout/configure" method="post">
+        <input type="hidden" name="_csrf_token" value="tok-configure">
+        <input type="hidden" name="redirectTo" value="frontend.checkout.confirm.page">
+    </form>
+    {radio(PAYMENT_PREPAYMENT, "Vorkasse")}
+    {radio(PAYMENT_INVOICE, "Rechnung")}
+    <form id="confirmOrderForm" action="/checkout/order" method="post">
+        <input type="hidden" name="_csrf_token" value="tok-order">
+    </form>
+    <input type="checkbox" id="tos" name="tos" form="confirmOrderForm">
+    """
+
+
+class StubShop:
+    """Shopware-Ersatz für den Checkout-Ablauf: Sessions per Cookie, CSRF-Tokens pro Formular."""
+
+    def __init__(self):
+        self.sessions: dict[str, dict] = {}
+        self.orders: list[dict] = []
+        self.session_ids = itertools.count(1)
+        shop = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _session(self) -> tuple[str, dict]:
+                if not getattr(self, "sid", None):
+                    for part in self.headers.get("Cookie", "").split(";"):
+                        name, _, value = part.strip().partition("=")
+                        if name == "session-" and value in shop.sessions:
+                            self.sid = value
+                    if not getattr(self, "sid", None):
+                        self.sid = f"s{next(shop.session_ids)}"
+                        shop.sessions[self.sid] = {"cart": {}, "customer": None, "payment": PAYMENT_PREPAYMENT}
+                return self.sid, shop.sessions[self.sid]
+
+            def _send(self, status: int, body: str = "", location: str = ""):
+                sid, _ = self._session()
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Set-Cookie", f"session-={sid}; Path=/")
+                if location:
+                    self.send_header("Location", location)
+                self.end_headers()
+                self.wfile.write(body.encode())
+
+            def do_GET(self):
+                sid, session = self._session()
+                if self.path.startswith("/p/"):
+                    self._send(200, PDP_HTML)
+                elif self.path == "/checkout/register":
+                    self._send(200, REGISTER_HTML)
+                elif self.path == "/checkout/confirm":
+                    if session["customer"]:
+                        self._send(200, confirm_html(session["payment"]))
+                    else:
+                        self._send(302, location="/checkout/register")
+                elif self.path.startswith("/checkout/finish"):
+                    number = shop.orders[-1]["number"]
+                    self._send(200, f'<p class="finish-ordernumber">Ihre Bestellnummer: <b>{number}</b></p>')
+                elif self.path == "/account/login":
+                    self._send(200, LOGIN_HTML)
+                elif self.path == "/account":
+                    self._send(200, "<h1>Übersicht</h1>")
+                elif self.path == "/account/logout":
+                    shop.sessions[sid] = {"cart": {}, "customer": None, "payment": PAYMENT_PREPAYMENT}
+                    self._send(302, location="/account/login")
+                else:
+                    self._send(404)
+
+            def do_POST(self):
+                _, session = self._session()
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode()
+                form = {k: v[0] for k, v in parse_qs(body).items()}
+                tokens = {
+                    "/checkout/line-item/add": "tok-cart",
+                    "/account/register": "tok-register",
+                    "/account/login": "tok-login",
+                    "/checkout/configure": "tok-configure",
+                    "/checkout/order": "tok-order",
+                }
+                if form.get("_csrf_token") != tokens.get(self.path):
+                    self._send(403, "Invalid CSRF token")
+                elif self.path == "/checkout/line-item/add":
+                    session["cart"][PRODUCT_ID] = session["cart"].get(PRODUCT_ID, 0) + 1
+                    self._send(200, "<div class='offcanvas-cart'></div>")
+                elif self.path == "/account/register":
+                    if form.get("salutationId") != SALUTATION_MR or "createCustomerAccount" in form:
+                        self._send(200, '<div class="alert alert-danger">Bitte Anrede wählen.</div>' + REGISTER_HTML)
+                        return
+                    session["customer"] = {**form, "guest": form.get("guest") == "1"}
+                    self._send(302, location="/checkout/confirm")
+                elif self.path == "/account/login":
+                    if (form.get("username"), form.get("password")) != CUSTOMER:
+                        self._send(200, '<div class="alert alert-danger">Zugangsdaten ungültig.</div>' + LOGIN_HTML)
+                        return
+                    session["customer"] = {"guest": False, "email": form["username"]}
+                    self._send(302, location="/account")
+                elif self.path == "/checkout/configure":
+                    session["payment"] = form["paymentMethodId"]
+                    self._send(302, location="/checkout/confirm")
+                elif self.path == "/checkout/order":
+                    if form.get("tos") != "on" or not session["cart"]:
+                        self._send(302, location="/checkout/confirm")
+                        return
+                    order_id = f"{len(shop.orders) + 1:032x}"
+                    shop.orders.append({
+                        "id": order_id,
+                        "number": str(10001 + len(shop.orders)),
+                        "payment": session["payment"],
+                        "customer": session["customer"],
+                        "cart": dict(session["cart"]),
+                    })
+                    session["cart"] = {}
+                    self._send(302, location=f"/checkout/finish?orderId={order_id}")
+                else:
+                    self._send(404)
+
+        self.handler = Handler
+        self.base_url = ""
+
+
+@pytest.fixture
+def shop():
+    stub = StubShop()
+    with serve_stub(stub.handler) as base_url:
+        stub.base_url = base_url
+        yield stub
+
+
+def guest_address(num: int = 1) -> Address:
+    return Address(first_name="Perf", last_name=f"Test-{num}", zip_code="4020", city="Linz",
+                   email=f"perf-{num}@example.com")
+
+
+def test_storefront_html_parses_forms_and_choices():
+    register = StorefrontHtml(REGISTER_HTML)
+    form = register.form("/account/register")
+    assert form.fields == {
+        "_csrf_token": "tok-register",
+        "redirectTo": "frontend.checkout.confirm.page",
+        "salutationId": "",
+        "createCustomerAccount": "1",
+    }
+    assert register.choice("salutationId", "Herr").value == SALUTATION_MR
+    assert register.choice("billingAddress[countryId]", "Österreich").value == COUNTRY_AT
+    assert register.choice("salutationId", "Divers") is None
+
+    confirm = StorefrontHtml(confirm_html(PAYMENT_PREPAYMENT))
+    assert confirm.checked("paymentMethodId").label == "Vorkasse Beschreibung"
+    assert confirm.choice("paymentMethodId", "rechnung").value == PAYMENT_INVOICE
+    # Eingabefelder mit form="..." gehören zum referenzierten Formular
+    assert confirm.form("/checkout/configure").fields["paymentMethodId"] == PAYMENT_PREPAYMENT
+    assert confirm.form("/checkout/order").fields == {"_csrf_token": "tok-order"}
+
+    errors = StorefrontHtml('<div class="alert alert-danger"><div class="alert-content"> Fehler <b>A</b></div></div>')
+    assert errors.errors == ["Fehler A"]
+    assert parse_order_id("https://shop/checkout/finish?orderId=ab12-cd") == "ab12-cd"
+    assert parse_order_number('<p class="finish-ordernumber">Nr. <strong>10042</strong></p>') == "10042"
+
+
+@pytest.mark.asyncio
+async def test_guest_order_over_http(shop):
+    checkout = HttpCheckout(shop.base_url, {"invoice": "Rechnung"})
+    submitted = []
+    async with async_playwright() as p:
+        pool = HttpSessionPool(p.request, shop.base_url)
+        async with pool.lease() as session:
+            order = await checkout.guest_order(
+                session.context, ["p/duftkissen/ge-p-49415"], guest_address(), "invoice",
+                on_submit=lambda: submitted.append(True),
+            )
+            assert await checkout.reset(session.context)
+        await pool.close()
+
+    assert order.order_id == f"{1:032x}"
+    assert order.order_number == "10001"
+    assert order.payment_method == "Rechnung"
+    # PDP, Warenkorb, Register-Seite, Registrierung, Zahlungsart, Bestellung
+    assert order.requests == 6
+    assert set(order.step_durations) == {"http_pdp", "http_cart", "http_register", "http_payment", "http_order"}
+    assert submitted == [True]
+
+    placed = shop.orders[0]
+    assert placed["payment"] == PAYMENT_INVOICE
+    assert placed["cart"] == {PRODUCT_ID: 1}
+    assert placed["customer"]["guest"] is True
+    assert placed["customer"]["billingAddress[countryId]"] == COUNTRY_AT
+    assert placed["customer"]["email"] == "perf-1@example.com"
+
+
+@pytest.mark.asyncio
+async def test_registered_order_and_failures(shop):
+    checkout = HttpCheckout(shop.base_url)
+    async with async_playwright() as p:
+        context = await p.request.new_context()
+        try:
+            # Bereits gewählte Zahlungsart: kein configure-Request
+            order = await checkout.registered_order(context, *CUSTOMER, ["p/duftkissen/ge-p-49415"], "Vorkasse")
+            assert order.requests == 6
+            assert "http_payment" not in order.step_durations
+
+            with pytest.raises(HttpCheckoutError, match="Zugangsdaten ungültig"):
+                await checkout.registered_order(context, CUSTOMER[0], "falsch", ["p/duftkissen/ge-p-49415"], "Vorkasse")
+
+            await checkout.reset(context)
+            with pytest.raises(HttpCheckoutError, match="Anrede 'Divers'"):
+                await checkout.guest_order(context, [], Address(salutation="Divers"), "Vorkasse")
+            with pytest.raises(HttpCheckoutError, match="Zahlungsart 'Kreditkarte' nicht gefunden"):
+                await checkout.guest_order(context, ["p/duftkissen/ge-p-49415"], guest_address(2), "Kreditkarte")
+        finally:
+            await context.dispose()
+
+    assert [o["customer"]["guest"] for o in shop.orders] == [False]
+
+
+@pytest.mark.asyncio
+async def test_session_pool_reuses_and_discards_sessions(shop):
+    checkout = HttpCheckout(shop.base_url)
+    async with async_playwright() as p:
+        pool = HttpSessionPool(p.request, shop.base_url, max_uses=2)
+        for num in range(3):
+            async with pool.lease() as session:
+                order = await checkout.guest_order(session.context, ["p/a/ge-p-1"], guest_address(num), "Vorkasse")
+                pool.stats.record(order)
+                session.healthy = await checkout.reset(session.context)
+        with pytest.raises(RuntimeError):
+            async with pool.lease():
+                raise RuntimeError("Abbruch")
+        await pool.close()
+
+    # 1. und 2. Bestellung in derselben Sitzung (nach Logout mit leerem Warenkorb), dann verworfen;
+    # die abgebrochene Ausleihe verwirft die Sitzung der 3. Bestellung
+    assert [o["cart"] for o in shop.orders] == [{PRODUCT_ID: 1}] * 3
+    assert pool.stats.to_dict() == {
+        "sessions_created": 2,
+        "sessions_reused": 2,
+        "sessions_discarded": 2,
+        "orders": 3,
+        "requests": 15,
+        "requests_per_order": 5.0,
+    }
@@ -0,0 +1,60 @@
+"""Tests für das Nutzerpfad-Modell (Markow-Kette über Seitentypen)."""
+import random
+from collections import Counter
+
+import pytest
+
+from playwright_tests.config import JourneyConfig
+from playwright_tests.utils.journey_model import JourneyModel, JourneyPage, JourneySession
+
+
+def test_journey_model_walks_weighted_chain():
+    model = JourneyModel(
+        {"listing": 1},
+        {
+            "listing": JourneyPage(think_seconds=2.0, think_sigma=0, next={"pdp": 3, "exit": 1}),
+            "pdp": JourneyPage(think_seconds=10.0, next={"exit": 1}),
+        },
+    )
+    rng = random.Random(1)
+    assert model.start(rng) == "listing"
+    steps = Counter(model.step("listing", rng) for _ in range(4000))
+    assert 0.7 < steps["pdp"] / 4000 < 0.8
+    assert steps[None] + steps["pdp"] == 4000
+    assert model.step("pdp", rng) is None
+
+    assert model.think_time("listing", rng) == 2.0
+    pauses = sorted(model.think_time("pdp", rng) for _ in range(2001))
+    assert 8.5 < pauses[1000] < 11.5  # Median der Log-Normalverteilung
+
+    visits = model.expected_visits()
+    assert visits["listing"] == pytest.approx(1.0)
+    assert visits["pdp"] == pytest.approx(0.75)
+
+
+def test_journey_model_rejects_invalid_definitions():
+    with pytest.raises(ValueError, match="Unbekannte Seitentypen"):
+        JourneyModel({"cart": 1}, {"cart": JourneyPage()})
+    with pytest.raises(ValueError, match="nicht definiert"):
+        JourneyModel({"home": 1}, {"home": JourneyPage(next={"pdp": 1})})
+    with pytest.raises(ValueError, match="Einstiegsseite"):
+        JourneyModel({}, {"home": JourneyPage()})
+
+    # Standardmodell aus der Konfiguration ist gültig und endet im Mittel nach wenigen Seiten
+    model = JourneyModel.from_config(JourneyConfig())
+    assert 2 < sum(model.expected_visits().values()) < 15
+
+
+def test_journey_session_builds_urls_from_context():
+    session = JourneySession(["/moebel/"], ["kissen"], ["p/duftkissen/ge-p-49415"], random.Random(3))
+    assert session.url("home") == "/"
+    assert session.url("listing") == "/moebel/"
+    assert session.url("listing_page") == "/moebel/?p=2"
+    assert session.url("listing_page") == "/moebel/?p=3"
+    assert session.url("listing_sort").startswith("/moebel/?order=")
+    assert session.url("listing_filter").startswith("/moebel/?min-price=")
+    assert session.url("suggest") in {"/suggest?search=ki", "/suggest?search=kis", "/suggest?search=kiss"}
+    assert session.url("search") == "/search?search=kissen"
+    assert session.url("pdp") == "p/duftkissen/ge-p-49415"
+    with pytest.raises(ValueError):
+        session.url("cart")
@@ -0,0 +1,81 @@
+"""Tests für die Latenz-Histogramme (ohne Browser)."""
+import json
+import random
+
+import pytest
+
+from playwright_tests.utils.latency_histogram import LatencyHistogram, LatencyHistogramSet
+
+
+def test_percentiles_within_precision():
+    rng = random.Random(42)
+    values = [rng.lognormvariate(3, 0.5) for _ in range(10_000)]
+    hist = LatencyHistogram(precision=0.01)
+    for value in values:
+        hist.record(value)
+
+    values.sort()
+    for p in (50, 90, 95, 99, 99.9):
+        exact = values[max(0, int(round(p / 100 * len(values))) - 1)]
+        assert hist.percentile(p) == pytest.approx(exact, rel=0.02)
+
+    assert hist.count == len(values)
+    assert hist.min_seconds == values[0]
+    assert hist.max_seconds == values[-1]
+    assert hist.mean_seconds == pytest.approx(sum(values) / len(values))
+
+
+def test_memory_is_bounded():
+    hist = LatencyHistogram(precision=0.01)
+    for i in range(100_000):
+        hist.record(0.5 + (i % 1000) * 0.1)
+    # 0.5s .. 100s bei 1 % Genauigkeit -> ca. 530 Buckets
+    assert len(hist.counts) < 600
+
+
+def test_merge_equals_combined_recording():
+    a, b, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for i in range(1, 200):
+        (a if i % 2 else b).record(i / 10)
+        combined.record(i / 10)
+
+    a.merge(b)
+    assert a.counts == combined.counts
+    assert a.percentiles() == combined.percentiles()
+    assert a.min_seconds == combined.min_seconds
+    assert a.max_seconds == combined.max_seconds
+
+
+def test_merge_rejects_different_resolution():
+    with pytest.raises(ValueError):
+        LatencyHistogram(precision=0.01).merge(LatencyHistogram(precision=0.05))
+
+
+def test_roundtrip_through_json():
+    hist = LatencyHistogram()
+    for value in (1.2, 3.4, 5.6, 120.0):
+        hist.record(value)
+
+    restored = LatencyHistogram.from_dict(json.loads(json.dumps(hist.to_dict())))
+    assert restored.counts == hist.counts
+    assert restored.summary() == hist.summary()
+
+
+def test_empty_histogram():
+    hist = LatencyHistogram()
+    assert hist.percentile(99) == 0.0
+    assert hist.summary()["count"] == 0
+
+
+def test_histogram_set_groups_by_key():
+    histograms = LatencyHistogramSet()
+    histograms.record("place_order", 2.0)
+    histograms.record("place_order", 4.0)
+    histograms.record("fill_guest_address", 1.0)
+
+    summary = histograms.summary()
+    assert summary["place_order"]["count"] == 2
+    assert summary["fill_guest_address"]["max"] == 1.0
+
+    restored = LatencyHistogramSet.from_dict(histograms.to_dict())
+    assert restored.summary() == summary
@@ -0,0 +1,115 @@
+"""Tests für das Auslesen und Vergleichen des Mega-Menü-Baums (ohne Browser)."""
+from playwright_tests.data.navigation_trees import EXPECTED_MOEBEL_TREE, EXPECTED_NAVIGATION_TREES
+from playwright_tests.utils import navigation_tree
+from playwright_tests.utils.navigation_tree import (
+    NAVIGATION_SCRIPT,
+    NavLink,
+    build_tree,
+    count_expected,
+    diff_category,
+    format_navigation_diff,
+    load_navigation,
+    parse_navigation,
+)
+
+
+RAW = {
+    "lang": "de-AT",
+    "categories": [
+        {"name": "Möbel", "href": "https://shop.example/moebel/", "trigger": "m1", "links": [
+            {"name": "Möbel", "href": "/moebel/", "level": 0},
+            {"name": "Betten", "href": "/moebel/betten/", "level": 0},
+            {"name": "Betten und Nachttische", "href": "/moebel/betten/betten-und-nachttische", "level": 1},
+            {"name": "Nachttische", "href": "/moebel/nachttische", "level": 2},
+            {"name": "Bettzubehör", "href": "/moebel/bettzubeh%C3%B6r", "level": 2},
+            {"name": "Sofas", "href": "/moebel/sofas", "level": 0},
+            {"name": "Hocker", "href": "/moebel/hocker", "level": 1},
+            {"name": "Hocker", "href": "/moebel/sofas/hocker", "level": 1},
+            {"name": "empty", "href": "/moebel/leer", "level": 1},
+            {"name": "Gartenmöbel", "href": "/moebel/garten", "level": 0},
+            {"name": "Alle anzeigen", "href": "/moebel/", "level": 0},
+        ]},
+        {"name": "Magazin", "href": "/magazin", "trigger": "", "links": None},
+        {"name": "Mode", "href": "/mode", "trigger": "m2", "links": None},
+    ],
+}
+
+EXPECTED = [
+    {"name": "Betten", "url": "/betten", "subcategories": [
+        {"name": "Betten und Nachttische", "url": "/betten-und-nachttische", "subcategories": [
+            {"name": "Nachttische", "url": "/nachttische"},
+            {"name": "Bettzubehör", "url": "/bettzubehoer"},
+        ]},
+    ]},
+    {"name": "Sofas", "url": "/sofas", "subcategories": [
+        {"name": "Schlafsofas", "url": "/schlafsofas"},
+        {"name": "Hocker", "url": "/hocker"},
+    ]},
+]
+
+
+def test_tree_is_built_from_levels():
+    tree = build_tree([
+        NavLink("A", "/a", 0), NavLink("A1", "/a1", 1), NavLink("A1x", "/a1x", 2),
+        NavLink("A2", "/a2", 1), NavLink("B", "/b", 0), NavLink("B1", "/b1", 2),
+    ])
+    assert [node.name for node in tree] == ["A", "B"]
+    assert [node.name for node in tree[0].children] == ["A1", "A2"]
+    assert tree[0].children[0].children[0].name == "A1x"
+    # Uebersprungene Ebene haengt am naechsthoeheren Knoten
+    assert tree[1].children[0].name == "B1"
+
+    assert count_expected(EXPECTED_MOEBEL_TREE)["uk1"] == 10
+    assert "Möbel" in EXPECTED_NAVIGATION_TREES
+
+
+def test_diff_reports_missing_mismatches_duplicates_and_extras():
+    navigation = parse_navigation(RAW)
+    moebel = navigation.category("möbel")
+
+    assert moebel.path == "/moebel"
+    assert [link.name for link in moebel.entries][:2] == ["Betten", "Betten und Nachttische"]
+
+    diff = diff_category(moebel, EXPECTED)
+    assert [(m["level"], m["name"], m["parent"]) for m in diff.missing] == [("UK2", "Schlafsofas", "Sofas")]
+    assert [m["name"] for m in diff.url_mismatches] == ["Bettzubehör"]
+    assert diff.url_mismatches[0]["actual_url"] == "/moebel/bettzubehör"
+    assert [d["name"] for d in diff.duplicates] == ["Hocker"]
+    assert diff.empty_entries == [{"name": "empty", "path": "/moebel/leer"}]
+    assert diff.extras == [{"name": "Gartenmöbel", "path": "/moebel/garten"}]
+    assert len(diff.correct) == 5
+    assert len(diff.errors) == 4
+    report = format_navigation_diff(diff)
+    assert "FEHLEND (1):" in report and "[EXTRA] Gartenmöbel" in report
+
+    # Ohne Soll-Baum: nur Struktur-Fehler; ein Link ohne Flyout-Trigger ist kein Fehler
+    assert len(diff_category(moebel).errors) == 2
+    assert diff_category(navigation.category("Magazin")).errors == []
+    assert diff_category(navigation.category("Mode")).errors == ["Mega-Menü-Flyout für 'Mode' nicht gefunden"]
+
+
+def test_navigation_is_extracted_once_per_run_and_locale(monkeypatch):
+    monkeypatch.setattr(navigation_tree, "_NAVIGATION_CACHE", {})
+
+    class Page:
+        def __init__(self):
+            self.calls = []
+
+        def goto(self, url):
+            self.calls.append(("goto", url))
+
+        def wait_for_load_state(self, state):
+            pass
+
+        def evaluate(self, script, selector):
+            assert script == NAVIGATION_SCRIPT
+            self.calls.append(("evaluate", selector))
+            return {"lang": "de-AT", "categories": RAW["categories"][:2]}
+
+    page = Page()
+    first = load_navigation(page, "https://shop.example/", "de-AT")
+    again = load_navigation(page, "https://shop.example", "de-AT")
+    other = load_navigation(page, "https://shop.example", "de-DE")
+
+    assert first is again and other is not first
+    assert [call[0] for call in page.calls] == ["goto", "evaluate", "goto", "evaluate"]
@@ -0,0 +1,136 @@
+"""Tests für die Netzwerk-Aufzeichnung pro Bestellung (mit Fake-Kontext, ohne Playwright)."""
+import json
+import random
+
+from playwright_tests.config import NetworkTraceConfig
+from playwright_tests.pages.checkout_page import CheckoutResult
+from playwright_tests.tests._fakes import FakeEmitter as FakeContext
+from playwright_tests.utils.network_trace import (
+    NetworkTraceRecorder,
+    NetworkTraceStats,
+    NetworkTracer,
+    format_network_trace,
+    url_template,
+)
+
+
+class FakeRequest:
+    def __init__(self, url, method="GET", resource_type="document", failure=None, post_data=None):
+        self.url = url
+        self.method = method
+        self.resource_type = resource_type
+        self.failure = failure
+        self.post_data_buffer = post_data
+        self.timing = {
+            "startTime": 1_000_000.0,
+            "domainLookupStart": -1,
+            "domainLookupEnd": -1,
+            "connectStart": -1,
+            "secureConnectionStart": -1,
+            "connectEnd": -1,
+            "requestStart": 2.0,
+            "responseStart": 152.0,
+            "responseEnd": 180.0,
+        }
+
+
+class FakeResponse:
+    def __init__(self, request, status=200, length="512"):
+        self.request = request
+        self.status = status
+        self.headers = {"content-length": length} if length else {}
+
+
+def finish(context, request, status=200):
+    context.emit("response", FakeResponse(request, status))
+    context.emit("requestfinished", request)
+
+
+def test_url_template_replaces_ids_and_query_values():
+    assert url_template("https://shop.at/detail/0a1b2c3d4e5f60718293a4b5c6d7e8f9?x=1&a=2") == \
+        "https://shop.at/detail/{id}?a&x"
+    assert url_template("https://shop.at/Sofa-Linea/12345") == "https://shop.at/Sofa-Linea/{id}"
+    assert url_template("https://shop.at/checkout/confirm") == "https://shop.at/checkout/confirm"
+
+
+def test_recorder_captures_status_phases_and_sizes():
+    context = FakeContext()
+    recorder = NetworkTraceRecorder(capacity=10)
+    recorder.attach(context)
+
+    finish(context, FakeRequest("https://shop.at/checkout/order", method="POST", post_data=b"tos=on"), status=500)
+    context.emit("requestfailed", FakeRequest("https://cdn.at/x.js", resource_type="script", failure="net::ERR_FAILED"))
+    recorder.detach()
+    finish(context, FakeRequest("https://shop.at/nach-detach"))
+
+    data = recorder.to_dict()
+    first, second = data["requests"]
+    assert (first["method"], first["status"], first["duration_ms"]) == ("POST", 500, 180.0)
+    assert first["phases"] == {"wait": 150.0, "download": 28.0}
+    assert (first["request_bytes"], first["response_bytes"]) == (6, 512)
+    assert second["failure"] == "net::ERR_FAILED" and second["status"] is None
+    assert data["summary"]["requests"] == 2
+    assert data["summary"]["http_errors"] == 1
+    assert data["summary"]["failed"] == 1
+
+
+def test_ring_buffer_keeps_last_requests():
+    context = FakeContext()
+    recorder = NetworkTraceRecorder(capacity=3)
+    recorder.attach(context)
+
+    for i in range(5):
+        finish(context, FakeRequest(f"https://shop.at/seite-{i}"))
+
+    summary = recorder.summary()
+    assert [e.url for e in recorder.entries] == [f"https://shop.at/seite-{i}" for i in (2, 3, 4)]
+    assert (summary["requests"], summary["kept"], summary["dropped"]) == (5, 3, 2)
+
+
+def test_tracer_saves_failed_and_slow_orders_only(tmp_path):
+    cfg = NetworkTraceConfig(directory=str(tmp_path), slow_order_seconds=60)
+    tracer = NetworkTracer(cfg, "massentest-1")
+    context = FakeContext()
+    outcomes = [
+        CheckoutResult(success=False, error_message="Timeout", duration_seconds=30.0),
+        CheckoutResult(success=True, duration_seconds=75.0),
+        CheckoutResult(success=True, duration_seconds=20.0),
+    ]
+
+    for order_num, result in enumerate(outcomes):
+        with tracer.record(context) as recorder:
+            finish(context, FakeRequest("https://shop.at/checkout/confirm"))
+        tracer.finish(recorder, order_num, result)
+
+    assert context.listeners["requestfinished"] == []  # nach jeder Bestellung abgehängt
+    assert [r.network_trace is not None for r in outcomes] == [True, True, False]
+    saved = json.loads((tmp_path / "massentest-1" / "order-00000-failed.json").read_text(encoding="utf-8"))
+    assert saved["error_message"] == "Timeout"
+    assert saved["summary"]["requests"] == 1
+    report = tracer.stats.to_dict()
+    assert (report["recorded"], report["failed"], report["slow"], report["sampled"]) == (3, 1, 1, 0)
+    assert "2 von 3 Bestellungen gespeichert" in format_network_trace(report)
+
+
+def test_sampling_and_disabled_tracer(tmp_path):
+    cfg = NetworkTraceConfig(directory=str(tmp_path), slow_order_seconds=0, sample_rate=0.5)
+    tracer = NetworkTracer(cfg, "run", rng=random.Random(1))
+    reasons = [tracer.flush_reason(True, 10.0) for _ in range(200)]
+    assert 60 < reasons.count("sampled") < 140
+
+    disabled = NetworkTracer()
+    context = FakeContext()
+    with disabled.record(context) as recorder:
+        assert recorder is None
+    assert disabled.finish(recorder, 0, CheckoutResult(success=False)) is None
+    assert context.listeners == {}
+
+
+def test_stats_merge_across_shards():
+    stats = NetworkTraceStats()
+    stats.merge({"recorded": 10, "failed": 2, "slow": 1, "sampled": 0, "directories": ["a"]})
+    stats.merge({"recorded": 5, "failed": 1, "slow": 0, "sampled": 1, "directories": ["b", "a"]})
+
+    assert stats.to_dict() == {
+        "recorded": 15, "saved": 5, "failed": 3, "slow": 1, "sampled": 1, "directories": ["a", "b"],
+    }
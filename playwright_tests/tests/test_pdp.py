@@ -11,6 +11,13 @@ import pytest
 from playwright.sync_api import Page, expect
 
 from ..conftest import accept_cookie_banner
+from ..utils.readiness import (
+    click_and_wait_for_cart,
+    endpoint_predicate,
+    submit_and_wait_for_page,
+    wait_for_page_ready,
+    wait_for_settled,
+)
 
 
 # =============================================================================
@@ -72,12 +79,10 @@ def test_product_image_gallery(page: Page, base_url: str):
     try:
         print(f"    Step 1: Produktseite aufrufen")
         page.goto(f"{base_url}/{TEST_PRODUCT['path']}")
-        page.wait_for_load_state("domcontentloaded")
-        page.wait_for_timeout(1500)
+        wait_for_page_ready(page)
 
         print(f"    Step 2: Cookie-Banner akzeptieren")
         accept_cookie_banner(page)
-        page.wait_for_timeout(500)
 
         print(f"    Step 3: Hauptbild pruefen")
         image_selectors = [
@@ -130,7 +135,7 @@ def test_product_image_gallery(page: Page, base_url: str):
             second_thumb = thumbnails.nth(1) if thumb_count > 1 else thumbnails.first
             if second_thumb.is_visible():
                 second_thumb.click()
-                page.wait_for_timeout(1000)
+                wait_for_settled(page)
                 print(f"    [OK] Thumbnail angeklickt")
         else:
             print(f"    [INFO] Weniger als 2 Thumbnails, Klick-Test uebersprungen")
@@ -138,7 +143,7 @@ def test_product_image_gallery(page: Page, base_url: str):
         print(f"    Step 6: Zoom/Vergroesserung testen")
         if main_image and main_image.is_visible():
             main_image.click()
-            page.wait_for_timeout(1500)
+            wait_for_settled(page)
 
             zoom_selectors = [
                 ".image-zoom-container",
@@ -179,12 +184,10 @@ def test_variant_selection(page: Page, base_url: str):
     try:
         print(f"    Step 1: Produktseite mit Varianten aufrufen")
         page.goto(f"{base_url}/{VARIANT_PRODUCT['path']}")
-        page.wait_for_load_state("domcontentloaded")
-        page.wait_for_timeout(1500)
+        wait_for_page_ready(page)
 
         print(f"    Step 2: Cookie-Banner akzeptieren")
         accept_cookie_banner(page)
-        page.wait_for_timeout(500)
 
         print(f"    Step 3: Varianten-Auswahl pruefen")
         variant_selectors = [
@@ -242,7 +245,7 @@ def test_variant_selection(page: Page, base_url: str):
                         opt.click()
                         break
 
-        page.wait_for_timeout(2000)
+        wait_for_settled(page)
 
         print(f"    Step 5: Preis nach Variantenwechsel pruefen")
         price_after = ""
@@ -261,8 +264,7 @@ def test_variant_selection(page: Page, base_url: str):
         if buy_btn.count() > 0 and buy_btn.first.is_visible():
             is_disabled = buy_btn.first.get_attribute("disabled") is not None
             if not is_disabled:
-                buy_btn.first.click()
-                page.wait_for_timeout(2000)
+                click_and_wait_for_cart(page, buy_btn.first)
                 print(f"    [OK] Variante zum Warenkorb hinzugefuegt")
             else:
                 print(f"    [INFO] Warenkorb-Button deaktiviert (Variante evtl. nicht vorreetig)")
@@ -290,12 +292,10 @@ def test_product_description_visible(page: Page, base_url: str):
     try:
         print(f"    Step 1: Produktseite aufrufen")
         page.goto(f"{base_url}/{TEST_PRODUCT['path']}")
-        page.wait_for_load_state("domcontentloaded")
-        page.wait_for_timeout(1500)
+        wait_for_page_ready(page)
 
         print(f"    Step 2: Cookie-Banner akzeptieren")
         accept_cookie_banner(page)
-        page.wait_for_timeout(500)
 
         print(f"    Step 3: Produktbeschreibung pruefen")
         desc_selectors = [
@@ -358,12 +358,10 @@ def test_out_of_stock_behavior(page: Page, base_url: str):
     try:
         print(f"    Step 1: Produktseite aufrufen")
         page.goto(f"{base_url}/{VARIANT_PRODUCT['path']}")
-        page.wait_for_load_state("domcontentloaded")
-        page.wait_for_timeout(1500)
+        wait_for_page_ready(page)
 
         print(f"    Step 2: Cookie-Banner akzeptieren")
         accept_cookie_banner(page)
-        page.wait_for_timeout(500)
 
         print(f"    Step 3: Nicht vorreetige Variante suchen")
         options = page.locator(".product-detail-configurator-option")
@@ -379,7 +377,7 @@ def test_out_of_stock_behavior(page: Page, base_url: str):
                     opt_text = opt.inner_text().strip()
                     print(f"    Nicht vorreetige Variante gefunden: {opt_text}")
                     opt.click()
-                    page.wait_for_timeout(1500)
+                    wait_for_settled(page)
                     oos_variant_found = True
                     break
 
@@ -448,17 +446,15 @@ def test_hotspot_elements(page: Page, base_url: str):
     try:
         print(f"    Step 1: Seite mit Hotspot-Bildern aufrufen")
         page.goto(f"{base_url}/")
-        page.wait_for_load_state("domcontentloaded")
-        page.wait_for_timeout(2000)
+        wait_for_page_ready(page)
 
         print(f"    Step 2: Cookie-Banner akzeptieren")
         accept_cookie_banner(page)
-        page.wait_for_timeout(500)
 
         print(f"    Step 3: Hotspot-Bilder suchen")
         # Auf der Seite nach unten scrollen, um lazy-loaded Inhalte zu laden
         page.evaluate("window.scrollTo(0, document.body.scrollHeight / 2)")
-        page.wait_for_timeout(2000)
+        wait_for_settled(page)
 
         hotspot_selectors = [
             ".cms-element-image-slider .hotspot",
@@ -481,7 +477,7 @@ def test_hotspot_elements(page: Page, base_url: str):
         if not hotspot_found:
             # Scroll weiter und erneut suchen
             page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            page.wait_for_timeout(2000)
+            wait_for_settled(page)
             for sel in hotspot_selectors:
                 elems = page.locator(sel)
                 if elems.count() > 0:
@@ -507,7 +503,7 @@ def test_hotspot_elements(page: Page, base_url: str):
         first_hotspot = hotspot_elements.first
         if first_hotspot.is_visible():
             first_hotspot.click()
-            page.wait_for_timeout(1500)
+            wait_for_settled(page)
 
             print(f"    Step 6: Hotspot-Produktinfo pruefen")
             # Pruefen ob Overlay/Tooltip mit Produktinfo erscheint
@@ -594,15 +590,12 @@ def test_product_review(page: Page, base_url: str, config):
         # [1] Login
         print(f"    Step 1: Login als AT-Kunde ({email})")
         page.goto(f"{base_url}/account/login")
-        page.wait_for_load_state("domcontentloaded")
-        page.wait_for_timeout(1000)
+        wait_for_page_ready(page)
         accept_cookie_banner(page)
 
         page.fill("#loginMail", email)
         page.fill("#loginPassword", password)
-        page.locator("button:has-text('Anmelden')").first.click()
-        page.wait_for_load_state("domcontentloaded")
-        page.wait_for_timeout(1500)
+        submit_and_wait_for_page(page, page.locator("button:has-text('Anmelden')").first)
 
         assert "account/login" not in page.url, "Login fehlgeschlagen"
         print(f"    [OK] Login erfolgreich")
@@ -610,24 +603,23 @@ def test_product_review(page: Page, base_url: str, config):
         # [2] Produktseite aufrufen
         print(f"    Step 2: Produktseite aufrufen")
         page.goto(f"{base_url}/{TEST_PRODUCT['path']}")
-        page.wait_for_load_state("domcontentloaded")
-        page.wait_for_timeout(1500)
+        wait_for_page_ready(page)
 
         # [3] Bewertungs-Tab oeffnen
         print(f"    Step 3: Bewertungs-Tab oeffnen")
         review_tab = page.locator(REVIEW_TAB_LINK)
         if review_tab.count() > 0 and review_tab.first.is_visible():
             review_tab.first.click()
-            page.wait_for_timeout(1000)
+            wait_for_settled(page)
             print(f"    [OK] Bewertungs-Tab geoeffnet")
         else:
             # Zum Tab-Bereich scrollen und erneut versuchen
             page.evaluate("document.querySelector('.product-detail-tabs')?.scrollIntoView()")
-            page.wait_for_timeout(1000)
+            wait_for_settled(page)
             review_tab = page.locator(REVIEW_TAB_LINK)
             assert review_tab.count() > 0, "Bewertungs-Tab nicht gefunden"
             review_tab.first.click()
-            page.wait_for_timeout(1000)
+            wait_for_settled(page)
 
         # [4] Bewertungsformular ausfuellen
         print(f"    Step 4: Bewertungsformular ausfuellen")
@@ -661,9 +653,10 @@ def test_product_review(page: Page, base_url: str, config):
         print(f"    Step 5: Bewertung absenden")
         submit_btn = page.locator(REVIEW_SUBMIT_BUTTON)
         assert submit_btn.count() > 0, "Absenden-Button nicht gefunden"
-        submit_btn.first.click()
-        page.wait_for_load_state("domcontentloaded")
-        page.wait_for_timeout(2000)
+        # Shopware speichert per AJAX oder per Formular-POST mit Neuladen: auf die Antwort warten
+        with page.expect_response(endpoint_predicate("/rating"), timeout=15000):
+            submit_btn.first.click()
+        wait_for_page_ready(page)
 
         # [6] Bewertung verifizieren
         print(f"    Step 6: Bewertung in der Liste verifizieren")
@@ -677,7 +670,7 @@ def test_product_review(page: Page, base_url: str, config):
         review_tab = page.locator(REVIEW_TAB_LINK)
         if review_tab.count() > 0 and review_tab.first.is_visible():
             review_tab.first.click()
-            page.wait_for_timeout(1000)
+            wait_for_settled(page)
 
         # Bewertungstext in der Liste suchen
         review_items = page.locator(REVIEW_ITEM_CONTENT)
@@ -754,12 +747,10 @@ def test_variant_changes_price_and_stock(page: Page, base_url: str):
         # [1] Produktseite aufrufen
         print(f"    Step 1: Produktseite mit Varianten aufrufen")
         page.goto(f"{base_url}/{VARIANT_PRODUCT['path']}")
-        page.wait_for_load_state("domcontentloaded")
-        page.wait_for_timeout(1500)
+        wait_for_page_ready(page)
 
         print(f"    Step 2: Cookie-Banner akzeptieren")
         accept_cookie_banner(page)
-        page.wait_for_timeout(500)
 
         # [2] Varianten-Typ ermitteln (Buttons vs. Dropdown)
         print(f"    Step 3: Varianten-Optionen ermitteln")
@@ -787,7 +778,7 @@ def test_variant_changes_price_and_stock(page: Page, base_url: str):
 
                 print(f"\n    --- Variante: {opt_text} ---")
                 select_elem.select_option(value=opt_val)
-                page.wait_for_timeout(2000)
+                wait_for_settled(page)
 
                 result = _capture_variant_state(page, opt_text)
                 variant_results.append(result)
@@ -810,7 +801,7 @@ def test_variant_changes_price_and_stock(page: Page, base_url: str):
 
                 print(f"\n    --- Variante: {opt_text} ---")
                 opt.click()
-                page.wait_for_timeout(2000)
+                wait_for_settled(page)
 
                 result = _capture_variant_state(page, opt_text)
                 result["combinable"] = "is-combinable" in opt_classes or "is-active" in opt_classes
@@ -9,21 +9,43 @@ Dieser Test erstellt 150 echte Bestellungen mit verschiedenen Szenarien:
 - Multi-Produkt-Bestellungen
 """
 import asyncio
+import functools
 import json
+import math
+import queue
 import random
 import time
-from dataclasses import dataclass, field
+from collections import Counter
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 
 import pytest
-from playwright.async_api import Browser, BrowserContext
+from playwright.async_api import Browser, BrowserContext, async_playwright
 
-from playwright_tests.config import TestConfig, TestCustomer, get_config
+from playwright_tests.config import PerformanceTestDistribution, TestConfig, TestCustomer
 from playwright_tests.conftest import accept_cookie_banner_async
 from playwright_tests.pages.checkout_page import Address, CheckoutPage, CheckoutResult
+from playwright_tests.utils.adaptive_concurrency import AdaptiveLimiter, format_concurrency, merge_concurrency_reports
+from playwright_tests.utils.auth_state import AuthStateCache, format_auth_stats
+from playwright_tests.utils.browse_traffic import BrowseTraffic, browse_targets, format_browse_stats
+from playwright_tests.utils.cart_seeding import CartSeeder
+from playwright_tests.utils.distributed import AgentClient, Coordinator, CoordinatorServer, format_distributed
+from playwright_tests.utils.http_checkout import HttpCheckout, HttpOrder, HttpSessionPool, format_http_stats
+from playwright_tests.utils.journey_model import JourneyModel
+from playwright_tests.utils.context_pool import BrowserContextPool, ContextLease, order_context
+from playwright_tests.utils.latency_histogram import LatencyHistogram, LatencyHistogramSet, format_percentiles
+from playwright_tests.utils.network_trace import NetworkTraceStats, NetworkTracer, format_network_trace
+from playwright_tests.utils.readiness import click_and_wait_for_cart_async
+from playwright_tests.utils.response_metrics import ResponseMetrics, ResponseMetricsCollector, format_response_metrics
+from playwright_tests.utils.result_stream import LiveAggregator, ResultStream, new_run_id, start_run_stream
+from playwright_tests.utils.results_history import RunKind, performance_metrics, record_run
+from playwright_tests.utils.run_manifest import OrderState, RunManifest
+from playwright_tests.utils.request_blocking import RequestBlocker, RequestBlockingStats, format_blocking, get_profile
+from playwright_tests.utils.step_timing import StepStats, StepTimer
+from playwright_tests.utils.sharding import ShardMessage, run_shards, split_counts, split_weighted
 
 
 class OrderType(Enum):
@@ -42,11 +64,29 @@ class PerformanceOrderResult(CheckoutResult):
     product_ids: list[str] = field(default_factory=list)
     shipping_type: str = "post"
     customer_type: str = "guest"
+    cohort: str = ""  # hybrider Lauf: browser oder protocol
+
+    def to_dict(self) -> dict:
+        """Serialisiert das Ergebnis (z.B. für die Übertragung zwischen Prozessen)."""
+        data = asdict(self)
+        data["order_type"] = self.order_type.value
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PerformanceOrderResult":
+        """Erstellt ein Ergebnis aus ``to_dict()``-Daten."""
+        return cls(**{**data, "order_type": OrderType(data["order_type"])})
 
 
 @dataclass
 class PerformanceTestResult:
-    """Aggregiertes Ergebnis des Performance-Tests."""
+    """
+    Aggregiertes Ergebnis des Performance-Tests.
+
+    Einzelergebnisse werden über ``record()`` inkrementell in Zähler und
+    Latenz-Histogramme übernommen. Mit ``keep_order_results=False`` werden
+    die Einzelergebnisse selbst nicht aufbewahrt (konstanter Speicher).
+    """
     total_orders: int = 0
     successful_orders: int = 0
     failed_orders: int = 0
@@ -61,58 +101,138 @@ class PerformanceTestResult:
     max_duration_seconds: float = 0.0
     orders_per_minute: float = 0.0
 
+    # Latenz-Verteilung erfolgreicher Bestellungen (gesamt, pro Typ, pro Checkout-Schritt)
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    latency_by_type: LatencyHistogramSet = field(default_factory=LatencyHistogramSet)
+    latency_by_step: LatencyHistogramSet = field(default_factory=LatencyHistogramSet)
+    # Requests/Navigationen pro Checkout-Schritt (nur mit Schritt-Messung)
+    step_stats: StepStats = field(default_factory=StepStats)
+
     # Aufschlüsselung nach Typ
     results_by_type: dict[str, dict] = field(default_factory=dict)
 
+    # Hybrider Lauf: Ergebnisse und Latenz pro Kohorte, Stöber-Traffic pro Seitentyp
+    results_by_cohort: dict[str, dict] = field(default_factory=dict)
+    latency_by_cohort: LatencyHistogramSet = field(default_factory=LatencyHistogramSet)
+    browse_stats: Optional[dict] = None
+
     # Einzelergebnisse
+    keep_order_results: bool = True
     order_results: list[PerformanceOrderResult] = field(default_factory=list)
     errors: list[dict] = field(default_factory=list)
 
+    # Browser-Kontext-Pool (falls aktiviert)
+    context_pool_stats: Optional[dict] = None
+
+    # Login-Cache registrierter Kunden (falls aktiviert)
+    auth_state_stats: Optional[dict] = None
+
+    # Blockier-Profil für Drittanbieter-Requests (falls aktiv)
+    request_blocking_stats: Optional[dict] = None
+
+    # Adaptive Parallelität: nachhaltige Parallelität und Knie-Punkt (falls aktiv)
+    concurrency_stats: Optional[dict] = None
+
+    # Netzwerk-Aufzeichnung: gespeicherte Traces (falls aktiv)
+    network_trace_stats: Optional[dict] = None
+
+    # Backend-Kennzahlen pro Seitentyp (TTFB, Server-Timing, Cache-Status)
+    response_metrics: ResponseMetrics = field(default_factory=ResponseMetrics)
+
+    # Sharding: Fehler abgebrochener Worker-Prozesse bzw. ausgefallener Agenten
+    shard_errors: list[str] = field(default_factory=list)
+
+    # Verteilter Modus: Agenten, Vergabe und Abbruchgrund
+    distributed_stats: Optional[dict] = None
+
+    # Protokoll-Ebene: HTTP-Sitzungen und Requests (falls ohne Browser)
+    protocol_stats: Optional[dict] = None
+
+    # Ergebnis-Stream (JSONL mit allen Einzelergebnissen)
+    run_id: str = ""
+    stream_path: Optional[str] = None
+
+    # Fortgesetzter Lauf: aus früheren Durchgängen übernommene Bestellungen
+    carried_over_orders: int = 0
+    unresolved_orders: list[int] = field(default_factory=list)
+
+    def record(self, res: PerformanceOrderResult) -> None:
+        """Übernimmt ein Einzelergebnis in Zähler, Histogramme und Fehlerliste."""
+        order_num = self.total_orders
+        self.total_orders += 1
+
+        type_stats = self.results_by_type.setdefault(res.order_type.value, {
+            "total": 0,
+            "successful": 0,
+            "failed": 0,
+            "success_rate": 0,
+        })
+        type_stats["total"] += 1
+
+        if res.success:
+            self.successful_orders += 1
+            type_stats["successful"] += 1
+            self.latency.record(res.duration_seconds)
+            self.latency_by_type.record(res.order_type.value, res.duration_seconds)
+            for step, seconds in res.step_durations.items():
+                self.latency_by_step.record(step, seconds)
+        else:
+            self.failed_orders += 1
+            type_stats["failed"] += 1
+            self.errors.append({
+                "order_num": order_num,
+                "order_type": res.order_type.value,
+                "error": res.error_message,
+                "trace": res.network_trace,
+            })
+        self.step_stats.record(res.steps)
+
+        if res.cohort:
+            cohort_stats = self.results_by_cohort.setdefault(res.cohort, {
+                "total": 0,
+                "successful": 0,
+                "failed": 0,
+                "success_rate": 0,
+            })
+            cohort_stats["total"] += 1
+            cohort_stats["successful" if res.success else "failed"] += 1
+            if res.success:
+                self.latency_by_cohort.record(res.cohort, res.duration_seconds)
+
+        if self.keep_order_results:
+            self.order_results.append(res)
+
     def calculate_stats(self) -> None:
-        """Berechnet alle Statistiken aus den Einzelergebnissen."""
-        if not self.order_results:
+        """Berechnet die abgeleiteten Kennzahlen aus Zählern und Histogrammen."""
+        # Direkt angehängte Einzelergebnisse (ohne record()) nachträglich übernehmen
+        if not self.total_orders and self.order_results:
+            pending, self.order_results = self.order_results, []
+            for res in pending:
+                self.record(res)
+
+        if not self.total_orders:
             return
 
-        self.total_orders = len(self.order_results)
-        self.successful_orders = len([r for r in self.order_results if r.success])
-        self.failed_orders = self.total_orders - self.successful_orders
-
-        if self.total_orders > 0:
-            self.success_rate = self.successful_orders / self.total_orders
+        self.success_rate = self.successful_orders / self.total_orders
 
         # Timing-Statistiken
-        durations = [r.duration_seconds for r in self.order_results if r.success]
-        if durations:
-            self.avg_duration_seconds = sum(durations) / len(durations)
-            self.min_duration_seconds = min(durations)
-            self.max_duration_seconds = max(durations)
+        if self.latency.count:
+            self.avg_duration_seconds = self.latency.mean_seconds
+            self.min_duration_seconds = self.latency.min_seconds
+            self.max_duration_seconds = self.latency.max_seconds
 
         # Orders pro Minute
         if self.total_duration_seconds > 0:
             self.orders_per_minute = (self.successful_orders / self.total_duration_seconds) * 60
 
-        # Aufschlüsselung nach Typ
-        for order_type in OrderType:
-            type_results = [r for r in self.order_results if r.order_type == order_type]
-            if type_results:
-                successful = len([r for r in type_results if r.success])
-                self.results_by_type[order_type.value] = {
-                    "total": len(type_results),
-                    "successful": successful,
-                    "failed": len(type_results) - successful,
-                    "success_rate": successful / len(type_results) if type_results else 0,
-                }
-
-        # Fehler sammeln
-        self.errors = [
-            {
-                "order_num": i,
-                "order_type": r.order_type.value,
-                "error": r.error_message
-            }
-            for i, r in enumerate(self.order_results)
-            if not r.success
-        ]
+        # Aufschlüsselung nach Typ (Reihenfolge wie OrderType)
+        self.results_by_type = {
+            order_type.value: self.results_by_type[order_type.value]
+            for order_type in OrderType
+            if order_type.value in self.results_by_type
+        }
+        for type_stats in [*self.results_by_type.values(), *self.results_by_cohort.values()]:
+            type_stats["success_rate"] = type_stats["successful"] / type_stats["total"]
 
     def to_dict(self) -> dict:
         """Konvertiert das Ergebnis in ein Dictionary für JSON-Export."""
@@ -133,9 +253,31 @@ class PerformanceTestResult:
                 "max_duration_seconds": round(self.max_duration_seconds, 2),
                 "orders_per_minute": round(self.orders_per_minute, 2),
             },
+            "latency": self.latency.to_dict(),
+            "latency_by_type": self.latency_by_type.to_dict(),
+            "latency_by_step": self.latency_by_step.to_dict(),
+            "steps": self.step_stats.summary(),
             "by_type": self.results_by_type,
+            "by_cohort": self.results_by_cohort,
+            "latency_by_cohort": self.latency_by_cohort.to_dict(),
+            "browse": self.browse_stats,
             "errors": self.errors[:20],  # Max 20 Fehler im Report
             "error_count": len(self.errors),
+            "context_pool": self.context_pool_stats,
+            "auth_state": self.auth_state_stats,
+            "request_blocking": self.request_blocking_stats,
+            "adaptive_concurrency": self.concurrency_stats,
+            "network_trace": self.network_trace_stats,
+            "backend": self.response_metrics.to_dict(),
+            "shard_errors": self.shard_errors,
+            "distributed": self.distributed_stats,
+            "protocol": self.protocol_stats,
+            "run_id": self.run_id,
+            "stream": self.stream_path,
+            "resume": {
+                "carried_over_orders": self.carried_over_orders,
+                "unresolved_orders": self.unresolved_orders,
+            },
         }
 
 
@@ -151,15 +293,59 @@ class PerformanceTestRunner:
         browser: Browser,
         config: TestConfig,
         parallel_workers: int = 15,
+        order_num_offset: int = 0,
+        on_result: Optional[Callable[[PerformanceOrderResult, int], None]] = None,
+        request_blocker: Optional[RequestBlocker] = None,
+        stream_results: bool = True,
+        use_manifest: bool = True,
+        resume_run_id: Optional[str] = None,
     ):
+        """
+        Args:
+            order_num_offset: Start der Bestellnummern (eindeutig über Shards hinweg)
+            on_result: Wird für jedes Einzelergebnis (mit Bestellnummer) aufgerufen, sobald es vorliegt
+            request_blocker: Blockiert Bilder/Tracker/Drittanbieter in jedem Bestell-Kontext
+            stream_results: Einzelergebnisse als JSONL streamen und live ausgeben
+                (laut ``result_stream``; in Shards übernimmt das der Koordinator)
+            use_manifest: Plan und Fortschritt als Lauf-Manifest schreiben
+                (laut ``run_manifest``; in Shards deaktiviert)
+            resume_run_id: Setzt den Lauf mit dieser ID fort statt neu zu planen
+        """
         self.browser = browser
         self.config = config
         self.base_url = config.base_url
         self.parallel_workers = parallel_workers
+        self.order_num_offset = order_num_offset
+        self.on_result = on_result
+        self.request_blocker = request_blocker
+        self.stream_results = stream_results and config.result_stream.enabled
+        self.stream: Optional[ResultStream] = None
+        self.live: Optional[LiveAggregator] = None
+        self.use_manifest = use_manifest and config.run_manifest.enabled
+        self.resume_run_id = resume_run_id
+        self.manifest: Optional[RunManifest] = None
+        self.seed = random.randrange(2**32)
+        self.rng = random.Random(self.seed)
+        self.tracer = NetworkTracer()  # pro Lauf in run() mit Lauf-ID ersetzt
+        self.response_collector = ResponseMetricsCollector(
+            self.base_url, enabled=config.performance_test.response_metrics
+        )
 
-        self.semaphore = asyncio.Semaphore(parallel_workers)
+        # Adaptive Parallelität ersetzt den festen Semaphore (Start bei parallel_workers)
+        self.limiter: Optional[AdaptiveLimiter] = None
+        if config.adaptive_concurrency.enabled:
+            self.limiter = AdaptiveLimiter.from_config(config.adaptive_concurrency, parallel_workers)
+        self.semaphore = self.limiter or asyncio.Semaphore(parallel_workers)
         self.results: list[PerformanceOrderResult] = []
         self.results_lock = asyncio.Lock()
+        self.pool: Optional[BrowserContextPool] = None
+        # Ein Login pro registriertem Kunden und Lauf statt pro Bestellung
+        self.auth_state: Optional[AuthStateCache] = None
+        if config.auth_state.enabled:
+            self.auth_state = AuthStateCache.from_config(config)
+        self.cart_seeder: Optional[CartSeeder] = None
+        if config.cart_seeding.enabled:
+            self.cart_seeder = CartSeeder(self.base_url, access_key=config.cart_seeding.store_api_access_key)
 
         # Produkte laden
         self.post_products = config.get_post_products()
@@ -172,6 +358,40 @@ class PerformanceTestRunner:
         if not self.spedition_products:
             self.spedition_products = self.all_products[2:] if len(self.all_products) > 2 else self.all_products[-1:]
 
+    def _get_context_options(self) -> dict:
+        """Gibt die Context-Optionen mit HTTP-Credentials zurück."""
+        # HTTP-Credentials für htaccess-geschützte Staging-Umgebungen
+        context_options = {"viewport": {"width": 1920, "height": 1080}}
+        if self.config.htaccess_user and self.config.htaccess_password:
+            context_options["http_credentials"] = {
+                "username": self.config.htaccess_user,
+                "password": self.config.htaccess_password,
+            }
+        return context_options
+
+    def _order_context(self):
+        """Browser-Kontext für eine Bestellung (Pool oder neu, mit Blockier-Profil)."""
+        return order_context(self.pool, self.browser, self._get_context_options(), self.request_blocker)
+
+    async def _start_pool(self) -> None:
+        """Startet den Kontext-Pool, falls in der Konfiguration aktiviert."""
+        cfg = self.config.context_pool
+        if not cfg.enabled:
+            return
+
+        size = cfg.size or self.parallel_workers
+        self.pool = BrowserContextPool(
+            browser=self.browser,
+            base_url=self.base_url,
+            size=size,
+            context_options=self._get_context_options(),
+            max_size=max(size, self.parallel_workers),
+            max_uses=cfg.max_uses,
+            max_consecutive_failures=cfg.max_consecutive_failures,
+            warm_up=cfg.warm_up,
+        )
+        await self.pool.start()
+
     def _generate_guest_address(self, order_num: int, country: str = "AT") -> Address:
         """Generiert eine Gast-Adresse aus dem konfigurierten Pool."""
         timestamp = int(time.time() * 1000)
@@ -200,12 +420,28 @@ class PerformanceTestRunner:
             email=f"perf-{timestamp}-{order_num}@gruene-erde-test.com",
         )
 
+    def _pick_payment_method(self, country: str) -> str:
+        """Wählt zufällig eine der für das Land konfigurierten Zahlungsarten."""
+        payment_methods = self.config.payment_methods.get(country, ["Rechnung"])
+        return random.choice(payment_methods) if payment_methods else "Rechnung"
+
     async def _add_products_to_cart(
         self,
         context: BrowserContext,
         product_ids: list[str],
+        timer: StepTimer,
     ) -> None:
-        """Fügt Produkte zum Warenkorb hinzu."""
+        """
+        Fügt Produkte zum Warenkorb hinzu.
+
+        Mit aktivierter Warenkorb-Befüllung per Request (``cart_seeding``) werden
+        keine Produktseiten geladen; ``CartSeedingError`` lässt die Bestellung scheitern.
+        """
+        if self.cart_seeder:
+            async with timer.span("cart_seed"):
+                await self.cart_seeder.seed_async(context.request, product_ids)
+            return
+
         page = await context.new_page()
         cookie_accepted = False
 
@@ -213,86 +449,116 @@ class PerformanceTestRunner:
             for product_id in product_ids:
                 # Zur Produktseite navigieren
                 product_url = f"{self.base_url}/{product_id}" if not product_id.startswith("/") else f"{self.base_url}{product_id}"
-                await page.goto(product_url)
-                await page.wait_for_load_state("networkidle")
+                async with timer.span("pdp_load"):
+                    await page.goto(product_url)
+                    await page.wait_for_load_state("networkidle")
 
                 # Cookie-Banner akzeptieren (nur beim ersten Produkt nötig)
                 if not cookie_accepted:
-                    await accept_cookie_banner_async(page)
+                    async with timer.span("cookie_banner"):
+                        await accept_cookie_banner_async(page)
                     cookie_accepted = True
 
                 # Zum Warenkorb hinzufügen
-                add_to_cart = page.locator("css=.btn-buy, [data-add-to-cart], .product-detail-buy button")
-                if await add_to_cart.count() > 0:
-                    await add_to_cart.first.click()
-                    await page.wait_for_timeout(1500)  # Warten auf AJAX
+                async with timer.span("add_to_cart"):
+                    add_to_cart = page.locator("css=.btn-buy, [data-add-to-cart], .product-detail-buy button")
+                    if await add_to_cart.count() > 0:
+                        await click_and_wait_for_cart_async(page, add_to_cart.first)
         finally:
             await page.close()
 
+    async def _run_timed(self, lease: ContextLease, order_num: int, order_flow) -> PerformanceOrderResult:
+        """
+        Führt einen Bestell-Flow mit (optionaler) Schritt-Messung, Backend-Kennzahlen
+        und Netzwerk-Aufzeichnung aus.
+
+        ``order_flow`` erhält den Timer und liefert das Ergebnis; die
+        Messwerte pro Schritt werden anschließend ins Ergebnis übernommen.
+        """
+        timer = StepTimer(enabled=self.config.performance_test.step_timing)
+        timer.attach(lease.context)
+        self.response_collector.attach(lease.context)
+        try:
+            with self.tracer.record(lease.context) as recorder:
+                result = await order_flow(timer)
+        finally:
+            timer.detach()
+            self.response_collector.detach(lease.context)
+        timer.apply_to(result)
+        self.tracer.finish(recorder, order_num, result)
+        lease.healthy = result.success
+        return result
+
     async def _run_guest_order(
         self,
         order_num: int,
         product_ids: list[str],
         order_type: OrderType,
+        on_submit: Optional[Callable[[], None]] = None,
     ) -> PerformanceOrderResult:
         """Führt eine Gast-Bestellung durch."""
-        async with self.semaphore:
-            # HTTP-Credentials für htaccess-geschützte Staging-Umgebungen
-            context_options = {"viewport": {"width": 1920, "height": 1080}}
-            if self.config.htaccess_user and self.config.htaccess_password:
-                context_options["http_credentials"] = {
-                    "username": self.config.htaccess_user,
-                    "password": self.config.htaccess_password,
-                }
-            context = await self.browser.new_context(**context_options)
-
-            start_time = time.time()
-
-            try:
-                # Produkte zum Warenkorb
-                await self._add_products_to_cart(context, product_ids)
-
-                # Checkout
-                page = await context.new_page()
-                checkout = CheckoutPage(page, self.base_url)
-                await checkout.goto_checkout()
-
-                # Adresse generieren
-                address = self._generate_guest_address(order_num)
-
-                # Zahlungsart wählen
-                payment_methods = self.config.payment_methods.get("AT", ["Rechnung"])
-                payment_method = random.choice(payment_methods) if payment_methods else "Rechnung"
-
-                # Checkout durchführen
-                result = await checkout.execute_guest_checkout(
-                    address=address,
-                    payment_method=payment_method
-                )
-
-                return PerformanceOrderResult(
-                    success=result.success,
-                    order_id=result.order_id,
-                    order_number=result.order_number,
-                    error_message=result.error_message,
-                    duration_seconds=time.time() - start_time,
-                    order_type=order_type,
-                    product_ids=product_ids,
-                    shipping_type="post" if order_type == OrderType.GUEST_POST else "spedition",
-                    customer_type="guest",
-                )
+        async with self.semaphore, self._order_context() as lease:
+            return await self._run_timed(
+                lease,
+                order_num,
+                lambda timer: self._guest_order_flow(
+                    lease.context, timer, order_num, product_ids, order_type, on_submit
+                ),
+            )
+
+    async def _guest_order_flow(
+        self,
+        context: BrowserContext,
+        timer: StepTimer,
+        order_num: int,
+        product_ids: list[str],
+        order_type: OrderType,
+        on_submit: Optional[Callable[[], None]] = None,
+    ) -> PerformanceOrderResult:
+        """Ablauf einer Gast-Bestellung (Warenkorb, Checkout, Bestätigung)."""
+        start_time = time.time()
 
-            except Exception as e:
-                return PerformanceOrderResult(
-                    success=False,
-                    error_message=f"Fehler: {str(e)}",
-                    duration_seconds=time.time() - start_time,
-                    order_type=order_type,
-                    product_ids=product_ids,
-                    customer_type="guest",
-                )
-            finally:
-                await context.close()
+        try:
+            # Produkte zum Warenkorb
+            await self._add_products_to_cart(context, product_ids, timer)
+
+            # Checkout
+            page = await context.new_page()
+            checkout = CheckoutPage(page, self.base_url)
+            checkout.use_timer(timer)
+            checkout.on_submit(on_submit)
+            await checkout.goto_checkout()
+
+            # Adresse generieren
+            address = self._generate_guest_address(order_num)
+
+            # Checkout durchführen
+            result = await checkout.execute_guest_checkout(
+                address=address,
+                payment_method=self._pick_payment_method("AT")
+            )
+
+            return PerformanceOrderResult(
+                success=result.success,
+                order_id=result.order_id,
+                order_number=result.order_number,
+                error_message=result.error_message,
+                duration_seconds=time.time() - start_time,
+                order_type=order_type,
+                product_ids=product_ids,
+                shipping_type="post" if order_type == OrderType.GUEST_POST else "spedition",
+                customer_type="guest",
+            )
+
+        except Exception as e:
+            return PerformanceOrderResult(
+                success=False,
+                error_message=f"Fehler: {str(e)}",
+                duration_seconds=time.time() - start_time,
+                order_type=order_type,
+                product_ids=product_ids,
+                customer_type="guest",
+            )
 
     async def _run_registered_order(
         self,
@@ -300,35 +566,51 @@ class PerformanceTestRunner:
         customer: TestCustomer,
         product_ids: list[str],
         order_type: OrderType,
+        on_submit: Optional[Callable[[], None]] = None,
     ) -> PerformanceOrderResult:
         """Führt eine Bestellung mit registriertem Kunden durch."""
-        async with self.semaphore:
-            # HTTP-Credentials für htaccess-geschützte Staging-Umgebungen
-            context_options = {"viewport": {"width": 1920, "height": 1080}}
-            if self.config.htaccess_user and self.config.htaccess_password:
-                context_options["http_credentials"] = {
-                    "username": self.config.htaccess_user,
-                    "password": self.config.htaccess_password,
-                }
-            context = await self.browser.new_context(**context_options)
-
-            start_time = time.time()
+        async with self.semaphore, self._order_context() as lease:
+            return await self._run_timed(
+                lease,
+                order_num,
+                lambda timer: self._registered_order_flow(
+                    lease.context, timer, customer, product_ids, order_type, on_submit
+                ),
+            )
+
+    async def _registered_order_flow(
+        self,
+        context: BrowserContext,
+        timer: StepTimer,
+        customer: TestCustomer,
+        product_ids: list[str],
+        order_type: OrderType,
+        on_submit: Optional[Callable[[], None]] = None,
+    ) -> PerformanceOrderResult:
+        """Ablauf einer Bestellung mit Login (Login, Warenkorb, Checkout)."""
+        start_time = time.time()
 
-            try:
-                # Login
+        try:
+            # Login
+            password = self.config.get_customer_password(customer)
+            if self.auth_state:
+                # Gecachter Storage-State: nur beim ersten Mal pro Kunde ein echter Login
+                async with timer.span("login"):
+                    await self.auth_state.apply_async(context, customer.email, password)
+            else:
                 page = await context.new_page()
-                await page.goto(f"{self.base_url}/account/login")
-                await page.wait_for_load_state("domcontentloaded")
+                async with timer.span("login"):
+                    await page.goto(f"{self.base_url}/account/login")
+                    await page.wait_for_load_state("domcontentloaded")
 
-                # Cookie-Banner akzeptieren (Usercentrics oder Shopware)
-                await accept_cookie_banner_async(page)
+                    # Cookie-Banner akzeptieren (Usercentrics oder Shopware)
+                    await accept_cookie_banner_async(page)
 
-                # Login-Formular ausfüllen
-                await page.fill("css=#loginMail, input[name='email']", customer.email)
-                password = self.config.get_customer_password(customer)
-                await page.fill("css=#loginPassword, input[name='password']", password)
-                await page.click("css=.login-submit button, button[type='submit']")
-                await page.wait_for_load_state("networkidle")
+                    # Login-Formular ausfüllen
+                    await page.fill("css=#loginMail, input[name='email']", customer.email)
+                    await page.fill("css=#loginPassword, input[name='password']", password)
+                    await page.click("css=.login-submit button, button[type='submit']")
+                    await page.wait_for_load_state("networkidle")
 
                 # Prüfen ob Login erfolgreich
                 if "/account" not in page.url:
@@ -343,175 +625,996 @@ class PerformanceTestRunner:
 
                 await page.close()
 
-                # Produkte zum Warenkorb
-                await self._add_products_to_cart(context, product_ids)
-
-                # Checkout
-                page = await context.new_page()
-                checkout = CheckoutPage(page, self.base_url)
-                await checkout.goto_checkout()
-
-                # Zahlungsart wählen
-                payment_methods = self.config.payment_methods.get(customer.country, ["Rechnung"])
-                payment_method = random.choice(payment_methods) if payment_methods else "Rechnung"
+            # Produkte zum Warenkorb
+            await self._add_products_to_cart(context, product_ids, timer)
 
-                await checkout.select_payment_method(payment_method)
-                await checkout.accept_terms()
-                await checkout.place_order()
-                await checkout.wait_for_confirmation()
+            # Checkout
+            page = await context.new_page()
+            checkout = CheckoutPage(page, self.base_url)
+            checkout.use_timer(timer)
+            checkout.on_submit(on_submit)
+            await checkout.goto_checkout()
 
-                order_number = await checkout.get_order_number()
-                order_id = await checkout.get_order_id_from_url()
-
-                return PerformanceOrderResult(
-                    success=True,
-                    order_id=order_id,
-                    order_number=order_number,
-                    duration_seconds=time.time() - start_time,
-                    order_type=order_type,
-                    product_ids=product_ids,
-                    shipping_type="post" if order_type == OrderType.REGISTERED_POST else "spedition",
-                    customer_type="registered",
-                )
-
-            except Exception as e:
+            # Angemeldete Kunden leitet /checkout/register auf die Confirm-Seite weiter
+            if self.auth_state and "/checkout/register" in page.url:
+                self.auth_state.invalidate(customer.email)
                 return PerformanceOrderResult(
                     success=False,
-                    error_message=f"Fehler: {str(e)}",
+                    error_message=f"Gecachter Login abgelaufen für {customer.email}",
                     duration_seconds=time.time() - start_time,
                     order_type=order_type,
                     product_ids=product_ids,
                     customer_type="registered",
                 )
-            finally:
-                await context.close()
 
-    def _create_order_tasks(self) -> list:
-        """Erstellt die Order-Tasks basierend auf der konfigurierten Verteilung."""
+            await checkout.select_payment_method(self._pick_payment_method(customer.country))
+            await checkout.accept_terms()
+            await checkout.place_order()
+            await checkout.wait_for_confirmation()
+
+            order_number = await checkout.get_order_number()
+            order_id = await checkout.get_order_id_from_url()
+
+            return PerformanceOrderResult(
+                success=True,
+                order_id=order_id,
+                order_number=order_number,
+                duration_seconds=time.time() - start_time,
+                order_type=order_type,
+                product_ids=product_ids,
+                shipping_type="post" if order_type == OrderType.REGISTERED_POST else "spedition",
+                customer_type="registered",
+            )
+
+        except Exception as e:
+            return PerformanceOrderResult(
+                success=False,
+                error_message=f"Fehler: {str(e)}",
+                duration_seconds=time.time() - start_time,
+                order_type=order_type,
+                product_ids=product_ids,
+                customer_type="registered",
+            )
+
+    def _plan_orders(self) -> list[dict]:
+        """
+        Plant die Bestellungen basierend auf der konfigurierten Verteilung.
+
+        Ein Eintrag pro Bestellung mit ``order_num``, ``order_type``,
+        ``product_ids`` und ``customer_email`` (None: Gast). Der Plan landet
+        im Lauf-Manifest, damit ``--resume`` dieselben Bestellungen fortsetzt.
+        """
         distribution = self.config.performance_test.distribution
-        tasks = []
-        order_num = 0
+        plan = []
 
         # Registrierte Kunden laden
         registered_customers = self.config.test_customers.registered
 
+        def add(order_type: OrderType, product_ids: list[str], customer: Optional[TestCustomer] = None) -> None:
+            plan.append({
+                "order_num": self.order_num_offset + len(plan),
+                "order_type": order_type.value,
+                "product_ids": product_ids,
+                "customer_email": customer.email if customer else None,
+            })
+
+        def post_product() -> str:
+            return self.rng.choice(self.post_products) if self.post_products else self.all_products[0]
+
+        def spedition_product() -> str:
+            return self.rng.choice(self.spedition_products) if self.spedition_products else self.all_products[-1]
+
         # 1. Gast + Postversand
         for _ in range(distribution.guest_post):
-            product = random.choice(self.post_products) if self.post_products else self.all_products[0]
-            tasks.append(self._run_guest_order(
-                order_num=order_num,
-                product_ids=[product],
-                order_type=OrderType.GUEST_POST,
-            ))
-            order_num += 1
+            add(OrderType.GUEST_POST, [post_product()])
 
         # 2. Gast + Spedition
         for _ in range(distribution.guest_spedition):
-            product = random.choice(self.spedition_products) if self.spedition_products else self.all_products[-1]
-            tasks.append(self._run_guest_order(
-                order_num=order_num,
-                product_ids=[product],
-                order_type=OrderType.GUEST_SPEDITION,
-            ))
-            order_num += 1
+            add(OrderType.GUEST_SPEDITION, [spedition_product()])
 
         # 3. Registriert + Postversand
         for i in range(distribution.registered_post):
             if registered_customers:
-                customer = registered_customers[i % len(registered_customers)]
-                product = random.choice(self.post_products) if self.post_products else self.all_products[0]
-                tasks.append(self._run_registered_order(
-                    order_num=order_num,
-                    customer=customer,
-                    product_ids=[product],
-                    order_type=OrderType.REGISTERED_POST,
-                ))
+                add(OrderType.REGISTERED_POST, [post_product()], registered_customers[i % len(registered_customers)])
             else:
                 # Fallback auf Gast wenn keine Kunden konfiguriert
-                product = random.choice(self.post_products) if self.post_products else self.all_products[0]
-                tasks.append(self._run_guest_order(
-                    order_num=order_num,
-                    product_ids=[product],
-                    order_type=OrderType.GUEST_POST,
-                ))
-            order_num += 1
+                add(OrderType.GUEST_POST, [post_product()])
 
         # 4. Registriert + Spedition
         for i in range(distribution.registered_spedition):
             if registered_customers:
                 customer = registered_customers[i % len(registered_customers)]
-                product = random.choice(self.spedition_products) if self.spedition_products else self.all_products[-1]
-                tasks.append(self._run_registered_order(
-                    order_num=order_num,
-                    customer=customer,
-                    product_ids=[product],
-                    order_type=OrderType.REGISTERED_SPEDITION,
-                ))
+                add(OrderType.REGISTERED_SPEDITION, [spedition_product()], customer)
             else:
-                product = random.choice(self.spedition_products) if self.spedition_products else self.all_products[-1]
-                tasks.append(self._run_guest_order(
-                    order_num=order_num,
-                    product_ids=[product],
-                    order_type=OrderType.GUEST_SPEDITION,
-                ))
-            order_num += 1
+                add(OrderType.GUEST_SPEDITION, [spedition_product()])
 
         # 5. Multi-Produkt (1 Post + 1 Spedition)
         for _ in range(distribution.multi_product):
             products = []
             if self.post_products:
-                products.append(random.choice(self.post_products))
+                products.append(self.rng.choice(self.post_products))
             if self.spedition_products:
-                products.append(random.choice(self.spedition_products))
+                products.append(self.rng.choice(self.spedition_products))
             if not products:
                 products = self.all_products[:2]
-
-            tasks.append(self._run_guest_order(
-                order_num=order_num,
-                product_ids=products,
-                order_type=OrderType.MULTI_PRODUCT,
-            ))
-            order_num += 1
-
-        return tasks
+            add(OrderType.MULTI_PRODUCT, products)
+
+        return plan
+
+    def _run_planned_order(self, entry: dict, on_submit: Optional[Callable[[], None]] = None):
+        """Erstellt die Bestellung zu einem Plan-Eintrag (Gast oder registrierter Kunde)."""
+        order_type = OrderType(entry["order_type"])
+        if entry["customer_email"]:
+            customers = {c.email: c for c in self.config.test_customers.registered}
+            customer = customers.get(entry["customer_email"])
+            if customer is None:
+                raise ValueError(f"Testkunde {entry['customer_email']} nicht mehr konfiguriert")
+            return self._run_registered_order(entry["order_num"], customer, entry["product_ids"], order_type, on_submit)
+        return self._run_guest_order(entry["order_num"], entry["product_ids"], order_type, on_submit)
+
+    def _open_manifest(self, plan: list[dict]) -> Optional[RunManifest]:
+        """
+        Legt das Lauf-Manifest an bzw. lädt es beim Fortsetzen.
+
+        Raises:
+            ManifestError: Wenn der fortzusetzende Lauf fehlt oder kein Performance-Lauf ist
+        """
+        directory = Path(self.config.run_manifest.directory)
+        if self.resume_run_id:
+            return RunManifest.load(directory, self.resume_run_id, kind="performance")
+        if not self.use_manifest:
+            return None
+        return RunManifest.create(directory, new_run_id("performance"), "performance", self.seed, plan, meta={
+            "profile": self.config.test_profile,
+            "parallel_workers": self.parallel_workers,
+            "distribution": self.config.performance_test.distribution.model_dump(),
+        })
+
+    async def _report_result(self, entry: dict, result: PerformanceTestResult) -> None:
+        """Führt eine Bestellung aus, erfasst das Ergebnis und meldet es sofort weiter."""
+        order_num = entry["order_num"]
+        on_submit = None
+        if self.manifest:
+            self.manifest.mark_started(order_num)
+            on_submit = functools.partial(self.manifest.mark_submitted, order_num)
+        try:
+            res = await self._run_planned_order(entry, on_submit)
+        except Exception as e:
+            res = PerformanceOrderResult(
+                success=False,
+                error_message=str(e),
+                order_type=OrderType(entry["order_type"]),
+                product_ids=entry["product_ids"],
+            )
+        result.record(res)
+        if self.manifest:
+            self.manifest.mark_finished(order_num, res.success, res.order_number, res.to_dict())
+        if self.limiter:
+            self.limiter.record(res.success, res.duration_seconds)
+        if self.stream:
+            self.stream.write(res.to_dict())
+        if self.live:
+            self.live.record(res.success, res.duration_seconds)
+        if self.on_result:
+            self.on_result(res, order_num)
+
+    def _carry_over(self, result: PerformanceTestResult) -> None:
+        """Übernimmt die Ergebnisse früherer Durchgänge aus dem Manifest."""
+        for entry, state, data in self.manifest.carried_over():
+            if state == OrderState.SUCCEEDED and data:
+                res = PerformanceOrderResult.from_dict(data)
+            else:
+                # Abgeschickt ohne Bestätigung: nicht wiederholen (evtl. schon im Shop angelegt)
+                res = PerformanceOrderResult(
+                    success=False,
+                    error_message="Unklar: Bestellung abgeschickt, aber keine Bestätigung (nicht wiederholt)",
+                    order_type=OrderType(entry["order_type"]),
+                    product_ids=entry["product_ids"],
+                )
+                result.unresolved_orders.append(entry["order_num"])
+            result.record(res)
+            result.carried_over_orders += 1
 
     async def run(self) -> PerformanceTestResult:
         """Führt den kompletten Performance-Test durch."""
-        result = PerformanceTestResult(start_time=datetime.now())
+        result = PerformanceTestResult(
+            start_time=datetime.now(),
+            keep_order_results=self.config.performance_test.keep_order_results,
+        )
+
+        # Plan erstellen bzw. beim Fortsetzen aus dem Manifest übernehmen
+        plan = self._plan_orders()
+        self.manifest = self._open_manifest(plan)
+        if self.manifest:
+            result.run_id = self.manifest.run_id
+            plan = self.manifest.orders_to_run()
+            self._carry_over(result)
 
-        # Tasks erstellen
-        tasks = self._create_order_tasks()
+        # Tasks erstellen (Ergebnisse werden beim Abschluss erfasst)
+        tasks = [self._report_result(entry, result) for entry in plan]
 
         print(f"\n{'='*70}")
         print(f"PERFORMANCE-TEST GESTARTET")
         print(f"{'='*70}")
         print(f"Ziel:              {len(tasks)} Bestellungen")
-        print(f"Parallelität:      {self.parallel_workers} Worker")
+        if self.limiter:
+            print(f"Parallelität:      adaptiv {self.limiter.limit} Worker "
+                  f"({self.limiter.min_limit}-{self.limiter.max_limit})")
+        else:
+            print(f"Parallelität:      {self.parallel_workers} Worker")
         print(f"Post-Produkte:     {len(self.post_products)}")
         print(f"Speditions-Produkte: {len(self.spedition_products)}")
+        if self.manifest:
+            print(f"Lauf-ID:           {self.manifest.run_id} (fortsetzen mit --resume {self.manifest.run_id})")
+        if result.carried_over_orders:
+            print(f"Fortsetzen:        {result.carried_over_orders} übernommen "
+                  f"({len(result.unresolved_orders)} unklar)")
         print(f"{'='*70}\n")
 
-        # Alle Tasks parallel ausführen
-        order_results = await asyncio.gather(*tasks, return_exceptions=True)
+        live_task = None
+        if self.stream_results:
+            self.stream, self.live = open_result_stream(self.config, result, target=len(tasks), meta={
+                "parallel_workers": self.parallel_workers,
+                "distribution": self.config.performance_test.distribution.model_dump(),
+            })
+            live_task = asyncio.create_task(self.live.run_periodic())
+        self.tracer = NetworkTracer(self.config.network_trace, result.run_id or new_run_id("performance"))
+
+        # Alle Tasks parallel ausführen (mit Kontext-Pool, falls aktiviert)
+        await self._start_pool()
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            if self.stream:
+                self.stream.close()  # ohne Zusammenfassung: als abgebrochen erkennbar
+            raise
+        finally:
+            if live_task:
+                live_task.cancel()
+            await self._close_run(result)
 
-        # Ergebnisse verarbeiten
-        for i, res in enumerate(order_results):
-            if isinstance(res, Exception):
-                result.order_results.append(PerformanceOrderResult(
-                    success=False,
-                    error_message=str(res),
-                    order_type=OrderType.GUEST_POST,
-                ))
-            else:
-                result.order_results.append(res)
+        result.end_time = datetime.now()
+        result.total_duration_seconds = (result.end_time - result.start_time).total_seconds()
+        result.calculate_stats()
+        if self.stream:
+            self.stream.close(summary=result.to_dict())
+
+        return result
+
+    async def run_leased(
+        self,
+        lease: Callable[[int], Awaitable[Optional[list[dict]]]],
+        run_id: str = "",
+    ) -> PerformanceTestResult:
+        """
+        Führt Bestellungen aus einer externen Quelle aus (Agent im verteilten Modus).
+
+        ``lease(n)`` liefert bis zu ``n`` Plan-Einträge, eine leere Liste
+        (später erneut fragen) oder None (keine weiteren Bestellungen). Es wird
+        auch bei ``n == 0`` regelmäßig aufgerufen und dient als Heartbeat.
+
+        Args:
+            lease: Quelle der Plan-Einträge (z.B. der Koordinator)
+            run_id: Lauf-ID des Koordinators (für Netzwerk-Traces)
+        """
+        result = PerformanceTestResult(
+            start_time=datetime.now(),
+            keep_order_results=self.config.performance_test.keep_order_results,
+        )
+        self.tracer = NetworkTracer(self.config.network_trace, run_id or new_run_id("performance"))
+
+        await self._start_pool()
+        in_flight: set[asyncio.Task] = set()
+        exhausted = False
+        try:
+            while in_flight or not exhausted:
+                free = 0 if exhausted else max(0, self.parallel_workers - len(in_flight))
+                batch = await lease(free)
+                if batch is None:
+                    exhausted = True
+                else:
+                    in_flight.update(asyncio.create_task(self._report_result(entry, result)) for entry in batch)
+                if in_flight and not batch:
+                    _, in_flight = await asyncio.wait(in_flight, timeout=1.0, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await self._close_run(result)
 
         result.end_time = datetime.now()
         result.total_duration_seconds = (result.end_time - result.start_time).total_seconds()
         result.calculate_stats()
+        return result
+
+    async def _close_run(self, result: PerformanceTestResult) -> None:
+        """Schließt den Kontext-Pool und übernimmt die Kennzahlen der Zusatzfunktionen."""
+        if self.pool:
+            result.context_pool_stats = self.pool.stats.to_dict()
+            await self.pool.close()
+            self.pool = None
+        if self.auth_state and any(self.auth_state.stats.to_dict().values()):
+            result.auth_state_stats = self.auth_state.stats.to_dict()
+        if self.request_blocker and self.request_blocker.active:
+            result.request_blocking_stats = self.request_blocker.report()
+        if self.limiter:
+            result.concurrency_stats = self.limiter.stats.to_dict()
+        if self.tracer.enabled:
+            result.network_trace_stats = self.tracer.stats.to_dict()
+        result.response_metrics = self.response_collector.metrics
+
+
+class ProtocolPerformanceTestRunner(PerformanceTestRunner):
+    """
+    Performance-Test auf Protokoll-Ebene: Bestellungen als HTTP-Requests ohne Browser.
+
+    Plan, Lauf-Manifest, Ergebnis-Stream und Report wie beim Browser-Runner,
+    Adressen und Zahlungsarten aus derselben Konfiguration. Jede Bestellung
+    läuft über eine Sitzung aus dem ``HttpSessionPool`` (``utils/http_checkout.py``);
+    die Parallelität entspricht der Zahl virtueller Nutzer.
+    """
+
+    def __init__(self, api_request, config: TestConfig, virtual_users: int = 100, **kwargs):
+        """
+        Args:
+            api_request: ``playwright.request`` (Request-Kontexte ohne Browser)
+            virtual_users: Gleichzeitige Bestellungen bzw. HTTP-Sitzungen
+            **kwargs: Wie ``PerformanceTestRunner`` (ohne ``browser``)
+        """
+        super().__init__(browser=None, config=config, parallel_workers=virtual_users, **kwargs)
+        self.api_request = api_request
+        self.protocol = config.performance_test.protocol
+        self.checkout = HttpCheckout(self.base_url, config.payment_method_aliases, timeout=self.protocol.timeout_ms)
+        self.sessions: Optional[HttpSessionPool] = None
+
+    async def _start_pool(self) -> None:
+        """Startet den Sitzungs-Pool (Sitzungen entstehen bei Bedarf)."""
+        context_options = {k: v for k, v in self._get_context_options().items() if k != "viewport"}
+        self.sessions = HttpSessionPool(
+            self.api_request, self.base_url, context_options, max_uses=self.protocol.max_session_uses
+        )
+
+    def _pick_payment_method(self, country: str) -> str:
+        """Wie im Browser, aber ohne Zahlungsarten mit Weiterleitung zu externen Anbietern."""
+        excluded = {m.lower() for m in self.protocol.redirect_payment_methods}
+        payment_methods = [
+            m for m in self.config.payment_methods.get(country, ["Rechnung"])
+            if self.config.payment_method_aliases.get(m, m).lower() not in excluded
+        ]
+        return random.choice(payment_methods) if payment_methods else "Rechnung"
+
+    async def _run_http(
+        self,
+        order_type: OrderType,
+        product_ids: list[str],
+        customer_type: str,
+        shipping_type: str,
+        order_flow: Callable[[object], Awaitable[HttpOrder]],
+    ) -> PerformanceOrderResult:
+        """Führt einen HTTP-Bestell-Flow mit einer Sitzung aus dem Pool aus."""
+        start_time = time.time()
+        async with self.semaphore, self.sessions.lease() as session:
+            try:
+                order = await order_flow(session.context)
+            except Exception as e:
+                session.healthy = False
+                return PerformanceOrderResult(
+                    success=False,
+                    error_message=f"Fehler: {str(e)}",
+                    duration_seconds=time.time() - start_time,
+                    order_type=order_type,
+                    product_ids=product_ids,
+                    customer_type=customer_type,
+                )
+            self.sessions.stats.record(order)
+            session.healthy = await self.checkout.reset(session.context)
+
+        return PerformanceOrderResult(
+            success=True,
+            order_id=order.order_id,
+            order_number=order.order_number,
+            duration_seconds=order.duration_seconds,
+            step_durations=order.step_durations,
+            order_type=order_type,
+            product_ids=product_ids,
+            shipping_type=shipping_type,
+            customer_type=customer_type,
+        )
+
+    async def _run_guest_order(
+        self,
+        order_num: int,
+        product_ids: list[str],
+        order_type: OrderType,
+        on_submit: Optional[Callable[[], None]] = None,
+    ) -> PerformanceOrderResult:
+        """Gast-Bestellung per HTTP."""
+        address = self._generate_guest_address(order_num)
+        payment_method = self._pick_payment_method("AT")
+        return await self._run_http(
+            order_type,
+            product_ids,
+            "guest",
+            "post" if order_type == OrderType.GUEST_POST else "spedition",
+            lambda request: self.checkout.guest_order(request, product_ids, address, payment_method, on_submit),
+        )
+
+    async def _run_registered_order(
+        self,
+        order_num: int,
+        customer: TestCustomer,
+        product_ids: list[str],
+        order_type: OrderType,
+        on_submit: Optional[Callable[[], None]] = None,
+    ) -> PerformanceOrderResult:
+        """Bestellung eines registrierten Kunden per HTTP (Login per Formular)."""
+        password = self.config.get_customer_password(customer)
+        payment_method = self._pick_payment_method(customer.country)
+        return await self._run_http(
+            order_type,
+            product_ids,
+            "registered",
+            "post" if order_type == OrderType.REGISTERED_POST else "spedition",
+            lambda request: self.checkout.registered_order(
+                request, customer.email, password, product_ids, payment_method, on_submit
+            ),
+        )
+
+    async def _close_run(self, result: PerformanceTestResult) -> None:
+        """Schließt den Sitzungs-Pool und übernimmt dessen Kennzahlen."""
+        if self.sessions:
+            await self.sessions.close()
+            result.protocol_stats = self.sessions.stats.to_dict()
+            self.sessions = None
+        await super()._close_run(result)
+
+
+class HybridPerformanceTestRunner:
+    """
+    Hybrides Lastprofil: Browser- und Protokoll-Nutzer bestellen im selben Lauf,
+    Stöber-Nutzer erzeugen Hintergrundlast (Listings, Suchen, Produktseiten).
+
+    Die Bestellungen aus ``performance_test.distribution`` (vervielfacht um
+    ``hybrid.distribution_factor``) werden gewichtet nach Nutzerzahl auf die
+    beiden Bestell-Kohorten verteilt. Deren Ergebnisse laufen wie beim Sharding
+    durch einen ``ShardMerger`` (eine Zeitachse, ein Stream mit Kohorte pro
+    Zeile); der Report enthält Perzentile pro Kohorte und pro Seitentyp.
+    """
+
+    COHORTS = ("browser", "protocol")
+
+    def __init__(self, playwright, config: TestConfig, request_blocker: Optional[RequestBlocker] = None):
+        """
+        Args:
+            playwright: Laufende async-Playwright-Instanz (Browser und Request-Kontexte)
+            request_blocker: Blockiert Drittanbieter in der Browser-Kohorte
+        """
+        self.playwright = playwright
+        self.config = config
+        self.request_blocker = request_blocker
+        self.hybrid = config.performance_test.hybrid
+
+    def _plan(self) -> dict[str, list[dict]]:
+        """Bestellplan, gewichtet nach Nutzerzahl auf die Bestell-Kohorten verteilt."""
+        perf_config = self.config.performance_test
+        config = with_distribution(self.config, perf_config.distribution, self.hybrid.distribution_factor)
+        plan = PerformanceTestRunner(browser=None, config=config)._plan_orders()
+        users = self.hybrid.users.model_dump()
+        return split_weighted(plan, {name: users[name] for name in self.COHORTS})
+
+    def _browse_traffic(self) -> Optional[BrowseTraffic]:
+        if not self.hybrid.users.browse:
+            return None
+        return create_browse_traffic(
+            self.playwright.request, self.config, self.hybrid.users.browse, self.hybrid.think_time_seconds,
+        )
+
+    async def _run_cohort(self, name: str, runner: PerformanceTestRunner, entries: list[dict], messages, run_id: str):
+        """Führt die Bestellungen einer Kohorte aus und meldet sie wie ein Shard."""
+        pending = list(entries)
+
+        async def lease(max_orders: int) -> Optional[list[dict]]:
+            if not pending:
+                return None
+            batch = pending[:max_orders]
+            del pending[:max_orders]
+            return batch
+
+        def send_result(res: PerformanceOrderResult, order_num: int) -> None:
+            res.cohort = name
+            messages.put((
+                ShardMessage.RESULT,
+                name,
+                {"order_num": order_num, "result": res.to_dict(), "finished_at": time.time()},
+            ))
+
+        runner.on_result = send_result
+        messages.put((ShardMessage.STARTED, name, time.time()))
+        try:
+            result = await runner.run_leased(lease, run_id=f"{run_id}-{name}")
+        except Exception as e:
+            messages.put((ShardMessage.ERROR, name, str(e)))
+            return None
+        messages.put((ShardMessage.DONE, name, shard_report(result)))
+        return result
+
+    async def run(self) -> PerformanceTestResult:
+        """Startet alle Kohorten gleichzeitig und führt die Ergebnisse zusammen."""
+        users = self.hybrid.users
+        cohorts = self._plan()
+        target = sum(len(entries) for entries in cohorts.values())
+        run_id = new_run_id("hybrid")
+        merger = ShardMerger(self.config, target=target, run_id=run_id, meta={
+            "mode": "hybrid",
+            "users": users.model_dump(),
+            "distribution_factor": self.hybrid.distribution_factor,
+        })
+
+        print(f"\n{'='*70}")
+        print("PERFORMANCE-TEST GESTARTET (HYBRID)")
+        print(f"{'='*70}")
+        print(f"Ziel:              {target} Bestellungen "
+              f"({len(cohorts['browser'])} Browser, {len(cohorts['protocol'])} Protokoll)")
+        print(f"Nutzer:            {users.browser} Browser, {users.protocol} Protokoll, {users.browse} Stöbern")
+        print(f"{'='*70}\n")
+
+        # Ergebnisse aller Kohorten über eine Queue in den Merger (eigener Thread, wie bei run_shards)
+        messages: queue.Queue = queue.Queue()
+        consumer = browser = browse_task = None
+        stop_browsing = asyncio.Event()
+        runners: dict[str, PerformanceTestRunner] = {}
+        try:
+            if cohorts["browser"]:
+                browser = await self.playwright.chromium.launch(headless=self.config.headless)
+                runners["browser"] = PerformanceTestRunner(
+                    browser=browser,
+                    config=self.config,
+                    parallel_workers=users.browser,
+                    request_blocker=self.request_blocker,
+                    stream_results=False,
+                    use_manifest=False,
+                )
+            if cohorts["protocol"]:
+                runners["protocol"] = ProtocolPerformanceTestRunner(
+                    self.playwright.request,
+                    self.config,
+                    virtual_users=users.protocol,
+                    stream_results=False,
+                    use_manifest=False,
+                )
+
+            consumer = asyncio.create_task(asyncio.to_thread(merger.consume, iter(messages.get, None), "Kohorte"))
+            traffic = self._browse_traffic()
+            browse_task = asyncio.create_task(traffic.run(stop_browsing)) if traffic else None
+            results = await asyncio.gather(*(
+                self._run_cohort(name, runner, cohorts[name], messages, run_id) for name, runner in runners.items()
+            ))
+        finally:
+            stop_browsing.set()
+            browse_stats = await browse_task if browse_task else None
+            if consumer:
+                messages.put(None)
+                await consumer
+            if browser:
+                await browser.close()
+
+        result = merger.finish(self.request_blocker)
+        for cohort_result in results:
+            if cohort_result and cohort_result.protocol_stats:
+                result.protocol_stats = cohort_result.protocol_stats
+        if browse_stats:
+            result.browse_stats = browse_stats.to_dict()
+        return result
+
+
+def open_result_stream(
+    config: TestConfig,
+    result: PerformanceTestResult,
+    target: int,
+    meta: dict,
+) -> tuple[ResultStream, LiveAggregator]:
+    """
+    Öffnet Ergebnis-Stream und Live-Auswertung (``result_stream``) und merkt sie im Ergebnis vor.
+
+    Ist bereits eine Lauf-ID gesetzt (Lauf-Manifest), verwendet der Stream dieselbe.
+    """
+    stream, live = start_run_stream(
+        config.result_stream, "performance", target, meta={"profile": config.test_profile, **meta},
+        run_id=result.run_id or None,
+    )
+    result.run_id, result.stream_path = stream.run_id, str(stream.path)
+    return stream, live
+
+
+def with_distribution(
+    config: TestConfig,
+    distribution: PerformanceTestDistribution,
+    factor: int = 1,
+) -> TestConfig:
+    """Kopie der Konfiguration mit anderer (optional vervielfachter) Bestellverteilung."""
+    scaled = PerformanceTestDistribution(**{k: v * factor for k, v in distribution.model_dump().items()})
+    return config.model_copy(update={
+        "performance_test": config.performance_test.model_copy(update={"distribution": scaled}),
+    })
+
+
+def create_browse_traffic(
+    api_request,
+    config: TestConfig,
+    users: int,
+    think_time_seconds: float = 3.0,
+) -> BrowseTraffic:
+    """Stöber-Nutzer nach ``performance_test.journeys`` (Nutzerpfade oder Zufallsziele)."""
+    journeys = config.performance_test.journeys
+    context_options = PerformanceTestRunner(browser=None, config=config)._get_context_options()
+    context_options.pop("viewport", None)
+    return BrowseTraffic(
+        api_request,
+        config.base_url,
+        browse_targets(journeys.listing_paths, journeys.search_terms, config.get_all_products()),
+        users=users,
+        think_time_seconds=think_time_seconds,
+        context_options=context_options,
+        journey=JourneyModel.from_config(journeys) if journeys.enabled else None,
+        max_session_pages=journeys.max_session_pages,
+    )
+
+
+def _performance_shard_worker(
+    result_queue,
+    shard_index: int,
+    distribution: dict,
+    parallel_workers: int,
+    order_num_offset: int,
+    headless: bool = True,
+    block_profile: str = "none",
+    block_allow_hosts: Optional[list[str]] = None,
+) -> None:
+    """
+    Einstiegspunkt eines Shard-Prozesses: eigener Event-Loop, eigener Browser.
+
+    Lädt die Konfiguration neu (Profil kommt über TEST_PROFILE aus der Umgebung),
+    führt den Anteil der Verteilung aus und streamt jedes Ergebnis sofort
+    an den Koordinator. Blockier-Statistik, adaptive Parallelität,
+    Netzwerk-Traces und Backend-Kennzahlen gehen mit der DONE-Meldung zurück.
+    """
+    blocker = RequestBlocker(get_profile(block_profile), allow_hosts=block_allow_hosts or [])
+
+    def send_result(res: PerformanceOrderResult, order_num: int) -> None:
+        result_queue.put((
+            ShardMessage.RESULT,
+            shard_index,
+            {"order_num": order_num, "result": res.to_dict(), "finished_at": time.time()},
+        ))
+
+    async def _run() -> PerformanceTestResult:
+        config = TestConfig.load()
+        config.performance_test.distribution = PerformanceTestDistribution(**distribution)
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=headless)
+            try:
+                runner = PerformanceTestRunner(
+                    browser=browser,
+                    config=config,
+                    parallel_workers=parallel_workers,
+                    order_num_offset=order_num_offset,
+                    on_result=send_result,
+                    request_blocker=blocker,
+                    stream_results=False,
+                    use_manifest=False,
+                )
+                result_queue.put((ShardMessage.STARTED, shard_index, time.time()))
+                return await runner.run()
+            finally:
+                await browser.close()
+
+    try:
+        shard_result = asyncio.run(_run())
+        result_queue.put((ShardMessage.DONE, shard_index, shard_report(shard_result)))
+    except Exception as e:
+        result_queue.put((ShardMessage.ERROR, shard_index, str(e)))
 
+
+class ShardMerger:
+    """
+    Führt die Nachrichten mehrerer Shards bzw. Agenten zu einem ``PerformanceTestResult`` zusammen.
+
+    Nachrichten sind ``(art, absender, payload)`` wie von ``run_shards`` oder
+    ``Coordinator.messages()``. Einzelergebnisse werden sofort erfasst und
+    gestreamt, Zusatzdaten der ``DONE``-Meldungen zusammengeführt.
+    """
+
+    def __init__(self, config: TestConfig, target: int, meta: dict, run_id: str = ""):
+        self.config = config
+        self.target = target
+        self.result = PerformanceTestResult(
+            start_time=datetime.now(),
+            keep_order_results=config.performance_test.keep_order_results,
+            run_id=run_id,
+        )
+        self.received: Counter = Counter()
+        self.starts: list[float] = []
+        self.last_finish: Optional[float] = None
+        self.blocking = RequestBlockingStats()
+        self.concurrency_reports: list[dict] = []
+        self.network_trace = NetworkTraceStats()
+        self.stream, self.live = None, None
+        if config.result_stream.enabled:
+            self.stream, self.live = open_result_stream(config, self.result, target=target, meta=meta)
+
+    def consume(self, messages, label: str = "Shard") -> None:
+        """Verarbeitet alle Nachrichten; ``label`` benennt den Absender in Fehlermeldungen."""
+        result = self.result
+        try:
+            for kind, sender, payload in messages:
+                if kind == ShardMessage.STARTED:
+                    self.starts.append(payload)
+                elif kind == ShardMessage.RESULT:
+                    res = PerformanceOrderResult.from_dict(payload["result"])
+                    result.record(res)
+                    self.received[sender] += 1
+                    self.last_finish = max(self.last_finish or 0.0, payload["finished_at"])
+                    if self.stream:
+                        self.stream.write({**payload["result"], "shard": sender})
+                    if self.live:
+                        self.live.record(res.success, res.duration_seconds)
+                    elif result.total_orders % 10 == 0:
+                        print(f"   [{result.total_orders}/{self.target}] Bestellungen abgeschlossen")
+                elif kind == ShardMessage.DONE and payload:
+                    if payload["request_blocking"]:
+                        self.blocking.merge(payload["request_blocking"])
+                    if payload["adaptive_concurrency"]:
+                        self.concurrency_reports.append(payload["adaptive_concurrency"])
+                    if payload["network_trace"]:
+                        self.network_trace.merge(payload["network_trace"])
+                    result.response_metrics.merge(payload["backend"])
+                elif kind == ShardMessage.ERROR:
+                    print(f"   [{label} {sender}] FEHLER: {payload}")
+                    result.shard_errors.append(f"{label} {sender}: {payload}")
+        except BaseException:
+            if self.stream:
+                self.stream.close()  # ohne Zusammenfassung: als abgebrochen erkennbar
+            raise
+
+    def finish(self, request_blocker: Optional[RequestBlocker] = None) -> PerformanceTestResult:
+        """Setzt die globale Zeitbasis, berechnet die Kennzahlen und schließt den Stream."""
+        result = self.result
+        # Globale Zeitbasis: frühester Start bis letztes Ergebnis
+        if self.starts:
+            result.start_time = datetime.fromtimestamp(min(self.starts))
+        result.end_time = datetime.fromtimestamp(self.last_finish) if self.last_finish else datetime.now()
+        result.total_duration_seconds = (result.end_time - result.start_time).total_seconds()
+        result.calculate_stats()
+        if request_blocker and request_blocker.active:
+            result.request_blocking_stats = {"profile": request_blocker.profile.name, **self.blocking.to_dict()}
+        result.concurrency_stats = merge_concurrency_reports(self.concurrency_reports)
+        if self.config.network_trace.enabled:
+            result.network_trace_stats = self.network_trace.to_dict()
+        if self.stream:
+            self.stream.close(summary=result.to_dict())
         return result
 
 
+def shard_report(result: PerformanceTestResult) -> dict:
+    """Zusatzdaten eines Shards/Agenten für die ``DONE``-Meldung."""
+    return {
+        "request_blocking": result.request_blocking_stats,
+        "adaptive_concurrency": result.concurrency_stats,
+        "network_trace": result.network_trace_stats,
+        "backend": result.response_metrics.to_dict(),
+    }
+
+
+class ShardedPerformanceTestRunner:
+    """
+    Verteilt den Performance-Test auf mehrere Prozesse mit je eigenem Browser.
+
+    Die Bestellverteilung wird gleichmäßig auf die Shards aufgeteilt. Jeder
+    Shard streamt seine Einzelergebnisse an den Koordinator, der sie zu einem
+    ``PerformanceTestResult`` mit globaler Start-/Endzeit zusammenführt.
+    """
+
+    def __init__(
+        self,
+        config: TestConfig,
+        shards: int,
+        parallel_workers: int = 15,
+        headless: bool = True,
+        request_blocker: Optional[RequestBlocker] = None,
+    ):
+        """
+        Args:
+            config: Testkonfiguration (Verteilung aus performance_test.distribution)
+            shards: Anzahl Worker-Prozesse
+            parallel_workers: Gesamt-Parallelität, wird auf die Shards aufgeteilt
+            headless: Browser ohne UI starten
+            request_blocker: Vorlage für das Blockier-Profil (jeder Shard baut einen eigenen Blocker)
+        """
+        self.config = config
+        self.shards = shards
+        self.parallel_workers = parallel_workers
+        self.headless = headless
+        self.request_blocker = request_blocker
+
+    def _shard_kwargs(self) -> list[dict]:
+        """Berechnet Verteilung, Parallelität und Bestellnummern-Offset pro Shard."""
+        distribution = self.config.performance_test.distribution.model_dump()
+        parts = split_counts(distribution, self.shards)
+        workers_per_shard = max(1, math.ceil(self.parallel_workers / self.shards))
+
+        blocker = self.request_blocker
+        kwargs = []
+        offset = 0
+        for part in parts:
+            kwargs.append({
+                "distribution": part,
+                "parallel_workers": workers_per_shard,
+                "order_num_offset": offset,
+                "headless": self.headless,
+                "block_profile": blocker.profile.name if blocker else "none",
+                "block_allow_hosts": list(blocker.allow_hosts) if blocker else [],
+            })
+            offset += sum(part.values())
+        return kwargs
+
+    async def run(self) -> PerformanceTestResult:
+        """Führt alle Shards aus und führt die Ergebnisse zusammen."""
+        return await asyncio.to_thread(self._run_blocking)
+
+    def _run_blocking(self) -> PerformanceTestResult:
+        shard_kwargs = self._shard_kwargs()
+        planned = [sum(k["distribution"].values()) for k in shard_kwargs]
+
+        merger = ShardMerger(self.config, target=sum(planned), meta={
+            "shards": self.shards,
+            "parallel_workers": self.parallel_workers,
+            "distribution": self.config.performance_test.distribution.model_dump(),
+        })
+
+        print(f"\n{'='*70}")
+        print("PERFORMANCE-TEST GESTARTET (SHARDED)")
+        print(f"{'='*70}")
+        print(f"Ziel:              {sum(planned)} Bestellungen")
+        print(f"Shards:            {self.shards} Prozesse à {shard_kwargs[0]['parallel_workers']} Worker")
+        print(f"{'='*70}\n")
+
+        timeout = self.config.performance_test.max_duration_minutes * 60 * 2
+        merger.consume(run_shards(_performance_shard_worker, shard_kwargs, timeout), label="Shard")
+
+        # Nicht gemeldete Bestellungen abgebrochener Shards zählen als Fehler
+        for index, plan in enumerate(planned):
+            for _ in range(plan - merger.received[index]):
+                merger.result.record(PerformanceOrderResult(
+                    success=False,
+                    error_message=f"Shard {index} abgebrochen - Bestellung nicht ausgeführt",
+                ))
+
+        return merger.finish(self.request_blocker)
+
+
+class DistributedPerformanceTestRunner:
+    """
+    Koordinator für verteilte Performance-Tests über mehrere Agenten (z.B. Docker-Replikas).
+
+    Plant alle Bestellungen aus ``performance_test.distribution`` (vervielfacht um
+    ``performance_test.distributed.distribution_factor``), vergibt sie per HTTP an angemeldete
+    Agenten (``run_performance_agent``) und führt deren Ergebnisse wie beim
+    Sharding zusammen. Globale Rate und Abbruchbedingung gelten über alle Agenten.
+    """
+
+    def __init__(self, config: TestConfig, request_blocker: Optional[RequestBlocker] = None):
+        self.config = config
+        self.request_blocker = request_blocker
+
+    def _plan(self) -> list[dict]:
+        """Bestellplan wie im Einzelprozess, mit vervielfachter Verteilung."""
+        perf_config = self.config.performance_test
+        config = with_distribution(self.config, perf_config.distribution, perf_config.distributed.distribution_factor)
+        return PerformanceTestRunner(browser=None, config=config)._plan_orders()
+
+    async def run(self) -> PerformanceTestResult:
+        """Startet den Koordinator und wartet, bis alle Agenten fertig sind."""
+        return await asyncio.to_thread(self._run_blocking)
+
+    def _run_blocking(self) -> PerformanceTestResult:
+        cfg = self.config.performance_test.distributed
+        plan = self._plan()
+        max_duration = self.config.performance_test.max_duration_minutes * 60
+        blocker = self.request_blocker
+        coordinator = Coordinator(
+            plan,
+            rate_per_minute=cfg.rate_per_minute,
+            burst=cfg.burst,
+            batch_size=cfg.batch_size,
+            min_agents=cfg.min_agents,
+            register_timeout_seconds=cfg.register_timeout_seconds,
+            stop_error_rate=cfg.stop_error_rate,
+            stop_min_orders=cfg.stop_min_orders,
+            max_duration_seconds=max_duration,
+            agent_timeout_seconds=cfg.agent_timeout_seconds,
+            settings={
+                "run_id": new_run_id("distributed"),
+                "block_profile": blocker.profile.name if blocker else "none",
+                "block_allow_hosts": list(blocker.allow_hosts) if blocker else [],
+            },
+        )
+        merger = ShardMerger(self.config, target=len(plan), run_id=coordinator.settings["run_id"], meta={
+            "mode": "distributed",
+            "distribution_factor": cfg.distribution_factor,
+            "rate_per_minute": cfg.rate_per_minute,
+        })
+
+        with CoordinatorServer(coordinator, cfg.host, cfg.port) as server:
+            print(f"\n{'='*70}")
+            print("PERFORMANCE-TEST GESTARTET (VERTEILT)")
+            print(f"{'='*70}")
+            print(f"Ziel:              {len(plan)} Bestellungen")
+            print(f"Koordinator:       {server.url} (wartet auf {cfg.min_agents} Agenten)")
+            if cfg.rate_per_minute:
+                print(f"Globale Rate:      {cfg.rate_per_minute:.0f} Starts/min")
+            print(f"{'='*70}\n")
+            merger.consume(coordinator.messages(timeout_seconds=max_duration * 2), label="Agent")
+
+        merger.result.distributed_stats = coordinator.status()
+        return merger.finish(blocker)
+
+
+async def run_performance_agent(
+    browser: Browser,
+    config: TestConfig,
+    client: AgentClient,
+    parallel_workers: int,
+) -> Optional[PerformanceTestResult]:
+    """
+    Agent im verteilten Modus: holt Bestellungen vom Koordinator und meldet Ergebnisse.
+
+    Ergebnisse werden gesammelt und bei jeder Vergabe-Anfrage (mindestens
+    sekündlich, zugleich Heartbeat) übertragen. Zum Schluss gehen die
+    Zusatzdaten wie bei einem Shard mit der Abschlussmeldung zurück.
+
+    Returns:
+        Ergebnis des Agenten oder None, wenn der Lauf bereits beendet war
+    """
+    info = await asyncio.to_thread(client.register, parallel_workers)
+    if info["finished"]:
+        return None
+    settings = info["settings"]
+
+    pending: list[dict] = []
+
+    def collect(res: PerformanceOrderResult, order_num: int) -> None:
+        pending.append({"order_num": order_num, "result": res.to_dict(), "finished_at": time.time()})
+
+    async def flush() -> None:
+        if pending:
+            batch = pending[:]
+            pending.clear()
+            await asyncio.to_thread(client.report, batch)
+
+    async def lease(max_orders: int) -> Optional[list[dict]]:
+        await flush()
+        reply = await asyncio.to_thread(client.lease, max_orders)
+        if reply["finished"]:
+            return None
+        if max_orders and not reply["orders"]:
+            await asyncio.sleep(reply["retry_after"])  # readiness: allow-sleep (Wartezeit des Koordinators)
+        return reply["orders"]
+
+    runner = PerformanceTestRunner(
+        browser=browser,
+        config=config,
+        parallel_workers=parallel_workers,
+        on_result=collect,
+        request_blocker=RequestBlocker(get_profile(settings["block_profile"]), allow_hosts=settings["block_allow_hosts"]),
+        stream_results=False,
+        use_manifest=False,
+    )
+    result = await runner.run_leased(lease, run_id=f"{settings['run_id']}-{client.name}")
+    await flush()
+    await asyncio.to_thread(client.finish, shard_report(result))
+    return result
+
+
 def print_performance_report(result: PerformanceTestResult) -> None:
     """Gibt einen formatierten Report aus."""
     print(f"\n{'='*70}")
@@ -527,13 +1630,95 @@ def print_performance_report(result: PerformanceTestResult) -> None:
     print(f"Min:                    {result.min_duration_seconds:.1f}s")
     print(f"Max:                    {result.max_duration_seconds:.1f}s")
     print(f"Orders/Minute:          {result.orders_per_minute:.1f}")
+    if result.latency.count:
+        print(f"Perzentile:             {format_percentiles(result.latency)}")
     print(f"{'='*70}")
 
+    if result.context_pool_stats:
+        pool = result.context_pool_stats
+        print(f"Kontext-Pool:           {pool['created']} erstellt, {pool['reused']} wiederverwendet, "
+              f"{pool['evicted']} ersetzt (Warm-up {pool['warm_up_seconds']:.1f}s)")
+        print(f"{'='*70}")
+
+    if result.auth_state_stats:
+        print(f"Login-Cache:            {format_auth_stats(result.auth_state_stats)}")
+        print(f"{'='*70}")
+
+    if result.request_blocking_stats:
+        print(f"Requests:               {format_blocking(result.request_blocking_stats)}")
+        print(f"{'='*70}")
+
+    if result.concurrency_stats:
+        print(f"Parallelität:           {format_concurrency(result.concurrency_stats)}")
+        print(f"{'='*70}")
+
+    if result.network_trace_stats:
+        print(f"Netzwerk-Traces:        {format_network_trace(result.network_trace_stats)}")
+        print(f"{'='*70}")
+
+    if len(result.response_metrics):
+        print("\nBACKEND PRO SEITENTYP (TTFB, Server-Timing, Cache):")
+        print(f"{'-'*70}")
+        for kind, info in result.response_metrics.to_dict().items():
+            print(f"  {format_response_metrics(kind, info)}")
+        print(f"{'='*70}")
+
+    if result.stream_path:
+        print(f"Ergebnis-Stream:        {result.stream_path}")
+        print(f"{'='*70}")
+
+    if result.carried_over_orders:
+        print(f"Fortgesetzt:            {result.carried_over_orders} übernommen, "
+              f"davon {len(result.unresolved_orders)} unklar (nicht wiederholt)")
+        print(f"{'='*70}")
+
+    if result.distributed_stats:
+        print(f"Verteilt:               {format_distributed(result.distributed_stats)}")
+        print(f"{'='*70}")
+
+    if result.protocol_stats:
+        print(f"Protokoll-Ebene:        {format_http_stats(result.protocol_stats)}")
+        print(f"{'='*70}")
+
+    if result.shard_errors:
+        print(f"Abgebrochene Shards:    {len(result.shard_errors)}")
+        for shard_error in result.shard_errors:
+            print(f"  - {shard_error}")
+        print(f"{'='*70}")
+
     if result.results_by_type:
         print(f"\nAUFSCHLÜSSELUNG NACH TYP:")
         print(f"{'-'*70}")
         for order_type, stats in result.results_by_type.items():
             print(f"  {order_type:25} {stats['successful']:3}/{stats['total']:3} ({stats['success_rate']:.1%})")
+            if order_type in result.latency_by_type.histograms:
+                print(f"  {'':25} {format_percentiles(result.latency_by_type.histograms[order_type])}")
+
+    if result.results_by_cohort:
+        print("\nAUFSCHLÜSSELUNG NACH KOHORTE:")
+        print(f"{'-'*70}")
+        for cohort, stats in result.results_by_cohort.items():
+            print(f"  {cohort:25} {stats['successful']:3}/{stats['total']:3} ({stats['success_rate']:.1%})")
+            if cohort in result.latency_by_cohort.histograms:
+                print(f"  {'':25} {format_percentiles(result.latency_by_cohort.histograms[cohort])}")
+
+    if result.browse_stats:
+        print("\nSTÖBERN (HINTERGRUNDLAST):")
+        print(f"{'-'*70}")
+        for line in format_browse_stats(result.browse_stats):
+            print(f"  {line}")
+
+    if len(result.latency_by_step):
+        print("\nDAUER PRO CHECKOUT-SCHRITT:")
+        print(f"{'-'*70}")
+        step_summary = result.step_stats.summary()
+        for step, hist in result.latency_by_step:
+            print(f"  {step:25} {format_percentiles(hist)}")
+            if step in step_summary:
+                info = step_summary[step]
+                ttfb = f", TTFB Ø {info['avg_ttfb_ms']:.0f}ms" if info["avg_ttfb_ms"] is not None else ""
+                print(f"  {'':25} Ø {info['avg_requests']} Requests, "
+                      f"{info['failed_requests']} fehlgeschlagen{ttfb}")
 
     if result.errors:
         print(f"\n{'='*70}")
@@ -555,13 +1740,30 @@ def save_json_report(result: PerformanceTestResult, path: Path) -> None:
     print(f"JSON-Report gespeichert: {path}")
 
 
+def record_history(config: TestConfig, name: str, result: PerformanceTestResult) -> None:
+    """Legt das Ergebnis in der Lauf-Historie ab und meldet Abweichungen zur Baseline."""
+    record_run(
+        config.results_history,
+        result.run_id or new_run_id(name),
+        RunKind.PERFORMANCE,
+        name,
+        performance_metrics(result.to_dict()),
+    )
+
+
 # =============================================================================
 # Pytest Tests
 # =============================================================================
 
 @pytest.mark.performance
 @pytest.mark.asyncio
-async def test_staging_performance_150_orders(browser: Browser, config: TestConfig):
+async def test_staging_performance_150_orders(
+    browser: Browser,
+    config: TestConfig,
+    shards: int,
+    request_blocker,
+    resume_run_id,
+):
     """
     Performance-Test: 150 Bestellungen auf Staging.
 
@@ -571,14 +1773,29 @@ async def test_staging_performance_150_orders(browser: Browser, config: TestConf
     Erfolgskriterien:
     - Mindestens 95% Erfolgsrate
     - Maximale Gesamtdauer: 15 Minuten
+
+    Mit --resume <Lauf-ID> wird ein abgebrochener Lauf fortgesetzt - immer
+    in einem Prozess, da nur der Einzelprozess-Runner ein Manifest schreibt.
     """
     perf_config = config.performance_test
 
-    runner = PerformanceTestRunner(
-        browser=browser,
-        config=config,
-        parallel_workers=perf_config.parallel_workers,
-    )
+    if shards > 1 and not resume_run_id:
+        # Mehrere Prozesse mit je eigenem Browser (--shards / performance_test.shards)
+        runner = ShardedPerformanceTestRunner(
+            config=config,
+            shards=shards,
+            parallel_workers=perf_config.parallel_workers,
+            headless=config.headless,
+            request_blocker=request_blocker,
+        )
+    else:
+        runner = PerformanceTestRunner(
+            browser=browser,
+            config=config,
+            parallel_workers=perf_config.parallel_workers,
+            request_blocker=request_blocker,
+            resume_run_id=resume_run_id,
+        )
 
     result = await runner.run()
 
@@ -588,6 +1805,7 @@ async def test_staging_performance_150_orders(browser: Browser, config: TestConf
     # JSON-Report speichern
     report_path = Path("reports/performance") / f"performance-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
     save_json_report(result, report_path)
+    record_history(config, "performance", result)
 
     # Assertions
     assert result.success_rate >= perf_config.success_rate_threshold, (
@@ -605,7 +1823,7 @@ async def test_staging_performance_150_orders(browser: Browser, config: TestConf
 
 @pytest.mark.performance
 @pytest.mark.asyncio
-async def test_staging_performance_quick(browser: Browser, config: TestConfig):
+async def test_staging_performance_quick(browser: Browser, config: TestConfig, request_blocker, resume_run_id):
     """
     Schneller Performance-Test: 30 Bestellungen (Smoke-Test für Performance).
 
@@ -622,10 +1840,13 @@ async def test_staging_performance_quick(browser: Browser, config: TestConfig):
         browser=browser,
         config=config,
         parallel_workers=10,
+        request_blocker=request_blocker,
+        resume_run_id=resume_run_id,
     )
 
     result = await runner.run()
     print_performance_report(result)
+    record_history(config, "performance-quick", result)
 
     # Lockerere Kriterien für Quick-Test
     assert result.success_rate >= 0.90, (
@@ -635,7 +1856,7 @@ async def test_staging_performance_quick(browser: Browser, config: TestConfig):
 
 @pytest.mark.performance
 @pytest.mark.asyncio
-async def test_staging_performance_stress(browser: Browser, config: TestConfig):
+async def test_staging_performance_stress(browser: Browser, config: TestConfig, request_blocker, resume_run_id):
     """
     Stress-Test: 300 Bestellungen mit hoher Parallelität.
 
@@ -653,6 +1874,8 @@ async def test_staging_performance_stress(browser: Browser, config: TestConfig):
         browser=browser,
         config=config,
         parallel_workers=25,  # Sehr hohe Parallelität
+        request_blocker=request_blocker,
+        resume_run_id=resume_run_id,
     )
 
     result = await runner.run()
@@ -661,8 +1884,194 @@ async def test_staging_performance_stress(browser: Browser, config: TestConfig):
     # Report speichern
     report_path = Path("reports/performance") / f"stress-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
     save_json_report(result, report_path)
+    record_history(config, "stress", result)
 
     # Niedrigere Schwelle für Stress-Test
     assert result.success_rate >= 0.85, (
         f"Stress-Test: Erfolgsrate {result.success_rate:.1%} unter 85%"
     )
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_staging_performance_protocol(config: TestConfig, request_blocker):
+    """
+    Lasttest auf Protokoll-Ebene: Checkout als HTTP-Requests, parallel eine kleine Browser-Kohorte.
+
+    Die Verteilung aus ``performance_test.distribution`` wird um
+    ``performance_test.protocol.distribution_factor`` vervielfacht und ohne
+    Browser bestellt. Die Browser-Kohorte (``browser_distribution``) läuft
+    gleichzeitig und zeigt die Dauer echter Checkouts unter dieser Last.
+    """
+    perf_config = config.performance_test
+    cfg = perf_config.protocol
+    protocol_config = with_distribution(config, perf_config.distribution, cfg.distribution_factor)
+    cohort_config = with_distribution(config, cfg.browser_distribution)
+    cohort_orders = sum(cfg.browser_distribution.model_dump().values())
+
+    async with async_playwright() as p:
+        runners = [ProtocolPerformanceTestRunner(p.request, protocol_config, virtual_users=cfg.virtual_users)]
+        browser = None
+        if cohort_orders and cfg.browser_workers:
+            browser = await p.chromium.launch(headless=config.headless)
+            runners.append(PerformanceTestRunner(
+                browser=browser,
+                config=cohort_config,
+                parallel_workers=cfg.browser_workers,
+                request_blocker=request_blocker,
+                stream_results=False,
+                use_manifest=False,
+            ))
+        try:
+            results = await asyncio.gather(*(runner.run() for runner in runners))
+        finally:
+            if browser:
+                await browser.close()
+
+    result, cohort = results[0], (results[1] if len(results) > 1 else None)
+    print_performance_report(result)
+    report_path = Path("reports/performance") / f"protocol-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    save_json_report(result, report_path)
+    record_history(config, "performance-protocol", result)
+    if cohort:
+        print("BROWSER-KOHORTE (parallel zum HTTP-Lauf):")
+        print_performance_report(cohort)
+        record_history(config, "performance-protocol-browser", cohort)
+
+    assert result.success_rate >= perf_config.success_rate_threshold, (
+        f"Protokoll-Ebene: Erfolgsrate {result.success_rate:.1%} unter Schwellwert "
+        f"{perf_config.success_rate_threshold:.1%}. "
+        f"Fehlgeschlagen: {result.failed_orders}/{result.total_orders}"
+    )
+    if cohort:
+        assert cohort.success_rate >= 0.90, f"Browser-Kohorte: Erfolgsrate {cohort.success_rate:.1%} unter 90%"
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_staging_performance_hybrid(config: TestConfig, request_blocker):
+    """
+    Hybrides Lastprofil: Browser- und Protokoll-Nutzer bestellen, Stöber-Nutzer erzeugen Hintergrundlast.
+
+    Nutzer pro Kohorte unter ``performance_test.hybrid.users``. Ein Report
+    mit Perzentilen pro Kohorte zeigt, wie sich echte Browser-Checkouts
+    unter der gesamten Last verhalten.
+    """
+    perf_config = config.performance_test
+    async with async_playwright() as p:
+        runner = HybridPerformanceTestRunner(p, config, request_blocker=request_blocker)
+        result = await runner.run()
+
+    print_performance_report(result)
+    report_path = Path("reports/performance") / f"hybrid-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    save_json_report(result, report_path)
+    record_history(config, "performance-hybrid", result)
+
+    assert not result.shard_errors, f"Kohorte abgebrochen: {result.shard_errors}"
+    assert result.success_rate >= perf_config.success_rate_threshold, (
+        f"Erfolgsrate {result.success_rate:.1%} unter Schwellwert "
+        f"{perf_config.success_rate_threshold:.1%}. "
+        f"Fehlgeschlagen: {result.failed_orders}/{result.total_orders}"
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_staging_browse_journeys(config: TestConfig):
+    """
+    Reiner Stöber-Traffic nach Nutzerpfaden, ohne Bestellungen.
+
+    ``performance_test.journeys.users`` Sitzungen laufen gleichzeitig für
+    ``duration_seconds`` durch die Markow-Kette. Der Report zeigt Durchsatz
+    und Perzentile pro Seitentyp - etwa um Listing- und Suchlast isoliert
+    zu messen, bevor sie im hybriden Lauf neben Bestellungen läuft.
+    """
+    journeys = config.performance_test.journeys
+    if not journeys.enabled:
+        pytest.skip("Nutzerpfade deaktiviert (performance_test.journeys.enabled)")
+
+    model = JourneyModel.from_config(journeys)
+    async with async_playwright() as p:
+        traffic = create_browse_traffic(p.request, config, journeys.users)
+        stop = asyncio.Event()
+        task = asyncio.create_task(traffic.run(stop))
+        await asyncio.sleep(journeys.duration_seconds)  # readiness: allow-sleep (Laufzeit der Hintergrundlast)
+        stop.set()
+        stats = (await task).to_dict()
+
+    print("\n" + "=" * 70)
+    print("STÖBERN NACH NUTZERPFADEN")
+    print("=" * 70)
+    expected = {kind: round(visits, 2) for kind, visits in model.expected_visits().items() if visits}
+    print(f"Modell: Ø {sum(expected.values()):.1f} Seiten pro Sitzung {expected}")
+    for line in format_browse_stats(stats):
+        print(f"  {line}")
+
+    report_path = Path("reports/performance") / f"journeys-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps({"model": expected, "browse": stats}, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    assert stats["requests"], "Keine Seiten aufgerufen"
+    error_rate = stats["errors"] / stats["requests"]
+    assert error_rate <= journeys.max_error_rate, (
+        f"Fehlerrate {error_rate:.1%} über {journeys.max_error_rate:.1%}"
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_staging_performance_distributed(config: TestConfig, request_blocker, coordinator_url):
+    """
+    Verteilter Performance-Test: dieser Prozess ist der Koordinator.
+
+    Agenten starten mit ``test_performance_agent`` und ``--coordinator``, z.B. als
+    Docker-Replikas (``docker compose --profile distributed up --scale agent=4``)
+    oder lokal in weiteren Terminals. Ohne Agenten bricht der Test nach dem
+    Gesamt-Timeout ab.
+    """
+    if coordinator_url:
+        pytest.skip("Prozess läuft als Agent (--coordinator gesetzt)")
+
+    perf_config = config.performance_test
+    runner = DistributedPerformanceTestRunner(config=config, request_blocker=request_blocker)
+    result = await runner.run()
+    print_performance_report(result)
+
+    report_path = Path("reports/performance") / f"distributed-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    save_json_report(result, report_path)
+    record_history(config, "distributed", result)
+
+    assert result.distributed_stats["agents"], "Kein Agent hat sich beim Koordinator angemeldet"
+    assert result.success_rate >= perf_config.success_rate_threshold, (
+        f"Erfolgsrate {result.success_rate:.1%} unter Schwellwert "
+        f"{perf_config.success_rate_threshold:.1%}. "
+        f"Fehlgeschlagen: {result.failed_orders}/{result.total_orders}"
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_performance_agent(config: TestConfig, coordinator_url, agent_name: str, parallel: int):
+    """
+    Agent für ``test_staging_performance_distributed``: führt vergebene Bestellungen aus.
+
+    Läuft nur mit ``--coordinator <url>``; Parallelität über ``--parallel``.
+    """
+    if not coordinator_url:
+        pytest.skip("Nur als Agent mit --coordinator <url>")
+
+    client = AgentClient(coordinator_url, agent_name)
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=config.headless)
+        try:
+            result = await run_performance_agent(browser, config, client, parallel_workers=parallel)
+        finally:
+            await browser.close()
+
+    if result is None:
+        pytest.skip("Lauf bereits beendet")
+    print(f"\n[Agent {agent_name}] {result.successful_orders}/{result.total_orders} Bestellungen erfolgreich")
@@ -0,0 +1,189 @@
+"""Tests für den PLZ-Sweep (gegen einen lokalen Stub-Shop, ohne Browser)."""
+from collections import Counter
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs
+
+import pytest
+from playwright.async_api import async_playwright
+
+from playwright_tests.data.shipping_rules import SHIPPING_TEST_CASES, generate_sweep_cases
+from playwright_tests.tests._fakes import serve_stub
+from playwright_tests.utils.http_checkout import HttpCheckout
+from playwright_tests.utils.plz_sweep import PlzSweep, format_plz_check
+
+
+PRODUCT_ID = "0123456789abcdef0123456789abcdef"
+ADDRESS_ID = "dddd0000dddd0000dddd0000dddd0001"
+
+REGISTER_HTML = """
+<form action="/account/register" method="post">
+    <select name="salutationId"><option value="mr">Herr</option></select>
+    <select name="billingAddress[countryId]"><option value="at">Österreich</option></select>
+</form>
+"""
+
+
+def address_book_html(address: dict) -> str:
+    """Adress-Modal der Confirm-Seite: Auswahl-Formular plus Bearbeiten-Formular der Lieferadresse."""
+    return f"""
+    <form action="/widgets/account/address-book" method="post">
+        <input type="hidden" name="selectAddress[id]" value="{ADDRESS_ID}">
+    </form>
+    <form action="/widgets/account/address-book" method="post">
+        <input type="hidden" name="address[id]" value="{ADDRESS_ID}">
+        <input name="address[lastName]" value="{address['lastName']}">
+        <input name="address[zipcode]" value="{address['zipcode']}">
+        <input name="address[city]" value="{address['city']}">
+    </form>
+    """
+
+
+def confirm_html(zipcode: str) -> str:
+    """Spedition nach PLZ: 6xxx Wetsch, 9xxx nur Post (falsch konfiguriert), sonst Fink."""
+    carrier = "Wetsch AT" if zipcode.startswith("6") else "Fink AT"
+    methods = [("post", "Postversand", zipcode.startswith("9"))]
+    if not zipcode.startswith("9"):
+        methods.append(("spedition", f"Speditionsversand ({carrier})", True))
+    return "".join(
+        f'<input type="radio" id="shippingMethod{value}" name="shippingMethodId" value="{value}"'
+        f'{" checked" if checked else ""}><label for="shippingMethod{value}">{label}</label>'
+        for value, label, checked in methods
+    )
+
+
+@pytest.fixture
+def shop():
+    state = {"address": None, "requests": Counter(), "widget_requires_login": False}
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status: int, body: str = "", location: str = ""):
+            self.send_response(status)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            if location:
+                self.send_header("Location", location)
+            self.end_headers()
+            self.wfile.write(body.encode())
+
+        def do_GET(self):
+            state["requests"][f"GET {self.path.split('?')[0]}"] += 1
+            if self.path.startswith("/p/"):
+                self._send(200, f'<input name="lineItems[{PRODUCT_ID}][id]" value="{PRODUCT_ID}">')
+            elif self.path == "/checkout/register":
+                self._send(200, REGISTER_HTML)
+            elif self.path == "/checkout/confirm":
+                self._send(200, confirm_html(state["address"]["zipcode"]))
+            elif self.path.startswith("/account/address"):
+                # Wie Shopware: Kontoseiten nur mit Login, Gäste landen auf dem Login
+                self._send(302, location="/account/login")
+            elif self.path == "/account/login":
+                self._send(200, '<form action="/account/login"></form>')
+            else:
+                self._send(404)
+
+        def do_POST(self):
+            state["requests"][f"POST {self.path}"] += 1
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode()
+            form = {k: v[0] for k, v in parse_qs(body).items()}
+            if self.path == "/checkout/line-item/add":
+                self._send(200)
+            elif self.path == "/account/register":
+                state["address"] = {
+                    "lastName": form["lastName"],
+                    "zipcode": form["billingAddress[zipcode]"],
+                    "city": form["billingAddress[city]"],
+                }
+                self._send(302, location="/checkout/confirm")
+            elif self.path == "/widgets/account/address-book":
+                if state["widget_requires_login"]:
+                    self._send(302, location="/account/login")
+                elif "address[id]" not in form:
+                    assert form["changeableAddresses[changeShipping]"] == "1"
+                    self._send(200, address_book_html(state["address"]))
+                elif not form.get("address[zipcode]", "").isdigit():
+                    self._send(200, '<div class="invalid-feedback">PLZ ungültig</div>')
+                else:
+                    assert form["address[id]"] == ADDRESS_ID
+                    assert form["address[lastName]"] == state["address"]["lastName"]
+                    state["address"] = {k: form[f"address[{k}]"] for k in ("lastName", "zipcode", "city")}
+                    self._send(200, address_book_html(state["address"]))
+            else:
+                self._send(404)
+
+    with serve_stub(Handler) as base_url:
+        yield base_url, state
+
+
+def test_generate_sweep_cases_samples_between_boundaries():
+    assert generate_sweep_cases(0) == SHIPPING_TEST_CASES
+
+    cases = generate_sweep_cases(2)
+    ids = [tc[0] for tc in cases]
+    assert len(ids) == len(set(ids))
+    assert "TC-SHIP-AT-WETSCH-S1-6333" in ids and "TC-SHIP-AT-WETSCH-S2-6666" in ids
+    # Nach Land gruppiert
+    countries = [tc[1] for tc in cases]
+    assert countries == sorted(countries, key=["AT", "DE", "CH"].index)
+
+
+@pytest.mark.asyncio
+async def test_sweep_checks_each_plz_in_one_session(shop):
+    base_url, state = shop
+    cases = [
+        ("T-FINK", "AT", "Fink AT", "4020", "Linz", "Spedition Fink"),
+        ("T-WETSCH", "AT", "Wetsch AT", "6020", "Innsbruck", "Spedition Wetsch"),
+        ("T-POST", "AT", "Fink AT", "9020", "Klagenfurt", "Spedition Fink"),
+        ("T-INVALID", "AT", "Fink AT", "40x0", "Linz", "Spedition Fink"),
+    ]
+
+    async with async_playwright() as p:
+        request = await p.request.new_context()
+        checks = await PlzSweep(HttpCheckout(base_url), "p/polsterbett-almeno/ge-p-693278").run(request, cases)
+        await request.dispose()
+
+    by_id = {check.test_id: check for check in checks}
+    assert by_id["T-FINK"].passed and by_id["T-FINK"].selected == "Speditionsversand (Fink AT)"
+    assert by_id["T-WETSCH"].passed and by_id["T-WETSCH"].selected_match
+    assert not by_id["T-POST"].passed and by_id["T-POST"].available == ["Postversand"]
+    assert "PLZ ungültig" in by_id["T-INVALID"].error
+    assert format_plz_check(by_id["T-POST"]).startswith("[FALSCH] T-POST: PLZ 9020 -> 'Postversand'")
+
+    # Warenkorb und Registrierung nur einmal, danach pro PLZ ein POST und ein GET
+    # (plus die Weiterleitung nach der Registrierung; ungültige PLZ ohne GET)
+    requests = state["requests"]
+    assert requests["POST /checkout/line-item/add"] == 1
+    assert requests["POST /account/register"] == 1
+    assert requests["POST /widgets/account/address-book"] == 1 + 4
+    assert requests["GET /checkout/confirm"] == 1 + 3
+    assert not any(key.startswith("GET /account/address") for key in requests)
+
+
+@pytest.mark.asyncio
+async def test_sweep_reports_failed_preparation_for_every_case(shop):
+    base_url, _ = shop
+    cases = [("T-1", "AT", "Fink AT", "4020", "Linz", "Spedition Fink"),
+             ("T-2", "AT", "Fink AT", "4699", "Wels", "Spedition Fink")]
+
+    async with async_playwright() as p:
+        request = await p.request.new_context()
+        checks = await PlzSweep(HttpCheckout(base_url), "unbekannt/produkt").run(request, cases)
+        await request.dispose()
+
+    assert [check.test_id for check in checks] == ["T-1", "T-2"]
+    assert all(check.error.startswith("Vorbereitung fehlgeschlagen") for check in checks)
+
+
+@pytest.mark.asyncio
+async def test_sweep_reports_address_book_login_redirect(shop):
+    base_url, state = shop
+    state["widget_requires_login"] = True
+    cases = [("T-1", "AT", "Fink AT", "4020", "Linz", "Spedition Fink")]
+
+    async with async_playwright() as p:
+        request = await p.request.new_context()
+        checks = await PlzSweep(HttpCheckout(base_url), "p/polsterbett-almeno/ge-p-693278").run(request, cases)
+        await request.dispose()
+
+    assert "verlangt einen Login" in checks[0].error
@@ -0,0 +1,124 @@
+"""Tests für den synchronisierten Race-Versand (gegen einen lokalen Stub-Server, ohne Browser)."""
+import functools
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+from playwright.async_api import async_playwright
+
+from playwright_tests.tests._fakes import serve_stub
+from playwright_tests.utils.race_dispatch import (
+    RaceReport,
+    RaceResponse,
+    form_request,
+    format_race,
+    parse_http_response,
+    race_barrier,
+    race_last_byte,
+)
+
+
+@pytest.fixture
+def coupon_shop():
+    """Einmal-Gutschein mit Check-then-Act-Lücke: Prüfen, 50 ms warten, dann als benutzt markieren."""
+    state = {"used": False, "arrivals": [], "cookies": []}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _reply(self, status: int, location: str = "", cookie: str = ""):
+            self.send_response(status)
+            if location:
+                self.send_header("Location", location)
+            if cookie:
+                self.send_header("Set-Cookie", cookie)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            self.wfile.write(b"2\r\nok\r\n0\r\n\r\n")
+
+        def do_GET(self):
+            self._reply(200, cookie="session=abc123; Path=/")
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            with lock:
+                state["arrivals"].append(time.perf_counter())
+                state["cookies"].append(self.headers.get("Cookie", ""))
+            assert b"code=ONCE" in body
+            already_used = state["used"]
+            time.sleep(0.05)  # readiness: allow-sleep (Race-Fenster im Stub-Server)
+            state["used"] = True
+            self._reply(302, "/checkout/confirm" if already_used else "/checkout/finish?orderId=1")
+
+    with serve_stub(Handler) as base_url:
+        yield base_url, state
+
+
+def test_parse_response_and_report():
+    status, headers, body = parse_http_response(
+        b"HTTP/1.1 302 Found\r\nLocation: /checkout/finish\r\nTransfer-Encoding: chunked\r\n\r\n"
+        b"5\r\nhello\r\n6\r\n world\r\n0\r\n\r\n"
+    )
+    assert (status, headers["location"], body) == (302, "/checkout/finish", b"hello world")
+
+    report = RaceReport("last_byte", [
+        RaceResponse(0, status=302, headers={"location": "/checkout/finish"}, released_at=1.0, responded_at=1.2),
+        RaceResponse(1, status=302, headers={"location": "/checkout/confirm"}, released_at=1.0005, responded_at=1.3),
+        RaceResponse(2, error="ConnectionResetError: reset"),
+    ])
+    assert report.release_spread_ms == 0.5
+    assert report.count(lambda r: "/checkout/finish" in r.location) == 1
+    data = report.to_dict()
+    assert data["statuses"] == {"302": 2}
+    assert data["errors"] == ["#2: ConnectionResetError: reset"]
+    assert format_race(report) == "last_byte: 3 Teilnehmer, Freigabe-Streuung 0.500 ms, Antworten 302: 2, 1 Fehler"
+
+
+@pytest.mark.asyncio
+async def test_last_byte_release_exposes_check_then_act_race(coupon_shop):
+    base_url, state = coupon_shop
+
+    async with async_playwright() as p:
+        contexts = [await p.request.new_context() for _ in range(8)]
+        for context in contexts:
+            await context.get(f"{base_url}/checkout/confirm")
+        requests = [await form_request(context, f"{base_url}/checkout/order", {"code": "ONCE"}) for context in contexts]
+        for context in contexts:
+            await context.dispose()
+
+    report = await race_last_byte(requests, timeout=5)
+
+    assert not report.errors
+    assert report.statuses == {302: 8}
+    assert report.release_spread_ms < 5
+    # Alle Anfragen treffen innerhalb des 50-ms-Fensters ein -> mehrere Einlösungen
+    assert max(state["arrivals"]) - min(state["arrivals"]) < 0.03
+    assert report.count(lambda r: "/checkout/finish" in r.location) > 1
+    # Session-Cookie des Playwright-Kontexts wurde mitgeschickt
+    assert state["cookies"] == ["session=abc123"] * 8
+
+
+@pytest.mark.asyncio
+async def test_barrier_release_with_playwright_contexts(coupon_shop):
+    base_url, state = coupon_shop
+
+    async with async_playwright() as p:
+        contexts = [await p.request.new_context() for _ in range(5)]
+        actions = [
+            functools.partial(context.post, f"{base_url}/checkout/order", form={"code": "ONCE"}, max_redirects=0)
+            for context in contexts
+        ]
+        report = await race_barrier(actions, timeout=5)
+        for context in contexts:
+            await context.dispose()
+
+    assert report.mode == "barrier"
+    assert report.statuses == {302: 5}
+    assert all(r.ok and r.released_at for r in report.responses)
+    assert report.count(lambda r: "/checkout/finish" in r.location) >= 1
+    assert len(state["arrivals"]) == 5
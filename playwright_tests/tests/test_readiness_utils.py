@@ -0,0 +1,116 @@
+"""Tests für die Readiness-Hilfen (Lint-Modus, Prädikate und Navigation, ohne Browser)."""
+import contextlib
+from types import SimpleNamespace
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from playwright_tests.utils.readiness import (
+    ALLOW_SLEEP_MARKER,
+    endpoint_predicate,
+    find_fixed_sleeps,
+    is_cart_update_response,
+    submit_and_wait_for_page,
+)
+
+
+class FakePage:
+    """Navigation wird erst nach der Aktion erwartet; ``navigates`` steuert, ob eine kommt."""
+
+    def __init__(self, navigates: bool):
+        self.navigates = navigates
+        self.events: list[str] = []
+
+    @contextlib.contextmanager
+    def expect_navigation(self, wait_until, timeout):
+        self.events.append("expect")
+        yield
+        if not self.navigates:
+            raise PlaywrightTimeoutError("Timeout")
+        self.events.append("navigated")
+
+    def wait_for_load_state(self, state, timeout):
+        self.events.append(state)
+
+    def evaluate(self, script, args):
+        return True
+
+
+class FakeLocator:
+    def __init__(self, page: FakePage):
+        self.page = page
+
+    def click(self):
+        self.page.events.append("click")
+
+    def press(self, key):
+        self.page.events.append(f"press {key}")
+
+
+def test_find_fixed_sleeps_flags_all_sleep_variants(tmp_path):
+    source = tmp_path / "test_example.py"
+    source.write_text(
+        "import asyncio, time\n"
+        "def test_a(page):\n"
+        "    page.wait_for_timeout(1000)\n"
+        "    time.sleep(1)\n"
+        "async def helper(self):\n"
+        "    await self.page.wait_for_timeout(500)\n"
+        "    await asyncio.sleep(0.5)\n"
+        "    page.wait_for_load_state('domcontentloaded')\n",
+        encoding="utf-8",
+    )
+
+    findings = find_fixed_sleeps([source])
+
+    assert [f.line for f in findings] == [3, 4, 6, 7]
+    assert findings[0].call == "page.wait_for_timeout"
+    assert findings[1].call == "time.sleep"
+    assert str(source) in str(findings[0])
+
+
+def test_find_fixed_sleeps_respects_allow_marker(tmp_path):
+    source = tmp_path / "scheduler.py"
+    source.write_text(
+        "import asyncio\n"
+        "async def run(delay):\n"
+        f"    await asyncio.sleep(delay)  # {ALLOW_SLEEP_MARKER}\n",
+        encoding="utf-8",
+    )
+
+    assert find_fixed_sleeps([source]) == []
+
+
+def test_find_fixed_sleeps_skips_unparsable_files(tmp_path):
+    source = tmp_path / "broken.py"
+    source.write_text("def broken(:\n    page.wait_for_timeout(1)\n", encoding="utf-8")
+
+    assert find_fixed_sleeps([source]) == []
+
+
+def test_endpoint_predicate_matches_url_parts():
+    predicate = endpoint_predicate("/checkout/line-item/add")
+
+    assert predicate(SimpleNamespace(url="https://shop.test/checkout/line-item/add"))
+    assert not predicate(SimpleNamespace(url="https://shop.test/checkout/cart"))
+
+
+def test_cart_update_response_covers_offcanvas_and_promotion():
+    assert is_cart_update_response(SimpleNamespace(url="https://shop.test/checkout/offcanvas"))
+    assert is_cart_update_response(SimpleNamespace(url="https://shop.test/checkout/promotion/add"))
+    assert not is_cart_update_response(SimpleNamespace(url="https://shop.test/widgets/menu/offcanvas"))
+
+
+def test_submit_and_wait_for_page_expects_navigation_before_the_action():
+    page = FakePage(navigates=True)
+    assert submit_and_wait_for_page(page, FakeLocator(page))
+    assert page.events == ["expect", "click", "navigated", "networkidle"]
+
+    page = FakePage(navigates=True)
+    assert submit_and_wait_for_page(page, FakeLocator(page), key="Enter")
+    assert page.events[:3] == ["expect", "press Enter", "navigated"]
+
+
+def test_submit_and_wait_for_page_without_navigation():
+    page = FakePage(navigates=False)
+    assert not submit_and_wait_for_page(page, FakeLocator(page))
+    assert page.events == ["expect", "click", "networkidle"]
@@ -549,3 +549,58 @@ def test_no_critical_js_errors(page: Page, base_url: str):
             print(f"           - {err[:80]}...")
     else:
         print(f"    [OK] Keine kritischen JavaScript-Fehler")
+
+
+# =============================================================================
+# TC-REG-016: Core Web Vitals innerhalb der Budgets
+# =============================================================================
+
+# Seiten und Viewports für die Web-Vitals-Messung (Budgets: config.yaml -> web_vitals)
+VITALS_PAGES = [
+    {"path": "/", "name": "Homepage"},
+    {"path": f"/{TEST_PRODUCT['path']}", "name": "Produktseite"},
+    {"path": "/moebel/", "name": "Kategorie"},
+    {"path": "/checkout/cart", "name": "Warenkorb"},
+]
+
+VITALS_VIEWPORTS = {
+    "desktop": {"width": 1920, "height": 1080},
+    "mobile": {"width": 390, "height": 844},
+}
+
+
+@pytest.mark.regression
+@pytest.mark.parametrize("viewport_name", list(VITALS_VIEWPORTS))
+@pytest.mark.parametrize("page_info", VITALS_PAGES, ids=[p["name"] for p in VITALS_PAGES])
+def test_critical_page_web_vitals(
+    browser, browser_context_args: dict, web_vitals, base_url: str, page_info: dict, viewport_name: str
+):
+    """
+    TC-REG-016: Misst LCP, CLS, INP, TBT, FCP und JS-Heap pro Seite und Viewport.
+
+    Die Messung landet in der Web-Vitals-Datenbank; der Test schlägt fehl,
+    wenn ein Budget des Seitentyps überschritten ist.
+    """
+    from ..utils.web_vitals import format_web_vitals, install_web_vitals
+
+    print(f"\n[Regression] Web Vitals: {page_info['name']} ({viewport_name})")
+
+    context = browser.new_context(**{**browser_context_args, "viewport": VITALS_VIEWPORTS[viewport_name]})
+    try:
+        install_web_vitals(context)
+        page = context.new_page()
+        page.goto(f"{base_url}{page_info['path']}")
+        page.wait_for_load_state("load")
+        accept_cookie_banner(page)
+        # Eine Tastatur-Interaktion, damit INP einen Messwert hat
+        page.keyboard.press("Tab")
+        page.wait_for_load_state("networkidle")
+
+        vitals = web_vitals.capture(page, test=f"{page_info['name']} ({viewport_name})")
+    finally:
+        context.close()
+
+    assert vitals is not None, f"Keine Web Vitals für {page_info['path']} (Skript nicht aktiv)"
+    print(f"    [{vitals.page_kind}] {format_web_vitals(vitals)}")
+    assert not vitals.violations, f"Budget überschritten: {', '.join(vitals.violations)}"
+    print("    [OK] Innerhalb der Budgets")
@@ -0,0 +1,129 @@
+"""Tests für die Blockier-Profile (Entscheidungen, Statistik, Profilwahl - ohne Browser)."""
+from types import SimpleNamespace
+
+import pytest
+
+from playwright_tests.utils.request_blocking import (
+    RequestBlocker,
+    RequestBlockingStats,
+    RouteAction,
+    format_blocking,
+    get_profile,
+    resolve_profile_name,
+)
+
+
+SHOP = "https://staging.example-shop.at"
+
+
+class FakeRoute:
+    """Merkt sich, wie der Blocker einen Request beantwortet hat."""
+
+    def __init__(self, url: str, resource_type: str):
+        self.request = SimpleNamespace(url=url, resource_type=resource_type)
+        self.outcome = None
+
+    def abort(self, error_code: str) -> None:
+        self.outcome = ("abort", error_code)
+
+    def fulfill(self, **kwargs) -> None:
+        self.outcome = ("fulfill", kwargs["content_type"])
+
+    def fallback(self) -> None:
+        self.outcome = ("fallback",)
+
+
+def test_load_profile_decisions():
+    blocker = RequestBlocker.for_base_url(get_profile("load"), SHOP, ["payment.example.com"])
+
+    assert blocker.decide(f"{SHOP}/checkout/confirm", "document") == (RouteAction.PASS, "")
+    assert blocker.decide(f"{SHOP}/media/a1/bett.jpg", "image") == (RouteAction.ABORT, "image")
+    assert blocker.decide("https://www.googletagmanager.com/gtm.js", "script") == (RouteAction.ABORT, "tracker")
+    assert blocker.decide("https://app.usercentrics.eu/browser-ui/loader.js", "script") == (RouteAction.STUB, "consent")
+    assert blocker.decide("https://cdn.other-vendor.net/widget.js", "script") == (RouteAction.ABORT, "third_party")
+    # Subdomains der Allow-List gelten nicht als Drittanbieter
+    assert blocker.decide("https://api.payment.example.com/session", "xhr") == (RouteAction.PASS, "")
+    assert blocker.decide("data:image/png;base64,AAAA", "other") == (RouteAction.PASS, "")
+
+
+def test_lighter_profiles_only_block_their_part():
+    assets = RequestBlocker.for_base_url(get_profile("assets"), SHOP)
+    trackers = RequestBlocker.for_base_url(get_profile("trackers"), SHOP)
+    none = RequestBlocker.for_base_url(get_profile("none"), SHOP)
+
+    assert assets.decide("https://www.google-analytics.com/collect", "xhr")[0] == RouteAction.PASS
+    assert assets.decide(f"{SHOP}/fonts/inter.woff2", "font")[0] == RouteAction.ABORT
+    assert trackers.decide(f"{SHOP}/media/bett.jpg", "image")[0] == RouteAction.PASS
+    assert trackers.decide("https://connect.facebook.net/fbevents.js", "script")[0] == RouteAction.ABORT
+    assert trackers.decide("https://cdn.other-vendor.net/widget.js", "script")[0] == RouteAction.PASS
+    assert not none.active
+
+
+def test_get_profile_rejects_unknown_name():
+    with pytest.raises(ValueError, match="aggressive"):
+        get_profile("aggressive")
+
+
+def test_handle_routes_and_counts():
+    blocker = RequestBlocker.for_base_url(get_profile("load"), SHOP)
+    routes = [
+        FakeRoute(f"{SHOP}/", "document"),
+        FakeRoute(f"{SHOP}/media/bett.jpg", "image"),
+        FakeRoute("https://app.usercentrics.eu/loader.js", "script"),
+    ]
+    for route in routes:
+        blocker._handle(route)
+
+    assert [r.outcome for r in routes] == [
+        ("fallback",),
+        ("abort", "blockedbyclient"),
+        ("fulfill", "application/javascript"),
+    ]
+    report = blocker.report()
+    assert report["profile"] == "load"
+    assert (report["passed"], report["blocked"], report["stubbed"]) == (1, 1, 1)
+    assert report["blocked_percent"] == pytest.approx(66.7)
+    assert "1 blockiert, 1 gestubbt von 3 Requests" in format_blocking(report)
+
+
+def test_detach_tolerates_closed_context():
+    class ClosedContext:
+        def __init__(self):
+            self.routes = []
+
+        def route(self, pattern, handler):
+            self.routes.append(pattern)
+
+        def unroute(self, pattern, handler):
+            raise RuntimeError("Target page, context or browser has been closed")
+
+    blocker = RequestBlocker.for_base_url(get_profile("load"), SHOP)
+    context = ClosedContext()
+    blocker.attach(context)
+    blocker.detach(context)
+    assert context.routes == ["**/*"]
+
+
+def test_stats_merge_from_shards():
+    first = RequestBlockingStats()
+    first.count(RouteAction.ABORT, "image")
+    first.count(RouteAction.PASS, "")
+    second = RequestBlockingStats()
+    second.count(RouteAction.ABORT, "image")
+    second.count(RouteAction.ABORT, "tracker")
+
+    merged = RequestBlockingStats()
+    merged.merge(first.to_dict())
+    merged.merge(second.to_dict())
+
+    assert merged.total == 4
+    assert merged.to_dict()["by_reason"] == {"image": 2, "tracker": 1}
+
+
+def test_resolve_profile_name_precedence():
+    marker_profiles = {"massentest": "load", "performance": "trackers"}
+
+    assert resolve_profile_name("assets", ["massentest"], True, "none", marker_profiles) == "assets"
+    assert resolve_profile_name(None, ["asyncio", "performance"], True, "none", marker_profiles) == "trackers"
+    assert resolve_profile_name(None, ["smoke"], True, "assets", marker_profiles) == "assets"
+    assert resolve_profile_name(None, ["massentest"], False, "assets", marker_profiles) == "none"
@@ -0,0 +1,103 @@
+"""Tests für Backend-Kennzahlen aus Shop-Antworten (mit Fake-Kontext, ohne Playwright)."""
+from playwright_tests.tests._fakes import FakeEmitter as FakeContext
+from playwright_tests.utils.response_metrics import (
+    CacheStatus,
+    ResponseMetrics,
+    ResponseMetricsCollector,
+    cache_status,
+    format_response_metrics,
+    page_type,
+    parse_server_timing,
+)
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type="document", ttfb_ms=200.0):
+        self.url = url
+        self.resource_type = resource_type
+        self.timing = {"requestStart": 10.0, "responseStart": 10.0 + ttfb_ms, "responseEnd": 300.0}
+
+
+class FakeResponse:
+    def __init__(self, request, headers):
+        self.request = request
+        self.headers = headers
+
+
+def respond(context, url, headers, resource_type="document", ttfb_ms=200.0):
+    request = FakeRequest(url, resource_type, ttfb_ms)
+    context.emit("response", FakeResponse(request, headers))
+    context.emit("requestfinished", request)
+
+
+def test_page_type_classification():
+    assert page_type("https://shop.at/checkout/confirm", "document") == "checkout/confirm"
+    assert page_type("https://shop.at/widgets/checkout/info", "fetch") == "widgets/checkout"
+    assert page_type("https://shop.at/p/polsterbett-almeno/ge-p-693278", "document") == "pdp"
+    assert page_type("https://shop.at/", "document") == "home"
+    assert page_type("https://shop.at/theme/app.js", "script") is None
+
+
+def test_cache_status_from_common_headers():
+    assert cache_status({"x-symfony-cache": "GET /p/bett: fresh"}) == CacheStatus.HIT
+    assert cache_status({"x-symfony-cache": "GET /checkout/cart: miss"}) == CacheStatus.MISS
+    assert cache_status({"x-cache": "MISS, HIT"}) == CacheStatus.HIT
+    assert cache_status({"cf-cache-status": "DYNAMIC"}) == CacheStatus.PASS
+    assert cache_status({"x-varnish": "32770 3"}) == CacheStatus.HIT
+    assert cache_status({"x-varnish": "32770"}) == CacheStatus.MISS
+    assert cache_status({"age": "120"}) == CacheStatus.HIT
+    assert cache_status({}) == CacheStatus.UNKNOWN
+
+
+def test_parse_server_timing():
+    assert parse_server_timing('db;dur=53, app;desc="PHP";dur=47.2, miss, total;dur=110') == {
+        "db": 53.0, "app": 47.2, "total": 110.0,
+    }
+    assert parse_server_timing("") == {}
+
+
+def test_collector_aggregates_per_page_type():
+    context = FakeContext()
+    collector = ResponseMetricsCollector("https://shop.at")
+    collector.attach(context)
+
+    respond(context, "https://shop.at/checkout/confirm", {
+        "x-symfony-cache": "GET /checkout/confirm: miss", "server-timing": "app;dur=400", "content-length": "2048",
+    }, ttfb_ms=450.0)
+    respond(context, "https://shop.at/checkout/confirm", {
+        "x-symfony-cache": "GET /checkout/confirm: fresh", "content-length": "4096",
+    }, ttfb_ms=50.0)
+    respond(context, "https://cdn.other.com/checkout/x", {"x-cache": "HIT"})  # fremde Origin
+    respond(context, "https://shop.at/bundles/app.css", {}, resource_type="stylesheet")
+    collector.detach(context)
+    respond(context, "https://shop.at/checkout/cart", {})
+
+    data = collector.metrics.to_dict()
+    assert list(data) == ["checkout/confirm"]
+    confirm = data["checkout/confirm"]
+    assert confirm["count"] == 2
+    assert confirm["cache"] == {CacheStatus.MISS: 1, CacheStatus.HIT: 1}
+    assert confirm["cache_hit_rate"] == 0.5
+    assert confirm["avg_bytes"] == 3072
+    assert confirm["server_timing"]["app"] == {"count": 1, "total_ms": 400.0, "avg_ms": 400.0}
+    assert confirm["ttfb"]["count"] == 2
+    assert confirm["server_time"]["max"] == 0.4
+    assert "Cache-HIT 50%" in format_response_metrics("checkout/confirm", confirm)
+
+
+def test_merge_shard_metrics():
+    first, second = ResponseMetrics(), ResponseMetrics()
+    first.record("pdp", 100.0, {"age": "5", "server-timing": "total;dur=80"})
+    second.record("pdp", 300.0, {"x-cache": "MISS"})
+    second.record("checkout/finish", 900.0, {})
+
+    merged = ResponseMetrics()
+    merged.merge(first.to_dict())
+    merged.merge(second.to_dict())
+
+    data = merged.to_dict()
+    assert data["pdp"]["count"] == 2
+    assert data["pdp"]["cache_hit_rate"] == 0.5
+    assert data["pdp"]["ttfb"]["count"] == 2
+    assert data["pdp"]["server_time"]["count"] == 1
+    assert data["checkout/finish"]["cache"] == {CacheStatus.UNKNOWN: 1}
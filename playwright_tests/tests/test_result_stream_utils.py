@@ -0,0 +1,94 @@
+"""Tests für Ergebnis-Stream und Live-Auswertung (ohne Browser)."""
+import json
+
+from playwright_tests.config import ResultStreamConfig
+from playwright_tests.utils.result_stream import (
+    LiveAggregator,
+    ResultStream,
+    new_run_id,
+    read_stream,
+    start_run_stream,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_stream_writes_one_line_per_order_and_summary(tmp_path):
+    path = tmp_path / "run.jsonl"
+    stream = ResultStream(path, "performance-1", meta={"parallel_workers": 5}).open()
+    stream.write({"success": True, "duration_seconds": 12.5})
+    stream.write({"success": False, "error_message": "Timeout"})
+    stream.close(summary={"total_orders": 2})
+
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [line["type"] for line in lines] == ["run", "order", "order", "end"]
+    assert [line["seq"] for line in lines[1:3]] == [0, 1]
+
+    contents = read_stream(path)
+    assert contents.run_id == "performance-1"
+    assert contents.meta == {"parallel_workers": 5}
+    assert len(contents.orders) == 2
+    assert contents.finished
+
+
+def test_aborted_stream_is_readable(tmp_path):
+    path = tmp_path / "run.jsonl"
+    stream = ResultStream(path, "massentest-1").open()
+    stream.write({"success": True})
+    stream.close()  # ohne Zusammenfassung
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"type": "order", "seq": 1, "da')  # beim Absturz abgeschnitten
+
+    contents = read_stream(path)
+
+    assert not contents.finished
+    assert contents.orders == [{"success": True}]
+    assert contents.skipped_lines == 1
+
+
+def test_writes_after_close_are_ignored(tmp_path):
+    path = tmp_path / "run.jsonl"
+    stream = ResultStream(path, "run").open()
+    stream.close()
+    stream.write({"success": True})
+
+    assert read_stream(path).orders == []
+
+
+def test_live_aggregator_window_and_interval():
+    clock = FakeClock()
+    lines = []
+    live = LiveAggregator(interval_seconds=10, window_seconds=60, target=4, printer=lines.append, clock=clock)
+
+    for t, success in ((1, True), (5, False), (70, True), (75, True)):
+        clock.now = t
+        live.record(success, 20.0)
+
+    snapshot = live.snapshot()
+    assert snapshot["completed"] == 4
+    assert snapshot["error_rate"] == 0.25
+    assert snapshot["window_orders"] == 2  # t=1 und t=5 liegen außerhalb des Fensters
+    assert snapshot["window_error_rate"] == 0.0
+    assert snapshot["orders_per_minute"] == 2.0
+    # Nur einmal ausgegeben (t=70); t=75 liegt im Intervall
+    assert len(lines) == 1
+    assert "3/4 fertig" in lines[0] and "p50" in lines[0]
+
+
+def test_start_run_stream_uses_config(tmp_path, capsys):
+    cfg = ResultStreamConfig(directory=str(tmp_path), live_interval_seconds=0)
+
+    stream, live = start_run_stream(cfg, "massentest", target=10, meta={"parallel_workers": 3})
+    stream.close()
+
+    assert stream.path.parent == tmp_path
+    assert stream.run_id.startswith("massentest-")
+    assert live.target == 10
+    assert str(stream.path) in capsys.readouterr().out
+    assert new_run_id("x") != new_run_id("x")
@@ -0,0 +1,121 @@
+"""Tests für die Lauf-Historie und die Regressionserkennung (ohne Playwright)."""
+import json
+from datetime import datetime, timedelta
+
+from playwright_tests.utils.results_history import (
+    TOTAL,
+    Metric,
+    ResultsHistory,
+    RunKind,
+    compare_metrics,
+    compare_run,
+    format_change,
+    ingest_file,
+    main,
+    performance_metrics,
+    summary_date,
+    summary_metrics,
+    trend_report,
+    web_vitals_metrics,
+)
+from playwright_tests.utils.web_vitals import WebVitals
+
+
+def performance_report(failed: int = 3, p95: float = 60.0, duration: float = 600.0) -> dict:
+    return {
+        "run_id": "",
+        "summary": {"total_orders": 100, "successful_orders": 100 - failed, "failed_orders": failed},
+        "timing": {"start_time": "2026-01-20T10:00:00", "total_duration_seconds": duration},
+        "latency": {"count": 100 - failed, "p95": p95},
+        "latency_by_type": {"guest_post": {"count": 58, "p95": p95 - 5}},
+        "by_type": {"guest_post": {"total": 60, "successful": 58, "failed": 2}},
+    }
+
+
+SUMMARY_MD = """# Test-Lauf Zusammenfassung
+
+**Datum:** 26.01.2026 22:00 Uhr
+
+| Status | Anzahl | Prozent |
+|--------|--------|---------|
+| ✅ PASSED | 23 | 8.8% |
+| ❌ FAILED | 7 | 2.7% |
+| ⏭️ SKIPPED | 43 | 16.5% |
+| ⏸️ Nicht ausgeführt | ~188 | ~72% |
+"""
+
+
+def test_metrics_from_reports():
+    metrics = {(m.group, m.name): m for m in performance_metrics(performance_report())}
+    assert metrics[(TOTAL, "error_rate")].value == 0.03 and metrics[(TOTAL, "error_rate")].samples == 100
+    assert metrics[(TOTAL, "throughput_per_min")].value == 9.7
+    assert metrics[("guest_post", "p95_seconds")].value == 55.0
+
+    summary = {m.name: m.value for m in summary_metrics(SUMMARY_MD)}
+    assert summary == {"passed": 23, "failed": 7, "error_rate": 7 / 30}
+    assert summary_date(SUMMARY_MD) == datetime(2026, 1, 26, 22, 0)
+    listed = {m.name: m.value for m in summary_metrics("- **PASSED:** 23 Tests\n- **FAILED:** 7 Tests\n- **9 PASSED** Tests")}
+    assert (listed["passed"], listed["failed"]) == (23, 7)
+
+    vitals = [WebVitals(url="/", page_kind="home", viewport="390x844", lcp_ms=ms) for ms in (1000, 2000, 3000, 4000)]
+    assert [(m.group, m.name, m.value) for m in web_vitals_metrics(vitals)] == [("home 390x844", "lcp_ms", 3000)]
+
+
+def test_compare_flags_only_significant_changes():
+    baseline = [[Metric(TOTAL, "p95_seconds", p95), Metric(TOTAL, "error_rate", 0.02, 200)] for p95 in (60, 62, 58, 61)]
+
+    noisy = compare_metrics([Metric(TOTAL, "p95_seconds", 63), Metric(TOTAL, "error_rate", 0.03, 200)], baseline)
+    assert noisy == []
+
+    changes = compare_metrics([Metric(TOTAL, "p95_seconds", 90), Metric(TOTAL, "error_rate", 0.12, 200)], baseline)
+    assert [(c.metric, c.regression) for c in changes] == [("p95_seconds", True), ("error_rate", True)]
+    assert "REGRESSION" in format_change(changes[0]) and "+49%" in format_change(changes[0])
+
+    faster = compare_metrics([Metric(TOTAL, "throughput_per_min", 20)], [[Metric(TOTAL, "throughput_per_min", 10)]] * 3)
+    assert len(faster) == 1 and not faster[0].regression  # Baseline ohne Streuung
+    assert compare_metrics([Metric(TOTAL, "p95_seconds", 90)], baseline[:2]) == []  # zu wenig Historie
+
+
+def test_compare_with_single_baseline_run():
+    baseline = [[Metric(TOTAL, "p95_seconds", 60)]]
+
+    changes = compare_metrics([Metric(TOTAL, "p95_seconds", 90)], baseline, min_baseline_runs=1)
+    assert [(c.metric, c.regression) for c in changes] == [("p95_seconds", True)]
+    assert compare_metrics([Metric(TOTAL, "p95_seconds", 61)], baseline, min_baseline_runs=1) == []
+
+
+def test_history_baseline_and_trend(tmp_path):
+    history = ResultsHistory(tmp_path / "history.sqlite")
+    start = datetime(2026, 1, 1)
+    for day, p95 in enumerate((60, 61, 59, 60, 95)):
+        history.add_run(f"run-{day}", RunKind.PERFORMANCE, "performance",
+                        performance_metrics(performance_report(p95=p95)), start + timedelta(days=day))
+    history.add_run("other", RunKind.PERFORMANCE, "stress", performance_metrics(performance_report()), start)
+
+    changes = compare_run(history, "run-4", baseline_runs=3)
+    assert {(c.group, c.metric) for c in changes} == {(TOTAL, "p95_seconds"), ("guest_post", "p95_seconds")}
+    assert [r["run_id"] for r in history.baseline(history.run("run-4"), 3)] == ["run-1", "run-2", "run-3"]
+
+    report = trend_report(history, name="performance")
+    assert "## performance (performance, gesamt)" in report
+    assert report.index("run-0") < report.index("run-4") and "95.0s" in report
+
+
+def test_ingest_existing_reports_and_cli(tmp_path, capsys):
+    report = tmp_path / "stress-20260120-100000.json"
+    report.write_text(json.dumps(performance_report()), encoding="utf-8")
+    summary = tmp_path / "test_run_summary_20260126_220022.md"
+    summary.write_text(SUMMARY_MD, encoding="utf-8")
+    database = str(tmp_path / "history.sqlite")
+
+    assert main(["--database", database, "ingest", str(report), str(summary)]) == 0
+    history = ResultsHistory(tmp_path / "history.sqlite")
+    assert [(r["kind"], r["name"]) for r in history.runs()] == [
+        (RunKind.PERFORMANCE, "stress"), (RunKind.SUMMARY, "test_run_summary"),
+    ]
+    assert ingest_file(history, report) == "stress-20260120-100000"  # erneut: ersetzt statt doppelt
+    assert len(history.runs()) == 2
+
+    capsys.readouterr()
+    assert main(["--database", database, "trend", "--kind", "summary"]) == 0
+    assert "| test_run_summary_20260126_220022 | 2026-01-26 22:00 | 23.3% | 23 | 7 |" in capsys.readouterr().out
@@ -0,0 +1,90 @@
+"""Tests für das Lauf-Manifest (Checkpoint und Fortsetzen, ohne Browser)."""
+import json
+
+import pytest
+
+from playwright_tests.utils.run_manifest import ManifestError, OrderState, RunManifest
+
+
+def make_plan(count: int) -> list[dict]:
+    return [{"order_num": i, "product_path": f"/produkt-{i}", "payment_method": "Rechnung"} for i in range(count)]
+
+
+def test_create_and_load_round_trip(tmp_path):
+    RunManifest.create(tmp_path, "massentest-1", "massentest", seed=42, planned=make_plan(3), meta={"parallel_workers": 2})
+
+    manifest = RunManifest.load(tmp_path, "massentest-1")
+
+    assert (manifest.kind, manifest.seed, manifest.meta) == ("massentest", 42, {"parallel_workers": 2})
+    assert manifest.planned == make_plan(3)
+    assert manifest.attempt == 1
+    assert manifest.orders_to_run() == make_plan(3)
+    data = json.loads((tmp_path / "massentest-1" / "manifest.json").read_text(encoding="utf-8"))
+    assert data["run_id"] == "massentest-1"
+
+
+def test_resume_skips_succeeded_and_submitted_orders(tmp_path):
+    manifest = RunManifest.create(tmp_path, "run", "massentest", seed=1, planned=make_plan(5))
+    manifest.mark_started(0)
+    manifest.mark_submitted(0)
+    manifest.mark_finished(0, success=True, order_number="10001", result={"success": True, "order_number": "10001"})
+    manifest.mark_started(1)  # abgebrochen vor dem Absenden
+    manifest.mark_started(2)
+    manifest.mark_finished(2, success=False, order_number=None, result={"success": False})  # vor dem Absenden
+    manifest.mark_started(3)
+    manifest.mark_submitted(3)  # abgebrochen nach dem Absenden
+    manifest.mark_started(4)
+    manifest.mark_submitted(4)
+    manifest.mark_finished(4, success=False, order_number=None, result={"success": False})
+
+    resumed = RunManifest.load(tmp_path, "run", kind="massentest")
+
+    assert resumed.attempt == 2
+    assert [e["order_num"] for e in resumed.orders_to_run()] == [1, 2]
+    carried = {entry["order_num"]: (state, data) for entry, state, data in resumed.carried_over()}
+    assert carried[0] == (OrderState.SUCCEEDED, {"success": True, "order_number": "10001"})
+    assert carried[3][0] == OrderState.UNRESOLVED
+    assert carried[4][0] == OrderState.UNRESOLVED
+    assert resumed.order_numbers() == {0: "10001"}
+    assert resumed.summary() == {
+        OrderState.SUCCEEDED: 1,
+        OrderState.STARTED: 1,
+        OrderState.FAILED: 1,
+        OrderState.SUBMITTED: 1,
+        OrderState.UNRESOLVED: 1,
+    }
+
+
+def test_retry_in_later_attempt_is_recorded(tmp_path):
+    manifest = RunManifest.create(tmp_path, "run", "massentest", seed=1, planned=make_plan(1))
+    manifest.mark_started(0)
+
+    resumed = RunManifest.load(tmp_path, "run")
+    resumed.mark_started(0)
+    resumed.mark_finished(0, success=True, order_number="10002", result={"success": True})
+
+    final = RunManifest.load(tmp_path, "run")
+    assert final.attempt == 3
+    assert final.progress[0].attempts == 2
+    assert final.orders_to_run() == []
+
+
+def test_truncated_progress_line_is_ignored(tmp_path):
+    manifest = RunManifest.create(tmp_path, "run", "massentest", seed=1, planned=make_plan(2))
+    manifest.mark_started(0)
+    with open(manifest.progress_path, "a", encoding="utf-8") as f:
+        f.write('{"event": "submitted", "order_n')  # beim Absturz abgeschnitten
+
+    resumed = RunManifest.load(tmp_path, "run")
+
+    assert resumed.state(0) == OrderState.STARTED
+    assert len(resumed.orders_to_run()) == 2
+
+
+def test_load_errors(tmp_path):
+    RunManifest.create(tmp_path, "run", "performance", seed=None, planned=[])
+
+    with pytest.raises(ManifestError):
+        RunManifest.load(tmp_path, "fehlt")
+    with pytest.raises(ManifestError):
+        RunManifest.load(tmp_path, "run", kind="massentest")
@@ -11,6 +11,7 @@ import pytest
 from playwright.sync_api import Page, expect
 
 from ..conftest import accept_cookie_banner
+from ..utils.readiness import submit_and_wait_for_page, wait_for_page_ready, wait_for_search_suggest
 
 
 # Testdaten: Artikelnummer -> erwartete Produkt-URL
@@ -50,8 +51,7 @@ def test_search_autocomplete_shows_correct_product(
     """
     # Startseite laden
     page.goto(base_url)
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1000)
+    wait_for_page_ready(page)
 
     # Cookie-Banner akzeptieren
     accept_cookie_banner(page)
@@ -59,15 +59,14 @@ def test_search_autocomplete_shows_correct_product(
     # Such-Toggle klicken
     search_toggle = page.locator("button.search-toggle-btn.js-search-toggle-btn")
     search_toggle.click()
-    page.wait_for_timeout(500)
 
     # Artikelnummer eingeben
     search_input = page.locator("input#header-main-search-input")
     expect(search_input).to_be_visible()
     search_input.fill(article_number)
 
-    # Auf Autocomplete warten (2 Sekunden für AJAX)
-    page.wait_for_timeout(2000)
+    # Auf Autocomplete warten
+    wait_for_search_suggest(page)
 
     # Ersten Autocomplete-Produktvorschlag prüfen
     # Der erste Vorschlag sollte ein Produktlink sein
@@ -101,8 +100,7 @@ def test_search_autocomplete_click_navigates_to_product(
     """
     # Startseite laden
     page.goto(base_url)
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1000)
+    wait_for_page_ready(page)
 
     # Cookie-Banner akzeptieren
     accept_cookie_banner(page)
@@ -110,7 +108,6 @@ def test_search_autocomplete_click_navigates_to_product(
     # Such-Toggle klicken
     search_toggle = page.locator("button.search-toggle-btn.js-search-toggle-btn")
     search_toggle.click()
-    page.wait_for_timeout(500)
 
     # Artikelnummer eingeben
     search_input = page.locator("input#header-main-search-input")
@@ -118,16 +115,14 @@ def test_search_autocomplete_click_navigates_to_product(
     search_input.fill(article_number)
 
     # Auf Autocomplete warten
-    page.wait_for_timeout(2000)
+    wait_for_search_suggest(page)
 
     # Ersten Vorschlag anklicken
     first_suggest = page.locator(".search-suggest-product-link, .search-suggest-product a").first
     expect(first_suggest).to_be_visible(timeout=5000)
-    first_suggest.click()
 
-    # Auf Produktseite warten
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1000)
+    # Anklicken und auf Produktseite warten
+    submit_and_wait_for_page(page, first_suggest)
 
     # URL prüfen
     current_url = page.url
@@ -172,8 +167,7 @@ def test_search_results_page_shows_correct_product(
     """
     # Startseite laden
     page.goto(base_url)
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1000)
+    wait_for_page_ready(page)
 
     # Cookie-Banner akzeptieren
     accept_cookie_banner(page)
@@ -181,7 +175,6 @@ def test_search_results_page_shows_correct_product(
     # Such-Toggle klicken
     search_toggle = page.locator("button.search-toggle-btn.js-search-toggle-btn")
     search_toggle.click()
-    page.wait_for_timeout(500)
 
     # Artikelnummer eingeben
     search_input = page.locator("input#header-main-search-input")
@@ -189,9 +182,7 @@ def test_search_results_page_shows_correct_product(
     search_input.fill(article_number)
 
     # Enter drücken - zur Suchergebnisseite oder Produktdetailseite
-    search_input.press("Enter")
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(3000)
+    submit_and_wait_for_page(page, search_input, key="Enter")
 
     # Prüfen wo wir gelandet sind: Produktdetailseite oder Suchergebnisseite
     expected_product_id = expected_url_path.split("/")[-1]  # z.B. "ge-p-862990"
@@ -257,8 +248,7 @@ def test_search_results_page_click_navigates_to_product(
     """
     # Startseite laden
     page.goto(base_url)
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1000)
+    wait_for_page_ready(page)
 
     # Cookie-Banner akzeptieren
     accept_cookie_banner(page)
@@ -266,7 +256,6 @@ def test_search_results_page_click_navigates_to_product(
     # Such-Toggle klicken
     search_toggle = page.locator("button.search-toggle-btn.js-search-toggle-btn")
     search_toggle.click()
-    page.wait_for_timeout(500)
 
     # Artikelnummer eingeben
     search_input = page.locator("input#header-main-search-input")
@@ -274,9 +263,7 @@ def test_search_results_page_click_navigates_to_product(
     search_input.fill(article_number)
 
     # Enter drücken - zur Suchergebnisseite oder Produktdetailseite
-    search_input.press("Enter")
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(3000)
+    submit_and_wait_for_page(page, search_input, key="Enter")
 
     # Prüfen wo wir gelandet sind
     expected_product_id = expected_url_path.split("/")[-1]
@@ -319,11 +306,9 @@ def test_search_results_page_click_navigates_to_product(
     # Fall 2b: Erstes Suchergebnis anklicken
     first_result = page.locator(".product-box a.product-name, .product-item a, .cms-listing-col a.product-name").first
     expect(first_result).to_be_visible(timeout=5000)
-    first_result.click()
 
-    # Auf Produktseite warten
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(2000)
+    # Anklicken und auf Produktseite warten
+    submit_and_wait_for_page(page, first_result)
 
     # URL prüfen
     current_url = page.url
@@ -348,8 +333,7 @@ def test_search_no_results_for_invalid_article(page: Page, base_url: str):
     """Testet, dass bei ungültiger Artikelnummer keine/passende Ergebnisse kommen."""
     # Startseite laden
     page.goto(base_url)
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1000)
+    wait_for_page_ready(page)
 
     # Cookie-Banner akzeptieren
     accept_cookie_banner(page)
@@ -357,7 +341,6 @@ def test_search_no_results_for_invalid_article(page: Page, base_url: str):
     # Such-Toggle klicken
     search_toggle = page.locator("button.search-toggle-btn.js-search-toggle-btn")
     search_toggle.click()
-    page.wait_for_timeout(500)
 
     # Ungültige Artikelnummer eingeben
     search_input = page.locator("input#header-main-search-input")
@@ -365,9 +348,7 @@ def test_search_no_results_for_invalid_article(page: Page, base_url: str):
     search_input.fill("99999999")
 
     # Enter drücken
-    search_input.press("Enter")
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(2000)
+    submit_and_wait_for_page(page, search_input, key="Enter")
 
     # Entweder keine Ergebnisse oder "keine Ergebnisse" Meldung
     no_results = page.locator(".search-no-results, .cms-element-text:has-text('keine'), .alert:has-text('keine')")
@@ -399,8 +380,7 @@ def test_search_wildrose_excludes_brushes(page: Page, base_url: str):
     """
     # Startseite laden
     page.goto(base_url)
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1000)
+    wait_for_page_ready(page)
 
     # Cookie-Banner akzeptieren
     accept_cookie_banner(page)
@@ -408,7 +388,6 @@ def test_search_wildrose_excludes_brushes(page: Page, base_url: str):
     # Such-Toggle klicken
     search_toggle = page.locator("button.search-toggle-btn.js-search-toggle-btn")
     search_toggle.click()
-    page.wait_for_timeout(500)
 
     # "wildrose" eingeben
     search_input = page.locator("input#header-main-search-input")
@@ -416,9 +395,7 @@ def test_search_wildrose_excludes_brushes(page: Page, base_url: str):
     search_input.fill("wildrose")
 
     # Enter drücken - zur Suchergebnisseite
-    search_input.press("Enter")
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(2000)
+    submit_and_wait_for_page(page, search_input, key="Enter")
 
     # Prüfen dass wir auf der Suchergebnisseite sind
     assert "search" in page.url, f"Nicht auf Suchergebnisseite: {page.url}"
@@ -482,8 +459,7 @@ def test_search_suggest_appears_on_input(page: Page, base_url: str):
     """
     # Startseite laden
     page.goto(base_url)
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1000)
+    wait_for_page_ready(page)
 
     # Cookie-Banner akzeptieren
     accept_cookie_banner(page)
@@ -491,7 +467,6 @@ def test_search_suggest_appears_on_input(page: Page, base_url: str):
     # Such-Toggle klicken
     search_toggle = page.locator("button.search-toggle-btn.js-search-toggle-btn")
     search_toggle.click()
-    page.wait_for_timeout(500)
 
     # Suchfeld fokussieren und minimale Eingabe
     search_input = page.locator("input#header-main-search-input")
@@ -501,7 +476,7 @@ def test_search_suggest_appears_on_input(page: Page, base_url: str):
     search_input.fill("be")
 
     # Warten auf Nosto Suggest
-    page.wait_for_timeout(2500)
+    wait_for_search_suggest(page)
 
     # Prüfen ob Suggest-Container erscheint
     suggest_selectors = [
@@ -554,8 +529,7 @@ def test_search_suggest_shows_categories(page: Page, base_url: str):
     """
     # Startseite laden
     page.goto(base_url)
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1000)
+    wait_for_page_ready(page)
 
     # Cookie-Banner akzeptieren
     accept_cookie_banner(page)
@@ -563,7 +537,6 @@ def test_search_suggest_shows_categories(page: Page, base_url: str):
     # Such-Toggle klicken
     search_toggle = page.locator("button.search-toggle-btn.js-search-toggle-btn")
     search_toggle.click()
-    page.wait_for_timeout(500)
 
     # Suchbegriff eingeben der Kategorien matchen sollte
     search_input = page.locator("input#header-main-search-input")
@@ -572,15 +545,15 @@ def test_search_suggest_shows_categories(page: Page, base_url: str):
     # "bett" sollte Kategorien wie "Betten", "Bettwaesche" etc. vorschlagen
     search_input.fill("bett")
 
-    # Warten auf Nosto Suggest (etwas laenger fuer Kategorien)
-    page.wait_for_timeout(3000)
+    # Warten auf Nosto Suggest
+    wait_for_search_suggest(page)
 
     # Suggest-Container finden - warte bis sichtbar
     suggest_container = page.locator(".search-suggest-container:visible, .search-suggest:visible")
 
     # Falls nicht sichtbar, nochmal warten und erneut versuchen
     if suggest_container.count() == 0:
-        page.wait_for_timeout(2000)
+        wait_for_search_suggest(page)
         suggest_container = page.locator(".search-suggest-container, .search-suggest").filter(has=page.locator(":visible"))
 
     # Pruefen ob Container existiert und sichtbar ist
@@ -679,8 +652,7 @@ def test_search_autocomplete_shows_product_images(
     """
     # Startseite laden
     page.goto(base_url)
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1000)
+    wait_for_page_ready(page)
 
     # Cookie-Banner akzeptieren
     accept_cookie_banner(page)
@@ -688,7 +660,6 @@ def test_search_autocomplete_shows_product_images(
     # Such-Toggle klicken
     search_toggle = page.locator("button.search-toggle-btn.js-search-toggle-btn")
     search_toggle.click()
-    page.wait_for_timeout(500)
 
     # Artikelnummer eingeben
     search_input = page.locator("input#header-main-search-input")
@@ -696,7 +667,7 @@ def test_search_autocomplete_shows_product_images(
     search_input.fill(article_number)
 
     # Auf Autocomplete warten
-    page.wait_for_timeout(2500)
+    wait_for_search_suggest(page)
 
     # Produktvorschläge finden
     suggest_product_selectors = [
@@ -770,8 +741,7 @@ def test_search_autocomplete_product_info_complete(page: Page, base_url: str):
 
     # Startseite laden
     page.goto(base_url)
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1000)
+    wait_for_page_ready(page)
 
     # Cookie-Banner akzeptieren
     accept_cookie_banner(page)
@@ -779,7 +749,6 @@ def test_search_autocomplete_product_info_complete(page: Page, base_url: str):
     # Such-Toggle klicken
     search_toggle = page.locator("button.search-toggle-btn.js-search-toggle-btn")
     search_toggle.click()
-    page.wait_for_timeout(500)
 
     # Artikelnummer eingeben
     search_input = page.locator("input#header-main-search-input")
@@ -787,7 +756,7 @@ def test_search_autocomplete_product_info_complete(page: Page, base_url: str):
     search_input.fill(article_number)
 
     # Auf Autocomplete warten
-    page.wait_for_timeout(2500)
+    wait_for_search_suggest(page)
 
     # Ersten Produktvorschlag finden
     first_product = page.locator(
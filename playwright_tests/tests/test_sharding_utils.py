@@ -0,0 +1,61 @@
+"""Tests für die Shard-Verteilung (ohne Browser)."""
+import pytest
+
+from playwright_tests.utils.sharding import ShardMessage, run_shards, split_counts, split_weighted
+
+
+def _echo_worker(result_queue, shard_index, count, fail=False):
+    """Test-Worker: meldet ``count`` Ergebnisse, optional mit Fehler."""
+    result_queue.put((ShardMessage.STARTED, shard_index, 0.0))
+    for i in range(count):
+        result_queue.put((ShardMessage.RESULT, shard_index, {"n": i}))
+    if fail:
+        raise SystemExit(3)
+    result_queue.put((ShardMessage.DONE, shard_index, None))
+
+
+def test_split_counts_preserves_totals():
+    counts = {"guest_post": 85, "guest_spedition": 10, "multi_product": 7, "registered": 3}
+    parts = split_counts(counts, 4)
+
+    assert len(parts) == 4
+    for key, total in counts.items():
+        assert sum(part[key] for part in parts) == total
+    sizes = [sum(part.values()) for part in parts]
+    assert max(sizes) - min(sizes) <= 1
+
+
+def test_split_counts_single_shard():
+    assert split_counts({"a": 3}, 1) == [{"a": 3}]
+
+
+def test_split_counts_rejects_zero_shards():
+    with pytest.raises(ValueError):
+        split_counts({"a": 1}, 0)
+
+
+def test_split_weighted_interleaves_by_weight():
+    groups = split_weighted(list(range(100)), {"browser": 5, "protocol": 45, "browse": 0})
+
+    assert len(groups["browser"]) == 10
+    assert len(groups["protocol"]) == 90
+    assert groups["browse"] == []
+    # Browser-Bestellungen über den ganzen Plan verteilt, nicht am Anfang gebündelt
+    assert groups["browser"][0] < 10 and groups["browser"][-1] >= 90
+
+    with pytest.raises(ValueError):
+        split_weighted([1], {"browser": 0})
+
+
+def test_run_shards_streams_results_and_detects_crash():
+    messages = list(run_shards(
+        _echo_worker,
+        [{"count": 2}, {"count": 1, "fail": True}],
+        timeout_seconds=60,
+    ))
+
+    results = [(index, payload) for kind, index, payload in messages if kind == ShardMessage.RESULT]
+    assert sorted(results, key=lambda r: (r[0], r[1]["n"])) == [(0, {"n": 0}), (0, {"n": 1}), (1, {"n": 0})]
+    assert (ShardMessage.DONE, 0, None) in messages
+    errors = [index for kind, index, _ in messages if kind == ShardMessage.ERROR]
+    assert errors == [1]
@@ -21,12 +21,26 @@ Ausfuehrung:
 
     # Einzelner Test
     pytest playwright_tests/tests/test_shipping_plz.py -v -k "FINK-MIN"
+
+    # Sweep: eine Session pro Land, pro PLZ nur Adresse aendern (ohne Browser)
+    pytest playwright_tests/tests/test_shipping_plz.py -v -k sweep
+
+    # Nur Regel-Konsistenz ueber alle PLZ pruefen (ohne Shop)
+    pytest playwright_tests/tests/test_shipping_plz.py -v -k consistent
 """
+import time
+from typing import Optional
+
 import pytest
+from playwright.async_api import async_playwright
 from playwright.sync_api import Page, expect
 
+from ..config import TestConfig, load_config
 from ..conftest import accept_cookie_banner
-from ..data.shipping_rules import SHIPPING_TEST_CASES
+from ..data.shipping_rules import SHIPPING_RULE_INDEX, SHIPPING_TEST_CASES, generate_sweep_cases
+from ..utils.cart_seeding import CartSeeder
+from ..utils.http_checkout import HttpCheckout
+from ..utils.plz_sweep import PlzCheck, PlzSweep, format_plz_check
 
 
 # Testprodukt: Polsterbett Almeno (Speditionsware)
@@ -37,8 +51,16 @@ SPEDITION_PRODUCT = "p/polsterbett-almeno/ge-p-693278"
 # Hilfsfunktionen
 # =============================================================================
 
-def add_spedition_product_to_cart(page: Page, base_url: str) -> None:
-    """Fuegt das Speditionsprodukt zum Warenkorb hinzu."""
+def add_spedition_product_to_cart(page: Page, base_url: str, cart_seeder: Optional[CartSeeder] = None) -> None:
+    """
+    Fuegt das Speditionsprodukt zum Warenkorb hinzu.
+
+    Mit ``cart_seeder`` per Request (ohne Produktseite), sonst per Klick.
+    """
+    if cart_seeder:
+        cart_seeder.seed(page.context.request, [SPEDITION_PRODUCT])
+        return
+
     product_url = f"{base_url}/{SPEDITION_PRODUCT}"
     page.goto(product_url)
     page.wait_for_load_state("domcontentloaded")
@@ -70,6 +92,9 @@ def navigate_to_checkout(page: Page, base_url: str) -> None:
     page.wait_for_load_state("domcontentloaded")
     page.wait_for_timeout(1000)
 
+    # Cookie-Banner (bei Befuellung per Request die erste Seite im Browser)
+    accept_cookie_banner(page)
+
     # Zur Kasse
     checkout_btn = page.locator("a:has-text('Zur Kasse'), button:has-text('Zur Kasse')")
     checkout_btn.first.click()
@@ -283,6 +308,33 @@ def get_all_shipping_methods(page: Page) -> list[str]:
     return methods
 
 
+# =============================================================================
+# Regel-Konsistenz (offline, vor den Browser-Tests)
+# =============================================================================
+
+@pytest.mark.shipping
+def test_shipping_rules_consistent(pytestconfig):
+    """
+    Prueft die Speditionsregeln ueber den gesamten PLZ-Raum, ohne Shop.
+
+    Ueberschneidungen verschiedener Speditionen und Testfaelle, deren
+    Erwartung nicht zu den Regeln passt, sind Fehler; Luecken (nur Post)
+    werden ausgegeben.
+    """
+    print("\n=== Regel-Abdeckung ===")
+    for country in SHIPPING_RULE_INDEX.countries:
+        print(f"    {country}: {dict(SHIPPING_RULE_INDEX.coverage(country).most_common())}")
+    for segment in SHIPPING_RULE_INDEX.gaps():
+        print(f"    Luecke: {segment}")
+
+    conflicts = [str(segment) for segment in SHIPPING_RULE_INDEX.conflicts()]
+    assert not conflicts, "Ueberschneidende Speditionen:\n" + "\n".join(conflicts)
+
+    cases = SHIPPING_TEST_CASES + sweep_cases(pytestconfig)
+    problems = SHIPPING_RULE_INDEX.check_test_cases(cases)
+    assert not problems, "Testfaelle widersprechen den Regeln:\n" + "\n".join(problems)
+
+
 # =============================================================================
 # Parametrisierte PLZ-Tests
 # =============================================================================
@@ -302,6 +354,7 @@ def test_shipping_method_for_plz(
     plz: str,
     city: str,
     expected_label: str,
+    cart_seeder: Optional[CartSeeder],
 ):
     """
     Testet, ob fuer eine bestimmte PLZ die korrekte Spedition angezeigt wird.
@@ -320,7 +373,7 @@ def test_shipping_method_for_plz(
 
     # 1. Speditionsprodukt in Warenkorb
     print("[1] Speditionsprodukt in Warenkorb...")
-    add_spedition_product_to_cart(page, base_url)
+    add_spedition_product_to_cart(page, base_url, cart_seeder)
 
     # 2. Zum Checkout navigieren
     print("[2] Zum Checkout navigieren...")
@@ -394,7 +447,7 @@ def test_shipping_method_for_plz(
 # =============================================================================
 
 @pytest.mark.shipping
-def test_shipping_single_at_fink(page: Page, base_url: str):
+def test_shipping_single_at_fink(page: Page, base_url: str, cart_seeder: Optional[CartSeeder]):
     """Schnelltest: AT PLZ 4020 (Linz) -> Spedition Fink."""
     test_shipping_method_for_plz(
         page, base_url,
@@ -404,11 +457,12 @@ def test_shipping_single_at_fink(page: Page, base_url: str):
         plz="4020",
         city="Linz",
         expected_label="Spedition Fink",
+        cart_seeder=cart_seeder,
     )
 
 
 @pytest.mark.shipping
-def test_shipping_single_de_logsens(page: Page, base_url: str):
+def test_shipping_single_de_logsens(page: Page, base_url: str, cart_seeder: Optional[CartSeeder]):
     """Schnelltest: DE PLZ 80331 (Muenchen) -> Spedition Logsens."""
     test_shipping_method_for_plz(
         page, base_url,
@@ -418,4 +472,83 @@ def test_shipping_single_de_logsens(page: Page, base_url: str):
         plz="80331",
         city="Muenchen",
         expected_label="Spedition Logsens",
+        cart_seeder=cart_seeder,
+    )
+
+
+# =============================================================================
+# PLZ-Sweep: eine Session pro Land
+# =============================================================================
+
+SWEEP_RESULTS_KEY = pytest.StashKey[dict]()
+SWEEP_CASES_KEY = pytest.StashKey[list]()
+
+
+def sweep_cases(pytestconfig) -> list[tuple]:
+    """
+    Sweep-Testfaelle inkl. zusaetzlicher PLZ pro Regel (``shipping_sweep``).
+
+    Einmal pro Lauf aus dem aktiven Profil (``--profile``) berechnet, damit
+    Parametrisierung und Sweep dieselben Faelle sehen.
+    """
+    if SWEEP_CASES_KEY not in pytestconfig.stash:
+        sweep = load_config(pytestconfig.getoption("--profile")).shipping_sweep
+        pytestconfig.stash[SWEEP_CASES_KEY] = generate_sweep_cases(sweep.samples_per_rule, sweep.boundary_neighbours)
+    return pytestconfig.stash[SWEEP_CASES_KEY]
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrisiert ``test_shipping_plz_sweep`` mit den Sweep-Testfaellen."""
+    if "sweep_case" in metafunc.fixturenames:
+        cases = sweep_cases(metafunc.config)
+        metafunc.parametrize("sweep_case", cases, ids=[tc[0] for tc in cases])
+
+
+async def sweep_country(config: TestConfig, base_url: str, country: str, cases: list[tuple]) -> dict[str, PlzCheck]:
+    """Prueft alle Testfaelle eines Landes in einer HTTP-Session."""
+    context_options = {}
+    if config.htaccess_user and config.htaccess_password:
+        context_options["http_credentials"] = {
+            "username": config.htaccess_user,
+            "password": config.htaccess_password,
+        }
+
+    start = time.perf_counter()
+    async with async_playwright() as p:
+        request = await p.request.new_context(**context_options)
+        try:
+            checks = await PlzSweep(HttpCheckout(base_url), SPEDITION_PRODUCT).run(request, cases)
+        finally:
+            await request.dispose()
+
+    duration = time.perf_counter() - start
+    print(f"\n=== PLZ-Sweep {country}: {len(checks)} PLZ in {duration:.1f}s ===")
+    for check in checks:
+        print(f"    {format_plz_check(check)}")
+    return {check.test_id: check for check in checks}
+
+
+@pytest.mark.shipping
+@pytest.mark.asyncio
+async def test_shipping_plz_sweep(sweep_case: tuple, config: TestConfig, base_url: str, pytestconfig):
+    """
+    Wie ``test_shipping_method_for_plz``, aber ein Checkout pro Land statt pro PLZ.
+
+    Der erste Testfall eines Landes fuehrt den Sweep fuer alle PLZ dieses
+    Landes aus (Ergebnisse im Stash der Session); jeder Testfall bewertet
+    danach nur sein eigenes Ergebnis.
+    """
+    test_id, country = sweep_case[0], sweep_case[1]
+    results = pytestconfig.stash.setdefault(SWEEP_RESULTS_KEY, {})
+    if country not in results:
+        cases = [tc for tc in sweep_cases(pytestconfig) if tc[1] == country]
+        results[country] = await sweep_country(config, base_url, country, cases)
+
+    check = results[country].get(test_id)
+    assert check is not None, f"{test_id} nicht im Sweep fuer {country}"
+    assert not check.error, f"{test_id}: {check.error}"
+    assert check.passed, (
+        f"Spedition '{check.expected_label}' nicht gefunden fuer PLZ {check.plz} ({country}).\n"
+        f"Angezeigte Versandart: '{check.selected}'\n"
+        f"Verfuegbare Versandarten: {check.available}"
     )
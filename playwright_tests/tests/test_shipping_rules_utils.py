@@ -0,0 +1,80 @@
+"""Tests für den Intervall-Index der Speditionsregeln (ohne Shop, ohne Browser)."""
+import pytest
+
+from playwright_tests.data.shipping_rules import (
+    ALL_SPEDITION_RULES,
+    SHIPPING_RULE_INDEX,
+    SHIPPING_TEST_CASES,
+    PLZRule,
+    PLZRuleIndex,
+    generate_boundary_cases,
+)
+
+
+RULES = [
+    PLZRule("AT", "Post AT", "POST", "1000", "9999", "Postversand"),
+    PLZRule("AT", "Fink AT", "FINK", "1000", "1999", "Spedition Fink"),
+    PLZRule("AT", "Wetsch AT", "WETSCH", "1500", "2999", "Spedition Wetsch"),
+    PLZRule("AT", "Cargoe AT", "CARGO", "4000", "4999", "Spedition Cargoe"),
+]
+
+
+def test_index_finds_gaps_overlaps_and_fallback():
+    index = PLZRuleIndex(RULES)
+
+    assert index.expected_carrier("AT", "1499").carrier == "Fink AT"
+    assert index.expected_carrier("AT", 2000).carrier == "Wetsch AT"
+    assert index.expected_carrier("AT", "3500").carrier == "Post AT"
+    assert index.expected_carrier("AT", "0999") is None
+    with pytest.raises(ValueError, match="mehrdeutig"):
+        index.expected_carrier("AT", "1500")
+    with pytest.raises(ValueError):
+        index.expected_carrier("AT", "123")
+
+    assert [(s.start, s.end) for s in index.gaps()] == [(0, 999), (3000, 3999), (5000, 9999)]
+    assert [(s.start, s.end, s.carriers) for s in index.conflicts()] == [(1500, 1999, ["Fink AT", "Wetsch AT"])]
+    assert str(index.gaps()[0]) == "AT 0000-0999 (1000 PLZ): keine Spedition"
+
+    coverage = index.coverage("AT")
+    assert coverage["Fink AT | Wetsch AT"] == 500 and coverage["Post AT"] == 6000 and coverage[""] == 1000
+    assert sum(coverage.values()) == 10_000
+
+    table = index.label_table("AT")
+    assert (table[999], table[1000], table[1500], table[3000]) == (
+        "", "Spedition Fink", "Spedition Fink | Spedition Wetsch", "Postversand"
+    )
+    assert index.check_test_cases([
+        ("OK", "AT", "Cargoe AT", "4000", "Linz", "Spedition Cargoe"),
+        ("X", "AT", "Fink AT", "1600", "Wien", "Spedition Fink"),
+    ]) == ["X: erwartet 'Spedition Fink', laut Regeln 'Spedition Fink | Spedition Wetsch'"]
+
+
+def test_index_matches_linear_scan_for_every_plz():
+    """Orakel: Index und naive Suche ueber alle Regeln stimmen fuer jede PLZ ueberein."""
+    for country in SHIPPING_RULE_INDEX.countries:
+        rules = [r for r in ALL_SPEDITION_RULES if r.country == country and r.carrier_code != "POST"]
+        digits = SHIPPING_RULE_INDEX.digits[country]
+        for value in range(10 ** digits):
+            plz = str(value).zfill(digits)
+            expected = {r.carrier for r in rules if r.plz_min <= plz <= r.plz_max}
+            assert set(SHIPPING_RULE_INDEX.segment(country, plz).carriers) == expected, plz
+
+    assert not SHIPPING_RULE_INDEX.conflicts()
+    assert SHIPPING_RULE_INDEX.check_test_cases(SHIPPING_TEST_CASES) == []
+
+
+def test_boundary_cases_expect_neighbour_or_fallback():
+    cases = generate_boundary_cases(PLZRuleIndex(RULES + [
+        PLZRule("AT", "Thurner AT", "TH", "3000", "3999", "Spedition Thurner"),
+        PLZRule("AT", "Kuoni AT", "KUONI", "1900", "2500", "Spedition Kuoni"),
+    ]))
+    by_id = {tc[0]: tc for tc in cases}
+
+    # 2999 ist Max der Wetsch-Regel und daher schon Testfall; 0999 liegt ausserhalb der Post-Regel
+    assert "TC-SHIP-AT-TH-BELOW-2999" not in by_id
+    assert not any(tc[3] == "0999" for tc in cases)
+    assert by_id["TC-SHIP-AT-CARGO-ABOVE-5000"][2:] == ("Post AT", "5000", "Teststadt-5000", "Postversand")
+    assert by_id["TC-SHIP-AT-WETSCH-BELOW-1499"][2] == "Fink AT"
+    assert by_id["TC-SHIP-AT-KUONI-ABOVE-2501"][2] == "Wetsch AT"
+    # Im Ueberschneidungsbereich gibt es keine eindeutige Erwartung
+    assert not any(tc[3] in ("1899", "2000") for tc in cases)
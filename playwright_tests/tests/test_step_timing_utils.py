@@ -0,0 +1,97 @@
+"""Tests für die Schritt-Messung (mit Fake-Kontext, ohne Playwright)."""
+import pytest
+
+from playwright_tests.pages.checkout_page import CheckoutResult
+from playwright_tests.tests._fakes import FakeEmitter
+from playwright_tests.utils.step_timing import StepStats, StepTimer
+
+
+class FakePage(FakeEmitter):
+    def __init__(self):
+        super().__init__()
+        self.main_frame = object()
+
+    def is_closed(self):
+        return False
+
+    async def evaluate(self, _script):
+        return {"ttfb_ms": 120.0, "dom_content_loaded_ms": 800.0, "load_ms": None}
+
+
+class FakeContext(FakeEmitter):
+    def __init__(self):
+        super().__init__()
+        self.pages = []
+
+    def new_page(self):
+        page = FakePage()
+        self.pages.append(page)
+        self.emit("page", page)
+        return page
+
+
+@pytest.mark.asyncio
+async def test_span_counts_requests_and_navigation_timing():
+    context = FakeContext()
+    timer = StepTimer()
+    timer.attach(context)
+    page = context.new_page()
+
+    async with timer.span("pdp_load"):
+        page.emit("framenavigated", page.main_frame)
+        for _ in range(3):
+            context.emit("request", None)
+        context.emit("requestfailed", None)
+
+    async with timer.span("add_to_cart"):
+        context.emit("request", None)
+
+    timer.detach()
+    assert context.listeners == {"request": [], "requestfailed": [], "page": []}
+    assert page.listeners == {"framenavigated": []}
+
+    pdp, cart = timer.spans
+    assert (pdp.requests, pdp.failed_requests, pdp.navigations) == (3, 1, 1)
+    assert pdp.ttfb_ms == 120.0
+    assert (cart.requests, cart.navigations, cart.ttfb_ms) == (1, 0, None)
+
+
+@pytest.mark.asyncio
+async def test_nested_spans_are_counted_once():
+    timer = StepTimer()
+    async with timer.span("select_payment_method"):
+        async with timer.span("select_payment_method"):
+            pass
+    assert [s.name for s in timer.spans] == ["select_payment_method"]
+
+
+@pytest.mark.asyncio
+async def test_disabled_timer_is_noop():
+    context = FakeContext()
+    timer = StepTimer(enabled=False)
+    timer.attach(context)
+    async with timer.span("place_order"):
+        pass
+
+    result = CheckoutResult(success=True)
+    timer.apply_to(result)
+    assert context.listeners == {}
+    assert timer.spans == []
+    assert result.step_durations == {} and result.steps == []
+
+
+@pytest.mark.asyncio
+async def test_apply_to_and_aggregate():
+    timer = StepTimer()
+    for _ in range(2):
+        async with timer.span("pdp_load"):
+            pass
+    result = CheckoutResult(success=True)
+    timer.apply_to(result)
+
+    assert set(result.step_durations) == {"pdp_load"}
+    assert len(result.steps) == 2
+
+    stats = StepStats()
+    stats.record(result.steps)
+    assert stats.summary()["pdp_load"]["count"] == 2
@@ -15,6 +15,13 @@ import pytest
 from playwright.sync_api import Page, sync_playwright, expect
 
 from ..conftest import accept_cookie_banner
+from ..utils.readiness import (
+    OFFCANVAS_OPEN,
+    click_and_wait_for_cart,
+    submit_and_wait_for_page,
+    wait_for_page_ready,
+    wait_for_settled,
+)
 
 
 # =============================================================================
@@ -75,7 +82,7 @@ def _accept_uc_cookie_banner(page, timeout=5000):
     """Akzeptiert das Usercentrics Cookie-Banner via Shadow DOM JS evaluation."""
     try:
         page.wait_for_selector(COOKIE_BANNER_SELECTOR, timeout=timeout)
-        page.wait_for_timeout(1000)
+        wait_for_settled(page)
         clicked = page.evaluate("""() => {
             const ucRoot = document.querySelector('#usercentrics-cmp-ui');
             if (ucRoot && ucRoot.shadowRoot) {
@@ -93,7 +100,7 @@ def _accept_uc_cookie_banner(page, timeout=5000):
             return false;
         }""")
         if clicked:
-            page.wait_for_timeout(1500)
+            wait_for_settled(page)
         return clicked
     except Exception:
         return False
@@ -119,8 +126,7 @@ def test_cookie_banner_appears_on_first_visit(base_url):
 
             print(f"  Schritt 2: Navigiere zu {base_url}")
             page.goto(base_url)
-            page.wait_for_load_state("domcontentloaded")
-            page.wait_for_timeout(3000)
+            wait_for_page_ready(page)
 
             print("  Schritt 3: Pruefe ob Usercentrics Cookie-Banner sichtbar ist...")
             banner_visible = page.evaluate("""() => {
@@ -154,8 +160,7 @@ def test_cookie_consent_accept_works(base_url):
         try:
             print(f"  Schritt 1-2: Navigiere zu {base_url} mit frischem Kontext")
             page.goto(base_url)
-            page.wait_for_load_state("domcontentloaded")
-            page.wait_for_timeout(3000)
+            wait_for_page_ready(page)
 
             print("  Schritt 3: Pruefe ob Cookie-Banner sichtbar ist...")
             banner = page.locator(COOKIE_BANNER_SELECTOR)
@@ -172,7 +177,7 @@ def test_cookie_consent_accept_works(base_url):
             print("  Cookie-Akzeptierung erfolgreich")
 
             print("  Schritt 5: Pruefe ob Banner verschwunden ist...")
-            page.wait_for_timeout(2000)
+            wait_for_settled(page)
             banner_gone = page.evaluate("""() => {
                 const uc = document.querySelector('#usercentrics-cmp-ui');
                 if (!uc) return true;
@@ -201,8 +206,7 @@ def test_cookie_preferences_persist(base_url):
         try:
             print(f"  Schritt 1: Navigiere zu {base_url}")
             page.goto(base_url)
-            page.wait_for_load_state("domcontentloaded")
-            page.wait_for_timeout(3000)
+            wait_for_page_ready(page)
 
             print("  Schritt 2: Akzeptiere Cookie-Banner...")
             accepted = _accept_uc_cookie_banner(page)
@@ -210,12 +214,11 @@ def test_cookie_preferences_persist(base_url):
                 accepted = accept_cookie_banner(page, timeout=5000)
             assert accepted, "Cookie-Banner konnte nicht akzeptiert werden"
             print("  Cookie-Banner akzeptiert")
-            page.wait_for_timeout(2000)
+            wait_for_settled(page)
 
             print("  Schritt 3: Lade Seite neu...")
             page.reload()
-            page.wait_for_load_state("domcontentloaded")
-            page.wait_for_timeout(3000)
+            wait_for_page_ready(page)
 
             print("  Schritt 4: Pruefe ob Banner NICHT erneut erscheint...")
             banner_reappeared = page.evaluate("""() => {
@@ -336,12 +339,10 @@ def test_homepage_mobile_viewport(base_url):
         try:
             print(f"  Schritt 1: Navigiere zu {base_url} (375x812 Viewport)")
             page.goto(base_url)
-            page.wait_for_load_state("domcontentloaded")
-            page.wait_for_timeout(2000)
+            wait_for_page_ready(page)
 
             _accept_uc_cookie_banner(page)
             accept_cookie_banner(page, timeout=3000)
-            page.wait_for_timeout(1000)
 
             print("  Schritt 2: Pruefe horizontalen Overflow...")
             has_overflow = page.evaluate("""() => {
@@ -390,18 +391,15 @@ def test_checkout_mobile_viewport(base_url, test_product_id):
             product_url = f"{base_url}/{test_product_id}"
             print(f"  Schritt 1: Navigiere zu Produktseite: {product_url} (375x812)")
             page.goto(product_url)
-            page.wait_for_load_state("domcontentloaded")
-            page.wait_for_timeout(2000)
+            wait_for_page_ready(page)
 
             _accept_uc_cookie_banner(page)
             accept_cookie_banner(page, timeout=3000)
-            page.wait_for_timeout(1000)
 
             print("  Schritt 2: Fuege Produkt zum Warenkorb hinzu...")
             add_btn = page.locator("button.btn-buy")
             if add_btn.count() > 0 and add_btn.first.is_visible(timeout=5000):
-                add_btn.first.click()
-                page.wait_for_timeout(3000)
+                click_and_wait_for_cart(page, add_btn.first)
                 print("  Produkt hinzugefuegt")
                 close_btn = page.locator(
                     ".offcanvas-close, .btn-close, [data-bs-dismiss='offcanvas']"
@@ -409,7 +407,7 @@ def test_checkout_mobile_viewport(base_url, test_product_id):
                 if close_btn.count() > 0:
                     try:
                         close_btn.first.click(timeout=2000)
-                        page.wait_for_timeout(500)
+                        page.locator(OFFCANVAS_OPEN).first.wait_for(state="hidden", timeout=3000)
                     except Exception:
                         pass
             else:
@@ -418,8 +416,7 @@ def test_checkout_mobile_viewport(base_url, test_product_id):
             cart_url = f"{base_url}/checkout/cart"
             print(f"  Schritt 3: Navigiere zum Warenkorb: {cart_url}")
             page.goto(cart_url)
-            page.wait_for_load_state("domcontentloaded")
-            page.wait_for_timeout(2000)
+            wait_for_page_ready(page)
 
             print("  Schritt 4: Pruefe ob Warenkorbseite nutzbar ist...")
             body_text = page.locator("body").inner_text()
@@ -443,7 +440,7 @@ def test_checkout_mobile_viewport(base_url, test_product_id):
             else:
                 if checkout_btn is None:
                     page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    page.wait_for_timeout(1000)
+                    wait_for_settled(page)
                     checkout_btn = _find_visible_element(page, checkout_selectors, timeout=3000)
                 assert checkout_btn is not None, \
                     "Checkout-Button nicht im mobilen Viewport sichtbar (auch nach Scrollen)"
@@ -468,12 +465,10 @@ def test_mobile_hamburger_menu(base_url):
         try:
             print(f"  Schritt 1: Navigiere zu {base_url} (375x812)")
             page.goto(base_url)
-            page.wait_for_load_state("domcontentloaded")
-            page.wait_for_timeout(2000)
+            wait_for_page_ready(page)
 
             _accept_uc_cookie_banner(page)
             accept_cookie_banner(page, timeout=3000)
-            page.wait_for_timeout(1000)
 
             print("  Schritt 2: Pruefe ob Hamburger-Menue-Icon sichtbar ist...")
             hamburger = _find_visible_element(page, HAMBURGER_SELECTORS, timeout=5000)
@@ -483,7 +478,7 @@ def test_mobile_hamburger_menu(base_url):
 
             print("  Schritt 3: Klicke Hamburger-Menue...")
             hamburger.click()
-            page.wait_for_timeout(1500)
+            wait_for_settled(page)
             print("  Hamburger-Menue geklickt")
 
             print("  Schritt 4: Pruefe ob Menue geoeffnet ist...")
@@ -512,11 +507,11 @@ def test_mobile_hamburger_menu(base_url):
             close_btn = _find_visible_element(page, MENU_CLOSE_SELECTORS, timeout=3000)
             if close_btn:
                 close_btn.click()
-                page.wait_for_timeout(1000)
+                wait_for_settled(page)
                 print("  Menue geschlossen via Close-Button")
             else:
                 page.keyboard.press("Escape")
-                page.wait_for_timeout(1000)
+                wait_for_settled(page)
                 print("  Menue geschlossen via Escape-Taste")
 
             print("  BESTANDEN: Hamburger-Menue funktioniert korrekt")
@@ -541,7 +536,6 @@ def test_keyboard_navigation(page: Page, base_url: str):
 
     print("  Schritt 2: Akzeptiere Cookie-Banner...")
     accept_cookie_banner(page)
-    page.wait_for_timeout(1000)
 
     print("  Schritt 3: Teste Tab-Navigation...")
     focused_elements = []
@@ -549,7 +543,6 @@ def test_keyboard_navigation(page: Page, base_url: str):
 
     for i in range(10):
         page.keyboard.press("Tab")
-        page.wait_for_timeout(300)
 
         focused_info = page.evaluate("""() => {
             const el = document.activeElement;
@@ -589,13 +582,11 @@ def test_keyboard_navigation(page: Page, base_url: str):
     page.goto(base_url)
     page.wait_for_load_state("domcontentloaded")
     accept_cookie_banner(page)
-    page.wait_for_timeout(1000)
 
     original_url = page.url
     link_found = False
     for i in range(15):
         page.keyboard.press("Tab")
-        page.wait_for_timeout(200)
 
         is_link = page.evaluate("""() => {
             const el = document.activeElement;
@@ -605,9 +596,7 @@ def test_keyboard_navigation(page: Page, base_url: str):
         if is_link:
             link_href = page.evaluate("document.activeElement.href")
             print(f"    Fokussierter Link: {link_href}")
-            page.keyboard.press("Enter")
-            page.wait_for_load_state("domcontentloaded")
-            page.wait_for_timeout(1000)
+            submit_and_wait_for_page(page, page.locator(":focus"), key="Enter")
 
             new_url = page.url
             navigated = new_url != original_url
@@ -635,7 +624,6 @@ def test_product_image_alt_texts(page: Page, base_url: str, test_product_id: str
 
     print("  Schritt 2: Akzeptiere Cookie-Banner...")
     accept_cookie_banner(page)
-    page.wait_for_timeout(1000)
 
     print("  Schritt 3: Suche Produktbilder...")
     combined_selector = ", ".join(PRODUCT_IMAGE_SELECTORS)
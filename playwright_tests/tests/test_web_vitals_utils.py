@@ -0,0 +1,73 @@
+"""Tests für Core Web Vitals, Budgets und die Lauf-Datenbank (mit Fake-Seite, ohne Playwright)."""
+from playwright_tests.config import WebVitalsBudget, WebVitalsConfig
+from playwright_tests.utils.web_vitals import (
+    WebVitals,
+    WebVitalsSession,
+    WebVitalsStore,
+    budget_for,
+    check_budget,
+    collect_web_vitals,
+    format_web_vitals,
+)
+
+
+class FakePage:
+    def __init__(self, snapshot, viewport=None):
+        self.snapshot = snapshot
+        self.viewport_size = viewport
+
+    def evaluate(self, script):
+        return self.snapshot
+
+
+SNAPSHOT = {
+    "url": "https://shop.at/p/duftkissen-lavendel/ge-p-49415",
+    "page_kind": "pdp",
+    "fcp_ms": 900.0,
+    "lcp_ms": 3800.0,
+    "cls": 0.02,
+    "inp_ms": 120.0,
+    "tbt_ms": 250.0,
+    "long_tasks": 4,
+    "js_heap_bytes": 40 * 1024 * 1024,
+}
+
+
+def test_collect_from_page_snapshot():
+    vitals = collect_web_vitals(FakePage(SNAPSHOT, {"width": 390, "height": 844}))
+    assert (vitals.page_kind, vitals.viewport, vitals.lcp_ms) == ("pdp", "390x844", 3800.0)
+    assert collect_web_vitals(FakePage(None)) is None  # Skript nicht aktiv
+    assert "LCP 3800ms" in format_web_vitals(vitals) and "Heap 40MB" in format_web_vitals(vitals)
+
+
+def test_budget_for_page_kind_overrides_default():
+    budgets = {
+        "default": WebVitalsBudget(lcp_ms=4000, cls=0.25, js_heap_mb=150),
+        "pdp": WebVitalsBudget(lcp_ms=3500),
+    }
+    assert budget_for(budgets, "pdp") == {"lcp_ms": 3500, "cls": 0.25, "js_heap_mb": 150}
+    assert budget_for(budgets, "home") == {"lcp_ms": 4000, "cls": 0.25, "js_heap_mb": 150}
+    assert "default" in WebVitalsConfig().budgets
+
+
+def test_check_budget_reports_each_exceeded_metric():
+    vitals = WebVitals(**SNAPSHOT)
+    violations = check_budget(vitals, {"lcp_ms": 3500, "cls": 0.1, "tbt_ms": 200, "js_heap_mb": 30, "inp_ms": 200})
+    assert violations == ["LCP 3800ms > 3500ms", "TBT 250ms > 200ms", "JS-Heap 40MB > 30MB"]
+    assert check_budget(WebVitals(url="https://shop.at/"), {"lcp_ms": 1}) == []  # fehlende Messwerte
+
+
+def test_session_records_violations_and_stores_history(tmp_path):
+    store = WebVitalsStore(tmp_path / "vitals.sqlite")
+    session = WebVitalsSession(store, "web-vitals-1", {"default": WebVitalsBudget(lcp_ms=3000)})
+
+    slow = session.capture(FakePage(SNAPSHOT, {"width": 390, "height": 844}), test="test_pdp[mobile]")
+    fast = session.record(WebVitals(**{**SNAPSHOT, "lcp_ms": 1200.0}, viewport="1920x1080"), "test_pdp[desktop]")
+
+    assert slow.violations == ["LCP 3800ms > 3000ms"] and fast.violations == []
+    assert session.violations == [slow]
+
+    mobile = store.history(SNAPSHOT["url"], "390x844")
+    assert len(mobile) == 1
+    assert (mobile[0]["run_id"], mobile[0]["test"], mobile[0]["lcp_ms"]) == ("web-vitals-1", "test_pdp[mobile]", 3800.0)
+    assert [row["viewport"] for row in store.history(SNAPSHOT["url"])] == ["1920x1080", "390x844"]
@@ -40,18 +40,12 @@ WISHLIST_PRODUCTS = [
 # Hilfsfunktionen
 # =============================================================================
 
-def login_customer(page: Page, base_url: str) -> None:
-    """Loggt den AT-Testkunden ein."""
-    page.goto(f"{base_url}/account/login", wait_until="domcontentloaded")
-    page.wait_for_timeout(1000)
+def login_customer(page: Page, base_url: str, auth_state) -> None:
+    """Loggt den AT-Testkunden ein (Login-Cache: ein UI-Login pro Lauf)."""
+    auth_state.apply(page.context, TEST_EMAIL, TEST_PASSWORD)
+    page.goto(f"{base_url}/account", wait_until="domcontentloaded")
     accept_cookie_banner(page)
 
-    page.fill("#loginMail", TEST_EMAIL)
-    page.fill("#loginPassword", TEST_PASSWORD)
-    page.locator("button:has-text('Anmelden')").first.click()
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_timeout(1000)
-
     # Pruefen ob Login erfolgreich
     assert "account/login" not in page.url, "Login fehlgeschlagen"
 
@@ -110,7 +104,7 @@ def clear_wishlist(page: Page, base_url: str) -> None:
 # =============================================================================
 
 @pytest.mark.wishlist
-def test_add_product_to_wishlist(page: Page, base_url: str):
+def test_add_product_to_wishlist(page: Page, base_url: str, auth_state):
     """
     TC-WISH-001: Produkt zur Merkliste hinzufuegen.
 
@@ -124,7 +118,7 @@ def test_add_product_to_wishlist(page: Page, base_url: str):
     product_path = WISHLIST_PRODUCTS[0]
 
     # Login
-    login_customer(page, base_url)
+    login_customer(page, base_url, auth_state)
 
     # Merkliste vorher leeren
     clear_wishlist(page, base_url)
@@ -152,7 +146,7 @@ def test_add_product_to_wishlist(page: Page, base_url: str):
 # =============================================================================
 
 @pytest.mark.wishlist
-def test_add_multiple_products_to_wishlist(page: Page, base_url: str):
+def test_add_multiple_products_to_wishlist(page: Page, base_url: str, auth_state):
     """
     TC-WISH-002: Mehrere Produkte zur Merkliste hinzufuegen.
 
@@ -163,7 +157,7 @@ def test_add_multiple_products_to_wishlist(page: Page, base_url: str):
     4. Pruefen: Alle 3 Produkte sind sichtbar
     """
     # Login
-    login_customer(page, base_url)
+    login_customer(page, base_url, auth_state)
 
     # Merkliste vorher leeren
     clear_wishlist(page, base_url)
@@ -190,7 +184,7 @@ def test_add_multiple_products_to_wishlist(page: Page, base_url: str):
 # =============================================================================
 
 @pytest.mark.wishlist
-def test_remove_product_from_wishlist(page: Page, base_url: str):
+def test_remove_product_from_wishlist(page: Page, base_url: str, auth_state):
     """
     TC-WISH-003: Produkt von der Merkliste entfernen.
 
@@ -204,7 +198,7 @@ def test_remove_product_from_wishlist(page: Page, base_url: str):
     product_path = WISHLIST_PRODUCTS[0]
 
     # Login
-    login_customer(page, base_url)
+    login_customer(page, base_url, auth_state)
 
     # Merkliste vorher leeren
     clear_wishlist(page, base_url)
@@ -234,7 +228,7 @@ def test_remove_product_from_wishlist(page: Page, base_url: str):
 # =============================================================================
 
 @pytest.mark.wishlist
-def test_wishlist_add_to_cart(page: Page, base_url: str):
+def test_wishlist_add_to_cart(page: Page, base_url: str, auth_state):
     """
     TC-WISH-004: Produkt aus der Merkliste in den Warenkorb legen.
 
@@ -249,7 +243,7 @@ def test_wishlist_add_to_cart(page: Page, base_url: str):
     product_path = WISHLIST_PRODUCTS[0]
 
     # Login
-    login_customer(page, base_url)
+    login_customer(page, base_url, auth_state)
 
     # Merkliste vorher leeren
     clear_wishlist(page, base_url)
@@ -296,7 +290,7 @@ def test_wishlist_add_to_cart(page: Page, base_url: str):
 # =============================================================================
 
 @pytest.mark.wishlist
-def test_empty_wishlist_shows_message(page: Page, base_url: str):
+def test_empty_wishlist_shows_message(page: Page, base_url: str, auth_state):
     """
     TC-WISH-005: Leere Merkliste zeigt entsprechende Meldung.
 
@@ -307,7 +301,7 @@ def test_empty_wishlist_shows_message(page: Page, base_url: str):
     4. Pruefen: Leer-Hinweis wird angezeigt oder keine Produkte vorhanden
     """
     # Login
-    login_customer(page, base_url)
+    login_customer(page, base_url, auth_state)
 
     # Merkliste leeren
     clear_wishlist(page, base_url)
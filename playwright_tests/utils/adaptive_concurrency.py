@@ -0,0 +1,283 @@
+"""
+Adaptive Parallelität (AIMD) für Massen- und Performance-Tests.
+
+Eine feste Worker-Zahl sagt nichts darüber, wo die Kapazität des Shops endet:
+Zu viele Worker erzeugen Timeouts, die als "fehlgeschlagene Bestellungen"
+zählen. ``AdaptiveLimiter`` ersetzt den Semaphore und passt die Anzahl
+gleichzeitiger Bestellungen laufend an (Additive Increase, Multiplicative
+Decrease):
+
+- Nach jedem Fenster von ``window`` abgeschlossenen Bestellungen wird bewertet.
+- Gesund (Fehlerquote unter Schwelle, Median-Latenz höchstens
+  ``latency_tolerance`` x Basislatenz): Limit + ``increase``.
+- Überlastet: Limit x ``decrease_factor`` - das Limit vor der Absenkung wird
+  als Knie-Punkt (Sättigung) gemerkt.
+
+Die Basislatenz ist der kleinste Fenster-Median eines gesunden Fensters,
+also die Latenz bei geringer Last (Gradient = aktuell / Basis).
+
+Ergebnis (``ConcurrencyStats``): nachhaltige Parallelität (höchstes gesundes
+Limit unterhalb des Knies) und Knie-Punkt (Median der Limits, bei denen
+abgesenkt wurde).
+"""
+import asyncio
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass
+class LimitChange:
+    """Eine Bewertung am Fensterende."""
+    elapsed_seconds: float
+    limit: int
+    new_limit: int
+    error_rate: float
+    median_seconds: float
+    healthy: bool
+
+    def to_dict(self) -> dict:
+        return {
+            "elapsed_seconds": round(self.elapsed_seconds, 1),
+            "limit": self.limit,
+            "new_limit": self.new_limit,
+            "error_rate": round(self.error_rate, 3),
+            "median_seconds": round(self.median_seconds, 2),
+            "healthy": self.healthy,
+        }
+
+
+@dataclass
+class ConcurrencyStats:
+    """Ergebnis der adaptiven Parallelität für Reports."""
+    initial_limit: int = 0
+    final_limit: int = 0
+    peak_limit: int = 0
+    baseline_seconds: Optional[float] = None
+    history: list[LimitChange] = field(default_factory=list)
+
+    @property
+    def backoff_limits(self) -> list[int]:
+        return [c.limit for c in self.history if not c.healthy]
+
+    @property
+    def knee_point(self) -> Optional[int]:
+        """Parallelität, ab der der Shop gesättigt ist (None: nie erreicht)."""
+        limits = self.backoff_limits
+        return int(statistics.median(limits)) if limits else None
+
+    @property
+    def sustainable_concurrency(self) -> Optional[int]:
+        """Höchstes Limit mit gesundem Fenster unterhalb des Knie-Punkts."""
+        knee = self.knee_point
+        healthy = [c.limit for c in self.history if c.healthy and (knee is None or c.limit < knee)]
+        return max(healthy) if healthy else None
+
+    def to_dict(self) -> dict:
+        """Konvertiert die Statistik in ein Dictionary für JSON-Export."""
+        return {
+            "initial_limit": self.initial_limit,
+            "final_limit": self.final_limit,
+            "peak_limit": self.peak_limit,
+            "sustainable_concurrency": self.sustainable_concurrency,
+            "knee_point": self.knee_point,
+            "saturated": self.knee_point is not None,
+            "baseline_seconds": round(self.baseline_seconds, 2) if self.baseline_seconds else None,
+            "backoffs": len(self.backoff_limits),
+            "history": [c.to_dict() for c in self.history],
+        }
+
+
+def merge_concurrency_reports(reports: list[dict]) -> Optional[dict]:
+    """
+    Fasst die ``to_dict()``-Daten mehrerer Shards zusammen.
+
+    Limits addieren sich, da jeder Shard einen eigenen Anteil der Last fährt.
+    """
+    reports = [r for r in reports if r]
+    if not reports:
+        return None
+
+    def total(key: str) -> Optional[int]:
+        values = [r[key] for r in reports if r.get(key) is not None]
+        return sum(values) if len(values) == len(reports) else None
+
+    return {
+        "initial_limit": total("initial_limit"),
+        "final_limit": total("final_limit"),
+        "peak_limit": total("peak_limit"),
+        "sustainable_concurrency": total("sustainable_concurrency"),
+        "knee_point": total("knee_point"),
+        "saturated": any(r.get("saturated") for r in reports),
+        "backoffs": sum(r.get("backoffs", 0) for r in reports),
+        "shards": reports,
+    }
+
+
+def format_concurrency(report: dict) -> str:
+    """Einzeilige Zusammenfassung für Konsolen-Reports."""
+    knee = report["knee_point"]
+    knee_text = f"Knie bei {knee}" if knee is not None else "keine Sättigung bis Limit"
+    sustainable = report["sustainable_concurrency"]
+    sustainable_text = sustainable if sustainable is not None else "-"
+    return (f"nachhaltig {sustainable_text}, {knee_text} "
+            f"(Start {report['initial_limit']}, Ende {report['final_limit']}, {report['backoffs']} Absenkungen)")
+
+
+class AdaptiveLimiter:
+    """
+    Semaphore-Ersatz mit AIMD-gesteuertem Limit.
+
+    Beispiel:
+        limiter = AdaptiveLimiter(initial=5, max_limit=30)
+        async with limiter:
+            res = await run_order()
+        limiter.record(res.success, res.duration_seconds)
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        min_limit: int = 1,
+        max_limit: int = 50,
+        window: int = 5,
+        error_rate_threshold: float = 0.1,
+        latency_tolerance: float = 1.5,
+        increase: int = 1,
+        decrease_factor: float = 0.7,
+    ):
+        """
+        Args:
+            initial: Start-Limit
+            min_limit: Untergrenze
+            max_limit: Obergrenze
+            window: Bestellungen pro Bewertung
+            error_rate_threshold: Fehlerquote im Fenster, ab der abgesenkt wird
+            latency_tolerance: Erlaubter Faktor der Median-Latenz gegenüber der Basis
+            increase: Erhöhung pro gesundem Fenster
+            decrease_factor: Faktor bei Überlast (0 < x < 1)
+
+        Raises:
+            ValueError: Bei ungültigen Grenzen oder Faktoren
+        """
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("min_limit muss zwischen 1 und max_limit liegen")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor muss zwischen 0 und 1 liegen")
+        if window < 1:
+            raise ValueError("window muss mindestens 1 sein")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.window = window
+        self.error_rate_threshold = error_rate_threshold
+        self.latency_tolerance = latency_tolerance
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+
+        self.limit = min(max(initial, min_limit), max_limit)
+        self.in_flight = 0
+        self.stats = ConcurrencyStats(initial_limit=self.limit, final_limit=self.limit, peak_limit=self.limit)
+        self._samples: list[tuple[bool, float]] = []
+        self._condition: Optional[asyncio.Condition] = None
+        # Starke Referenzen auf laufende Weck-Tasks (Event-Loop hält nur schwache)
+        self._wake_tasks: set[asyncio.Task] = set()
+        self._started = time.monotonic()
+
+    @classmethod
+    def from_config(cls, cfg, parallel_workers: int) -> "AdaptiveLimiter":
+        """Erstellt einen Limiter aus ``AdaptiveConcurrencyConfig``; Start bei ``parallel_workers``."""
+        max_limit = cfg.max_workers or parallel_workers * 3
+        return cls(
+            initial=parallel_workers,
+            min_limit=min(cfg.min_workers, max_limit),
+            max_limit=max_limit,
+            window=cfg.window_orders,
+            error_rate_threshold=cfg.error_rate_threshold,
+            latency_tolerance=cfg.latency_tolerance,
+            decrease_factor=cfg.decrease_factor,
+        )
+
+    @property
+    def condition(self) -> asyncio.Condition:
+        # Erst im laufenden Event-Loop erzeugen
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    # =========================================================================
+    # Semaphore-Schnittstelle
+    # =========================================================================
+
+    async def acquire(self) -> None:
+        async with self.condition:
+            await self.condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+
+    async def release(self) -> None:
+        async with self.condition:
+            self.in_flight -= 1
+            self.condition.notify()
+
+    async def __aenter__(self) -> "AdaptiveLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.release()
+
+    # =========================================================================
+    # Regelung
+    # =========================================================================
+
+    def record(self, success: bool, duration_seconds: float) -> None:
+        """Erfasst ein Ergebnis; nach ``window`` Ergebnissen wird das Limit angepasst."""
+        self._samples.append((success, duration_seconds))
+        if len(self._samples) < self.window:
+            return
+        samples, self._samples = self._samples, []
+        self._evaluate(samples)
+
+    def _evaluate(self, samples: list[tuple[bool, float]]) -> None:
+        errors = sum(1 for success, _ in samples if not success)
+        error_rate = errors / len(samples)
+        durations = [d for success, d in samples if success]
+        median = statistics.median(durations) if durations else 0.0
+
+        baseline = self.stats.baseline_seconds
+        slow = bool(durations and baseline and median > baseline * self.latency_tolerance)
+        healthy = error_rate <= self.error_rate_threshold and not slow
+
+        if healthy and durations:
+            self.stats.baseline_seconds = median if baseline is None else min(baseline, median)
+            new_limit = min(self.limit + self.increase, self.max_limit)
+        elif healthy:
+            new_limit = self.limit
+        else:
+            new_limit = max(int(self.limit * self.decrease_factor), self.min_limit)
+
+        self.stats.history.append(LimitChange(
+            elapsed_seconds=time.monotonic() - self._started,
+            limit=self.limit,
+            new_limit=new_limit,
+            error_rate=error_rate,
+            median_seconds=median,
+            healthy=healthy,
+        ))
+        self._set_limit(new_limit)
+
+    def _set_limit(self, new_limit: int) -> None:
+        grew = new_limit > self.limit
+        self.limit = new_limit
+        self.stats.final_limit = new_limit
+        self.stats.peak_limit = max(self.stats.peak_limit, new_limit)
+        if grew and self._condition is not None:
+            # Wartende Bestellungen für die zusätzlichen Plätze wecken
+            task = asyncio.ensure_future(self._wake_waiters())
+            self._wake_tasks.add(task)
+            task.add_done_callback(self._wake_tasks.discard)
+
+    async def _wake_waiters(self) -> None:
+        async with self.condition:
+            self.condition.notify_all()
@@ -0,0 +1,290 @@
+"""
+Open-Loop Ankunftsraten-Scheduler für Massen- und Performance-Tests.
+
+Im Gegensatz zum geschlossenen Modell (``asyncio.gather`` + Semaphore), bei
+dem langsame Bestellungen die Last automatisch drosseln, startet der
+Scheduler Bestellungen zu fest geplanten Zeitpunkten - unabhängig davon,
+wie schnell vorherige Bestellungen fertig werden.
+
+Unterstützte Ankunftsprofile:
+- constant: gleichmäßige Rate (Bestellungen/Minute)
+- ramp:     lineare Steigerung von ``start_rate`` auf ``rate`` über ``ramp_seconds``
+- step:     Stufen um ``step_rate`` alle ``step_seconds`` bis ``rate``
+- poisson:  zufällige Ankünfte (exponentielle Abstände) mit mittlerer Rate ``rate``
+
+Für jede Bestellung wird die Differenz zwischen geplantem und tatsächlichem
+Start (Lag) festgehalten, damit Coordinated Omission in den Zahlen sichtbar wird.
+"""
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Awaitable, Callable, Optional
+
+
+class ArrivalProfileType(Enum):
+    """Verfügbare Ankunftsprofile."""
+    CONSTANT = "constant"
+    RAMP = "ramp"
+    STEP = "step"
+    POISSON = "poisson"
+
+
+@dataclass
+class ArrivalProfile:
+    """
+    Beschreibt, wann Bestellungen gestartet werden sollen.
+
+    Alle Raten sind in Bestellungen pro Minute angegeben.
+    """
+    profile_type: ArrivalProfileType = ArrivalProfileType.CONSTANT
+    rate_per_minute: float = 10.0  # Zielrate (constant/poisson) bzw. Endrate (ramp/step)
+    start_rate_per_minute: float = 1.0  # Startrate für ramp/step
+    ramp_seconds: float = 60.0  # Dauer der Rampe
+    step_rate_per_minute: float = 5.0  # Erhöhung pro Stufe
+    step_seconds: float = 60.0  # Dauer einer Stufe
+    seed: Optional[int] = None  # Für reproduzierbare Poisson-Ankünfte
+
+    @classmethod
+    def from_name(cls, name: str, rate_per_minute: float, **kwargs: Any) -> "ArrivalProfile":
+        """
+        Erstellt ein Profil anhand des Namens (z.B. aus CLI oder config.yaml).
+
+        Raises:
+            ValueError: Wenn der Profilname unbekannt ist
+        """
+        try:
+            profile_type = ArrivalProfileType(name.lower())
+        except ValueError:
+            valid = ", ".join(t.value for t in ArrivalProfileType)
+            raise ValueError(f"Unbekanntes Ankunftsprofil '{name}'. Erlaubt: {valid}")
+        return cls(profile_type=profile_type, rate_per_minute=rate_per_minute, **kwargs)
+
+    def rate_at(self, elapsed_seconds: float) -> float:
+        """Gibt die geplante Rate (pro Minute) zum Zeitpunkt ``elapsed_seconds`` zurück."""
+        if self.profile_type == ArrivalProfileType.RAMP:
+            if elapsed_seconds >= self.ramp_seconds:
+                return self.rate_per_minute
+            progress = elapsed_seconds / self.ramp_seconds
+            return self.start_rate_per_minute + (self.rate_per_minute - self.start_rate_per_minute) * progress
+
+        if self.profile_type == ArrivalProfileType.STEP:
+            step = int(elapsed_seconds // self.step_seconds)
+            return min(self.rate_per_minute, self.start_rate_per_minute + step * self.step_rate_per_minute)
+
+        return self.rate_per_minute
+
+    def _cumulative_arrivals(self, elapsed_seconds: float) -> float:
+        """Erwartete Anzahl Ankünfte im Intervall [0, elapsed_seconds]."""
+        t = elapsed_seconds
+
+        if self.profile_type == ArrivalProfileType.RAMP:
+            r0, r1, ramp = self.start_rate_per_minute, self.rate_per_minute, self.ramp_seconds
+            if t <= ramp:
+                return (r0 * t + (r1 - r0) * t * t / (2 * ramp)) / 60
+            return ((r0 + r1) * ramp / 2 + r1 * (t - ramp)) / 60
+
+        if self.profile_type == ArrivalProfileType.STEP:
+            total = 0.0
+            segment_start = 0.0
+            while segment_start < t:
+                segment_end = min(t, segment_start + self.step_seconds)
+                total += self.rate_at(segment_start) * (segment_end - segment_start) / 60
+                segment_start = segment_end
+            return total
+
+        return self.rate_per_minute * t / 60
+
+    def _time_for_arrivals(self, arrivals: float) -> float:
+        """Invertiert die kumulative Ankunftsfunktion per Bisektion (1 ms genau)."""
+        low, high = 0.0, 1.0
+        while self._cumulative_arrivals(high) < arrivals:
+            high *= 2
+        while high - low > 0.001:
+            mid = (low + high) / 2
+            if self._cumulative_arrivals(mid) < arrivals:
+                low = mid
+            else:
+                high = mid
+        return high
+
+    def schedule(self, num_arrivals: int) -> list[float]:
+        """
+        Berechnet die geplanten Startzeitpunkte (Sekunden ab Teststart).
+
+        Die erste Bestellung startet immer bei 0.
+
+        Raises:
+            ValueError: Wenn das Profil nie eine positive Rate erreicht oder
+                Rampen-/Stufendauer ungültig sind
+        """
+        if self.rate_per_minute <= 0:
+            raise ValueError("rate_per_minute muss größer als 0 sein")
+        if self.profile_type in (ArrivalProfileType.RAMP, ArrivalProfileType.STEP):
+            if self.start_rate_per_minute < 0:
+                raise ValueError("start_rate_per_minute darf nicht negativ sein")
+            if self.profile_type == ArrivalProfileType.STEP and self.start_rate_per_minute <= 0 and self.step_rate_per_minute <= 0:
+                raise ValueError("Step-Profil erreicht nie eine positive Rate")
+        if self.profile_type == ArrivalProfileType.RAMP and self.ramp_seconds < 0:
+            raise ValueError("ramp_seconds darf nicht negativ sein")
+        if self.profile_type == ArrivalProfileType.STEP and self.step_seconds <= 0:
+            raise ValueError("step_seconds muss größer als 0 sein")
+
+        if num_arrivals <= 0:
+            return []
+
+        if self.profile_type == ArrivalProfileType.POISSON:
+            rng = random.Random(self.seed)
+            mean_gap = 60 / self.rate_per_minute
+            offsets = [0.0]
+            for _ in range(num_arrivals - 1):
+                offsets.append(offsets[-1] + rng.expovariate(1 / mean_gap))
+            return offsets
+
+        return [0.0] + [self._time_for_arrivals(k) for k in range(1, num_arrivals)]
+
+    def describe(self) -> str:
+        """Kurzbeschreibung für Reports."""
+        if self.profile_type == ArrivalProfileType.RAMP:
+            return (f"ramp {self.start_rate_per_minute:g}->{self.rate_per_minute:g}/min "
+                    f"über {self.ramp_seconds:g}s")
+        if self.profile_type == ArrivalProfileType.STEP:
+            return (f"step {self.start_rate_per_minute:g}+{self.step_rate_per_minute:g}/min "
+                    f"alle {self.step_seconds:g}s bis {self.rate_per_minute:g}/min")
+        return f"{self.profile_type.value} {self.rate_per_minute:g}/min"
+
+
+@dataclass
+class ScheduledStart:
+    """Geplanter vs. tatsächlicher Start einer Bestellung."""
+    order_num: int
+    intended_offset_seconds: float
+    actual_offset_seconds: float
+    in_flight_at_start: int
+
+    @property
+    def lag_seconds(self) -> float:
+        """Verspätung des Starts gegenüber dem Plan."""
+        return max(0.0, self.actual_offset_seconds - self.intended_offset_seconds)
+
+
+@dataclass
+class SchedulerStats:
+    """Statistiken eines Open-Loop-Laufs."""
+    profile: str = ""
+    planned_orders: int = 0
+    starts: list[ScheduledStart] = field(default_factory=list)
+    peak_in_flight: int = 0
+    duration_seconds: float = 0.0
+
+    @property
+    def avg_lag_seconds(self) -> float:
+        if not self.starts:
+            return 0.0
+        return sum(s.lag_seconds for s in self.starts) / len(self.starts)
+
+    @property
+    def max_lag_seconds(self) -> float:
+        return max((s.lag_seconds for s in self.starts), default=0.0)
+
+    @property
+    def achieved_start_rate_per_minute(self) -> float:
+        """Tatsächlich erreichte Startrate (Bestellungen/Minute)."""
+        if len(self.starts) < 2:
+            return 0.0
+        span = self.starts[-1].actual_offset_seconds - self.starts[0].actual_offset_seconds
+        return (len(self.starts) - 1) / span * 60 if span > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        """Konvertiert die Statistik in ein Dictionary für JSON-Export."""
+        return {
+            "profile": self.profile,
+            "planned_orders": self.planned_orders,
+            "started_orders": len(self.starts),
+            "peak_in_flight": self.peak_in_flight,
+            "avg_start_lag_seconds": round(self.avg_lag_seconds, 3),
+            "max_start_lag_seconds": round(self.max_lag_seconds, 3),
+            "achieved_start_rate_per_minute": round(self.achieved_start_rate_per_minute, 2),
+            "duration_seconds": round(self.duration_seconds, 2),
+        }
+
+
+class OpenLoopScheduler:
+    """
+    Startet Bestellungen nach einem Ankunftsprofil (Open-Loop).
+
+    Beispiel:
+        scheduler = OpenLoopScheduler(ArrivalProfile.from_name("constant", 30))
+        results = await scheduler.run(100, lambda i: runner.run_order(i))
+    """
+
+    def __init__(self, profile: ArrivalProfile, max_in_flight: Optional[int] = None):
+        """
+        Args:
+            profile: Ankunftsprofil
+            max_in_flight: Optionale Sicherheitsgrenze für gleichzeitig laufende
+                Bestellungen. Wird sie erreicht, verzögert sich der Start - die
+                Verspätung wird als Lag sichtbar und nicht verschwiegen.
+        """
+        self.profile = profile
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+        self.stats = SchedulerStats(profile=profile.describe())
+        self._slot_freed = asyncio.Event()
+
+    async def _wait_for_slot(self) -> None:
+        """Wartet, bis die optionale Sicherheitsgrenze wieder Platz hat."""
+        while self.max_in_flight and self.in_flight >= self.max_in_flight:
+            self._slot_freed.clear()
+            await self._slot_freed.wait()
+
+    async def _tracked(self, order_coro: Awaitable[Any]) -> Any:
+        """Führt eine Bestellung aus und zählt die laufenden Bestellungen mit."""
+        try:
+            return await order_coro
+        finally:
+            self.in_flight -= 1
+            self._slot_freed.set()
+
+    async def run(
+        self,
+        num_orders: int,
+        order_factory: Callable[[int], Awaitable[Any]],
+    ) -> list[Any]:
+        """
+        Führt ``num_orders`` Bestellungen nach Profil aus.
+
+        Args:
+            num_orders: Anzahl der Bestellungen
+            order_factory: Erzeugt für eine Bestellnummer die auszuführende Coroutine
+
+        Returns:
+            Ergebnisse in Reihenfolge der Bestellnummern (Exceptions werden
+            wie bei ``asyncio.gather(return_exceptions=True)`` zurückgegeben)
+        """
+        offsets = self.profile.schedule(num_orders)
+        self.stats.planned_orders = num_orders
+        tasks: list[asyncio.Task] = []
+        start = time.monotonic()
+
+        for order_num, intended in enumerate(offsets):
+            delay = intended - (time.monotonic() - start)
+            if delay > 0:
+                await asyncio.sleep(delay)  # readiness: allow-sleep (Ankunftszeitpunkt)
+            await self._wait_for_slot()
+
+            actual = time.monotonic() - start
+            self.in_flight += 1
+            self.stats.peak_in_flight = max(self.stats.peak_in_flight, self.in_flight)
+            self.stats.starts.append(ScheduledStart(
+                order_num=order_num,
+                intended_offset_seconds=intended,
+                actual_offset_seconds=actual,
+                in_flight_at_start=self.in_flight,
+            ))
+            tasks.append(asyncio.create_task(self._tracked(order_factory(order_num))))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        self.stats.duration_seconds = time.monotonic() - start
+        return list(results)
@@ -0,0 +1,351 @@
+"""
+Login-Storage-State registrierter Testkunden, einmal pro Lauf.
+
+Bisher meldet sich jeder Test und jede Bestellung mit registriertem Kunden
+über das Login-Formular an. Das kostet pro Login mehrere Runden (Seite,
+Cookie-Banner, POST, Weiterleitung) und löst unter paralleler Last den
+Brute-Force-Schutz von Shopware aus (gesperrte Konten, Captcha).
+
+``AuthStateCache`` meldet jeden Kunden nur einmal an und merkt sich den
+Storage-State (Cookies + localStorage):
+
+- Speicher: Innerhalb eines Laufs wird der State ohne weitere Prüfung
+  wiederverwendet, solange er jünger als ``max_age_seconds`` ist.
+- Platte: Der State wird pro Profil und E-Mail unter ``directory``
+  gespeichert. Ein späterer Lauf (oder ein anderer Shard-Prozess) übernimmt
+  ihn, wenn er frisch ist und ein einzelner ``GET /account`` ohne
+  Weiterleitung zeigt, dass die Session noch angemeldet ist.
+- Parallel: Pro E-Mail meldet sich nur ein Aufrufer an, alle anderen
+  warten auf dessen State.
+
+Tests und Worker bekommen Kopien: ``new_context_async`` erzeugt einen neuen
+Kontext mit dem State, ``apply_async`` überträgt die Cookies in einen
+bestehenden (z.B. gepoolten) Kontext. Alle Kopien teilen sich dieselbe
+Shopware-Session des Kunden.
+
+Beispiel:
+    cache = AuthStateCache.from_config(config)
+    context = await cache.new_context_async(browser, email, password, **context_args)
+    page = await context.new_page()
+    await page.goto(f"{base_url}/account")  # bereits angemeldet
+"""
+import asyncio
+import json
+import os
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from .cookie_banner import accept_cookie_banner, accept_cookie_banner_async
+from .context_pool import is_session_cookie
+
+
+# Login-Formular (Shopware 6 Standard)
+LOGIN_PATH = "/account/login"
+LOGIN_EMAIL = "css=#loginMail, input[name='email']"
+LOGIN_PASSWORD = "css=#loginPassword, input[name='password']"
+LOGIN_SUBMIT = "css=.login-submit button, button[type='submit']"
+
+# Angemeldet: 200, abgemeldet: Weiterleitung auf LOGIN_PATH
+CHECK_PATH = "/account"
+
+
+class AuthStateError(Exception):
+    """Login für den Storage-State ist fehlgeschlagen."""
+
+
+@dataclass
+class AuthStateStats:
+    """Kennzahlen des Caches für Reports."""
+    logins: int = 0
+    memory_hits: int = 0
+    disk_hits: int = 0
+    rejected: int = 0  # gespeicherte States, die abgelaufen oder abgemeldet waren
+    invalidated: int = 0
+
+    def to_dict(self) -> dict:
+        """Konvertiert die Statistik in ein Dictionary für JSON-Export."""
+        return {
+            "logins": self.logins,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "rejected": self.rejected,
+            "invalidated": self.invalidated,
+        }
+
+
+def state_path(directory: str | Path, profile: str, email: str) -> Path:
+    """Datei des gespeicherten States: ``<directory>/<profile>/<email>.json``."""
+    safe = re.sub(r"[^a-z0-9._@-]", "_", email.strip().lower())
+    return Path(directory) / (profile or "default") / f"{safe}.json"
+
+
+def is_fresh(state: dict, saved_at: float, max_age_seconds: float, now: Optional[float] = None) -> bool:
+    """
+    Prüft ohne Browser, ob ein State noch verwendbar sein kann.
+
+    Er muss jünger als ``max_age_seconds`` sein, ein Session-Cookie enthalten
+    und kein Session-Cookie darf abgelaufen sein (``expires`` -1 = bis
+    Browser-Ende, gilt als gültig).
+    """
+    now = time.time() if now is None else now
+    if max_age_seconds <= 0 or now - saved_at >= max_age_seconds:
+        return False
+    session = [c for c in state.get("cookies", []) if is_session_cookie(c)]
+    if not session:
+        return False
+    return all(c.get("expires", -1) in (-1, None) or c["expires"] > now for c in session)
+
+
+class AuthStateCache:
+    """
+    Storage-States registrierter Kunden, pro Lauf (Speicher) und Profil (Platte).
+
+    Mit ``enabled=False`` wird bei jedem Aufruf neu angemeldet; Tests können
+    den Cache dann unverändert verwenden.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        profile: str = "",
+        directory: str | Path = "reports/auth_state",
+        max_age_seconds: float = 1800,
+        context_options: Optional[dict] = None,
+        enabled: bool = True,
+        persist: bool = True,
+    ):
+        """
+        Args:
+            base_url: Shop-URL
+            profile: Konfigurationsprofil (Teil des Dateipfads, z.B. staging)
+            directory: Ablage der gespeicherten States
+            max_age_seconds: Höchstalter eines States (Speicher und Platte)
+            context_options: Optionen für den Login-Kontext (HTTP-Credentials, Locale)
+            enabled: False = keine Wiederverwendung, jeder Aufruf meldet neu an
+            persist: States auf Platte speichern und von dort übernehmen
+        """
+        self.base_url = base_url.rstrip("/")
+        self.profile = profile
+        self.directory = Path(directory)
+        self.max_age_seconds = max_age_seconds
+        self.context_options = context_options or {}
+        self.enabled = enabled
+        self.persist = persist
+
+        self.stats = AuthStateStats()
+        self._states: dict[str, tuple[float, dict]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._locks_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def from_config(cls, config) -> "AuthStateCache":
+        """Erstellt den Cache aus ``config.auth_state`` (Profil, HTTP-Credentials, Locale)."""
+        cfg = config.auth_state
+        options = {"locale": config.locale}
+        if config.htaccess_user and config.htaccess_password:
+            options["http_credentials"] = {
+                "username": config.htaccess_user,
+                "password": config.htaccess_password,
+            }
+        return cls(
+            config.base_url,
+            profile=config.test_profile,
+            directory=cfg.directory,
+            max_age_seconds=cfg.max_age_minutes * 60,
+            context_options=options,
+            enabled=cfg.enabled,
+            persist=cfg.persist,
+        )
+
+    # =========================================================================
+    # Speicher & Platte
+    # =========================================================================
+
+    def _key(self, email: str) -> str:
+        return email.strip().lower()
+
+    def _cached(self, email: str) -> Optional[dict]:
+        """State aus dem Speicher, solange er jünger als ``max_age_seconds`` ist."""
+        entry = self._states.get(self._key(email)) if self.enabled else None
+        if entry and time.time() - entry[0] < self.max_age_seconds:
+            self.stats.memory_hits += 1
+            return entry[1]
+        return None
+
+    def _load(self, email: str) -> Optional[tuple[float, dict]]:
+        """Frischer State mit Speicherzeitpunkt von der Platte (ungeprüft gegen den Shop)."""
+        if not (self.enabled and self.persist):
+            return None
+        path = state_path(self.directory, self.profile, email)
+        try:
+            saved_at = path.stat().st_mtime
+            state = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if is_fresh(state, saved_at, self.max_age_seconds):
+            return saved_at, state
+        self.stats.rejected += 1
+        return None
+
+    def _remember(self, email: str, state: dict, saved_at: Optional[float] = None) -> dict:
+        """Merkt sich den State und schreibt ihn (atomar) auf die Platte."""
+        if not self.enabled:
+            return state
+        self._states[self._key(email)] = (saved_at or time.time(), state)
+        if self.persist and saved_at is None:
+            path = state_path(self.directory, self.profile, email)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(state), encoding="utf-8")
+            os.replace(tmp, path)
+        return state
+
+    def invalidate(self, email: str) -> None:
+        """Verwirft den State eines Kunden (z.B. nach Logout oder abgelaufener Session)."""
+        self.stats.invalidated += 1
+        self._states.pop(self._key(email), None)
+        try:
+            state_path(self.directory, self.profile, email).unlink()
+        except OSError:
+            pass
+
+    def _lock(self, email: str) -> asyncio.Lock:
+        """Ein Lock pro E-Mail; pytest-asyncio startet pro Test eine neue Event-Loop."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._locks_loop:
+            self._locks = {}
+            self._locks_loop = loop
+        return self._locks.setdefault(self._key(email), asyncio.Lock())
+
+    # =========================================================================
+    # Async API
+    # =========================================================================
+
+    async def state_for_async(self, browser, email: str, password: str) -> dict:
+        """
+        Storage-State des Kunden: Speicher, dann Platte (geprüft), sonst Login.
+
+        Raises:
+            AuthStateError: Login fehlgeschlagen
+        """
+        async with self._lock(email):
+            state = self._cached(email)
+            if state:
+                return state
+
+            saved = self._load(email)
+            if saved:
+                saved_at, state = saved
+                if await self._is_logged_in_async(browser, state):
+                    self.stats.disk_hits += 1
+                    return self._remember(email, state, saved_at)
+                self.stats.rejected += 1
+
+            return self._remember(email, await self._login_async(browser, email, password))
+
+    async def new_context_async(self, browser, email: str, password: str, **options):
+        """Neuer Browser-Kontext, in dem der Kunde bereits angemeldet ist."""
+        state = await self.state_for_async(browser, email, password)
+        return await browser.new_context(**{**options, "storage_state": state})
+
+    async def apply_async(self, context, email: str, password: str) -> None:
+        """Überträgt die Login-Cookies in einen bestehenden Kontext (z.B. aus dem Pool)."""
+        state = await self.state_for_async(context.browser, email, password)
+        await context.add_cookies(state["cookies"])
+
+    async def _is_logged_in_async(self, browser, state: dict) -> bool:
+        """Ein ``GET /account`` ohne Weiterleitung: 200 = noch angemeldet."""
+        context = await browser.new_context(**{**self.context_options, "storage_state": state})
+        try:
+            response = await context.request.get(f"{self.base_url}{CHECK_PATH}", max_redirects=0)
+            return response.status == 200
+        except Exception:
+            return False
+        finally:
+            await context.close()
+
+    async def _login_async(self, browser, email: str, password: str) -> dict:
+        """Meldet den Kunden in einem eigenen Kontext an und gibt dessen State zurück."""
+        self.stats.logins += 1
+        context = await browser.new_context(**self.context_options)
+        try:
+            page = await context.new_page()
+            await page.goto(f"{self.base_url}{LOGIN_PATH}", timeout=60000)
+            await page.wait_for_load_state("domcontentloaded")
+            await accept_cookie_banner_async(page)
+
+            await page.fill(LOGIN_EMAIL, email)
+            await page.fill(LOGIN_PASSWORD, password)
+            await page.click(LOGIN_SUBMIT)
+            await page.wait_for_load_state("networkidle")
+
+            if LOGIN_PATH in page.url:
+                raise AuthStateError(f"Login fehlgeschlagen für {email}")
+            return await context.storage_state()
+        finally:
+            await context.close()
+
+    # =========================================================================
+    # Sync API (pytest-playwright ``page``/``context``)
+    # =========================================================================
+
+    def state_for(self, browser, email: str, password: str) -> dict:
+        """Wie ``state_for_async`` für die Sync-API (ein Thread, kein Lock nötig)."""
+        state = self._cached(email)
+        if state:
+            return state
+
+        saved = self._load(email)
+        if saved:
+            saved_at, state = saved
+            if self._is_logged_in(browser, state):
+                self.stats.disk_hits += 1
+                return self._remember(email, state, saved_at)
+            self.stats.rejected += 1
+
+        return self._remember(email, self._login(browser, email, password))
+
+    def apply(self, context, email: str, password: str) -> None:
+        """Überträgt die Login-Cookies in den Kontext (z.B. pytest-playwright ``page.context``)."""
+        context.add_cookies(self.state_for(context.browser, email, password)["cookies"])
+
+    def _is_logged_in(self, browser, state: dict) -> bool:
+        context = browser.new_context(**{**self.context_options, "storage_state": state})
+        try:
+            return context.request.get(f"{self.base_url}{CHECK_PATH}", max_redirects=0).status == 200
+        except Exception:
+            return False
+        finally:
+            context.close()
+
+    def _login(self, browser, email: str, password: str) -> dict:
+        self.stats.logins += 1
+        context = browser.new_context(**self.context_options)
+        try:
+            page = context.new_page()
+            page.goto(f"{self.base_url}{LOGIN_PATH}", timeout=60000)
+            page.wait_for_load_state("domcontentloaded")
+            accept_cookie_banner(page)
+
+            page.fill(LOGIN_EMAIL, email)
+            page.fill(LOGIN_PASSWORD, password)
+            page.click(LOGIN_SUBMIT)
+            page.wait_for_load_state("networkidle")
+
+            if LOGIN_PATH in page.url:
+                raise AuthStateError(f"Login fehlgeschlagen für {email}")
+            return context.storage_state()
+        finally:
+            context.close()
+
+
+def format_auth_stats(stats: dict) -> str:
+    """Kurzfassung für die Konsole: Logins vs. wiederverwendete States."""
+    reused = stats["memory_hits"] + stats["disk_hits"]
+    text = f"{stats['logins']} Logins, {reused} wiederverwendet ({stats['disk_hits']} von Platte)"
+    if stats["rejected"] or stats["invalidated"]:
+        text += f", {stats['rejected']} verworfen, {stats['invalidated']} ungültig geworden"
+    return text
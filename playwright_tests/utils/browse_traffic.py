@@ -0,0 +1,235 @@
+"""
+Stöber-Traffic als Hintergrundlast: virtuelle Nutzer, die nur schauen und nicht bestellen.
+
+Echte Last auf dem Shop besteht großteils aus Listings, Suchen und
+Produktseiten. ``BrowseTraffic`` erzeugt diese Last parallel zu einem
+Bestell-Lauf: Jeder virtuelle Nutzer hat eine eigene HTTP-Sitzung
+(``APIRequestContext``, kein Browser), ruft reihum zufällige Ziele auf und
+wartet zwischen zwei Seiten eine Denkpause (±50 %). Gemessen werden Dauer,
+Requests, Durchsatz und Fehler pro Seitentyp.
+
+Mit einem ``JourneyModel`` (``utils/journey_model.py``) folgen die Nutzer
+stattdessen realistischen Pfaden: Jede Sitzung startet mit neuen Cookies,
+läuft die Markow-Kette bis ``exit`` (höchstens ``max_session_pages`` Seiten)
+und wartet pro Seitentyp die modellierte Denkpause. Danach beginnt der
+Nutzer eine neue Sitzung - so entstehen laufend neue Besucher wie im
+Live-Betrieb (Cache-Churn, neue Sessions).
+
+Beispiel:
+    targets = browse_targets(["/moebel/"], ["kissen"], ["p/duftkissen/ge-p-49415"])
+    traffic = BrowseTraffic(playwright.request, base_url, targets, users=20)
+    stop = asyncio.Event()
+    task = asyncio.create_task(traffic.run(stop))
+    ...  # Bestell-Lauf
+    stop.set()
+    stats = await task
+
+    # Nutzerpfade statt Zufallsziele
+    journey = JourneyModel.from_config(config.performance_test.journeys)
+    traffic = BrowseTraffic(playwright.request, base_url, targets, users=2000, journey=journey)
+"""
+import asyncio
+import contextlib
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional
+from urllib.parse import quote_plus
+
+from .journey_model import JourneyModel, JourneySession
+from .latency_histogram import LatencyHistogramSet
+
+
+@dataclass
+class BrowseTarget:
+    """Eine aufrufbare Seite mit ihrem Seitentyp (``listing``, ``search``, ``pdp``, ...)."""
+    kind: str
+    path: str
+    term: str = field(default="", compare=False)  # Suchbegriff bei ``search``
+
+
+def browse_targets(
+    listing_paths: list[str],
+    search_terms: list[str],
+    product_paths: list[str],
+) -> list[BrowseTarget]:
+    """Stöber-Ziele aus Kategorie-Pfaden, Suchbegriffen und Produktpfaden."""
+    targets = [BrowseTarget("listing", path) for path in listing_paths]
+    targets += [BrowseTarget("search", f"/search?search={quote_plus(term)}", term) for term in search_terms]
+    targets += [BrowseTarget("pdp", path) for path in product_paths]
+    return targets
+
+
+@dataclass
+class BrowseStats:
+    """Dauer, Requests und Fehler pro Seitentyp, dazu abgeschlossene Sitzungen."""
+    latency: LatencyHistogramSet = field(default_factory=LatencyHistogramSet)
+    requests: Counter = field(default_factory=Counter)
+    errors: Counter = field(default_factory=Counter)
+    users: int = 0
+    duration_seconds: float = 0.0
+    sessions: int = 0
+    session_pages: int = 0
+
+    def record(self, kind: str, seconds: float, ok: bool) -> None:
+        self.requests[kind] += 1
+        if ok:
+            self.latency.record(kind, seconds)
+        else:
+            self.errors[kind] += 1
+
+    def record_session(self, pages: int) -> None:
+        self.sessions += 1
+        self.session_pages += pages
+
+    def _rate(self, count: int) -> float:
+        return round(count / self.duration_seconds, 2) if self.duration_seconds else 0.0
+
+    def to_dict(self) -> dict:
+        total = sum(self.requests.values())
+        return {
+            "users": self.users,
+            "requests": total,
+            "errors": sum(self.errors.values()),
+            "requests_per_second": self._rate(total),
+            "sessions": self.sessions,
+            "pages_per_session": round(self.session_pages / self.sessions, 1) if self.sessions else 0.0,
+            "by_kind": {
+                kind: {
+                    "requests": count,
+                    "errors": self.errors[kind],
+                    "requests_per_second": self._rate(count),
+                    **(self.latency.histograms[kind].summary() if kind in self.latency.histograms else {}),
+                }
+                for kind, count in sorted(self.requests.items())
+            },
+        }
+
+
+class BrowseTraffic:
+    """Virtuelle Stöber-Nutzer per HTTP mit Denkpausen zwischen den Seiten (zufällig oder nach Nutzerpfad)."""
+
+    def __init__(
+        self,
+        api_request,
+        base_url: str,
+        targets: list[BrowseTarget],
+        users: int,
+        think_time_seconds: float = 3.0,
+        context_options: Optional[dict] = None,
+        timeout: int = 30000,
+        seed: Optional[int] = None,
+        journey: Optional[JourneyModel] = None,
+        max_session_pages: int = 50,
+    ):
+        """
+        Args:
+            api_request: ``playwright.request`` (erzeugt die Request-Kontexte)
+            base_url: Shop-URL
+            targets: Aufrufbare Seiten (siehe ``browse_targets``)
+            users: Anzahl gleichzeitiger Stöber-Nutzer
+            think_time_seconds: Mittlere Pause zwischen zwei Seiten
+            context_options: Weitere Optionen für ``new_context`` (z.B. ``http_credentials``)
+            timeout: Timeout pro Request in ms
+            seed: Startwert für die Zufallsauswahl (reproduzierbare Abfolge)
+            journey: Nutzerpfad-Modell; ohne Modell werden Ziele zufällig aufgerufen
+            max_session_pages: Obergrenze pro Sitzung (Schutz vor Zyklen ohne ``exit``)
+        """
+        if not targets:
+            raise ValueError("Keine Stöber-Ziele konfiguriert")
+        self.api_request = api_request
+        self.base_url = base_url.rstrip("/")
+        self.targets = targets
+        self.users = users
+        self.think_time_seconds = think_time_seconds
+        self.context_options = context_options or {}
+        self.timeout = timeout
+        self.rng = random.Random(seed)
+        self.journey = journey
+        self.max_session_pages = max_session_pages
+        self.stats = BrowseStats(users=users)
+
+    async def _pause(self, stop: asyncio.Event, seconds: float) -> None:
+        """Wartet ``seconds`` oder bis ``stop`` gesetzt ist."""
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(stop.wait(), timeout=seconds)
+
+    def _think_time(self) -> float:
+        return self.think_time_seconds * self.rng.uniform(0.5, 1.5)
+
+    async def _visit(self, request, kind: str, path: str) -> None:
+        start = time.perf_counter()
+        try:
+            response = await request.get(f"{self.base_url}/{path.lstrip('/')}", timeout=self.timeout)
+            ok = response.ok
+        except Exception:
+            ok = False
+        self.stats.record(kind, time.perf_counter() - start, ok)
+
+    def _journey_session(self) -> JourneySession:
+        by_kind: dict[str, list[BrowseTarget]] = {}
+        for target in self.targets:
+            by_kind.setdefault(target.kind, []).append(target)
+        return JourneySession(
+            [target.path for target in by_kind.get("listing", [])],
+            [target.term for target in by_kind.get("search", []) if target.term],
+            [target.path for target in by_kind.get("pdp", [])],
+            self.rng,
+        )
+
+    async def _journey(self, stop: asyncio.Event) -> None:
+        """Eine Sitzung entlang des Nutzerpfad-Modells mit eigenem Request-Kontext."""
+        request = await self.api_request.new_context(**self.context_options)
+        session = self._journey_session()
+        pages = 0
+        try:
+            kind = self.journey.start(self.rng)
+            while kind is not None and not stop.is_set() and pages < self.max_session_pages:
+                await self._visit(request, kind, session.url(kind))
+                pages += 1
+                await self._pause(stop, self.journey.think_time(kind, self.rng))
+                kind = self.journey.step(kind, self.rng)
+        finally:
+            await request.dispose()
+        if kind is None or pages >= self.max_session_pages:
+            self.stats.record_session(pages)
+
+    async def _random(self, stop: asyncio.Event) -> None:
+        request = await self.api_request.new_context(**self.context_options)
+        try:
+            while not stop.is_set():
+                target = self.rng.choice(self.targets)
+                await self._visit(request, target.kind, target.path)
+                await self._pause(stop, self._think_time())
+        finally:
+            await request.dispose()
+
+    async def _user(self, stop: asyncio.Event) -> None:
+        # Versetzter Start, damit nicht alle Nutzer gleichzeitig die erste Seite laden
+        await self._pause(stop, self.rng.uniform(0, self.think_time_seconds))
+        if self.journey is None:
+            await self._random(stop)
+            return
+        while not stop.is_set():
+            await self._journey(stop)
+
+    async def run(self, stop: asyncio.Event) -> BrowseStats:
+        """Lässt alle Nutzer stöbern, bis ``stop`` gesetzt ist."""
+        start = time.perf_counter()
+        await asyncio.gather(*(self._user(stop) for _ in range(self.users)))
+        self.stats.duration_seconds = time.perf_counter() - start
+        return self.stats
+
+
+def format_browse_stats(stats: dict) -> list[str]:
+    """Zeilen für Konsolen-Reports: Gesamtdurchsatz und Perzentile pro Seitentyp."""
+    lines = [f"{stats['users']} Nutzer, {stats['requests']} Seiten ({stats['requests_per_second']}/s), "
+             f"{stats['errors']} Fehler"]
+    if stats.get("sessions"):
+        lines.append(f"{stats['sessions']} abgeschlossene Sitzungen, Ø {stats['pages_per_session']} Seiten")
+    for kind, info in stats["by_kind"].items():
+        percentiles = " | ".join(f"{key} {info[key]:.2f}s" for key in ("p50", "p95", "p99") if key in info)
+        lines.append(f"{kind:14} {info['requests']:6} Seiten ({info.get('requests_per_second', 0.0)}/s), "
+                     f"{info['errors']} Fehler  {percentiles}")
+    return lines
@@ -0,0 +1,253 @@
+"""
+Warenkorb per HTTP befüllen statt per Klick auf der Produktseite.
+
+Checkout-Tests, die nicht das "In den Warenkorb" selbst testen, müssen keine
+Produktseite rendern. Der ``CartSeeder`` legt die Positionen direkt per
+Request an und die Tests starten auf ``/checkout/cart`` bzw. ``/checkout/confirm``.
+
+Ablauf:
+
+1. Produkt-ID (UUID) ermitteln - per Store API (``/store-api/product``, Filter
+   auf Artikelnummer; benötigt den Sales-Channel-Zugangsschlüssel) oder, ohne
+   Schlüssel, aus dem Kaufformular im HTML der Produktseite. IDs werden pro
+   Lauf zwischengespeichert.
+2. Positionen über den Storefront-Endpunkt ``/checkout/line-item/add`` anlegen.
+   Abgelehnte Positionen (ausverkauft, Mindestmenge ...) beantwortet Shopware
+   trotzdem mit 200 bzw. einer Weiterleitung; der Grund steht nur als
+   Flash-Meldung im Offcanvas-Warenkorb und wird von dort gelesen.
+
+Die Requests laufen über ``context.request`` des Browser-Kontexts: Dieser
+``APIRequestContext`` teilt die Cookies mit dem Browser, die Session mit dem
+Warenkorb liegt danach also bereits im Kontext. (Ein reiner Store-API-Warenkorb
+hängt an einem eigenen Context-Token, den die Storefront-Session nicht übernimmt.)
+
+Alle Methoden gibt es als sync-Variante (pytest-playwright) und als
+``_async``-Variante (Massen- und Performance-Tests).
+"""
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from .storefront_html import StorefrontHtml
+
+
+STORE_API_PRODUCT = "/store-api/product"
+LINE_ITEM_ADD = "/checkout/line-item/add"
+
+# Kaufformular auf der Produktseite: <input name="lineItems[<uuid>][id]" ...>
+BUY_FORM_ID_RE = re.compile(r'name="lineItems\[([0-9a-fA-F]{32})\]\[id\]"')
+# Artikelnummer am Ende des Produktpfads: "p/duftkissen-lavendel/ge-p-49415" -> "49415"
+PRODUCT_NUMBER_RE = re.compile(r"(\d+)/?$")
+
+
+class CartSeedingError(Exception):
+    """Der Warenkorb konnte nicht per Request befüllt werden."""
+
+
+@dataclass
+class SeedResult:
+    """Ergebnis einer Befüllung."""
+    line_items: dict[str, int] = field(default_factory=dict)  # Produkt-ID -> Menge
+    duration_seconds: float = 0.0
+
+    @property
+    def quantity(self) -> int:
+        return sum(self.line_items.values())
+
+
+def parse_product_id(html: str) -> Optional[str]:
+    """Liest die Produkt-ID aus dem Kaufformular einer Produktseite."""
+    match = BUY_FORM_ID_RE.search(html)
+    return match.group(1).lower() if match else None
+
+
+def product_number_from_path(product_path: str) -> Optional[str]:
+    """Ermittelt die Artikelnummer aus einem Produktpfad."""
+    match = PRODUCT_NUMBER_RE.search(product_path)
+    return match.group(1) if match else None
+
+
+def line_item_form(product_id: str, quantity: int) -> dict:
+    """Formulardaten für ``/checkout/line-item/add`` (wie das Kaufformular der Storefront)."""
+    prefix = f"lineItems[{product_id}]"
+    return {
+        "redirectTo": "frontend.cart.offcanvas",
+        f"{prefix}[id]": product_id,
+        f"{prefix}[type]": "product",
+        f"{prefix}[referencedId]": product_id,
+        f"{prefix}[quantity]": str(quantity),
+        f"{prefix}[stackable]": "1",
+        f"{prefix}[removable]": "1",
+    }
+
+
+def product_search_payload(product_number: str) -> dict:
+    """Store-API-Suche nach genau einer Artikelnummer (nur die ID wird geladen)."""
+    return {
+        "filter": [{"type": "equals", "field": "productNumber", "value": product_number}],
+        "includes": {"product": ["id", "productNumber"]},
+        "limit": 1,
+    }
+
+
+class CartSeeder:
+    """
+    Befüllt Warenkörbe per Request; Produkt-IDs werden pro Lauf gecacht.
+
+    Beispiel:
+        seeder = CartSeeder(base_url, access_key=config.cart_seeding.store_api_access_key)
+        await seeder.seed_async(context.request, ["p/duftkissen-lavendel/ge-p-49415"])
+        await page.goto(f"{base_url}/checkout/cart")
+    """
+
+    def __init__(self, base_url: str, access_key: str = "", timeout: int = 30000):
+        """
+        Args:
+            base_url: Shop-URL
+            access_key: Sales-Channel-Zugangsschlüssel für die Store API
+                (leer: Produkt-IDs werden aus der Produktseite gelesen)
+            timeout: Timeout pro Request in ms
+        """
+        self.base_url = base_url.rstrip("/")
+        self.access_key = access_key
+        self.timeout = timeout
+        self.product_ids: dict[str, str] = {}
+
+    def _product_url(self, product_path: str) -> str:
+        return f"{self.base_url}/{product_path.lstrip('/')}"
+
+    def _store_api_headers(self) -> dict:
+        return {"sw-access-key": self.access_key, "Accept": "application/json"}
+
+    def _remember_page(self, product_path: str, html: str) -> str:
+        """Merkt sich die ID aus dem HTML einer Produktseite."""
+        product_id = parse_product_id(html)
+        if not product_id:
+            raise CartSeedingError(f"Kein Kaufformular auf {product_path} gefunden")
+        self.product_ids[product_path] = product_id
+        return product_id
+
+    def _remember_store_api(self, product_path: str, data: dict) -> Optional[str]:
+        elements = data.get("elements") or []
+        if not elements:
+            return None
+        self.product_ids[product_path] = elements[0]["id"]
+        return self.product_ids[product_path]
+
+    @staticmethod
+    def _check_added(product_path: str, html: str) -> None:
+        """Wirft bei Fehlermeldungen im Offcanvas-Warenkorb nach dem Hinzufügen."""
+        errors = StorefrontHtml(html).errors
+        if errors:
+            raise CartSeedingError(f"Position {product_path} abgelehnt: {'; '.join(errors[:3])}")
+
+    @staticmethod
+    def _count(product_paths: Iterable[str], quantity: int) -> Counter:
+        """Fasst doppelte Produkte zu einer Position mit höherer Menge zusammen."""
+        counts: Counter = Counter()
+        for product_path in product_paths:
+            counts[product_path] += quantity
+        return counts
+
+    # =========================================================================
+    # Sync-Variante (pytest-playwright)
+    # =========================================================================
+
+    def resolve(self, request, product_path: str) -> str:
+        """
+        Gibt die Produkt-ID zu einem Produktpfad zurück.
+
+        Raises:
+            CartSeedingError: Wenn weder Store API noch Produktseite eine ID liefern
+        """
+        if product_path in self.product_ids:
+            return self.product_ids[product_path]
+
+        number = product_number_from_path(product_path)
+        if self.access_key and number:
+            response = request.post(
+                f"{self.base_url}{STORE_API_PRODUCT}",
+                headers=self._store_api_headers(),
+                data=product_search_payload(number),
+                timeout=self.timeout,
+            )
+            if response.ok and self._remember_store_api(product_path, response.json()):
+                return self.product_ids[product_path]
+
+        response = request.get(self._product_url(product_path), timeout=self.timeout)
+        if not response.ok:
+            raise CartSeedingError(f"Produktseite {product_path}: HTTP {response.status}")
+        return self._remember_page(product_path, response.text())
+
+    def seed(self, request, product_paths: Iterable[str], quantity: int = 1) -> SeedResult:
+        """
+        Legt die Produkte im Warenkorb der Session von ``request`` an.
+
+        Args:
+            request: ``context.request`` des Browser-Kontexts (teilt dessen Cookies)
+            product_paths: Produktpfade (Duplikate erhöhen die Menge)
+            quantity: Menge pro Vorkommen
+
+        Raises:
+            CartSeedingError: Bei fehlender Produkt-ID oder abgelehnter Position
+        """
+        start = time.perf_counter()
+        result = SeedResult()
+        for product_path, count in self._count(product_paths, quantity).items():
+            product_id = self.resolve(request, product_path)
+            response = request.post(
+                f"{self.base_url}{LINE_ITEM_ADD}",
+                form=line_item_form(product_id, count),
+                timeout=self.timeout,
+            )
+            if not response.ok:
+                raise CartSeedingError(f"Position {product_path} abgelehnt: HTTP {response.status}")
+            self._check_added(product_path, response.text())
+            result.line_items[product_id] = result.line_items.get(product_id, 0) + count
+        result.duration_seconds = time.perf_counter() - start
+        return result
+
+    # =========================================================================
+    # Async-Variante (Massen- und Performance-Tests)
+    # =========================================================================
+
+    async def resolve_async(self, request, product_path: str) -> str:
+        """Async-Variante von ``resolve``."""
+        if product_path in self.product_ids:
+            return self.product_ids[product_path]
+
+        number = product_number_from_path(product_path)
+        if self.access_key and number:
+            response = await request.post(
+                f"{self.base_url}{STORE_API_PRODUCT}",
+                headers=self._store_api_headers(),
+                data=product_search_payload(number),
+                timeout=self.timeout,
+            )
+            if response.ok and self._remember_store_api(product_path, await response.json()):
+                return self.product_ids[product_path]
+
+        response = await request.get(self._product_url(product_path), timeout=self.timeout)
+        if not response.ok:
+            raise CartSeedingError(f"Produktseite {product_path}: HTTP {response.status}")
+        return self._remember_page(product_path, await response.text())
+
+    async def seed_async(self, request, product_paths: Iterable[str], quantity: int = 1) -> SeedResult:
+        """Async-Variante von ``seed``."""
+        start = time.perf_counter()
+        result = SeedResult()
+        for product_path, count in self._count(product_paths, quantity).items():
+            product_id = await self.resolve_async(request, product_path)
+            response = await request.post(
+                f"{self.base_url}{LINE_ITEM_ADD}",
+                form=line_item_form(product_id, count),
+                timeout=self.timeout,
+            )
+            if not response.ok:
+                raise CartSeedingError(f"Position {product_path} abgelehnt: HTTP {response.status}")
+            self._check_added(product_path, await response.text())
+            result.line_items[product_id] = result.line_items.get(product_id, 0) + count
+        result.duration_seconds = time.perf_counter() - start
+        return result
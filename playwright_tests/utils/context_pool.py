@@ -0,0 +1,336 @@
+"""
+Pool vorgewärmter Browser-Kontexte für Massen- und Performance-Tests.
+
+Statt für jede Bestellung ``browser.new_context()`` aufzurufen (inkl. erneuter
+HTTP-Basic-Auth und Cookie-Banner), werden Kontexte wiederverwendet:
+
+- Warm-up: ``size`` Kontexte werden vorab erstellt und haben die Startseite
+  bereits einmal geladen (Basic-Auth ausgehandelt, Verbindungen offen).
+- Cookie-Consent: Einmal akzeptiert, wird der Storage-State (Consent-Cookies +
+  localStorage von Usercentrics) in jeden neuen Kontext übernommen.
+- Reset: Zwischen zwei Bestellungen werden Session-Cookies (Warenkorb/Login)
+  gelöscht, die Consent-Cookies bleiben erhalten.
+- Eviction: Kontexte mit wiederholten Fehlern, zu vielen Nutzungen oder
+  fehlgeschlagenem Health-Check werden geschlossen und ersetzt.
+"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Optional
+
+from playwright.async_api import Browser, BrowserContext
+
+from .cookie_banner import accept_cookie_banner_async
+from .request_blocking import RequestBlocker
+
+
+# Cookies, die Warenkorb bzw. Login tragen und beim Reset entfernt werden
+SESSION_COOKIE_PREFIXES = ("session-", "sw-", "PHPSESSID")
+
+
+@dataclass
+class PooledContext:
+    """Ein Kontext im Pool mit Nutzungs- und Fehlerzählern."""
+    context: BrowserContext
+    created_at: float = field(default_factory=time.monotonic)
+    uses: int = 0
+    consecutive_failures: int = 0
+
+
+@dataclass
+class ContextPoolStats:
+    """Kennzahlen des Pools für Reports."""
+    created: int = 0
+    leases: int = 0
+    reused: int = 0
+    evicted: int = 0
+    resets: int = 0
+    warm_up_seconds: float = 0.0
+    wait_seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        """Konvertiert die Statistik in ein Dictionary für JSON-Export."""
+        return {
+            "created": self.created,
+            "leases": self.leases,
+            "reused": self.reused,
+            "evicted": self.evicted,
+            "resets": self.resets,
+            "warm_up_seconds": round(self.warm_up_seconds, 2),
+            "wait_seconds": round(self.wait_seconds, 2),
+        }
+
+
+def is_session_cookie(cookie: dict) -> bool:
+    """Prüft ob ein Cookie Session/Warenkorb-Zustand trägt."""
+    name = cookie.get("name", "")
+    return name.startswith(SESSION_COOKIE_PREFIXES) or "context-token" in name
+
+
+class BrowserContextPool:
+    """
+    Verwaltet wiederverwendbare, vorgewärmte Browser-Kontexte.
+
+    Beispiel:
+        pool = BrowserContextPool(browser, base_url, size=10, context_options=opts)
+        await pool.start()
+        async with pool.lease() as lease:
+            page = await lease.context.new_page()
+            ...
+            lease.healthy = result.success
+        await pool.close()
+    """
+
+    def __init__(
+        self,
+        browser: Browser,
+        base_url: str,
+        size: int,
+        context_options: Optional[dict] = None,
+        max_size: Optional[int] = None,
+        max_uses: int = 25,
+        max_consecutive_failures: int = 2,
+        warm_up: bool = True,
+    ):
+        """
+        Args:
+            browser: Browser-Instanz
+            base_url: Shop-URL (für Warm-up und Cookie-Consent)
+            size: Anzahl vorgewärmter Kontexte
+            context_options: Optionen für ``browser.new_context`` (Viewport, Credentials)
+            max_size: Obergrenze inkl. on-demand erzeugter Kontexte (None = unbegrenzt)
+            max_uses: Nach so vielen Bestellungen wird ein Kontext ersetzt
+            max_consecutive_failures: Nach so vielen Fehlern in Folge wird ersetzt
+            warm_up: Kontexte beim Start vorab erstellen und Startseite laden
+        """
+        self.browser = browser
+        self.base_url = base_url.rstrip("/")
+        self.size = size
+        self.context_options = context_options or {}
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.max_consecutive_failures = max_consecutive_failures
+        self.warm_up = warm_up
+
+        self.stats = ContextPoolStats()
+        self.storage_state: Optional[dict] = None
+        self._idle: asyncio.Queue[PooledContext] = asyncio.Queue()
+        self._total = 0
+        self._closed = False
+
+    # =========================================================================
+    # Lebenszyklus
+    # =========================================================================
+
+    async def start(self) -> None:
+        """Ermittelt den Consent-Storage-State und wärmt die Kontexte vor."""
+        start = time.monotonic()
+        await self._seed_consent_state()
+
+        if self.warm_up:
+            pooled = await asyncio.gather(
+                *[self._create() for _ in range(self.size)],
+                return_exceptions=True,
+            )
+            for item in pooled:
+                if isinstance(item, PooledContext):
+                    self._idle.put_nowait(item)
+
+        self.stats.warm_up_seconds = time.monotonic() - start
+
+    async def close(self) -> None:
+        """Schließt alle Kontexte im Pool."""
+        self._closed = True
+        while not self._idle.empty():
+            pooled = self._idle.get_nowait()
+            await self._dispose(pooled)
+
+    async def _seed_consent_state(self) -> None:
+        """Akzeptiert das Cookie-Banner einmal und merkt sich den Storage-State."""
+        context = await self.browser.new_context(**self.context_options)
+        try:
+            page = await context.new_page()
+            await page.goto(self.base_url, timeout=60000)
+            await page.wait_for_load_state("domcontentloaded")
+            await accept_cookie_banner_async(page)
+            state = await context.storage_state()
+            state["cookies"] = [c for c in state.get("cookies", []) if not is_session_cookie(c)]
+            self.storage_state = state
+        except Exception as e:
+            # Ohne Consent-State funktioniert der Pool weiterhin, nur ohne Pre-Seeding
+            print(f"   [Pool] Cookie-Consent konnte nicht vorbereitet werden: {e}")
+        finally:
+            await context.close()
+
+    async def _create(self) -> PooledContext:
+        """Erstellt einen neuen Kontext mit Consent-State und lädt die Startseite."""
+        self._total += 1
+        try:
+            options = dict(self.context_options)
+            if self.storage_state:
+                options["storage_state"] = self.storage_state
+            context = await self.browser.new_context(**options)
+
+            if self.warm_up:
+                page = await context.new_page()
+                try:
+                    await page.goto(self.base_url, timeout=60000)
+                    await page.wait_for_load_state("domcontentloaded")
+                finally:
+                    await page.close()
+                await self._reset(context)
+        except Exception:
+            self._total -= 1
+            raise
+
+        self.stats.created += 1
+        return PooledContext(context=context)
+
+    async def _dispose(self, pooled: PooledContext) -> None:
+        """Schließt einen Kontext und gibt seinen Platz frei."""
+        self._total -= 1
+        try:
+            await pooled.context.close()
+        except Exception:
+            pass
+
+    # =========================================================================
+    # Ausleihen & Zurückgeben
+    # =========================================================================
+
+    async def acquire(self) -> PooledContext:
+        """
+        Leiht einen Kontext aus.
+
+        Nimmt einen freien Kontext, erzeugt bei Bedarf einen neuen (bis
+        ``max_size``) oder wartet auf eine Rückgabe.
+        """
+        wait_start = time.monotonic()
+
+        if self._idle.empty() and (self.max_size is None or self._total < self.max_size):
+            pooled = await self._create()
+        else:
+            pooled = await self._idle.get()
+            self.stats.reused += 1
+
+        self.stats.wait_seconds += time.monotonic() - wait_start
+        self.stats.leases += 1
+        pooled.uses += 1
+        return pooled
+
+    async def release(self, pooled: PooledContext, healthy: bool = True) -> None:
+        """
+        Gibt einen Kontext zurück.
+
+        Ungesunde oder verbrauchte Kontexte werden geschlossen; bei Bedarf
+        wird ein Ersatz erzeugt, damit der Pool nicht schrumpft.
+        """
+        pooled.consecutive_failures = 0 if healthy else pooled.consecutive_failures + 1
+
+        if not self._closed and await self._is_reusable(pooled):
+            try:
+                await self._reset(pooled.context)
+                self._idle.put_nowait(pooled)
+                return
+            except Exception:
+                pass
+
+        self.stats.evicted += 1
+        await self._dispose(pooled)
+
+        if not self._closed and self._total < self.size:
+            try:
+                self._idle.put_nowait(await self._create())
+            except Exception as e:
+                print(f"   [Pool] Ersatz-Kontext konnte nicht erstellt werden: {e}")
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator["ContextLease"]:
+        """Leiht einen Kontext für die Dauer des ``async with``-Blocks aus."""
+        pooled = await self.acquire()
+        lease = ContextLease(pooled)
+        try:
+            yield lease
+        except Exception:
+            lease.healthy = False
+            raise
+        finally:
+            await self.release(pooled, healthy=lease.healthy)
+
+    # =========================================================================
+    # Health & Reset
+    # =========================================================================
+
+    async def _is_reusable(self, pooled: PooledContext) -> bool:
+        """Health-Check: Fehlerserie, Nutzungsgrenze und Erreichbarkeit."""
+        if pooled.consecutive_failures >= self.max_consecutive_failures:
+            return False
+        if pooled.uses >= self.max_uses:
+            return False
+        try:
+            await asyncio.wait_for(pooled.context.cookies(), timeout=5)
+            return True
+        except Exception:
+            return False
+
+    async def _reset(self, context: BrowserContext) -> None:
+        """Entfernt Session/Warenkorb-Cookies und offene Seiten, Consent bleibt."""
+        for page in list(context.pages):
+            await page.close()
+
+        cookies = await context.cookies()
+        if any(is_session_cookie(c) for c in cookies):
+            await context.clear_cookies()
+            await context.add_cookies([c for c in cookies if not is_session_cookie(c)])
+        self.stats.resets += 1
+
+
+class ContextLease:
+    """Ausgeliehener Kontext; ``healthy`` steuert die Eviction bei Rückgabe."""
+
+    def __init__(self, pooled: PooledContext):
+        self.pooled = pooled
+        self.context = pooled.context
+        self.healthy = True
+
+
+@asynccontextmanager
+async def order_context(
+    pool: Optional[BrowserContextPool],
+    browser: Browser,
+    context_options: dict,
+    request_blocker: Optional[RequestBlocker] = None,
+) -> AsyncIterator[ContextLease]:
+    """
+    Stellt den Browser-Kontext für eine Bestellung bereit.
+
+    Mit Pool: vorgewärmter Kontext, der nach der Bestellung zurückgesetzt wird.
+    Ohne Pool: frischer Kontext mit ``context_options``, der danach geschlossen wird.
+    Ein aktives Blockier-Profil gilt jeweils für die Dauer der Bestellung.
+    """
+    if pool:
+        async with pool.lease() as lease:
+            async with _blocking(lease.context, request_blocker):
+                yield lease
+        return
+
+    context = await browser.new_context(**context_options)
+    try:
+        async with _blocking(context, request_blocker):
+            yield ContextLease(PooledContext(context=context))
+    finally:
+        await context.close()
+
+
+@asynccontextmanager
+async def _blocking(context: BrowserContext, request_blocker: Optional[RequestBlocker]) -> AsyncIterator[None]:
+    """Hängt den Request-Blocker für die Dauer einer Bestellung an den Kontext."""
+    if not request_blocker:
+        yield
+        return
+    await request_blocker.attach_async(context)
+    try:
+        yield
+    finally:
+        await request_blocker.detach_async(context)
@@ -0,0 +1,91 @@
+"""
+Cookie-Banner akzeptieren (Usercentrics und Shopware 6 Standard).
+
+Wird von Tests (über ``conftest``), Page Objects und Hilfsmodulen wie
+``context_pool`` und ``auth_state`` verwendet.
+"""
+from playwright.sync_api import Page
+
+
+def accept_cookie_banner(page: Page, timeout: int = 3000) -> bool:
+    """
+    Akzeptiert das Cookie-Banner, falls sichtbar (sync Version).
+
+    Unterstützt:
+    - Usercentrics Banner (#accept.uc-accept-button)
+    - Shopware 6 Standard Banner (.js-cookie-accept-all-button)
+
+    Args:
+        page: Playwright Page-Instanz
+        timeout: Timeout in ms für die Sichtbarkeitsprüfung
+
+    Returns:
+        True wenn Banner akzeptiert wurde, False wenn nicht vorhanden
+    """
+    # Selektoren für verschiedene Cookie-Banner
+    cookie_selectors = [
+        "button#accept",  # Usercentrics (primär)
+        "#accept",  # Usercentrics (alternativ)
+        "button[data-action-type='accept']",  # Usercentrics data-attribute
+        ".js-cookie-accept-all-button",  # Shopware 6
+        "[data-cookie-accept-all]",  # Shopware 6 alternativ
+    ]
+
+    for selector in cookie_selectors:
+        try:
+            button = page.locator(selector)
+            if button.is_visible(timeout=timeout):
+                button.click()
+                # Warten bis Banner verschwindet
+                banner = page.locator("#usercentrics-cmp-ui")
+                try:
+                    banner.wait_for(state="hidden", timeout=5000)
+                except Exception:
+                    pass  # Banner evtl. anders strukturiert
+                return True
+        except Exception:
+            continue
+
+    return False
+
+
+async def accept_cookie_banner_async(page, timeout: int = 3000) -> bool:
+    """
+    Akzeptiert das Cookie-Banner, falls sichtbar (async Version).
+
+    Unterstützt:
+    - Usercentrics Banner (#accept.uc-accept-button)
+    - Shopware 6 Standard Banner (.js-cookie-accept-all-button)
+
+    Args:
+        page: Playwright async Page-Instanz
+        timeout: Timeout in ms für die Sichtbarkeitsprüfung
+
+    Returns:
+        True wenn Banner akzeptiert wurde, False wenn nicht vorhanden
+    """
+    # Selektoren für verschiedene Cookie-Banner
+    cookie_selectors = [
+        "button#accept",  # Usercentrics (primär)
+        "#accept",  # Usercentrics (alternativ)
+        "button[data-action-type='accept']",  # Usercentrics data-attribute
+        ".js-cookie-accept-all-button",  # Shopware 6
+        "[data-cookie-accept-all]",  # Shopware 6 alternativ
+    ]
+
+    for selector in cookie_selectors:
+        try:
+            button = page.locator(selector)
+            if await button.is_visible(timeout=timeout):
+                await button.click()
+                # Warten bis Banner verschwindet
+                banner = page.locator("#usercentrics-cmp-ui")
+                try:
+                    await banner.wait_for(state="hidden", timeout=5000)
+                except Exception:
+                    pass  # Banner evtl. anders strukturiert
+                return True
+        except Exception:
+            continue
+
+    return False
@@ -0,0 +1,485 @@
+"""
+Verteilte Lasterzeugung: ein Koordinator, mehrere Agenten (z.B. Docker-Replikas).
+
+``run_shards`` verteilt einen Lauf auf Prozesse einer Maschine. Für Lasten,
+die ein Rechner nicht erzeugen kann (Sale-Day-Ansturm), melden sich mehrere
+``test-runner``-Container als Agenten bei einem Koordinator an:
+
+- Der Koordinator plant alle Bestellungen und vergibt sie in Batches
+  (``lease``), sobald ein Agent freie Worker meldet.
+- Eine globale Startrate (Token-Bucket über alle Agenten) begrenzt, wie
+  schnell Bestellungen vergeben werden.
+- Globale Abbruchbedingungen (Fehlerrate, Maximaldauer) stoppen die Vergabe
+  für alle Agenten gleichzeitig.
+- Agenten melden Ergebnisse laufend zurück; meldet sich ein Agent länger
+  nicht, zählen seine offenen Bestellungen als fehlgeschlagen (nicht neu
+  vergeben, da sie im Shop bereits angelegt sein könnten).
+
+Der Koordinator liefert dieselben Nachrichten wie ``run_shards``
+(``ShardMessage``), sodass die Zusammenführung identisch bleibt. Transport ist
+JSON über HTTP (nur Standardbibliothek).
+"""
+import json
+import queue
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Iterator, Optional
+
+from playwright_tests.utils.sharding import ShardMessage
+
+
+@dataclass
+class AgentState:
+    """Stand eines angemeldeten Agenten."""
+    name: str
+    capacity: int
+    last_seen: float
+    leased: set[int] = field(default_factory=set)
+    started: bool = False
+    reported: int = 0
+    done: bool = False
+    lost: bool = False
+
+
+class Coordinator:
+    """
+    Vergabe eines Bestellplans an Agenten mit globaler Rate und Abbruchbedingung.
+
+    Thread-sicher; der HTTP-Server ruft die Methoden aus Handler-Threads auf.
+    Nachrichten für die Zusammenführung liefert ``messages()``.
+
+    Beispiel:
+        coordinator = Coordinator(plan, rate_per_minute=600, min_agents=3)
+        with CoordinatorServer(coordinator, port=8765):
+            for kind, agent, payload in coordinator.messages():
+                ...
+    """
+
+    def __init__(
+        self,
+        plan: list[dict],
+        rate_per_minute: float = 0.0,
+        burst: int = 5,
+        batch_size: int = 5,
+        min_agents: int = 1,
+        register_timeout_seconds: float = 120.0,
+        stop_error_rate: float = 0.0,
+        stop_min_orders: int = 20,
+        max_duration_seconds: float = 0.0,
+        agent_timeout_seconds: float = 120.0,
+        settings: Optional[dict] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            plan: Plan-Einträge mit ``order_num`` (z.B. ``PerformanceTestRunner._plan_orders()``)
+            rate_per_minute: Globale Startrate über alle Agenten (0 = unbegrenzt)
+            burst: Maximal angesparte Starts des Token-Buckets
+            batch_size: Maximale Bestellungen pro Vergabe
+            min_agents: Vergabe erst, wenn so viele Agenten angemeldet sind
+                (oder ``register_timeout_seconds`` abgelaufen ist)
+            stop_error_rate: Vergabe stoppen, wenn die Fehlerrate darüber liegt (0 = nie)
+            stop_min_orders: Fehlerrate erst ab so vielen Ergebnissen prüfen
+            max_duration_seconds: Vergabe nach dieser Dauer stoppen (0 = unbegrenzt)
+            agent_timeout_seconds: Agent gilt als ausgefallen, wenn er sich so lange nicht meldet
+            settings: Einstellungen, die jeder Agent bei der Anmeldung erhält
+        """
+        self.pending = list(plan)
+        self.entries = {entry["order_num"]: entry for entry in plan}
+        self.rate_per_second = rate_per_minute / 60
+        self.burst = max(1, burst)
+        self.batch_size = max(1, batch_size)
+        self.min_agents = min_agents
+        self.register_timeout_seconds = register_timeout_seconds
+        self.stop_error_rate = stop_error_rate
+        self.stop_min_orders = stop_min_orders
+        self.max_duration_seconds = max_duration_seconds
+        self.agent_timeout_seconds = agent_timeout_seconds
+        self.settings = settings or {}
+        self.clock = clock
+
+        self.agents: dict[str, AgentState] = {}
+        self.stop_reason: Optional[str] = None
+        self.finished_orders = 0
+        self.failed_orders = 0
+        self._created = clock()
+        self._first_lease: Optional[float] = None
+        self._tokens = float(self.burst)
+        self._refilled = self._created
+        self._lock = threading.Lock()
+        self._events: queue.Queue = queue.Queue()
+
+    # -------------------------------------------------------------------------
+    # Agenten-Schnittstelle
+    # -------------------------------------------------------------------------
+
+    def register(self, name: str, capacity: int) -> dict:
+        """Meldet einen Agenten an; ein erneutes Anmelden (Neustart) übernimmt den Namen."""
+        with self._lock:
+            agent = self.agents.get(name)
+            if agent and agent.leased:
+                self._fail_leased(agent, f"Agent {name} neu gestartet - Ergebnis fehlt")
+            self.agents[name] = AgentState(name=name, capacity=capacity, last_seen=self.clock())
+            return {"settings": self.settings, "finished": self._exhausted()}
+
+    def lease(self, name: str, max_orders: int) -> dict:
+        """
+        Vergibt bis zu ``max_orders`` Bestellungen und dient zugleich als Heartbeat.
+
+        Returns:
+            ``{"orders": [...], "retry_after": Sekunden, "finished": bool}``;
+            ``finished`` heißt: keine weiteren Bestellungen mehr, Agent kann enden.
+        """
+        with self._lock:
+            agent = self._touch(name)
+            self._check_duration()
+            if self._exhausted() or agent.lost:
+                return {"orders": [], "retry_after": 0.0, "finished": True}
+            if max_orders <= 0:
+                return {"orders": [], "retry_after": 0.0, "finished": False}
+            if not self._enough_agents():
+                return {"orders": [], "retry_after": 1.0, "finished": False}
+
+            count = min(max_orders, self.batch_size, len(self.pending))
+            retry_after = 0.0
+            if self.rate_per_second > 0:
+                self._refill()
+                count = min(count, int(self._tokens))
+                self._tokens -= count
+                if count == 0:
+                    retry_after = (1 - self._tokens) / self.rate_per_second
+
+            orders, self.pending = self.pending[:count], self.pending[count:]
+            if orders:
+                if self._first_lease is None:
+                    self._first_lease = self.clock()
+                agent.leased.update(entry["order_num"] for entry in orders)
+                if not agent.started:
+                    agent.started = True
+                    self._events.put((ShardMessage.STARTED, name, time.time()))
+            return {"orders": orders, "retry_after": retry_after, "finished": False}
+
+    def report(self, name: str, results: list[dict]) -> dict:
+        """
+        Übernimmt Ergebnisse eines Agenten.
+
+        Args:
+            results: ``{"order_num", "result", "finished_at"}`` pro Bestellung
+        """
+        with self._lock:
+            agent = self._touch(name)
+            for item in results:
+                if item["order_num"] not in agent.leased:
+                    continue  # bereits als verloren gewertet
+                agent.leased.discard(item["order_num"])
+                agent.reported += 1
+                self._count(item["result"]["success"])
+                self._events.put((ShardMessage.RESULT, name, {
+                    "result": item["result"], "finished_at": item["finished_at"],
+                }))
+            self._check_error_rate()
+            return {"finished": self._exhausted()}
+
+    def finish(self, name: str, payload: Optional[dict]) -> dict:
+        """Abschlussmeldung eines Agenten (Zusatzdaten wie bei Shards)."""
+        with self._lock:
+            agent = self._touch(name)
+            if agent.leased:
+                self._fail_leased(agent, f"Agent {name} beendet ohne Ergebnis")
+            agent.done = True
+            self._events.put((ShardMessage.DONE, name, payload))
+            return {}
+
+    # -------------------------------------------------------------------------
+    # Koordinator-Seite
+    # -------------------------------------------------------------------------
+
+    def expire_agents(self) -> None:
+        """Wertet Agenten ohne Meldung seit ``agent_timeout_seconds`` als ausgefallen."""
+        with self._lock:
+            now = self.clock()
+            for agent in self.agents.values():
+                if agent.done or agent.lost or now - agent.last_seen < self.agent_timeout_seconds:
+                    continue
+                agent.lost = True
+                self._events.put((ShardMessage.ERROR, agent.name,
+                                  f"keine Meldung seit {now - agent.last_seen:.0f}s"))
+                self._fail_leased(agent, f"Agent {agent.name} ausgefallen - Ergebnis fehlt")
+
+    @property
+    def finished(self) -> bool:
+        """Keine Bestellung mehr offen und alle angemeldeten Agenten fertig oder ausgefallen."""
+        with self._lock:
+            return (
+                self._exhausted()
+                and (bool(self.agents) or self.stop_reason is not None)
+                and all(agent.done or agent.lost for agent in self.agents.values())
+            )
+
+    def messages(self, timeout_seconds: Optional[float] = None, poll_seconds: float = 1.0) -> Iterator[tuple[str, str, Any]]:
+        """
+        Liefert ``(art, agent, payload)`` bis alle Agenten fertig sind.
+
+        Nach ``timeout_seconds`` wird die Vergabe gestoppt und noch offene
+        Bestellungen zählen als fehlgeschlagen.
+        """
+        deadline = self.clock() + timeout_seconds if timeout_seconds else None
+        while True:
+            try:
+                yield self._events.get(timeout=poll_seconds)
+                continue
+            except queue.Empty:
+                pass
+            self.expire_agents()
+            if deadline and self.clock() > deadline:
+                with self._lock:
+                    self._stop("Gesamt-Timeout erreicht")
+                    for agent in self.agents.values():
+                        if not agent.done and not agent.lost:
+                            agent.lost = True
+                            self._fail_leased(agent, f"Agent {agent.name}: Gesamt-Timeout - Ergebnis fehlt")
+                deadline = None
+            if self.finished and self._events.empty():
+                return
+
+    def status(self) -> dict:
+        """Kennzahlen der Vergabe für Reports."""
+        with self._lock:
+            return {
+                "agents": {
+                    agent.name: {
+                        "capacity": agent.capacity,
+                        "reported": agent.reported,
+                        "state": "lost" if agent.lost else "done" if agent.done else "running",
+                    }
+                    for agent in self.agents.values()
+                },
+                "planned": len(self.entries),
+                "finished": self.finished_orders,
+                "failed": self.failed_orders,
+                "not_started": len(self.pending),
+                "stop_reason": self.stop_reason,
+                "rate_per_minute": round(self.rate_per_second * 60, 1),
+            }
+
+    # -------------------------------------------------------------------------
+    # Intern (Aufrufer hält den Lock)
+    # -------------------------------------------------------------------------
+
+    def _touch(self, name: str) -> AgentState:
+        agent = self.agents.get(name)
+        if agent is None:
+            # Koordinator neu gestartet oder Anmeldung verpasst: nachträglich anmelden
+            agent = self.agents[name] = AgentState(name=name, capacity=0, last_seen=self.clock())
+        agent.last_seen = self.clock()
+        return agent
+
+    def _exhausted(self) -> bool:
+        return self.stop_reason is not None or not self.pending
+
+    def _enough_agents(self) -> bool:
+        if len(self.agents) >= self.min_agents:
+            return True
+        return self.clock() - self._created >= self.register_timeout_seconds
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate_per_second)
+        self._refilled = now
+
+    def _count(self, success: bool) -> None:
+        self.finished_orders += 1
+        if not success:
+            self.failed_orders += 1
+
+    def _stop(self, reason: str) -> None:
+        if self.stop_reason is None:
+            self.stop_reason = reason
+
+    def _check_error_rate(self) -> None:
+        if not self.stop_error_rate or self.finished_orders < self.stop_min_orders:
+            return
+        rate = self.failed_orders / self.finished_orders
+        if rate > self.stop_error_rate:
+            self._stop(f"Fehlerrate {rate:.0%} über {self.stop_error_rate:.0%}")
+
+    def _check_duration(self) -> None:
+        if self.max_duration_seconds and self._first_lease is not None:
+            if self.clock() - self._first_lease > self.max_duration_seconds:
+                self._stop(f"Maximaldauer {self.max_duration_seconds:.0f}s erreicht")
+
+    def _fail_leased(self, agent: AgentState, message: str) -> None:
+        """Meldet die offenen Bestellungen eines Agenten als fehlgeschlagen."""
+        for order_num in sorted(agent.leased):
+            entry = self.entries[order_num]
+            self._count(False)
+            self._events.put((ShardMessage.RESULT, agent.name, {
+                "result": {
+                    "success": False,
+                    "error_message": message,
+                    "order_type": entry["order_type"],
+                    "product_ids": entry["product_ids"],
+                },
+                "finished_at": time.time(),
+            }))
+        agent.leased.clear()
+
+
+# =============================================================================
+# HTTP-Transport
+# =============================================================================
+
+class _Handler(BaseHTTPRequestHandler):
+    """JSON-Endpunkte ``/register``, ``/lease``, ``/report``, ``/finish`` (POST) und ``/status`` (GET)."""
+
+    coordinator: Coordinator  # über die Unterklasse in CoordinatorServer gesetzt
+
+    def do_GET(self) -> None:
+        if self.path == "/status":
+            self._reply(200, self.coordinator.status())
+        else:
+            self._reply(404, {"error": "unbekannter Pfad"})
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+            name = body["agent"]
+            if self.path == "/register":
+                reply = self.coordinator.register(name, body.get("capacity", 0))
+            elif self.path == "/lease":
+                reply = self.coordinator.lease(name, body.get("max_orders", 0))
+            elif self.path == "/report":
+                reply = self.coordinator.report(name, body.get("results", []))
+            elif self.path == "/finish":
+                reply = self.coordinator.finish(name, body.get("payload"))
+            else:
+                self._reply(404, {"error": "unbekannter Pfad"})
+                return
+        except (KeyError, ValueError) as e:
+            self._reply(400, {"error": str(e)})
+            return
+        self._reply(200, reply)
+
+    def _reply(self, status: int, data: dict) -> None:
+        body = json.dumps(data, ensure_ascii=False, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass  # kein Log pro Request (Heartbeats im Sekundentakt)
+
+
+class CoordinatorServer:
+    """
+    HTTP-Server für einen ``Coordinator`` in einem Hintergrund-Thread.
+
+    Beispiel:
+        with CoordinatorServer(coordinator, host="0.0.0.0", port=8765) as server:
+            print(server.url)
+    """
+
+    def __init__(self, coordinator: Coordinator, host: str = "0.0.0.0", port: int = 8765):
+        handler = type("CoordinatorHandler", (_Handler,), {"coordinator": coordinator})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{'localhost' if host in ('0.0.0.0', '') else host}:{port}"
+
+    def start(self) -> "CoordinatorServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="coordinator", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "CoordinatorServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+class CoordinatorUnavailable(Exception):
+    """Koordinator nicht erreichbar (auch nach Wiederholungen)."""
+
+
+class AgentClient:
+    """
+    HTTP-Client eines Agenten (blockierend; im Event-Loop per ``asyncio.to_thread``).
+
+    Beispiel:
+        client = AgentClient("http://coordinator:8765", name="agent-1")
+        settings = client.register(capacity=10)["settings"]
+        orders = client.lease(10)["orders"]
+    """
+
+    def __init__(self, url: str, name: str, timeout_seconds: float = 10.0, retries: int = 5):
+        self.url = url.rstrip("/")
+        self.name = name
+        self.timeout_seconds = timeout_seconds
+        self.retries = retries
+
+    def _post(self, path: str, data: dict, retries: Optional[int] = None) -> dict:
+        body = json.dumps({"agent": self.name, **data}, default=str).encode("utf-8")
+        attempts = (self.retries if retries is None else retries) + 1
+        for attempt in range(attempts):
+            request = urllib.request.Request(
+                self.url + path, data=body, headers={"Content-Type": "application/json"}, method="POST",
+            )
+            try:
+                with urllib.request.urlopen(request, timeout=self.timeout_seconds) as response:
+                    return json.loads(response.read())
+            except (urllib.error.URLError, ConnectionError, TimeoutError) as e:
+                if attempt == attempts - 1:
+                    raise CoordinatorUnavailable(f"{self.url}{path}: {e}") from e
+                time.sleep(min(2 ** attempt, 10))  # readiness: allow-sleep (Backoff)
+        raise CoordinatorUnavailable(self.url)  # pragma: no cover
+
+    def register(self, capacity: int, wait_seconds: float = 120.0) -> dict:
+        """Meldet den Agenten an; wartet bis ``wait_seconds``, falls der Koordinator noch startet."""
+        deadline = time.monotonic() + wait_seconds
+        while True:
+            try:
+                return self._post("/register", {"capacity": capacity}, retries=0)
+            except CoordinatorUnavailable:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(2)  # readiness: allow-sleep (Koordinator startet noch)
+
+    def lease(self, max_orders: int) -> dict:
+        return self._post("/lease", {"max_orders": max_orders})
+
+    def report(self, results: list[dict]) -> dict:
+        return self._post("/report", {"results": results})
+
+    def finish(self, payload: Optional[dict]) -> dict:
+        return self._post("/finish", {"payload": payload})
+
+
+def format_distributed(stats: dict) -> str:
+    """Einzeilige Zusammenfassung der verteilten Vergabe für Konsolen-Reports."""
+    agents = stats["agents"]
+    lost = sum(1 for agent in agents.values() if agent["state"] == "lost")
+    text = f"{len(agents)} Agenten"
+    if lost:
+        text += f" ({lost} ausgefallen)"
+    text += f", {stats['finished']}/{stats['planned']} Bestellungen"
+    if stats["rate_per_minute"]:
+        text += f", Rate {stats['rate_per_minute']:.0f}/min"
+    if stats["stop_reason"]:
+        text += f", gestoppt: {stats['stop_reason']} ({stats['not_started']} nicht gestartet)"
+    return text
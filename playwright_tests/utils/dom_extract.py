@@ -0,0 +1,116 @@
+"""
+Gebündeltes Auslesen des DOM: eine ``evaluate``-Runde statt vieler Locator-Aufrufe.
+
+Jeder ``count()``/``text_content()``/``input_value()``-Aufruf ist eine eigene
+Runde zwischen Python und Browser. Beim Auslesen einer Liste (Warenkorb-
+Positionen, Zahlungsarten, Formularfehler) summiert sich das auf
+Positionen x Felder Runden. Hier werden die Felder deklarativ als
+``DomField`` beschrieben und in einem einzigen ``evaluate_all``-Aufruf im
+Browser gelesen:
+
+    ITEM = {
+        "name": DomField(".line-item-label"),
+        "quantity": DomField("input[name='quantity']", read="value"),
+    }
+    rows = await extract_all(page.locator(".line-item"), ITEM)
+    # [{"name": "Kurzarmshirt", "quantity": "2"}, ...]
+
+Ganze Ansichten (Positionen plus Summen) gehen mit verschachtelten Feldern
+ebenfalls in einer Runde, siehe ``extract``.
+
+Selektoren innerhalb von ``DomField`` laufen über ``querySelectorAll`` und
+müssen reines CSS sein (kein ``:has-text``). Der äußere Selektor von
+``extract_all`` ist ein normaler Playwright-Selektor.
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+
+# Lesearten eines Felds
+READS = ("text", "value", "attr", "checked", "label", "count", "exists")
+
+# Wird im Browser ausgeführt: (elements, spec) -> ein Datensatz pro Element
+EXTRACT_SCRIPT = """
+(elements, spec) => {
+    const labelOf = (el) => {
+        const label = (el.labels && el.labels[0])
+            || (el.id && document.querySelector(`label[for="${CSS.escape(el.id)}"]`));
+        return label ? label.textContent.trim() : null;
+    };
+    const readOne = (el, field) => {
+        if (!el) return null;
+        if (field.fields) {
+            const record = {};
+            for (const [name, sub] of Object.entries(field.fields)) record[name] = extract(el, sub);
+            return record;
+        }
+        switch (field.read) {
+            case 'value': return 'value' in el ? el.value : el.getAttribute('value');
+            case 'attr': return el.getAttribute(field.attr);
+            case 'checked': return !!el.checked;
+            case 'label': return labelOf(el);
+            default: return (el.textContent || '').trim();
+        }
+    };
+    const extract = (scope, field) => {
+        const found = field.selector ? Array.from(scope.querySelectorAll(field.selector)) : [scope];
+        if (field.read === 'count') return found.length;
+        if (field.read === 'exists') return found.length > 0;
+        return field.all ? found.map((el) => readOne(el, field)) : readOne(found[0], field);
+    };
+    return elements.map((el) => readOne(el, spec));
+}
+"""
+
+
+@dataclass
+class DomField:
+    """
+    Ein Feld, das relativ zu einem Element gelesen wird.
+
+    Ohne Treffer ist der Wert ``None`` (bei ``all`` eine leere Liste).
+    """
+    selector: str = ""  # reines CSS relativ zum Element ("" = das Element selbst)
+    read: str = "text"  # text (getrimmt), value, attr, checked, label, count, exists
+    attr: str = ""  # Attributname für read="attr"
+    all: bool = False  # alle Treffer als Liste statt nur des ersten
+    fields: Optional[dict[str, "DomField"]] = None  # verschachtelter Datensatz pro Treffer
+
+    def __post_init__(self):
+        if self.read not in READS:
+            raise ValueError(f"Unbekannte Leseart '{self.read}' (erlaubt: {', '.join(READS)})")
+        if self.read == "attr" and not self.attr:
+            raise ValueError("read='attr' braucht einen Attributnamen")
+        if ":has-text(" in self.selector or ":text(" in self.selector:
+            raise ValueError(f"Selektor '{self.selector}' ist kein reines CSS")
+
+    def to_js(self) -> dict:
+        """Serialisierbare Form für ``EXTRACT_SCRIPT``."""
+        spec = {"selector": self.selector, "read": self.read, "attr": self.attr, "all": self.all}
+        if self.fields is not None:
+            spec["fields"] = {name: field.to_js() for name, field in self.fields.items()}
+        return spec
+
+
+async def extract_all(locator, fields: dict[str, DomField]) -> list[dict]:
+    """
+    Liest ``fields`` für jedes Element des Locators - in einer Runde.
+
+    Args:
+        locator: Playwright-Locator (async); keine Treffer ergeben eine leere Liste
+        fields: Feldname -> ``DomField``
+
+    Returns:
+        Ein Dict pro Element, Schlüssel wie ``fields``
+    """
+    return await locator.evaluate_all(EXTRACT_SCRIPT, DomField(fields=fields).to_js())
+
+
+async def extract(page, fields: dict[str, DomField], root: str = "html") -> dict:
+    """
+    Liest eine ganze Ansicht unterhalb von ``root`` in einer Runde.
+
+    Fehlt ``root``, sind alle Werte ``None``.
+    """
+    rows = await extract_all(page.locator(root), fields)
+    return rows[0] if rows else dict.fromkeys(fields)
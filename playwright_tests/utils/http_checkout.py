@@ -0,0 +1,492 @@
+"""
+Checkout auf Protokoll-Ebene: Bestellungen als reine HTTP-Requests, ohne Browser.
+
+Ein Browser-Checkout kostet 50-80 MB und mehrere CPU-Sekunden pro Bestellung,
+damit ist bei etwa 15 parallelen Nutzern Schluss. ``HttpCheckout`` spielt
+denselben Storefront-Ablauf als Formular-Requests nach:
+
+1. Produktseite laden (GET), Produkt-ID aus dem Kaufformular lesen
+2. ``/checkout/line-item/add`` (POST, wie ``CartSeeder``)
+3. ``/checkout/register`` laden, Gast-Registrierung an ``/account/register``
+   senden (bzw. Login an ``/account/login`` für registrierte Kunden)
+4. Zahlungsart auf ``/checkout/confirm`` wählen (``/checkout/configure``)
+5. Bestellung an ``/checkout/order`` senden, Bestellnummer von ``/checkout/finish``
+
+Versteckte Formularfelder (``redirectTo``, ``_csrf_token`` usw.) werden aus
+dem HTML der jeweiligen Seite übernommen. Bis Shopware 6.4 (CSRF-Modus
+``twig``) steht das Token dort in jedem Formular; ab 6.5 gibt es keins mehr.
+Im Modus ``ajax`` fehlt es im HTML - für Lasttests dann ``twig`` einstellen.
+
+Die Requests laufen über Playwrights ``APIRequestContext`` (async, ohne
+Browser-Prozess). Jede Sitzung des ``HttpSessionPool`` hat eigene Cookies und
+hält ihre Verbindungen offen; nach einer Bestellung wird sie per Logout
+zurückgesetzt und für die nächste wiederverwendet. Zahlungsarten mit
+Weiterleitung zu einem externen Anbieter (z.B. Kreditkarte) enden nicht auf
+der Bestätigungsseite und sind hier nicht nutzbar.
+"""
+import contextlib
+import re
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Iterable, Optional
+
+from ..pages.checkout_page import Address, CheckoutPage
+from .cart_seeding import LINE_ITEM_ADD, line_item_form, parse_product_id
+from .storefront_html import HtmlForm, StorefrontHtml
+
+
+CHECKOUT_CART = "/checkout/cart"
+CHECKOUT_PROMOTION_ADD = "/checkout/promotion/add"
+CHECKOUT_REGISTER = "/checkout/register"
+CHECKOUT_CONFIRM = "/checkout/confirm"
+CHECKOUT_CONFIGURE = "/checkout/configure"
+CHECKOUT_ORDER = "/checkout/order"
+CHECKOUT_FINISH = "/checkout/finish"
+ACCOUNT_REGISTER = "/account/register"
+ACCOUNT_LOGIN = "/account/login"
+ACCOUNT_LOGOUT = "/account/logout"
+# Adressbuch-Widget des Checkout-Modals (auch für Gäste; /account/address nur mit Login)
+ADDRESS_BOOK = "/widgets/account/address-book"
+
+# Finish-Seite: /checkout/finish?orderId=<uuid>, "Ihre Bestellnummer: 10001"
+ORDER_ID_RE = re.compile(r"orderId=([0-9a-fA-F-]+)")
+ORDER_NUMBER_RE = re.compile(r"finish-ordernumber.{0,300}?(\d{5,})", re.S)
+
+
+class HttpCheckoutError(Exception):
+    """Ein Schritt des HTTP-Checkouts ist fehlgeschlagen."""
+
+
+def parse_order_id(url: str) -> Optional[str]:
+    """Liest die Order-ID aus der URL der Finish-Seite."""
+    match = ORDER_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+def parse_order_number(html: str) -> Optional[str]:
+    """Liest die Bestellnummer aus der Finish-Seite."""
+    match = ORDER_NUMBER_RE.search(html)
+    return match.group(1) if match else None
+
+
+def guest_register_data(page: StorefrontHtml, address: Address) -> dict[str, str]:
+    """
+    Formulardaten für die Gast-Registrierung (``/account/register``) aus einer ``Address``.
+
+    Anrede und Land werden wie im Browser über ihre Beschriftung gewählt
+    (``CheckoutPage.SALUTATION_MAP`` / ``COUNTRY_MAP``).
+
+    Raises:
+        HttpCheckoutError: Wenn Formular, Anrede oder Land fehlen
+    """
+    form = page.form(ACCOUNT_REGISTER)
+    if form is None:
+        raise HttpCheckoutError("Kein Registrierungsformular auf /checkout/register")
+
+    salutation_label = CheckoutPage.SALUTATION_MAP.get(address.salutation, address.salutation)
+    salutation = page.choice("salutationId", salutation_label)
+    country_label = CheckoutPage.COUNTRY_MAP.get(address.country, address.country)
+    country = page.choice("billingAddress[countryId]", country_label)
+    if salutation is None:
+        raise HttpCheckoutError(f"Anrede '{salutation_label}' nicht im Formular")
+    if country is None:
+        raise HttpCheckoutError(f"Land '{country_label}' nicht im Formular")
+
+    values = {
+        "guest": "1",
+        "accountType": address.account_type,
+        "salutationId": salutation.value,
+        "firstName": address.first_name,
+        "lastName": address.last_name,
+        "email": address.email,
+        "billingAddress[street]": address.street,
+        "billingAddress[zipcode]": address.zip_code,
+        "billingAddress[city]": address.city,
+        "billingAddress[countryId]": country.value,
+        "acceptedDataProtection": "1",
+    }
+    if address.phone:
+        values["billingAddress[phoneNumber]"] = address.phone
+    if address.account_type == "business":
+        for key, value in (("company", address.company), ("department", address.department)):
+            if value:
+                values[f"billingAddress[{key}]"] = value
+        if address.vat_id:
+            values["vatIds[]"] = address.vat_id
+
+    data = form.data(values)
+    data.pop("createCustomerAccount", None)  # ohne Haken: Gastbestellung
+    return data
+
+
+@dataclass
+class HttpOrder:
+    """Ergebnis einer Bestellung auf Protokoll-Ebene."""
+    order_id: Optional[str] = None
+    order_number: Optional[str] = None
+    payment_method: str = ""
+    requests: int = 0
+    duration_seconds: float = 0.0
+    # Dauer pro Schritt (Sekunden): http_pdp, http_cart, http_register/http_login, http_payment, http_order
+    step_durations: dict[str, float] = field(default_factory=dict)
+
+
+class HttpCheckout:
+    """
+    Führt Bestellungen per HTTP über einen ``APIRequestContext`` aus.
+
+    Beispiel:
+        checkout = HttpCheckout(base_url, config.payment_method_aliases)
+        async with pool.lease() as session:
+            order = await checkout.guest_order(session.context, ["p/duftkissen/ge-p-49415"], address, "Rechnung")
+            await checkout.reset(session.context)
+    """
+
+    def __init__(self, base_url: str, payment_aliases: Optional[dict[str, str]] = None, timeout: int = 30000):
+        """
+        Args:
+            base_url: Shop-URL
+            payment_aliases: Alias -> Beschriftung der Zahlungsart (``payment_method_aliases``)
+            timeout: Timeout pro Request in ms
+        """
+        self.base_url = base_url.rstrip("/")
+        self.payment_aliases = payment_aliases or {}
+        self.timeout = timeout
+
+    def _url(self, path: str) -> str:
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    @contextlib.contextmanager
+    def _step(self, order: HttpOrder, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            order.step_durations[name] = order.step_durations.get(name, 0.0) + time.perf_counter() - start
+
+    async def _get(self, request, order: HttpOrder, path: str) -> tuple[str, str]:
+        """GET mit Redirects; gibt finale URL und HTML zurück."""
+        order.requests += 1
+        response = await request.get(self._url(path), timeout=self.timeout)
+        if not response.ok:
+            raise HttpCheckoutError(f"GET {path}: HTTP {response.status}")
+        return response.url, await response.text()
+
+    async def _post(self, request, order: HttpOrder, path: str, data: dict[str, str]) -> tuple[str, str]:
+        """Formular-POST mit Redirects; gibt finale URL und HTML zurück."""
+        order.requests += 1
+        response = await request.post(self._url(path), form=data, timeout=self.timeout)
+        if not response.ok:
+            raise HttpCheckoutError(f"POST {path}: HTTP {response.status}")
+        return response.url, await response.text()
+
+    @staticmethod
+    def _expect(url: str, html: str, path: str, step: str) -> StorefrontHtml:
+        """Prüft, ob ein Schritt auf ``path`` gelandet ist; sonst Fehler mit den Meldungen der Seite."""
+        page = StorefrontHtml(html)
+        if path not in url:
+            details = "; ".join(page.errors[:3]) or f"gelandet auf {url}"
+            raise HttpCheckoutError(f"{step} fehlgeschlagen: {details}")
+        return page
+
+    async def add_to_cart(self, request, order: HttpOrder, product_paths: Iterable[str]) -> None:
+        """Lädt jede Produktseite und legt das Produkt in den Warenkorb."""
+        for product_path in product_paths:
+            with self._step(order, "http_pdp"):
+                _, html = await self._get(request, order, product_path)
+            product_id = parse_product_id(html)
+            if not product_id:
+                raise HttpCheckoutError(f"Kein Kaufformular auf {product_path} gefunden")
+            buy_form = StorefrontHtml(html).form(LINE_ITEM_ADD)
+            data = line_item_form(product_id, 1)
+            with self._step(order, "http_cart"):
+                await self._post(request, order, LINE_ITEM_ADD, buy_form.data(data) if buy_form else data)
+
+    async def apply_promotion(self, request, order: HttpOrder, code: str) -> None:
+        """Löst einen Aktionscode im Warenkorb ein."""
+        with self._step(order, "http_promotion"):
+            _, html = await self._get(request, order, CHECKOUT_CART)
+            form = StorefrontHtml(html).form(CHECKOUT_PROMOTION_ADD)
+            data = {"code": code, "redirectTo": "frontend.checkout.cart.page"}
+            _, html = await self._post(request, order, CHECKOUT_PROMOTION_ADD, form.data(data) if form else data)
+        errors = StorefrontHtml(html).errors
+        if errors:
+            raise HttpCheckoutError(f"Aktionscode {code} abgelehnt: {'; '.join(errors[:3])}")
+
+    async def register_guest(self, request, order: HttpOrder, address: Address) -> StorefrontHtml:
+        """Sendet die Gast-Registrierung; gibt die Confirm-Seite zurück."""
+        with self._step(order, "http_register"):
+            _, html = await self._get(request, order, CHECKOUT_REGISTER)
+            data = guest_register_data(StorefrontHtml(html), address)
+            url, html = await self._post(request, order, ACCOUNT_REGISTER, data)
+        return self._expect(url, html, CHECKOUT_CONFIRM, "Gast-Registrierung")
+
+    async def login(self, request, order: HttpOrder, email: str, password: str) -> None:
+        """Meldet einen registrierten Kunden an."""
+        with self._step(order, "http_login"):
+            _, html = await self._get(request, order, ACCOUNT_LOGIN)
+            form = StorefrontHtml(html).form(ACCOUNT_LOGIN)
+            if form is None:
+                raise HttpCheckoutError("Kein Login-Formular auf /account/login")
+            url, html = await self._post(request, order, ACCOUNT_LOGIN, form.data({"username": email, "password": password}))
+        if ACCOUNT_LOGIN in url:
+            details = "; ".join(StorefrontHtml(html).errors[:3])
+            raise HttpCheckoutError(f"Login fehlgeschlagen für {email}" + (f": {details}" if details else ""))
+
+    async def confirm_page(self, request, order: HttpOrder) -> StorefrontHtml:
+        """Lädt die Confirm-Seite (Warenkorb, Adressen, Versand- und Zahlungsarten)."""
+        with self._step(order, "http_confirm"):
+            url, html = await self._get(request, order, CHECKOUT_CONFIRM)
+        return self._expect(url, html, CHECKOUT_CONFIRM, "Confirm-Seite")
+
+    async def address_form(self, request, order: HttpOrder) -> HtmlForm:
+        """
+        Bearbeiten-Formular der Lieferadresse aus dem Adressbuch-Widget.
+
+        Das Widget ist das Adress-Modal der Confirm-Seite und steht auch
+        Gästen offen; die Seiten unter ``/account/address`` leiten Gäste auf
+        den Login um.
+        """
+        data = {"changeableAddresses[changeShipping]": "1", "changeableAddresses[changeBilling]": "1"}
+        with self._step(order, "http_address"):
+            url, html = await self._post(request, order, ADDRESS_BOOK, data)
+        if ACCOUNT_LOGIN in url:
+            raise HttpCheckoutError("Adressbuch-Widget verlangt einen Login (Session abgelaufen?)")
+        page = StorefrontHtml(html)
+        form = next((f for f in page.forms if ADDRESS_BOOK in f.action and f.fields.get("address[id]")), None)
+        if form is None:
+            raise HttpCheckoutError(f"Kein Adressformular im Adressbuch-Widget ({ADDRESS_BOOK})")
+        return form
+
+    async def save_address(self, request, order: HttpOrder, form: HtmlForm, values: dict[str, str]) -> None:
+        """
+        Speichert die Adresse mit geänderten Feldern.
+
+        Args:
+            form: Formular aus ``address_form``
+            values: Feldname ohne Präfix -> Wert, z.B. ``{"zipcode": "4020", "city": "Linz"}``
+        """
+        data = form.data({f"address[{name}]": value for name, value in values.items()})
+        with self._step(order, "http_address"):
+            url, html = await self._post(request, order, form.action, data)
+        if ACCOUNT_LOGIN in url:
+            raise HttpCheckoutError("Adresse nicht gespeichert: Weiterleitung auf den Login")
+        errors = StorefrontHtml(html).errors
+        if errors:
+            raise HttpCheckoutError(f"Adresse nicht gespeichert: {'; '.join(errors[:3])}")
+
+    async def select_payment(self, request, order: HttpOrder, page: StorefrontHtml, method: str) -> StorefrontHtml:
+        """
+        Wählt die Zahlungsart (Alias oder Beschriftung) auf der Confirm-Seite.
+
+        Ist sie bereits gewählt, entfällt der Request.
+        """
+        label = self.payment_aliases.get(method, method)
+        choice = page.choice("paymentMethodId", label)
+        if choice is None:
+            available = [c.label for c in page.radios.get("paymentMethodId", [])]
+            raise HttpCheckoutError(f"Zahlungsart '{label}' nicht gefunden (verfügbar: {available})")
+        order.payment_method = label
+        if choice.checked:
+            return page
+
+        form = page.form(CHECKOUT_CONFIGURE)
+        data = {"paymentMethodId": choice.value, "redirectTo": "frontend.checkout.confirm.page"}
+        with self._step(order, "http_payment"):
+            url, html = await self._post(request, order, CHECKOUT_CONFIGURE, form.data(data) if form else data)
+        return self._expect(url, html, CHECKOUT_CONFIRM, "Zahlungsart")
+
+    @staticmethod
+    def order_data(page: StorefrontHtml) -> dict[str, str]:
+        """Formularfelder für ``/checkout/order`` (AGB akzeptiert) von der Confirm-Seite."""
+        form = page.form(CHECKOUT_ORDER)
+        if form is None:
+            raise HttpCheckoutError("Kein Bestellformular auf /checkout/confirm")
+        return form.data({"tos": "on"})
+
+    async def place_order(
+        self,
+        request,
+        order: HttpOrder,
+        page: StorefrontHtml,
+        on_submit: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Akzeptiert die AGB, sendet die Bestellung und liest Order-ID und Bestellnummer."""
+        data = self.order_data(page)
+        if on_submit:
+            on_submit()
+        with self._step(order, "http_order"):
+            url, html = await self._post(request, order, CHECKOUT_ORDER, data)
+        self._expect(url, html, CHECKOUT_FINISH, "Bestellung")
+        order.order_id = parse_order_id(url)
+        order.order_number = parse_order_number(html)
+
+    async def guest_order(
+        self,
+        request,
+        product_paths: list[str],
+        address: Address,
+        payment_method: str,
+        on_submit: Optional[Callable[[], None]] = None,
+    ) -> HttpOrder:
+        """
+        Kompletter Gast-Checkout.
+
+        Args:
+            request: ``APIRequestContext`` mit eigener Session (leerer Warenkorb)
+            product_paths: Produktpfade (je ein Stück)
+            address: Rechnungsadresse des Gasts
+            payment_method: Alias oder Beschriftung der Zahlungsart
+            on_submit: Wird unmittelbar vor dem Absenden der Bestellung aufgerufen
+
+        Raises:
+            HttpCheckoutError: Bei einem fehlgeschlagenen Schritt
+        """
+        order = HttpOrder()
+        start = time.perf_counter()
+        await self.add_to_cart(request, order, product_paths)
+        page = await self.register_guest(request, order, address)
+        page = await self.select_payment(request, order, page, payment_method)
+        await self.place_order(request, order, page, on_submit)
+        order.duration_seconds = time.perf_counter() - start
+        return order
+
+    async def registered_order(
+        self,
+        request,
+        email: str,
+        password: str,
+        product_paths: list[str],
+        payment_method: str,
+        on_submit: Optional[Callable[[], None]] = None,
+    ) -> HttpOrder:
+        """Kompletter Checkout eines registrierten Kunden (Login, Warenkorb, Confirm, Bestellung)."""
+        order = HttpOrder()
+        start = time.perf_counter()
+        await self.login(request, order, email, password)
+        await self.add_to_cart(request, order, product_paths)
+        page = await self.confirm_page(request, order)
+        page = await self.select_payment(request, order, page, payment_method)
+        await self.place_order(request, order, page, on_submit)
+        order.duration_seconds = time.perf_counter() - start
+        return order
+
+    async def reset(self, request) -> bool:
+        """Beendet die Session per Logout (Gast oder Kunde); False: Sitzung nicht wiederverwenden."""
+        try:
+            response = await request.get(self._url(ACCOUNT_LOGOUT), timeout=self.timeout)
+        except Exception:
+            return False
+        return response.ok
+
+
+# =============================================================================
+# Sitzungs-Pool
+# =============================================================================
+
+@dataclass
+class HttpSession:
+    """Eine Sitzung des Pools (eigene Cookies, offene Verbindungen)."""
+    context: object
+    uses: int = 0
+    healthy: bool = True
+
+
+@dataclass
+class HttpSessionStats:
+    """Kennzahlen des Sitzungs-Pools und der Requests."""
+    created: int = 0
+    reused: int = 0
+    discarded: int = 0
+    orders: int = 0
+    requests: int = 0
+
+    def record(self, order: HttpOrder) -> None:
+        self.orders += 1
+        self.requests += order.requests
+
+    def to_dict(self) -> dict:
+        return {
+            "sessions_created": self.created,
+            "sessions_reused": self.reused,
+            "sessions_discarded": self.discarded,
+            "orders": self.orders,
+            "requests": self.requests,
+            "requests_per_order": round(self.requests / self.orders, 1) if self.orders else 0.0,
+        }
+
+
+class HttpSessionPool:
+    """
+    Wiederverwendbare ``APIRequestContext``-Sitzungen für virtuelle Nutzer.
+
+    Sitzungen entstehen bei Bedarf (höchstens so viele wie gleichzeitige
+    Bestellungen) und gehen nach der Bestellung zurück in den Pool. Als
+    ungesund markierte oder ``max_uses``-mal genutzte Sitzungen werden verworfen.
+
+    Beispiel:
+        pool = HttpSessionPool(playwright.request, base_url, max_uses=50)
+        async with pool.lease() as session:
+            ...
+        await pool.close()
+    """
+
+    def __init__(self, api_request, base_url: str, context_options: Optional[dict] = None, max_uses: int = 0):
+        """
+        Args:
+            api_request: ``playwright.request`` (erzeugt die Request-Kontexte)
+            base_url: Shop-URL
+            context_options: Weitere Optionen für ``new_context`` (z.B. ``http_credentials``)
+            max_uses: Bestellungen pro Sitzung (0 = unbegrenzt)
+        """
+        self.api_request = api_request
+        self.base_url = base_url
+        self.context_options = context_options or {}
+        self.max_uses = max_uses
+        self.stats = HttpSessionStats()
+        self._idle: list[HttpSession] = []
+        self._closed = False
+
+    async def _create(self) -> HttpSession:
+        context = await self.api_request.new_context(base_url=self.base_url, **self.context_options)
+        self.stats.created += 1
+        return HttpSession(context=context)
+
+    async def _dispose(self, session: HttpSession) -> None:
+        self.stats.discarded += 1
+        with contextlib.suppress(Exception):
+            await session.context.dispose()
+
+    @contextlib.asynccontextmanager
+    async def lease(self) -> AsyncIterator[HttpSession]:
+        """Stellt eine Sitzung für eine Bestellung bereit."""
+        if self._idle:
+            session = self._idle.pop()
+            self.stats.reused += 1
+        else:
+            session = await self._create()
+        try:
+            yield session
+        except BaseException:
+            session.healthy = False
+            raise
+        finally:
+            session.uses += 1
+            if session.healthy and not self._closed and (not self.max_uses or session.uses < self.max_uses):
+                self._idle.append(session)
+            else:
+                await self._dispose(session)
+
+    async def close(self) -> None:
+        """Verwirft alle freien Sitzungen; ausgeliehene werden bei Rückgabe verworfen."""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for session in idle:
+            await self._dispose(session)
+
+
+def format_http_stats(stats: dict) -> str:
+    """Einzeilige Zusammenfassung für Konsolen-Reports."""
+    return (f"{stats['orders']} Bestellungen, {stats['requests']} Requests "
+            f"({stats['requests_per_order']}/Bestellung), Sitzungen: {stats['sessions_created']} erstellt, "
+            f"{stats['sessions_reused']} wiederverwendet, {stats['sessions_discarded']} verworfen")
@@ -0,0 +1,200 @@
+"""
+Nutzerpfade für Stöber-Traffic als gewichtete Markow-Kette mit Denkpausen.
+
+Echte Last besteht großteils aus Stöbern: Kategorie öffnen, filtern,
+sortieren, blättern, Suchvorschläge tippen, Produktseiten ansehen. Ein
+``JourneyModel`` beschreibt das kompakt pro Seitentyp:
+
+- ``entry``: Einstiegsseiten mit Gewichten
+- ``pages``: pro Seitentyp die Denkpause (Log-Normalverteilung mit Median
+  ``think_seconds`` und Streuung ``think_sigma``) und die Folgeseiten mit
+  Gewichten; ``exit`` beendet die Sitzung
+
+Beispiel (``config.yaml``, ``performance_test.journeys``)::
+
+    entry: {home: 40, listing: 35, search: 15, pdp: 10}
+    pages:
+      listing: {think_seconds: 8, next: {listing_page: 25, listing_sort: 10, pdp: 45, exit: 20}}
+      ...
+
+``JourneySession`` baut die URLs einer Sitzung: Blättern, Sortieren und
+Filtern beziehen sich auf die zuletzt geöffnete Kategorie, die Suche auf den
+zuvor in die Vorschlagssuche getippten Begriff. Ausgeführt werden die
+Sitzungen von ``BrowseTraffic`` (``utils/browse_traffic.py``).
+"""
+import math
+import random
+from dataclasses import dataclass, field
+from typing import Optional
+from urllib.parse import quote_plus
+
+
+EXIT = "exit"
+
+# Seitentypen, für die ``JourneySession`` URLs bauen kann
+PAGE_KINDS = (
+    "home",  # Startseite
+    "listing",  # Kategorie (auch über das Mega-Menü)
+    "listing_page",  # nächste Seite der aktuellen Kategorie
+    "listing_sort",  # aktuelle Kategorie, andere Sortierung
+    "listing_filter",  # aktuelle Kategorie, Preisfilter
+    "suggest",  # Suchvorschläge (Autocomplete) zu den ersten Buchstaben
+    "search",  # Suchergebnis
+    "pdp",  # Produktseite
+)
+
+SORTINGS = ("price-asc", "price-desc", "name-asc", "topseller")
+PRICE_BANDS = ((0, 50), (50, 200), (200, 1000), (1000, 5000))
+
+
+@dataclass
+class JourneyPage:
+    """Denkpause und Übergänge eines Seitentyps."""
+    think_seconds: float = 5.0
+    think_sigma: float = 0.5
+    next: dict[str, float] = field(default_factory=dict)
+
+
+def _weighted(rng: random.Random, weights: dict[str, float]) -> str:
+    names = list(weights)
+    return rng.choices(names, weights=[weights[name] for name in names])[0]
+
+
+class JourneyModel:
+    """
+    Gewichtete Markow-Kette über Seitentypen.
+
+    Raises:
+        ValueError: Bei unbekannten Seitentypen, Übergängen ins Leere oder negativen Gewichten
+    """
+
+    def __init__(self, entry: dict[str, float], pages: dict[str, JourneyPage]):
+        self.entry = entry
+        self.pages = pages
+        self._validate()
+
+    @classmethod
+    def from_config(cls, config) -> "JourneyModel":
+        """Erstellt das Modell aus ``performance_test.journeys``."""
+        pages = {
+            kind: JourneyPage(think_seconds=page.think_seconds, think_sigma=page.think_sigma, next=dict(page.next))
+            for kind, page in config.pages.items()
+        }
+        return cls(dict(config.entry), pages)
+
+    def _validate(self) -> None:
+        unknown = set(self.pages) - set(PAGE_KINDS)
+        if unknown:
+            raise ValueError(f"Unbekannte Seitentypen: {sorted(unknown)} (bekannt: {list(PAGE_KINDS)})")
+        if not self.entry or sum(self.entry.values()) <= 0:
+            raise ValueError("Mindestens eine Einstiegsseite mit Gewicht > 0 nötig")
+        for source, weights in [("entry", self.entry), *((kind, page.next) for kind, page in self.pages.items())]:
+            for target, weight in weights.items():
+                if weight < 0:
+                    raise ValueError(f"Negatives Gewicht {source} -> {target}")
+                if target not in self.pages and not (target == EXIT and source != "entry"):
+                    raise ValueError(f"Übergang {source} -> {target}: Seitentyp nicht definiert")
+
+    def start(self, rng: random.Random) -> str:
+        """Erste Seite einer Sitzung."""
+        return _weighted(rng, self.entry)
+
+    def step(self, kind: str, rng: random.Random) -> Optional[str]:
+        """Nächste Seite nach ``kind`` (None: Sitzung endet)."""
+        weights = self.pages[kind].next
+        if not weights or sum(weights.values()) <= 0:
+            return None
+        target = _weighted(rng, weights)
+        return None if target == EXIT else target
+
+    def think_time(self, kind: str, rng: random.Random) -> float:
+        """Denkpause auf einer Seite (Log-Normalverteilung um den Median)."""
+        page = self.pages[kind]
+        if page.think_sigma <= 0 or page.think_seconds <= 0:
+            return max(0.0, page.think_seconds)
+        return rng.lognormvariate(math.log(page.think_seconds), page.think_sigma)
+
+    def expected_visits(self, max_steps: int = 1000) -> dict[str, float]:
+        """
+        Erwartete Aufrufe pro Seitentyp und Sitzung (ohne Seitenlimit).
+
+        Summiert die Wahrscheinlichkeitsmasse über die Schritte der Kette,
+        bis praktisch alle Sitzungen beendet sind.
+        """
+        total_entry = sum(self.entry.values())
+        current = {kind: weight / total_entry for kind, weight in self.entry.items()}
+        visits = {kind: 0.0 for kind in self.pages}
+        for _ in range(max_steps):
+            if sum(current.values()) < 1e-9:
+                break
+            following: dict[str, float] = {}
+            for kind, mass in current.items():
+                visits[kind] += mass
+                weights = self.pages[kind].next
+                total = sum(weights.values())
+                for target, weight in weights.items():
+                    if target != EXIT and total > 0:
+                        following[target] = following.get(target, 0.0) + mass * weight / total
+            current = following
+        return visits
+
+
+class JourneySession:
+    """
+    Zustand einer Stöber-Sitzung; baut die URL für den nächsten Seitentyp.
+
+    Args:
+        listing_paths: Kategorie-Pfade
+        search_terms: Suchbegriffe
+        product_paths: Produktpfade
+        rng: Zufallsquelle des Nutzers
+    """
+
+    def __init__(
+        self,
+        listing_paths: list[str],
+        search_terms: list[str],
+        product_paths: list[str],
+        rng: random.Random,
+    ):
+        self.listing_paths = listing_paths or ["/"]
+        self.search_terms = search_terms or ["a"]
+        self.product_paths = product_paths or ["/"]
+        self.rng = rng
+        self.listing: Optional[str] = None
+        self.listing_page = 1
+        self.term: Optional[str] = None
+
+    def _current_listing(self) -> str:
+        if self.listing is None:
+            self.listing, self.listing_page = self.rng.choice(self.listing_paths), 1
+        return self.listing
+
+    def url(self, kind: str) -> str:
+        """URL (Pfad) für einen Seitentyp aus ``PAGE_KINDS``."""
+        rng = self.rng
+        if kind == "home":
+            return "/"
+        if kind == "listing":
+            self.listing, self.listing_page = rng.choice(self.listing_paths), 1
+            return self.listing
+        if kind == "listing_page":
+            listing = self._current_listing()
+            self.listing_page += 1
+            return f"{listing}?p={self.listing_page}"
+        if kind == "listing_sort":
+            return f"{self._current_listing()}?order={rng.choice(SORTINGS)}"
+        if kind == "listing_filter":
+            low, high = rng.choice(PRICE_BANDS)
+            return f"{self._current_listing()}?min-price={low}&max-price={high}"
+        if kind == "suggest":
+            self.term = rng.choice(self.search_terms)
+            prefix = self.term[:rng.randint(min(2, len(self.term)), max(2, min(4, len(self.term))))]
+            return f"/suggest?search={quote_plus(prefix)}"
+        if kind == "search":
+            term = self.term or rng.choice(self.search_terms)
+            self.term = None
+            return f"/search?search={quote_plus(term)}"
+        if kind == "pdp":
+            return rng.choice(self.product_paths)
+        raise ValueError(f"Unbekannter Seitentyp: {kind}")
@@ -0,0 +1,230 @@
+"""
+Latenz-Histogramme mit festem Speicherbedarf (HDR-Histogram-Prinzip).
+
+Statt alle Dauern zu speichern, werden Messwerte in logarithmische Buckets
+mit fester relativer Genauigkeit (Standard: 1 %) einsortiert. Daraus folgt:
+
+- konstanter Speicher unabhängig von der Anzahl Bestellungen
+  (1 ms bis 1 h bei 1 % Genauigkeit: max. ~1.500 Buckets)
+- Perzentile (p50/p90/p95/p99/p99.9) mit höchstens ``precision`` Abweichung
+- Histogramme sind zusammenführbar (z.B. über Shards oder Bestelltypen)
+
+Min, Max, Summe und Anzahl werden exakt mitgeführt.
+"""
+import math
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+
+# Standard-Perzentile für Reports
+PERCENTILES = (50.0, 90.0, 95.0, 99.0, 99.9)
+
+
+def _percentile_key(percentile: float) -> str:
+    """Schlüssel für Reports: 50 -> 'p50', 99.9 -> 'p99.9'."""
+    return f"p{percentile:g}"
+
+
+class LatencyHistogram:
+    """
+    Logarithmisches Latenz-Histogramm mit fester relativer Genauigkeit.
+
+    Beispiel:
+        hist = LatencyHistogram()
+        hist.record(12.3)
+        hist.percentile(99)  # -> Sekunden
+    """
+
+    def __init__(
+        self,
+        precision: float = 0.01,
+        lowest_seconds: float = 0.001,
+        highest_seconds: float = 3600.0,
+    ):
+        """
+        Args:
+            precision: Relative Bucket-Breite (0.01 = 1 %)
+            lowest_seconds: Kleinster unterscheidbarer Wert (kleinere landen im ersten Bucket)
+            highest_seconds: Größter unterscheidbarer Wert (größere landen im letzten Bucket)
+
+        Raises:
+            ValueError: Bei ungültigen Grenzen oder Genauigkeit
+        """
+        if not 0 < precision < 1:
+            raise ValueError("precision muss zwischen 0 und 1 liegen")
+        if not 0 < lowest_seconds < highest_seconds:
+            raise ValueError("lowest_seconds muss größer 0 und kleiner highest_seconds sein")
+
+        self.precision = precision
+        self.lowest_seconds = lowest_seconds
+        self.highest_seconds = highest_seconds
+        self._log_base = math.log1p(precision)
+        self._max_index = self._index_for(highest_seconds)
+
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total_seconds = 0.0
+        self.min_seconds: Optional[float] = None
+        self.max_seconds: Optional[float] = None
+
+    # =========================================================================
+    # Erfassen
+    # =========================================================================
+
+    def _index_for(self, seconds: float) -> int:
+        """Bucket-Index: 0 für <= lowest, danach je Faktor (1 + precision) ein Bucket."""
+        if seconds <= self.lowest_seconds:
+            return 0
+        return math.ceil(math.log(seconds / self.lowest_seconds) / self._log_base)
+
+    def _upper_bound(self, index: int) -> float:
+        """Obere Grenze eines Buckets in Sekunden."""
+        return self.lowest_seconds * (1 + self.precision) ** index
+
+    def record(self, seconds: float, count: int = 1) -> None:
+        """Erfasst einen Messwert (in Sekunden)."""
+        if count <= 0:
+            return
+        seconds = max(0.0, seconds)
+        index = min(self._index_for(seconds), self._max_index)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.count += count
+        self.total_seconds += seconds * count
+        self.min_seconds = seconds if self.min_seconds is None else min(self.min_seconds, seconds)
+        self.max_seconds = seconds if self.max_seconds is None else max(self.max_seconds, seconds)
+
+    def _check_compatible(self, other: "LatencyHistogram") -> None:
+        if (other.precision, other.lowest_seconds, other.highest_seconds) != (
+            self.precision, self.lowest_seconds, self.highest_seconds
+        ):
+            raise ValueError("Histogramme mit unterschiedlicher Auflösung können nicht zusammengeführt werden")
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Addiert ein anderes Histogramm gleicher Auflösung.
+
+        Raises:
+            ValueError: Bei abweichender Genauigkeit oder Grenzen
+        """
+        self._check_compatible(other)
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total_seconds += other.total_seconds
+        if other.min_seconds is not None:
+            self.min_seconds = other.min_seconds if self.min_seconds is None else min(self.min_seconds, other.min_seconds)
+        if other.max_seconds is not None:
+            self.max_seconds = other.max_seconds if self.max_seconds is None else max(self.max_seconds, other.max_seconds)
+
+    # =========================================================================
+    # Auswerten
+    # =========================================================================
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.count if self.count else 0.0
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Gibt den Wert zurück, unter dem ``percentile`` Prozent der Messwerte liegen.
+
+        Das Ergebnis ist die obere Bucket-Grenze, begrenzt auf das exakte Min/Max.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(percentile / 100 * self.count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                value = self._upper_bound(index)
+                return min(max(value, self.min_seconds), self.max_seconds)
+        return self.max_seconds
+
+    def percentiles(self, percentiles: tuple[float, ...] = PERCENTILES) -> dict[str, float]:
+        """Gibt mehrere Perzentile als ``{"p50": ..., "p99.9": ...}`` zurück."""
+        return {_percentile_key(p): self.percentile(p) for p in percentiles}
+
+    def summary(self) -> dict:
+        """Kennzahlen für Reports (Sekunden, gerundet)."""
+        data = {
+            "count": self.count,
+            "mean": round(self.mean_seconds, 3),
+            "min": round(self.min_seconds or 0.0, 3),
+            "max": round(self.max_seconds or 0.0, 3),
+        }
+        data.update({k: round(v, 3) for k, v in self.percentiles().items()})
+        return data
+
+    # =========================================================================
+    # Serialisierung
+    # =========================================================================
+
+    def to_dict(self) -> dict:
+        """Serialisiert Kennzahlen und Buckets (verlustfrei zusammenführbar)."""
+        return {
+            **self.summary(),
+            "precision": self.precision,
+            "lowest_seconds": self.lowest_seconds,
+            "highest_seconds": self.highest_seconds,
+            "total_seconds": self.total_seconds,
+            "min_seconds": self.min_seconds,
+            "max_seconds": self.max_seconds,
+            "buckets": {str(index): count for index, count in sorted(self.counts.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        """Erstellt ein Histogramm aus ``to_dict()``-Daten."""
+        hist = cls(
+            precision=data["precision"],
+            lowest_seconds=data["lowest_seconds"],
+            highest_seconds=data["highest_seconds"],
+        )
+        hist.counts = {int(index): count for index, count in data.get("buckets", {}).items()}
+        hist.count = sum(hist.counts.values())
+        hist.total_seconds = data.get("total_seconds", 0.0)
+        hist.min_seconds = data.get("min_seconds")
+        hist.max_seconds = data.get("max_seconds")
+        return hist
+
+
+def format_percentiles(hist: LatencyHistogram) -> str:
+    """Einzeilige Perzentil-Übersicht für Konsolen-Reports."""
+    return " | ".join(f"{key} {value:.1f}s" for key, value in hist.percentiles().items())
+
+
+@dataclass
+class LatencyHistogramSet:
+    """Histogramme nach Schlüssel (z.B. Bestelltyp oder Checkout-Schritt)."""
+    histograms: dict[str, LatencyHistogram] = field(default_factory=dict)
+
+    def get(self, key: str) -> LatencyHistogram:
+        """Gibt das Histogramm für ``key`` zurück (wird bei Bedarf angelegt)."""
+        if key not in self.histograms:
+            self.histograms[key] = LatencyHistogram()
+        return self.histograms[key]
+
+    def record(self, key: str, seconds: float) -> None:
+        self.get(key).record(seconds)
+
+    def merge(self, other: "LatencyHistogramSet") -> None:
+        for key, hist in other.histograms.items():
+            self.get(key).merge(hist)
+
+    def __iter__(self) -> Iterator[tuple[str, LatencyHistogram]]:
+        return iter(self.histograms.items())
+
+    def __len__(self) -> int:
+        return len(self.histograms)
+
+    def summary(self) -> dict[str, dict]:
+        """Kennzahlen pro Schlüssel für Reports."""
+        return {key: hist.summary() for key, hist in self.histograms.items()}
+
+    def to_dict(self) -> dict[str, dict]:
+        return {key: hist.to_dict() for key, hist in self.histograms.items()}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, dict]) -> "LatencyHistogramSet":
+        return cls({key: LatencyHistogram.from_dict(value) for key, value in data.items()})
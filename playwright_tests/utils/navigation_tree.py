@@ -0,0 +1,421 @@
+"""
+Kategoriebaum des Mega-Menüs in einem Durchgang auslesen und vergleichen.
+
+Bisher wurde pro Kategorie gehovert und jeder Flyout-Link einzeln per
+``inner_text()``/``get_attribute()`` gelesen - Minuten für einen kompletten
+Navigations-Audit. Shopware rendert die Flyouts aller Hauptkategorien aber
+schon mit der Seite (``.navigation-flyout[data-flyout-menu-id]``, verknüpft
+über ``data-flyout-menu-trigger`` am Hauptnavigations-Link). Ein einziges
+``evaluate`` liest daher Hauptnavigation und alle Flyouts mit allen Ebenen
+(UK1/UK2/UK3, aus ``is-level-N`` bzw. der Verschachtelung der
+``.navigation-flyout-categories``).
+
+Nur Flyouts, die nicht im DOM stehen (nachgeladen), werden einmal gehovert.
+Das Ergebnis wird pro Lauf, Shop und Locale zwischengespeichert
+(``load_navigation``), alle Navigations-Tests teilen sich eine Extraktion.
+
+``diff_category`` vergleicht eine Kategorie mit einem deklarativen
+Soll-Baum (``data/navigation_trees.py``): fehlende Kategorien,
+URL-Abweichungen, Duplikate, leere Einträge und zusätzliche Kategorien.
+"""
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+from urllib.parse import unquote, urlparse
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+
+MAIN_NAVIGATION_LINK = ".main-navigation-link, .nav-link.main-navigation-link, .main-navigation a"
+
+# Flyout-Einträge, die keine Kategorien sind (zusätzlich zum Namen der Hauptkategorie)
+SKIP_NAMES = {"alle anzeigen", "alle produkte"}
+
+NAVIGATION_SCRIPT = """
+(mainSelector) => {
+    const text = (el) => (el.textContent || '').replace(/\\s+/g, ' ').trim();
+    const levelOf = (a, flyout) => {
+        const match = (a.getAttribute('class') || '').match(/is-level-(\\d+)/);
+        if (match) return Number(match[1]);
+        let depth = -1;
+        for (let el = a.parentElement; el && el !== flyout; el = el.parentElement) {
+            if (el.classList.contains('navigation-flyout-categories')) depth += 1;
+        }
+        return depth;
+    };
+    const linksOf = (flyout) => {
+        if (!flyout) return null;
+        const structured = !!flyout.querySelector('.navigation-flyout-categories');
+        return [...flyout.querySelectorAll('a')]
+            .map((a) => ({name: text(a), href: a.getAttribute('href') || '', level: structured ? levelOf(a, flyout) : 0}))
+            .filter((link) => link.level >= 0);
+    };
+    const categories = [];
+    for (const a of document.querySelectorAll(mainSelector)) {
+        if (a.closest('.navigation-flyout') || !text(a)) continue;
+        const trigger = a.getAttribute('data-flyout-menu-trigger') || '';
+        const flyout = trigger
+            ? document.querySelector(`.navigation-flyout[data-flyout-menu-id="${CSS.escape(trigger)}"]`)
+            : null;
+        categories.push({name: text(a), href: a.getAttribute('href') || '', trigger, links: linksOf(flyout)});
+    }
+    return {lang: document.documentElement.lang || '', categories};
+}
+"""
+
+
+def normalize_name(name: str) -> str:
+    """Normalisiert Kategorienamen für den Vergleich (lowercase, Whitespace)."""
+    return " ".join(name.strip().lower().split())
+
+
+def extract_path(href: str) -> str:
+    """Extrahiert und normalisiert den URL-Pfad."""
+    if not href:
+        return ""
+    return unquote(urlparse(href).path).rstrip("/")
+
+
+def path_matches(actual_path: str, expected_suffix: str) -> bool:
+    """Prüft ob der tatsächliche Pfad mit dem erwarteten Suffix endet."""
+    return unquote(actual_path).rstrip("/").endswith(expected_suffix.rstrip("/"))
+
+
+def count_expected(tree: list[dict]) -> dict:
+    """Zählt erwartete Kategorien auf allen 3 Ebenen."""
+    counts = {"uk1": 0, "uk2": 0, "uk3": 0, "total": 0}
+    for uk1 in tree:
+        counts["uk1"] += 1
+        for uk2 in uk1.get("subcategories", []):
+            counts["uk2"] += 1
+            counts["uk3"] += len(uk2.get("subcategories", []))
+    counts["total"] = counts["uk1"] + counts["uk2"] + counts["uk3"]
+    return counts
+
+
+@dataclass
+class NavLink:
+    """Ein Link im Flyout (Ebene 0 = UK1)."""
+    name: str
+    path: str
+    level: int = 0
+
+
+@dataclass
+class NavNode:
+    """Knoten des Kategoriebaums."""
+    name: str
+    path: str
+    children: list["NavNode"] = field(default_factory=list)
+
+
+def find_node(nodes: list[NavNode], name: str) -> Optional[NavNode]:
+    """Sucht einen Knoten per normalisiertem Namen (Tiefensuche)."""
+    target = normalize_name(name)
+    for node in nodes:
+        if normalize_name(node.name) == target:
+            return node
+        found = find_node(node.children, name)
+        if found:
+            return found
+    return None
+
+
+def build_tree(links: list[NavLink]) -> list[NavNode]:
+    """Baut aus den Flyout-Links (Dokumentreihenfolge + Ebene) einen Baum."""
+    roots: list[NavNode] = []
+    stack: list[tuple[int, NavNode]] = []
+    for link in links:
+        node = NavNode(link.name, link.path)
+        while stack and stack[-1][0] >= link.level:
+            stack.pop()
+        (stack[-1][1].children if stack else roots).append(node)
+        stack.append((link.level, node))
+    return roots
+
+
+@dataclass
+class NavCategory:
+    """Hauptkategorie mit ihren Flyout-Links (``links`` ist None ohne Flyout)."""
+    name: str
+    path: str
+    trigger: str = ""
+    links: Optional[list[NavLink]] = None
+
+    @property
+    def tree(self) -> list[NavNode]:
+        return build_tree(self.entries)
+
+    @property
+    def entries(self) -> list[NavLink]:
+        """Flyout-Links ohne die Hauptkategorie selbst und ohne "Alle anzeigen"."""
+        skip = SKIP_NAMES | {normalize_name(self.name)}
+        return [link for link in self.links or [] if link.name and normalize_name(link.name) not in skip]
+
+
+@dataclass
+class Navigation:
+    """Hauptnavigation mit allen Flyouts."""
+    lang: str
+    categories: list[NavCategory]
+    duration_seconds: float = 0.0
+
+    def category(self, name: str) -> Optional[NavCategory]:
+        target = normalize_name(name)
+        return next((c for c in self.categories if normalize_name(c.name) == target), None)
+
+
+def parse_navigation(raw: dict, duration_seconds: float = 0.0) -> Navigation:
+    """Wandelt das Ergebnis von ``NAVIGATION_SCRIPT`` in ``Navigation`` um."""
+    categories = []
+    for item in raw.get("categories", []):
+        links = item.get("links")
+        categories.append(NavCategory(
+            name=item["name"],
+            path=extract_path(item.get("href", "")),
+            trigger=item.get("trigger", ""),
+            links=None if links is None else [
+                NavLink(link["name"], extract_path(link["href"]), link["level"]) for link in links
+            ],
+        ))
+    return Navigation(raw.get("lang", ""), categories, duration_seconds)
+
+
+# Ergebnis pro Lauf: (Basis-URL, Locale) -> Navigation
+_NAVIGATION_CACHE: dict[tuple[str, str], Navigation] = {}
+
+
+def _missing_flyouts(raw: dict) -> list[str]:
+    return [c["trigger"] for c in raw["categories"] if c["trigger"] and c["links"] is None]
+
+
+def _flyout_selector(trigger: str) -> tuple[str, str]:
+    return (f"[data-flyout-menu-trigger='{trigger}']", f".navigation-flyout[data-flyout-menu-id='{trigger}']")
+
+
+def load_navigation(page, base_url: str, locale: str = "", refresh: bool = False) -> Navigation:
+    """
+    Lädt die Startseite und liest die komplette Navigation (sync, ``page``-Fixture).
+
+    Pro (Basis-URL, Locale) nur einmal pro Lauf; ``refresh`` erzwingt eine neue Extraktion.
+    """
+    key = (base_url.rstrip("/"), locale)
+    if key in _NAVIGATION_CACHE and not refresh:
+        return _NAVIGATION_CACHE[key]
+
+    start = time.perf_counter()
+    page.goto(base_url)
+    page.wait_for_load_state("domcontentloaded")
+    raw = page.evaluate(NAVIGATION_SCRIPT, MAIN_NAVIGATION_LINK)
+    missing = _missing_flyouts(raw)
+    for trigger in missing:
+        link, flyout = _flyout_selector(trigger)
+        try:
+            page.locator(link).first.hover(timeout=3000)
+            page.locator(flyout).first.wait_for(state="attached", timeout=3000)
+        except PlaywrightTimeoutError:
+            continue
+    if missing:
+        raw = page.evaluate(NAVIGATION_SCRIPT, MAIN_NAVIGATION_LINK)
+
+    navigation = parse_navigation(raw, time.perf_counter() - start)
+    _NAVIGATION_CACHE[key] = navigation
+    return navigation
+
+
+async def load_navigation_async(page, base_url: str, locale: str = "", refresh: bool = False) -> Navigation:
+    """Wie ``load_navigation``, für async Pages."""
+    key = (base_url.rstrip("/"), locale)
+    if key in _NAVIGATION_CACHE and not refresh:
+        return _NAVIGATION_CACHE[key]
+
+    start = time.perf_counter()
+    await page.goto(base_url)
+    await page.wait_for_load_state("domcontentloaded")
+    raw = await page.evaluate(NAVIGATION_SCRIPT, MAIN_NAVIGATION_LINK)
+    missing = _missing_flyouts(raw)
+    for trigger in missing:
+        link, flyout = _flyout_selector(trigger)
+        try:
+            await page.locator(link).first.hover(timeout=3000)
+            await page.locator(flyout).first.wait_for(state="attached", timeout=3000)
+        except PlaywrightTimeoutError:
+            continue
+    if missing:
+        raw = await page.evaluate(NAVIGATION_SCRIPT, MAIN_NAVIGATION_LINK)
+
+    navigation = parse_navigation(raw, time.perf_counter() - start)
+    _NAVIGATION_CACHE[key] = navigation
+    return navigation
+
+
+# =============================================================================
+# Soll/Ist-Vergleich
+# =============================================================================
+
+LEVELS = ("UK1", "UK2", "UK3")
+
+
+@dataclass
+class NavigationDiff:
+    """Ergebnis des Vergleichs einer Hauptkategorie mit ihrem Soll-Baum."""
+    category: str
+    expected_counts: dict = field(default_factory=dict)
+    correct: list[dict] = field(default_factory=list)
+    url_mismatches: list[dict] = field(default_factory=list)
+    missing: list[dict] = field(default_factory=list)
+    duplicates: list[dict] = field(default_factory=list)
+    empty_entries: list[dict] = field(default_factory=list)
+    extras: list[dict] = field(default_factory=list)
+    flyout_found: bool = True
+
+    @property
+    def failed(self) -> bool:
+        return bool(self.errors)
+
+    @property
+    def errors(self) -> list[str]:
+        """Fehlermeldungen: fehlende Kategorien, URL-Abweichungen, Duplikate, leere Einträge."""
+        errors = []
+        if not self.flyout_found:
+            errors.append(f"Mega-Menü-Flyout für '{self.category}' nicht gefunden")
+        if self.missing:
+            errors.append(
+                f"Fehlende Kategorien ({len(self.missing)}):\n"
+                + "\n".join(
+                    f"  - {m['level']} {m['name']} ({m['expected_url']})"
+                    + (f" unter {m['parent']}" if m.get("parent") else "")
+                    for m in self.missing
+                )
+            )
+        if self.url_mismatches:
+            errors.append(
+                f"URL-Abweichungen ({len(self.url_mismatches)}):\n"
+                + "\n".join(
+                    f"  - {m['level']} {m['name']}: "
+                    f"erwartet '{m['expected_url']}', gefunden '{m['actual_url']}'"
+                    for m in self.url_mismatches
+                )
+            )
+        if self.duplicates:
+            errors.append(
+                f"Duplikate im Mega-Menü ({len(self.duplicates)}):\n"
+                + "\n".join(
+                    f"  - \"{d['name']}\" {d['count']}x: {', '.join(d['paths'])}"
+                    for d in self.duplicates
+                )
+            )
+        if self.empty_entries:
+            errors.append(
+                f"Leere Einträge im Mega-Menü ({len(self.empty_entries)}):\n"
+                + "\n".join(f"  - \"{e['name']}\" ({e['path']})" for e in self.empty_entries)
+            )
+        return errors
+
+
+def diff_category(category: NavCategory, expected: Optional[list[dict]] = None) -> NavigationDiff:
+    """
+    Vergleicht eine Hauptkategorie mit ihrem Soll-Baum.
+
+    Eine Soll-Kategorie wird zuerst unterhalb ihrer (gefundenen) Eltern-
+    Kategorie gesucht, sonst im ganzen Flyout. Ohne Soll-Baum werden nur
+    Duplikate und leere Einträge geprüft.
+
+    Args:
+        category: Ausgelesene Hauptkategorie
+        expected: Soll-Baum (``{"name", "url", "subcategories"}``, 3 Ebenen)
+    """
+    # Ohne Trigger hat der Link kein Flyout (z.B. Magazin) - das ist kein Fehler
+    flyout_found = category.links is not None or not category.trigger
+    diff = NavigationDiff(category.name, count_expected(expected or []), flyout_found=flyout_found)
+    entries = category.entries
+    tree = build_tree(entries)
+
+    occurrences: dict[str, list[NavLink]] = {}
+    for link in entries:
+        occurrences.setdefault(normalize_name(link.name), []).append(link)
+    for links in occurrences.values():
+        if len(links) > 1:
+            diff.duplicates.append({"name": links[0].name, "count": len(links), "paths": [link.path for link in links]})
+    diff.empty_entries = [
+        {"name": link.name, "path": link.path} for link in entries if normalize_name(link.name) == "empty"
+    ]
+
+    if expected is None:
+        return diff
+
+    matched: set[str] = set()
+
+    def check(nodes: list[dict], scope: list[NavNode], depth: int, parents: list[str]) -> None:
+        for item in nodes:
+            found = find_node(scope, item["name"]) or find_node(tree, item["name"])
+            entry = {
+                "level": LEVELS[depth], "name": item["name"],
+                "expected_url": item.get("url", ""), "parent": " > ".join(parents),
+            }
+            if found is None:
+                diff.missing.append(entry)
+            else:
+                matched.add(normalize_name(item["name"]))
+                entry["actual_url"] = found.path
+                if item.get("url") and not path_matches(found.path, item["url"]):
+                    diff.url_mismatches.append(entry)
+                else:
+                    diff.correct.append(entry)
+            if depth + 1 < len(LEVELS):
+                check(item.get("subcategories", []), found.children if found else [], depth + 1,
+                      parents + [item["name"]])
+
+    check(expected, tree, 0, [])
+
+    seen = set()
+    for link in entries:
+        norm = normalize_name(link.name)
+        if norm not in matched and norm != "empty" and norm not in seen:
+            diff.extras.append({"name": link.name, "path": link.path})
+            seen.add(norm)
+    return diff
+
+
+def format_navigation_diff(diff: NavigationDiff) -> str:
+    """Mehrzeiliger Bericht wie im bisherigen Möbel-Test."""
+    header = f"  {'Ebene':<5} {'Kategorie':<35} {'URL (Soll)':<30} {{}}"
+    rule = f"  {'-'*5:<5} {'-'*35:<35} {'-'*30:<30} {'-'*40}"
+    lines = ["=" * 60, f"ERGEBNIS: {diff.category} (UK1 / UK2 / UK3)", "=" * 60]
+
+    lines += [f"\nKORREKT ({len(diff.correct)}):", header.format("URL (Ist)"), rule]
+    lines += [f"  {i['level']:<5} {i['name']:<35} {i['expected_url']:<30} {i['actual_url']}" for i in diff.correct]
+    if diff.url_mismatches:
+        lines += [f"\nURL-ABWEICHUNGEN ({len(diff.url_mismatches)}):", header.format("URL (Ist)"), rule]
+        lines += [f"  {i['level']:<5} {i['name']:<35} {i['expected_url']:<30} {i['actual_url']}"
+                  for i in diff.url_mismatches]
+    if diff.missing:
+        lines += [f"\nFEHLEND ({len(diff.missing)}):", header.format("Eltern"), rule]
+        lines += [f"  {i['level']:<5} {i['name']:<35} {i['expected_url']:<30} {i['parent']}" for i in diff.missing]
+    if diff.duplicates:
+        lines.append(f"\nDUPLIKATE - FEHLER ({len(diff.duplicates)}):")
+        for dup in diff.duplicates:
+            lines.append(f"  [DUPLIKAT] \"{dup['name']}\" kommt {dup['count']}x vor:")
+            lines += [f"             - {path}" for path in dup["paths"]]
+    if diff.empty_entries:
+        lines.append(f"\nLEERE EINTRAEGE - FEHLER ({len(diff.empty_entries)}):")
+        lines += [f"  [LEER] \"{e['name']}\": {e['path']}" for e in diff.empty_entries]
+    if diff.extras:
+        lines.append(f"\nZUSAETZLICH - nicht in Soll-Liste ({len(diff.extras)}):")
+        lines += [f"  [EXTRA] {e['name']}: {e['path']}" for e in diff.extras]
+
+    counts = diff.expected_counts
+    lines += [
+        f"\n{'=' * 60}", "ZUSAMMENFASSUNG", "=" * 60,
+        f"  Soll-Kategorien gesamt:  {counts.get('total', 0)}",
+        f"    davon UK1:             {counts.get('uk1', 0)}",
+        f"    davon UK2:             {counts.get('uk2', 0)}",
+        f"    davon UK3:             {counts.get('uk3', 0)}",
+        f"  Korrekt:                 {len(diff.correct)}",
+        f"  URL-Abweichungen:        {len(diff.url_mismatches)}",
+        f"  Fehlend:                 {len(diff.missing)}",
+        f"  Duplikate:               {len(diff.duplicates)}",
+        f"  Leere Eintraege:         {len(diff.empty_entries)}",
+        f"  Zusaetzlich:             {len(diff.extras)}",
+    ]
+    return "\n".join(lines)
@@ -0,0 +1,308 @@
+"""
+Leichtgewichtige Netzwerk-Aufzeichnung pro Bestellung (ohne HAR/Playwright-Trace).
+
+Bei Massenläufen liefert eine fehlgeschlagene Bestellung sonst nur
+``error_message``; ``trace_on_failure`` ist bei 15+ parallelen Workern zu
+teuer. ``NetworkTraceRecorder`` hängt sich an einen Browser-Kontext und merkt
+sich pro Request nur wenige Felder in einem Ringpuffer:
+
+- Methode, URL-Template (IDs durch ``{id}`` ersetzt, nur Query-Schlüssel)
+- Status bzw. Fehlertext, Ressourcentyp
+- Zeitphasen aus ``request.timing`` (DNS, Verbindung, TLS, Warten, Download)
+- Request-Body-Größe und ``Content-Length`` der Antwort
+
+Es werden nur Events ausgewertet, kein ``route()`` und keine zusätzlichen
+Protokoll-Aufrufe (``request.sizes()``/``response.body()``) - daher günstig
+genug für Stresstests. ``NetworkTracer`` entscheidet nach der Bestellung, ob
+der Puffer auf Platte landet: fehlgeschlagene und langsame Bestellungen immer,
+erfolgreiche mit Wahrscheinlichkeit ``sample_rate``.
+"""
+import json
+import random
+import re
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+from playwright.async_api import BrowserContext
+
+from playwright_tests.utils.request_events import RequestEventListener
+
+
+# Pfadsegmente, die wie IDs aussehen: Zahlen, Shopware-UUIDs (32 Hex), UUIDs mit Bindestrich
+_ID_SEGMENT = re.compile(r"^(?:\d+|[0-9a-f]{32}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$", re.I)
+
+
+def url_template(url: str) -> str:
+    """
+    Verdichtet eine URL zu einem Template.
+
+    Beispiel:
+        url_template("https://shop.at/checkout/finish?orderId=0a1b...")
+        -> "https://shop.at/checkout/finish?orderId"
+    """
+    parts = urlsplit(url)
+    path = "/".join("{id}" if _ID_SEGMENT.match(s) else s for s in parts.path.split("/"))
+    template = f"{parts.scheme}://{parts.netloc}{path}"
+    keys = sorted({key for key, _ in parse_qsl(parts.query, keep_blank_values=True)})
+    return f"{template}?{'&'.join(keys)}" if keys else template
+
+
+def _phase(timing: dict, start: str, end: str) -> Optional[float]:
+    """Dauer zwischen zwei Timing-Marken in ms (None: nicht verfügbar, z.B. wiederverwendete Verbindung)."""
+    a, b = timing.get(start, -1), timing.get(end, -1)
+    if a is None or b is None or a < 0 or b < 0:
+        return None
+    return round(b - a, 1)
+
+
+@dataclass
+class TraceEntry:
+    """Ein aufgezeichneter Request."""
+    method: str
+    url: str
+    resource_type: str
+    started_ms: float  # relativ zum Start der Aufzeichnung
+    status: Optional[int] = None
+    failure: Optional[str] = None
+    duration_ms: Optional[float] = None
+    phases: dict[str, Optional[float]] = field(default_factory=dict)
+    request_bytes: int = 0
+    response_bytes: Optional[int] = None
+
+    def to_dict(self) -> dict:
+        data = {
+            "method": self.method,
+            "url": self.url,
+            "type": self.resource_type,
+            "started_ms": round(self.started_ms, 1),
+            "status": self.status,
+            "duration_ms": self.duration_ms,
+            "phases": {k: v for k, v in self.phases.items() if v is not None},
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+        }
+        if self.failure:
+            data["failure"] = self.failure
+        return data
+
+
+class NetworkTraceRecorder(RequestEventListener):
+    """
+    Ringpuffer der letzten ``capacity`` Requests eines Browser-Kontexts.
+
+    Beispiel:
+        recorder = NetworkTraceRecorder(capacity=300)
+        recorder.attach(context)
+        try:
+            await run_order()
+        finally:
+            recorder.detach()
+        data = recorder.to_dict()
+    """
+
+    def __init__(self, capacity: int = 300):
+        super().__init__()
+        self.capacity = capacity
+        self.entries: deque[TraceEntry] = deque(maxlen=capacity)
+        self.total_requests = 0
+
+        self._context: Optional[BrowserContext] = None
+        self._started_ms = time.time() * 1000
+
+    # =========================================================================
+    # Event-Listener
+    # =========================================================================
+
+    def _complete(self, request, response, failure: Optional[str]) -> None:
+        timing = request.timing or {}
+        start = timing.get("startTime") or time.time() * 1000
+        entry = TraceEntry(
+            method=request.method,
+            url=url_template(request.url),
+            resource_type=request.resource_type,
+            started_ms=start - self._started_ms,
+            failure=failure,
+            duration_ms=round(timing["responseEnd"], 1) if timing.get("responseEnd", -1) >= 0 else None,
+            phases={
+                "dns": _phase(timing, "domainLookupStart", "domainLookupEnd"),
+                "connect": _phase(timing, "connectStart", "connectEnd"),
+                "tls": _phase(timing, "secureConnectionStart", "connectEnd"),
+                "wait": _phase(timing, "requestStart", "responseStart"),
+                "download": _phase(timing, "responseStart", "responseEnd"),
+            },
+        )
+        try:
+            entry.request_bytes = len(request.post_data_buffer or b"")
+        except Exception:
+            pass
+        if response is not None:
+            entry.status = response.status
+            length = response.headers.get("content-length")
+            entry.response_bytes = int(length) if length and length.isdigit() else None
+        self.total_requests += 1
+        self.entries.append(entry)
+
+    def attach(self, context: BrowserContext) -> None:
+        """Hängt den Recorder an einen Kontext (alle Seiten des Kontexts)."""
+        self._context = context
+        self._started_ms = time.time() * 1000
+        self._listen(context)
+
+    def detach(self) -> None:
+        """Entfernt alle Listener (wichtig bei wiederverwendeten Pool-Kontexten)."""
+        if not self._context:
+            return
+        self._unlisten(self._context)
+        self._responses.clear()
+        self._context = None
+
+    # =========================================================================
+    # Auswerten
+    # =========================================================================
+
+    def summary(self) -> dict:
+        """Kennzahlen über die gepufferten Requests."""
+        entries = list(self.entries)
+        timed = [e for e in entries if e.duration_ms is not None]
+        slowest = sorted(timed, key=lambda e: e.duration_ms, reverse=True)[:5]
+        return {
+            "requests": self.total_requests,
+            "kept": len(entries),
+            "dropped": self.total_requests - len(entries),
+            "failed": sum(1 for e in entries if e.failure),
+            "http_errors": sum(1 for e in entries if e.status and e.status >= 400),
+            "response_bytes": sum(e.response_bytes or 0 for e in entries),
+            "slowest": [{"url": e.url, "status": e.status, "duration_ms": e.duration_ms} for e in slowest],
+        }
+
+    def to_dict(self) -> dict:
+        return {"summary": self.summary(), "requests": [e.to_dict() for e in self.entries]}
+
+
+@dataclass
+class NetworkTraceStats:
+    """Anzahl aufgezeichneter und gespeicherter Bestellungen."""
+    recorded: int = 0
+    failed: int = 0
+    slow: int = 0
+    sampled: int = 0
+    directories: list[str] = field(default_factory=list)
+
+    @property
+    def saved(self) -> int:
+        return self.failed + self.slow + self.sampled
+
+    def merge(self, data: dict) -> None:
+        """Übernimmt ``to_dict()``-Daten (z.B. aus einem Shard-Prozess)."""
+        self.recorded += data.get("recorded", 0)
+        self.failed += data.get("failed", 0)
+        self.slow += data.get("slow", 0)
+        self.sampled += data.get("sampled", 0)
+        self.directories.extend(d for d in data.get("directories", []) if d not in self.directories)
+
+    def to_dict(self) -> dict:
+        """Konvertiert die Statistik in ein Dictionary für JSON-Export."""
+        return {
+            "recorded": self.recorded,
+            "saved": self.saved,
+            "failed": self.failed,
+            "slow": self.slow,
+            "sampled": self.sampled,
+            "directories": self.directories,
+        }
+
+
+def format_network_trace(report: dict) -> str:
+    """Einzeilige Zusammenfassung für Konsolen-Reports."""
+    directories = ", ".join(report["directories"]) or "-"
+    return (f"{report['saved']} von {report['recorded']} Bestellungen gespeichert "
+            f"({report['failed']} fehlgeschlagen, {report['slow']} langsam, "
+            f"{report['sampled']} Stichprobe) in {directories}")
+
+
+class NetworkTracer:
+    """
+    Erstellt pro Bestellung einen Recorder und speichert ihn bei Bedarf.
+
+    Ein deaktivierter Tracer (``cfg`` None oder ``enabled: false``) ist ein
+    No-op, damit Runner ohne Fallunterscheidung aufzeichnen können.
+
+    Beispiel:
+        tracer = NetworkTracer(config.network_trace, run_id)
+        with tracer.record(context) as recorder:
+            result = await run_order()
+        tracer.finish(recorder, order_num, result)
+    """
+
+    def __init__(self, cfg=None, run_id: str = "", rng: Optional[random.Random] = None):
+        """
+        Args:
+            cfg: ``NetworkTraceConfig`` (None: deaktiviert)
+            run_id: Unterverzeichnis für die gespeicherten Traces
+            rng: Zufallsquelle für die Stichprobe (für Tests)
+        """
+        self.enabled = bool(cfg and cfg.enabled)
+        self.capacity = cfg.capacity if cfg else 0
+        self.slow_order_seconds = cfg.slow_order_seconds if cfg else 0.0
+        self.sample_rate = cfg.sample_rate if cfg else 0.0
+        self.directory = Path(cfg.directory) / run_id if cfg else Path()
+        self.stats = NetworkTraceStats()
+        self._rng = rng or random.Random()
+
+    @contextmanager
+    def record(self, context: BrowserContext) -> Iterator[Optional[NetworkTraceRecorder]]:
+        """Zeichnet die Requests des Kontexts für die Dauer des Blocks auf."""
+        if not self.enabled:
+            yield None
+            return
+        recorder = NetworkTraceRecorder(self.capacity)
+        recorder.attach(context)
+        try:
+            yield recorder
+        finally:
+            recorder.detach()
+
+    def flush_reason(self, success: bool, duration_seconds: float) -> Optional[str]:
+        """Grund für das Speichern (``failed``, ``slow``, ``sampled``) oder None."""
+        if not success:
+            return "failed"
+        if self.slow_order_seconds and duration_seconds >= self.slow_order_seconds:
+            return "slow"
+        if self.sample_rate and self._rng.random() < self.sample_rate:
+            return "sampled"
+        return None
+
+    def finish(self, recorder: Optional[NetworkTraceRecorder], order_num: int, result) -> Optional[Path]:
+        """
+        Speichert den Puffer, falls die Bestellung fehlschlug, langsam war oder gezogen wurde.
+
+        Der Pfad wird in ``result.network_trace`` vermerkt.
+        """
+        if recorder is None:
+            return None
+        self.stats.recorded += 1
+        reason = self.flush_reason(result.success, result.duration_seconds)
+        if reason is None:
+            return None
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if str(self.directory) not in self.stats.directories:
+            self.stats.directories.append(str(self.directory))
+        path = self.directory / f"order-{order_num:05d}-{reason}.json"
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "order_num": order_num,
+                "reason": reason,
+                "success": result.success,
+                "error_message": result.error_message,
+                "duration_seconds": round(result.duration_seconds, 2),
+                **recorder.to_dict(),
+            }, f, ensure_ascii=False)
+        setattr(self.stats, reason, getattr(self.stats, reason) + 1)
+        result.network_trace = str(path)
+        return path
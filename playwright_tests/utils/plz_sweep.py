@@ -0,0 +1,145 @@
+"""
+PLZ-Sweep: Versandart für viele PLZ in einer einzigen Checkout-Session prüfen.
+
+Der Browser-Test in ``test_shipping_plz.py`` durchläuft pro PLZ den ganzen
+Ablauf (Speditionsprodukt, Warenkorb, Gast-Checkout, Adresse, Confirm). Die
+Versandart hängt aber nur an der Adresse. ``PlzSweep`` erreicht
+``/checkout/confirm`` daher einmal pro Land (per HTTP, siehe
+``HttpCheckout``) und ändert danach für jede PLZ nur noch die Adresse:
+
+1. Adresse im Adressbuch-Widget des Checkouts speichern
+   (``/widgets/account/address-book``, ein POST; auch für Gäste)
+2. Confirm-Seite laden und die Versandarten lesen (ein GET)
+
+Jede PLZ bekommt ein eigenes Ergebnis (``PlzCheck``). Die Bewertung
+entspricht dem Browser-Test: Die erwartete Spedition muss gewählt oder
+zumindest verfügbar sein.
+
+Beispiel:
+    sweep = PlzSweep(HttpCheckout(base_url), SPEDITION_PRODUCT)
+    checks = await sweep.run(request, [tc for tc in SHIPPING_TEST_CASES if tc[1] == "AT"])
+"""
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Optional
+
+from ..pages.checkout_page import Address
+from .http_checkout import HttpCheckout, HttpOrder
+from .storefront_html import HtmlForm, StorefrontHtml
+
+
+SHIPPING_METHOD_FIELD = "shippingMethodId"
+
+
+@dataclass
+class PlzCheck:
+    """Ergebnis einer PLZ: gewählte und verfügbare Versandarten."""
+    test_id: str
+    country: str
+    plz: str
+    city: str
+    expected_label: str
+    selected: str = ""
+    available: list[str] = field(default_factory=list)
+    duration_seconds: float = 0.0
+    error: str = ""
+
+    @property
+    def carrier(self) -> str:
+        """Name der Spedition ohne Präfix, z.B. "fink" aus "Spedition Fink"."""
+        return self.expected_label.replace("Spedition ", "").strip().lower()
+
+    @property
+    def selected_match(self) -> bool:
+        return bool(self.selected) and self.carrier in self.selected.lower()
+
+    @property
+    def available_match(self) -> bool:
+        return any(self.carrier in method.lower() for method in self.available)
+
+    @property
+    def passed(self) -> bool:
+        return not self.error and (self.selected_match or self.available_match)
+
+
+def shipping_methods(page: StorefrontHtml) -> tuple[str, list[str]]:
+    """Gewählte und alle verfügbaren Versandarten der Confirm-Seite."""
+    choices = page.radios.get(SHIPPING_METHOD_FIELD, [])
+    selected = next((choice.label for choice in choices if choice.checked), "")
+    return selected, [choice.label for choice in choices if choice.label]
+
+
+class PlzSweep:
+    """Eine Gast-Session pro Land; pro PLZ nur Adresse speichern und Confirm-Seite lesen."""
+
+    def __init__(self, checkout: HttpCheckout, product_path: str):
+        """
+        Args:
+            checkout: ``HttpCheckout`` für den Shop
+            product_path: Speditionsprodukt für den Warenkorb
+        """
+        self.checkout = checkout
+        self.product_path = product_path
+        self.order = HttpOrder()
+        self._form: Optional[HtmlForm] = None
+
+    async def prepare(self, request, country: str, plz: str, city: str) -> None:
+        """Legt das Produkt in den Warenkorb und registriert einen Gast bis zur Confirm-Seite."""
+        await self.checkout.add_to_cart(request, self.order, [self.product_path])
+        address = Address(
+            last_name=f"Spedition-{country}",
+            street="Teststrasse 1",
+            zip_code=plz,
+            city=city,
+            country=country,
+            email=f"plz-sweep-{country.lower()}-{uuid.uuid4().hex[:8]}@example.com",
+        )
+        await self.checkout.register_guest(request, self.order, address)
+        self._form = await self.checkout.address_form(request, self.order)
+
+    async def check(self, request, case: tuple) -> PlzCheck:
+        """Setzt PLZ und Ort eines Testfalls und liest die Versandarten."""
+        test_id, country, _, plz, city, expected_label = case
+        result = PlzCheck(test_id, country, plz, city, expected_label)
+        start = time.perf_counter()
+        try:
+            if self._form is None:
+                raise RuntimeError("Sweep nicht vorbereitet (prepare)")
+            await self.checkout.save_address(request, self.order, self._form, {"zipcode": plz, "city": city})
+            page = await self.checkout.confirm_page(request, self.order)
+            result.selected, result.available = shipping_methods(page)
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+        result.duration_seconds = time.perf_counter() - start
+        return result
+
+    async def run(self, request, cases: list[tuple]) -> list[PlzCheck]:
+        """
+        Prüft alle Testfälle eines Landes in einer Session.
+
+        Schlägt die Vorbereitung fehl, erhält jeder Testfall diesen Fehler.
+        """
+        if not cases:
+            return []
+        _, country, _, plz, city, _ = cases[0]
+        try:
+            await self.prepare(request, country, plz, city)
+        except Exception as e:
+            error = f"Vorbereitung fehlgeschlagen: {type(e).__name__}: {e}"
+            return [PlzCheck(tc[0], tc[1], tc[3], tc[4], tc[5], error=error) for tc in cases]
+        return [await self.check(request, case) for case in cases]
+
+
+def format_plz_check(check: PlzCheck) -> str:
+    """Einzeilige Zusammenfassung für die Konsole."""
+    if check.error:
+        status = "FEHLER"
+    elif check.selected_match:
+        status = "OK"
+    elif check.available_match:
+        status = "WARNUNG"
+    else:
+        status = "FALSCH"
+    return (f"[{status}] {check.test_id}: PLZ {check.plz} -> '{check.selected}' "
+            f"(erwartet {check.expected_label}, {check.duration_seconds:.2f}s)")
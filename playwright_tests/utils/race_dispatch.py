@@ -0,0 +1,327 @@
+"""
+Synchronisierter Versand für Race-Condition-Tests.
+
+Requests aus getrennten Seiten oder Tasks kommen beim Server mit einigen
+zehn Millisekunden Abstand an - zu weit auseinander, um echte Races
+(Einmal-Gutschein, letzter Lagerartikel, parallele Logins) zu treffen.
+Hier wird jede Anfrage vollständig vorbereitet und erst dann gemeinsam
+freigegeben:
+
+- ``race_barrier``: Aktionen über Playwright (``APIRequestContext``), die an
+  einer ``asyncio.Barrier`` warten und gemeinsam starten. Cookies und
+  Redirects verwaltet Playwright; die Streuung liegt im Bereich weniger
+  Millisekunden (alle Requests laufen über den Playwright-Treiber).
+- ``race_last_byte``: HTTP/1.1 über eigene Sockets. Jede Verbindung ist
+  offen und hat die Anfrage bis auf das letzte Byte gesendet; danach gehen
+  alle letzten Bytes in einer Schleife ohne ``await`` hinaus. Der Server
+  kann keine Anfrage vorher verarbeiten, die Streuung liegt bei
+  Mikrosekunden. Antworten werden nicht weitergeleitet (Redirect = 302 mit
+  ``Location``).
+
+Ein HTTP/2-Burst in einem Paket bräuchte einen HTTP/2-Client (``h2``), der
+nicht zu den Abhängigkeiten gehört; ``last_byte`` erreicht über HTTP/1.1
+eine vergleichbare Gleichzeitigkeit.
+
+Beispiel:
+    requests = [await form_request(ctx, f"{base_url}/checkout/order", data) for ctx, data in prepared]
+    report = await race_last_byte(requests)
+    assert report.count(lambda r: "/checkout/finish" in r.location) <= 1
+"""
+import asyncio
+import base64
+import socket
+import ssl
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
+from urllib.parse import urlencode, urlsplit
+
+
+RACE_MODES = ("barrier", "last_byte")
+
+
+@dataclass
+class RaceRequest:
+    """Vollständig vorbereitete HTTP-Anfrage für ``race_last_byte``."""
+    method: str
+    url: str
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    label: str = ""
+
+
+@dataclass
+class RaceResponse:
+    """Antwort eines Teilnehmers mit Freigabe- und Antwortzeitpunkt (``time.perf_counter``)."""
+    index: int
+    label: str = ""
+    status: int = 0
+    headers: dict[str, str] = field(default_factory=dict)
+    body: str = ""
+    url: str = ""
+    released_at: float = 0.0
+    responded_at: float = 0.0
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        """Antwort ohne Fehler mit Status 2xx/3xx."""
+        return not self.error and 200 <= self.status < 400
+
+    @property
+    def location(self) -> str:
+        """Redirect-Ziel (``last_byte``) bzw. finale URL (``barrier``)."""
+        return self.headers.get("location", "") or self.url
+
+    @property
+    def duration_seconds(self) -> float:
+        return max(0.0, self.responded_at - self.released_at)
+
+
+@dataclass
+class RaceReport:
+    """Ergebnis eines Race-Versands: Antworten und Streuung der Freigabe."""
+    mode: str
+    responses: list[RaceResponse] = field(default_factory=list)
+
+    def _spread_ms(self, attribute: str) -> float:
+        times = [getattr(r, attribute) for r in self.responses if getattr(r, attribute)]
+        return round((max(times) - min(times)) * 1000, 3) if len(times) > 1 else 0.0
+
+    @property
+    def release_spread_ms(self) -> float:
+        """Abstand zwischen erster und letzter Freigabe (clientseitige Ankunftsstreuung)."""
+        return self._spread_ms("released_at")
+
+    @property
+    def response_spread_ms(self) -> float:
+        """Abstand zwischen erster und letzter Antwort."""
+        return self._spread_ms("responded_at")
+
+    @property
+    def statuses(self) -> Counter:
+        return Counter(r.status for r in self.responses if not r.error)
+
+    @property
+    def errors(self) -> list[str]:
+        return [f"#{r.index}: {r.error}" for r in self.responses if r.error]
+
+    def count(self, predicate: Callable[[RaceResponse], bool]) -> int:
+        """Anzahl Antworten (ohne Fehler), auf die ``predicate`` zutrifft."""
+        return sum(1 for r in self.responses if not r.error and predicate(r))
+
+    def to_dict(self) -> dict:
+        durations = sorted(r.duration_seconds for r in self.responses if not r.error)
+        return {
+            "mode": self.mode,
+            "participants": len(self.responses),
+            "release_spread_ms": self.release_spread_ms,
+            "response_spread_ms": self.response_spread_ms,
+            "statuses": {str(status): count for status, count in sorted(self.statuses.items())},
+            "errors": self.errors,
+            "max_duration_seconds": round(durations[-1], 3) if durations else 0.0,
+        }
+
+
+def format_race(report: RaceReport) -> str:
+    """Einzeilige Zusammenfassung für Konsolen-Reports."""
+    statuses = ", ".join(f"{status}: {count}" for status, count in sorted(report.statuses.items()))
+    line = (f"{report.mode}: {len(report.responses)} Teilnehmer, Freigabe-Streuung "
+            f"{report.release_spread_ms:.3f} ms, Antworten {statuses or '-'}")
+    if report.errors:
+        line += f", {len(report.errors)} Fehler"
+    return line
+
+
+# =============================================================================
+# Barrier-Modus (Playwright)
+# =============================================================================
+
+
+async def race_barrier(
+    actions: list[Callable[[], Awaitable]],
+    timeout: float = 30.0,
+    labels: Optional[list[str]] = None,
+) -> RaceReport:
+    """
+    Startet alle Aktionen gemeinsam, sobald jede an der Barriere wartet.
+
+    Args:
+        actions: Je Teilnehmer eine Funktion, die den Request sendet und eine
+            Playwright-``APIResponse`` zurückgibt (z.B. ``lambda: ctx.post(url, form=data)``)
+        timeout: Timeout pro Aktion in Sekunden
+        labels: Optionale Bezeichnungen pro Teilnehmer
+    """
+    barrier = asyncio.Barrier(len(actions))
+
+    async def run(index: int, action: Callable[[], Awaitable]) -> RaceResponse:
+        result = RaceResponse(index, label=labels[index] if labels else "")
+        await barrier.wait()
+        result.released_at = time.perf_counter()
+        try:
+            response = await asyncio.wait_for(action(), timeout)
+            result.status = response.status
+            result.headers = {k.lower(): v for k, v in response.headers.items()}
+            result.url = response.url
+            result.body = await response.text()
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+        result.responded_at = time.perf_counter()
+        return result
+
+    responses = await asyncio.gather(*(run(i, action) for i, action in enumerate(actions)))
+    return RaceReport("barrier", list(responses))
+
+
+# =============================================================================
+# Last-Byte-Modus (HTTP/1.1 über eigene Sockets)
+# =============================================================================
+
+
+def basic_auth_header(username: str, password: str) -> str:
+    """Wert für den ``Authorization``-Header (Basic Auth, z.B. Staging-Schutz)."""
+    return "Basic " + base64.b64encode(f"{username}:{password}".encode()).decode()
+
+
+def _cookie_matches(cookie: dict, host: str, path: str) -> bool:
+    domain = cookie.get("domain", "").lstrip(".")
+    return (host == domain or host.endswith(f".{domain}")) and path.startswith(cookie.get("path") or "/")
+
+
+async def form_request(
+    context,
+    url: str,
+    data: dict[str, str],
+    headers: Optional[dict[str, str]] = None,
+    label: str = "",
+) -> RaceRequest:
+    """
+    Formular-POST mit den Cookies eines Playwright-Kontexts (Session, Warenkorb).
+
+    Args:
+        context: ``APIRequestContext`` oder ``BrowserContext`` mit ``storage_state()``
+        url: Ziel-URL
+        data: Formularfelder (inkl. ``_csrf_token``, falls vorhanden)
+        headers: Weitere Header (z.B. ``Authorization``)
+        label: Bezeichnung im Report
+    """
+    parts = urlsplit(url)
+    state = await context.storage_state()
+    cookies = [c for c in state.get("cookies", []) if _cookie_matches(c, parts.hostname or "", parts.path or "/")]
+    all_headers = {"Content-Type": "application/x-www-form-urlencoded", **(headers or {})}
+    if cookies:
+        all_headers["Cookie"] = "; ".join(f"{c['name']}={c['value']}" for c in cookies)
+    return RaceRequest("POST", url, all_headers, urlencode(data).encode(), label)
+
+
+def _encode(request: RaceRequest) -> bytes:
+    parts = urlsplit(request.url)
+    target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+    headers = {"Host": parts.netloc, "Connection": "close", "User-Agent": "race-dispatch", **request.headers}
+    if request.body or request.method.upper() in ("POST", "PUT", "PATCH"):
+        headers["Content-Length"] = str(len(request.body))
+    head = f"{request.method.upper()} {target} HTTP/1.1\r\n"
+    head += "".join(f"{name}: {value}\r\n" for name, value in headers.items()) + "\r\n"
+    return head.encode("latin-1") + request.body
+
+
+def _dechunk(body: bytes) -> bytes:
+    out = bytearray()
+    while body:
+        size_line, _, rest = body.partition(b"\r\n")
+        size = int(size_line.split(b";")[0].strip() or b"0", 16)
+        if size == 0:
+            break
+        out += rest[:size]
+        body = rest[size + 2:]
+    return bytes(out)
+
+
+def parse_http_response(raw: bytes) -> tuple[int, dict[str, str], bytes]:
+    """Zerlegt eine HTTP/1.1-Antwort (bis Verbindungsende gelesen) in Status, Header und Body."""
+    head, _, body = raw.partition(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split()[1]) if lines and len(lines[0].split()) > 1 else 0
+    headers: dict[str, str] = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        body = _dechunk(body)
+    return status, headers, body
+
+
+@dataclass
+class _Connection:
+    result: RaceResponse
+    reader: Optional[asyncio.StreamReader] = None
+    writer: Optional[asyncio.StreamWriter] = None
+    tail: bytes = b""
+
+
+async def _open(index: int, request: RaceRequest, ssl_context: Optional[ssl.SSLContext]) -> _Connection:
+    """Verbindet und sendet alles bis auf das letzte Byte."""
+    conn = _Connection(RaceResponse(index, label=request.label, url=request.url))
+    parts = urlsplit(request.url)
+    https = parts.scheme == "https"
+    try:
+        conn.reader, conn.writer = await asyncio.open_connection(
+            parts.hostname,
+            parts.port or (443 if https else 80),
+            ssl=(ssl_context or ssl.create_default_context()) if https else None,
+        )
+        sock = conn.writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        payload = _encode(request)
+        conn.writer.write(payload[:-1])
+        await conn.writer.drain()
+        conn.tail = payload[-1:]
+    except Exception as e:
+        conn.result.error = f"{type(e).__name__}: {e}"
+    return conn
+
+
+async def _finish(conn: _Connection, timeout: float) -> RaceResponse:
+    result = conn.result
+    if conn.writer is None:
+        return result
+    if result.error:
+        conn.writer.close()
+        return result
+    try:
+        await conn.writer.drain()
+        raw = await asyncio.wait_for(conn.reader.read(), timeout)
+        result.responded_at = time.perf_counter()
+        status, headers, body = parse_http_response(raw)
+        result.status, result.headers = status, headers
+        result.body = body.decode("utf-8", errors="replace")
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    finally:
+        conn.writer.close()
+    return result
+
+
+async def race_last_byte(
+    requests: list[RaceRequest],
+    timeout: float = 30.0,
+    ssl_context: Optional[ssl.SSLContext] = None,
+) -> RaceReport:
+    """
+    Sendet alle Anfragen bis auf das letzte Byte und gibt sie dann gemeinsam frei.
+
+    Args:
+        requests: Vorbereitete Anfragen (siehe ``form_request``)
+        timeout: Timeout für die Antwort in Sekunden
+        ssl_context: Eigener TLS-Kontext (z.B. ohne Zertifikatsprüfung auf Staging)
+    """
+    connections = await asyncio.gather(*(_open(i, r, ssl_context) for i, r in enumerate(requests)))
+    # Freigabe ohne await dazwischen: alle letzten Bytes im selben Schleifendurchlauf
+    for conn in connections:
+        if conn.writer is not None and not conn.result.error:
+            conn.writer.write(conn.tail)
+            conn.result.released_at = time.perf_counter()
+    responses = await asyncio.gather(*(_finish(conn, timeout) for conn in connections))
+    return RaceReport("last_byte", list(responses))
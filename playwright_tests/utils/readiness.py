@@ -0,0 +1,342 @@
+"""
+Ereignisbasierte Wartebedingungen statt fester ``wait_for_timeout``-Pausen.
+
+Feste Pausen sind entweder zu lang (verschenkte Laufzeit) oder zu kurz
+(flaky Tests). Dieses Modul wartet stattdessen auf konkrete Signale:
+
+- Shopware-Warenkorb-AJAX (``/checkout/line-item/*``, Offcanvas-Cart)
+- Offcanvas öffnen/schließen
+- Netzwerk-Ruhe (``networkidle``, begrenzt - Tracker halten das Netz oft offen)
+- DOM-Ruhe: keine Struktur-Änderungen (MutationObserver) für ``quiet_ms``
+
+Alle Funktionen gibt es als sync-Variante (für pytest-playwright ``page``)
+und als ``_async``-Variante (für Page Objects / Massentests), analog zu
+``accept_cookie_banner`` / ``accept_cookie_banner_async``.
+
+Lint-Modus: ``find_fixed_sleeps()`` findet verbliebene feste Pausen
+(``pytest --lint-sleeps``). Bewusst beibehaltene Pausen werden mit dem
+Kommentar ``# readiness: allow-sleep`` markiert.
+"""
+import ast
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+
+# Shopware Storefront-Endpunkte, die den Warenkorb verändern bzw. neu rendern
+CART_UPDATE_ENDPOINTS = (
+    "/checkout/line-item/add",
+    "/checkout/line-item/change-quantity",
+    "/checkout/line-item/delete",
+    "/checkout/line-item/remove",
+    "/checkout/promotion/add",
+    "/checkout/offcanvas",
+    "/widgets/checkout/info",
+)
+
+OFFCANVAS_OPEN = ".offcanvas.show, .cart-offcanvas.show"
+OFFCANVAS_CLOSE = ".offcanvas.show .offcanvas-close, .offcanvas.show .btn-close, .offcanvas.show [data-bs-dismiss='offcanvas']"
+
+# Shopware-/Nosto-Suggest-Container im Header
+SEARCH_SUGGEST = ".search-suggest, .search-suggest-container, .ns-autocomplete, [data-search-suggest]"
+
+# Kommentar-Marker für bewusst beibehaltene feste Pausen
+ALLOW_SLEEP_MARKER = "readiness: allow-sleep"
+
+# Wartet, bis für ``quiet`` ms keine Knoten mehr eingefügt/entfernt wurden.
+# Attribute/Styles (Animationen, Slider) werden bewusst ignoriert.
+DOM_SETTLE_JS = """
+([quiet, max]) => new Promise(resolve => {
+    let timer;
+    const observer = new MutationObserver(() => {
+        clearTimeout(timer);
+        timer = setTimeout(done, quiet, true);
+    });
+    const hardStop = setTimeout(done, max, false);
+    function done(settled) {
+        observer.disconnect();
+        clearTimeout(timer);
+        clearTimeout(hardStop);
+        resolve(settled);
+    }
+    observer.observe(document.documentElement, {childList: true, subtree: true});
+    timer = setTimeout(done, quiet, true);
+})
+"""
+
+
+def endpoint_predicate(*endpoints: str):
+    """Erzeugt ein Prädikat für ``page.expect_response``, das auf URL-Teile prüft."""
+    def predicate(response) -> bool:
+        return any(endpoint in response.url for endpoint in endpoints)
+    return predicate
+
+
+is_cart_update_response = endpoint_predicate(*CART_UPDATE_ENDPOINTS)
+
+
+# =============================================================================
+# Sync-Variante (pytest-playwright)
+# =============================================================================
+
+def wait_for_dom_settle(page, quiet_ms: int = 300, timeout_ms: int = 3000) -> bool:
+    """
+    Wartet, bis das DOM für ``quiet_ms`` stabil ist.
+
+    Returns:
+        True wenn das DOM zur Ruhe kam, False wenn ``timeout_ms`` erreicht wurde
+    """
+    try:
+        return page.evaluate(DOM_SETTLE_JS, [quiet_ms, timeout_ms])
+    except Exception:
+        # Navigation während der Messung zerstört den Kontext - kein Fehler
+        return False
+
+
+def wait_for_network_quiet(page, timeout_ms: int = 5000) -> bool:
+    """
+    Wartet auf Netzwerk-Ruhe (keine Requests für 500 ms), höchstens ``timeout_ms``.
+
+    Returns:
+        True bei Ruhe, False wenn z.B. Tracker das Netzwerk offen halten
+    """
+    try:
+        page.wait_for_load_state("networkidle", timeout=timeout_ms)
+        return True
+    except Exception:
+        return False
+
+
+def wait_for_settled(page, timeout_ms: int = 3000) -> None:
+    """Wartet nach einer Interaktion auf Netzwerk- und DOM-Ruhe."""
+    wait_for_network_quiet(page, timeout_ms=timeout_ms)
+    wait_for_dom_settle(page, timeout_ms=min(timeout_ms, 3000))
+
+
+def wait_for_page_ready(page, timeout_ms: int = 10000) -> None:
+    """Wartet nach einer Navigation, bis die Seite benutzbar und stabil ist."""
+    page.wait_for_load_state("domcontentloaded", timeout=timeout_ms)
+    wait_for_settled(page, timeout_ms=min(timeout_ms, 3000))
+
+
+def submit_and_wait_for_page(page, locator, key: Optional[str] = None, timeout_ms: int = 15000) -> bool:
+    """
+    Klickt ``locator`` (bzw. drückt ``key`` darin) und wartet auf die ausgelöste Navigation.
+
+    ``wait_for_page_ready`` direkt nach dem Klick sähe noch die alte, bereits
+    geladene Seite. Bleibt die Navigation aus (z.B. Browser-Validierung des
+    Formulars), wird nur auf Ruhe gewartet.
+
+    Returns:
+        True wenn eine Navigation stattfand
+    """
+    try:
+        with page.expect_navigation(wait_until="domcontentloaded", timeout=timeout_ms):
+            if key:
+                locator.press(key)
+            else:
+                locator.click()
+        navigated = True
+    except PlaywrightTimeoutError:
+        navigated = False
+    wait_for_settled(page, timeout_ms=3000)
+    return navigated
+
+
+def wait_for_search_suggest(page, timeout_ms: int = 5000) -> bool:
+    """
+    Wartet nach einer Sucheingabe auf den sichtbaren Suggest-Container und DOM-Ruhe.
+
+    Returns:
+        True wenn ein Suggest-Container erschien
+    """
+    try:
+        page.locator(SEARCH_SUGGEST).first.wait_for(state="visible", timeout=timeout_ms)
+    except Exception:
+        return False
+    wait_for_dom_settle(page)
+    return True
+
+
+def click_and_wait_for_cart(page, locator, timeout_ms: int = 15000) -> bool:
+    """
+    Klickt einen Warenkorb-Button und wartet auf die Shopware-Antwort.
+
+    Wartet danach auf den Offcanvas-Cart (falls er sich öffnet) und DOM-Ruhe.
+
+    Returns:
+        True wenn eine Warenkorb-Antwort eintraf, sonst False
+    """
+    try:
+        with page.expect_response(is_cart_update_response, timeout=timeout_ms):
+            locator.click()
+    except PlaywrightTimeoutError:
+        return False
+
+    try:
+        page.locator(OFFCANVAS_OPEN).first.wait_for(state="visible", timeout=3000)
+    except Exception:
+        pass  # Nicht jede Aktion öffnet den Offcanvas-Cart
+    wait_for_dom_settle(page)
+    return True
+
+
+def close_offcanvas_cart(page, timeout_ms: int = 3000) -> bool:
+    """
+    Schließt den Offcanvas-Cart, falls offen, und wartet bis er verschwunden ist.
+
+    Returns:
+        True wenn ein offener Offcanvas geschlossen wurde
+    """
+    close = page.locator(OFFCANVAS_CLOSE)
+    try:
+        if close.count() == 0 or not close.first.is_visible():
+            return False
+        close.first.click()
+        page.locator(OFFCANVAS_OPEN).first.wait_for(state="hidden", timeout=timeout_ms)
+        return True
+    except Exception:
+        return False
+
+
+# =============================================================================
+# Async-Variante (Page Objects, Massen- und Performance-Tests)
+# =============================================================================
+
+async def wait_for_dom_settle_async(page, quiet_ms: int = 300, timeout_ms: int = 3000) -> bool:
+    """Async-Variante von ``wait_for_dom_settle``."""
+    try:
+        return await page.evaluate(DOM_SETTLE_JS, [quiet_ms, timeout_ms])
+    except Exception:
+        return False
+
+
+async def wait_for_network_quiet_async(page, timeout_ms: int = 5000) -> bool:
+    """Async-Variante von ``wait_for_network_quiet``."""
+    try:
+        await page.wait_for_load_state("networkidle", timeout=timeout_ms)
+        return True
+    except Exception:
+        return False
+
+
+async def wait_for_settled_async(page, timeout_ms: int = 3000) -> None:
+    """Async-Variante von ``wait_for_settled``."""
+    await wait_for_network_quiet_async(page, timeout_ms=timeout_ms)
+    await wait_for_dom_settle_async(page, timeout_ms=min(timeout_ms, 3000))
+
+
+async def wait_for_page_ready_async(page, timeout_ms: int = 10000) -> None:
+    """Async-Variante von ``wait_for_page_ready``."""
+    await page.wait_for_load_state("domcontentloaded", timeout=timeout_ms)
+    await wait_for_settled_async(page, timeout_ms=min(timeout_ms, 3000))
+
+
+async def submit_and_wait_for_page_async(page, locator, key: Optional[str] = None, timeout_ms: int = 15000) -> bool:
+    """Async-Variante von ``submit_and_wait_for_page``."""
+    try:
+        async with page.expect_navigation(wait_until="domcontentloaded", timeout=timeout_ms):
+            if key:
+                await locator.press(key)
+            else:
+                await locator.click()
+        navigated = True
+    except PlaywrightTimeoutError:
+        navigated = False
+    await wait_for_settled_async(page, timeout_ms=3000)
+    return navigated
+
+
+async def wait_for_search_suggest_async(page, timeout_ms: int = 5000) -> bool:
+    """Async-Variante von ``wait_for_search_suggest``."""
+    try:
+        await page.locator(SEARCH_SUGGEST).first.wait_for(state="visible", timeout=timeout_ms)
+    except Exception:
+        return False
+    await wait_for_dom_settle_async(page)
+    return True
+
+
+async def click_and_wait_for_cart_async(page, locator, timeout_ms: int = 15000) -> bool:
+    """Async-Variante von ``click_and_wait_for_cart``."""
+    try:
+        async with page.expect_response(is_cart_update_response, timeout=timeout_ms):
+            await locator.click()
+    except PlaywrightTimeoutError:
+        return False
+
+    try:
+        await page.locator(OFFCANVAS_OPEN).first.wait_for(state="visible", timeout=3000)
+    except Exception:
+        pass
+    await wait_for_dom_settle_async(page)
+    return True
+
+
+async def close_offcanvas_cart_async(page, timeout_ms: int = 3000) -> bool:
+    """Async-Variante von ``close_offcanvas_cart``."""
+    close = page.locator(OFFCANVAS_CLOSE)
+    try:
+        if await close.count() == 0 or not await close.first.is_visible():
+            return False
+        await close.first.click()
+        await page.locator(OFFCANVAS_OPEN).first.wait_for(state="hidden", timeout=timeout_ms)
+        return True
+    except Exception:
+        return False
+
+
+# =============================================================================
+# Lint-Modus: verbliebene feste Pausen finden
+# =============================================================================
+
+@dataclass
+class SleepFinding:
+    """Eine feste Pause im Quellcode."""
+    path: Path
+    line: int
+    call: str
+    source: str
+
+    def __str__(self) -> str:
+        return f"{self.path}:{self.line}: {self.call} -> {self.source.strip()}"
+
+
+def _call_name(node: ast.Call) -> str:
+    func = node.func
+    if isinstance(func, ast.Attribute):
+        owner = func.value.id if isinstance(func.value, ast.Name) else "..."
+        return f"{owner}.{func.attr}"
+    if isinstance(func, ast.Name):
+        return func.id
+    return ""
+
+
+def _is_fixed_sleep(node: ast.Call) -> bool:
+    name = _call_name(node)
+    return name.endswith(".wait_for_timeout") or name in ("time.sleep", "asyncio.sleep")
+
+
+def find_fixed_sleeps(paths: Iterable[Path]) -> list[SleepFinding]:
+    """
+    Findet ``wait_for_timeout``, ``time.sleep`` und ``asyncio.sleep`` in Python-Dateien.
+
+    Zeilen mit ``# readiness: allow-sleep`` werden übersprungen.
+    """
+    findings = []
+    for path in paths:
+        source = path.read_text(encoding="utf-8")
+        lines = source.splitlines()
+        try:
+            tree = ast.parse(source, filename=str(path))
+        except SyntaxError:
+            continue
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Call) and _is_fixed_sleep(node):
+                line = lines[node.lineno - 1] if node.lineno <= len(lines) else ""
+                if ALLOW_SLEEP_MARKER in line:
+                    continue
+                findings.append(SleepFinding(path, node.lineno, _call_name(node), line))
+    return sorted(findings, key=lambda f: (str(f.path), f.line))
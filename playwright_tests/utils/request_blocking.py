@@ -0,0 +1,295 @@
+"""
+Blockier-Profile für Drittanbieter-Requests in Last- und Performance-Läufen.
+
+Massen- und Performance-Tests sollen Shopware messen, nicht Nosto,
+Usercentrics, Analytics oder Bild-CDNs. Ein ``RequestBlocker`` hängt sich per
+``context.route`` an einen Browser-Kontext und entscheidet pro Request:
+
+- ``stub``: Consent-Skripte werden mit leerem Inhalt beantwortet
+  (kein Banner, keine Folge-Requests, Seite läuft trotzdem)
+- ``abort``: blockierte Ressourcentypen (Bilder, Fonts, Medien), bekannte
+  Tracker-Hosts und - je nach Profil - alle Hosts außerhalb der Allow-List
+- ``pass``: alles andere, insbesondere die Shop-Origin
+
+Die Entscheidungen werden in ``RequestBlockingStats`` gezählt und landen im
+Report. Profile werden per Name gewählt (``PROFILES``), über die Konfiguration
+(``request_blocking``) pro Test-Marker oder per ``--block-profile``.
+"""
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+from urllib.parse import urlparse
+
+
+class RouteAction:
+    """Entscheidungen für einen abgefangenen Request."""
+    PASS = "pass"
+    ABORT = "abort"
+    STUB = "stub"
+
+
+# Analytics, Tag-Manager, Empfehlungen, Session-Recording
+TRACKER_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googleadservices.com",
+    "facebook.net",
+    "facebook.com",
+    "bat.bing.com",
+    "clarity.ms",
+    "hotjar.com",
+    "nosto.com",
+    "pinterest.com",
+    "tiktok.com",
+)
+
+# Consent-Management: wird mit leerem Skript beantwortet statt abgebrochen,
+# damit wartende Inline-Skripte nicht in Fehler laufen
+CONSENT_HOSTS = (
+    "usercentrics.eu",
+    "usercentrics.com",
+)
+
+ASSET_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+STUB_CONTENT_TYPES = {
+    "script": "application/javascript",
+    "stylesheet": "text/css",
+    "xhr": "application/json",
+    "fetch": "application/json",
+}
+
+
+def _host_matches(host: str, hosts: Iterable[str]) -> bool:
+    """Prüft Host und Subdomains: 'app.usercentrics.eu' passt auf 'usercentrics.eu'."""
+    return any(host == h or host.endswith("." + h) for h in hosts)
+
+
+@dataclass(frozen=True)
+class BlockingProfile:
+    """Welche Requests ein ``RequestBlocker`` blockiert oder durch Stubs ersetzt."""
+    name: str
+    block_resource_types: frozenset = frozenset()
+    block_hosts: tuple[str, ...] = ()
+    stub_hosts: tuple[str, ...] = ()
+    block_third_party: bool = False  # alles außerhalb der Allow-List blockieren
+
+
+PROFILES: dict[str, BlockingProfile] = {
+    "none": BlockingProfile(name="none"),
+    "assets": BlockingProfile(name="assets", block_resource_types=ASSET_RESOURCE_TYPES),
+    "trackers": BlockingProfile(name="trackers", block_hosts=TRACKER_HOSTS, stub_hosts=CONSENT_HOSTS),
+    "load": BlockingProfile(
+        name="load",
+        block_resource_types=ASSET_RESOURCE_TYPES,
+        block_hosts=TRACKER_HOSTS,
+        stub_hosts=CONSENT_HOSTS,
+        block_third_party=True,
+    ),
+}
+
+
+def get_profile(name: str) -> BlockingProfile:
+    """
+    Gibt ein Profil nach Namen zurück.
+
+    Raises:
+        ValueError: Bei unbekanntem Profil
+    """
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unbekanntes Blockier-Profil: {name} (verfügbar: {', '.join(PROFILES)})")
+
+
+@dataclass
+class RequestBlockingStats:
+    """Zähler für durchgelassene, blockierte und gestubbte Requests."""
+    passed: int = 0
+    blocked: int = 0
+    stubbed: int = 0
+    by_reason: Counter = field(default_factory=Counter)
+
+    @property
+    def total(self) -> int:
+        return self.passed + self.blocked + self.stubbed
+
+    def count(self, action: str, reason: str) -> None:
+        if action == RouteAction.ABORT:
+            self.blocked += 1
+        elif action == RouteAction.STUB:
+            self.stubbed += 1
+        else:
+            self.passed += 1
+            return
+        self.by_reason[reason] += 1
+
+    def merge(self, data: dict) -> None:
+        """Übernimmt ``to_dict()``-Daten (z.B. aus einem Shard-Prozess)."""
+        self.passed += data.get("passed", 0)
+        self.blocked += data.get("blocked", 0)
+        self.stubbed += data.get("stubbed", 0)
+        self.by_reason.update(data.get("by_reason", {}))
+
+    def to_dict(self) -> dict:
+        """Konvertiert die Statistik in ein Dictionary für JSON-Export."""
+        return {
+            "passed": self.passed,
+            "blocked": self.blocked,
+            "stubbed": self.stubbed,
+            "blocked_percent": round(100 * (self.blocked + self.stubbed) / self.total, 1) if self.total else 0.0,
+            "by_reason": dict(self.by_reason.most_common()),
+        }
+
+
+class RequestBlocker:
+    """
+    Fängt Requests eines Browser-Kontexts ab und wendet ein Blockier-Profil an.
+
+    Eine Instanz kann an beliebig viele Kontexte gehängt werden; die
+    Statistik wird über alle Kontexte summiert.
+
+    Beispiel:
+        blocker = RequestBlocker(get_profile("load"), allow_hosts=["shop.example.com"])
+        await blocker.attach_async(context)
+        ...
+        await blocker.detach_async(context)
+        print(blocker.stats.to_dict())
+    """
+
+    def __init__(self, profile: BlockingProfile, allow_hosts: Iterable[str] = ()):
+        """
+        Args:
+            profile: Blockier-Profil
+            allow_hosts: Hosts, die nie als Drittanbieter gelten (Shop-Origin, Zahlungsanbieter)
+        """
+        self.profile = profile
+        self.allow_hosts = tuple(h for h in allow_hosts if h)
+        self.stats = RequestBlockingStats()
+
+    @classmethod
+    def for_base_url(cls, profile: BlockingProfile, base_url: str, extra_hosts: Iterable[str] = ()) -> "RequestBlocker":
+        """Erstellt einen Blocker mit der Shop-Origin auf der Allow-List."""
+        return cls(profile, allow_hosts=[urlparse(base_url).hostname or "", *extra_hosts])
+
+    @property
+    def active(self) -> bool:
+        p = self.profile
+        return bool(p.block_resource_types or p.block_hosts or p.stub_hosts or p.block_third_party)
+
+    def report(self) -> dict:
+        """Profilname und Statistik für den Report."""
+        return {"profile": self.profile.name, **self.stats.to_dict()}
+
+    def decide(self, url: str, resource_type: str) -> tuple[str, str]:
+        """
+        Entscheidet über einen Request.
+
+        Returns:
+            (Aktion aus ``RouteAction``, Grund für die Statistik)
+        """
+        host = (urlparse(url).hostname or "").lower()
+        if not host:
+            return RouteAction.PASS, ""  # data:, blob: usw.
+
+        if _host_matches(host, self.profile.stub_hosts):
+            return RouteAction.STUB, "consent"
+        if resource_type in self.profile.block_resource_types:
+            return RouteAction.ABORT, resource_type
+        if _host_matches(host, self.allow_hosts):
+            return RouteAction.PASS, ""
+        if _host_matches(host, self.profile.block_hosts):
+            return RouteAction.ABORT, "tracker"
+        if self.profile.block_third_party:
+            return RouteAction.ABORT, "third_party"
+        return RouteAction.PASS, ""
+
+    def _stub_response(self, resource_type: str) -> dict:
+        return {"status": 200, "body": "", "content_type": STUB_CONTENT_TYPES.get(resource_type, "text/plain")}
+
+    # =========================================================================
+    # Sync-Variante (pytest-playwright)
+    # =========================================================================
+
+    def _handle(self, route) -> None:
+        request = route.request
+        action, reason = self.decide(request.url, request.resource_type)
+        self.stats.count(action, reason)
+        if action == RouteAction.ABORT:
+            route.abort("blockedbyclient")
+        elif action == RouteAction.STUB:
+            route.fulfill(**self._stub_response(request.resource_type))
+        else:
+            route.fallback()
+
+    def attach(self, context) -> None:
+        """Aktiviert das Profil für einen (sync) Browser-Kontext."""
+        if self.active:
+            context.route("**/*", self._handle)
+
+    def detach(self, context) -> None:
+        """Entfernt das Profil wieder; ein bereits geschlossener Kontext ist kein Fehler."""
+        if self.active:
+            try:
+                context.unroute("**/*", self._handle)
+            except Exception:
+                pass  # Kontext bereits geschlossen
+
+    # =========================================================================
+    # Async-Variante (Massen- und Performance-Tests)
+    # =========================================================================
+
+    async def _handle_async(self, route) -> None:
+        request = route.request
+        action, reason = self.decide(request.url, request.resource_type)
+        self.stats.count(action, reason)
+        if action == RouteAction.ABORT:
+            await route.abort("blockedbyclient")
+        elif action == RouteAction.STUB:
+            await route.fulfill(**self._stub_response(request.resource_type))
+        else:
+            await route.fallback()
+
+    async def attach_async(self, context) -> None:
+        """Aktiviert das Profil für einen (async) Browser-Kontext."""
+        if self.active:
+            await context.route("**/*", self._handle_async)
+
+    async def detach_async(self, context) -> None:
+        """Entfernt das Profil wieder (wichtig bei wiederverwendeten Pool-Kontexten)."""
+        if self.active:
+            try:
+                await context.unroute("**/*", self._handle_async)
+            except Exception:
+                pass  # Kontext bereits geschlossen
+
+
+def format_blocking(report: dict) -> str:
+    """Einzeilige Zusammenfassung für Konsolen-Reports."""
+    total = report["passed"] + report["blocked"] + report["stubbed"]
+    return (f"{report['blocked']} blockiert, {report['stubbed']} gestubbt von {total} Requests "
+            f"({report['blocked_percent']:.0f}%, Profil {report['profile']})")
+
+
+def resolve_profile_name(
+    cli_profile: Optional[str],
+    markers: Iterable[str],
+    enabled: bool,
+    default_profile: str,
+    marker_profiles: dict[str, str],
+) -> str:
+    """
+    Ermittelt das Profil für einen Test.
+
+    Reihenfolge: ``--block-profile`` > Marker-Zuordnung > Standardprofil.
+    Ohne ``enabled`` gilt nur die CLI-Option.
+    """
+    if cli_profile:
+        return cli_profile
+    if not enabled:
+        return "none"
+    for marker in markers:
+        if marker in marker_profiles:
+            return marker_profiles[marker]
+    return default_profile
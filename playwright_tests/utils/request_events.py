@@ -0,0 +1,53 @@
+"""
+Gemeinsame Verdrahtung der Request-Events eines Browser-Kontexts.
+
+Playwright meldet Antwort (``response``) und Abschluss eines Requests
+(``requestfinished``/``requestfailed``) getrennt; Zeitphasen in
+``request.timing`` sind erst beim Abschluss vollständig. ``RequestEventListener``
+merkt sich die Antwort bis zum Abschluss und übergibt beides an
+``_complete()`` - Basis für ``ResponseMetricsCollector`` und
+``NetworkTraceRecorder``.
+"""
+from typing import Optional
+
+from playwright.async_api import BrowserContext
+
+
+class RequestEventListener:
+    """
+    Basisklasse: führt Antwort und Abschluss eines Requests zusammen.
+
+    Unterklassen implementieren ``_complete(request, response, failure)`` und
+    können mit ``_accept(response)`` Antworten vorab verwerfen (hält den
+    Zwischenspeicher klein). ``response`` ist bei Requests ohne (akzeptierte)
+    Antwort ``None``, ``failure`` nur bei ``requestfailed`` gesetzt.
+    """
+
+    def __init__(self):
+        self._responses: dict = {}
+
+    def _accept(self, response) -> bool:
+        return True
+
+    def _complete(self, request, response, failure: Optional[str]) -> None:
+        raise NotImplementedError
+
+    def _on_response(self, response) -> None:
+        if self._accept(response):
+            self._responses[response.request] = response
+
+    def _on_finished(self, request) -> None:
+        self._complete(request, self._responses.pop(request, None), None)
+
+    def _on_failed(self, request) -> None:
+        self._complete(request, self._responses.pop(request, None), request.failure or "failed")
+
+    def _listen(self, context: BrowserContext) -> None:
+        context.on("response", self._on_response)
+        context.on("requestfinished", self._on_finished)
+        context.on("requestfailed", self._on_failed)
+
+    def _unlisten(self, context: BrowserContext) -> None:
+        context.remove_listener("response", self._on_response)
+        context.remove_listener("requestfinished", self._on_finished)
+        context.remove_listener("requestfailed", self._on_failed)
@@ -0,0 +1,254 @@
+"""
+Backend-Kennzahlen aus Shopware-Antworten (TTFB, Server-Timing, HTTP-Cache).
+
+Die End-to-End-Dauer einer Bestellung trennt nicht zwischen Serverzeit,
+Rendering im Browser und Drittanbieter-Skripten. ``ResponseMetricsCollector``
+wertet deshalb die Antworten der Shop-Origin aus, gruppiert nach Seitentyp:
+
+- Dokumente (``home``, ``pdp``, ``account``, ``page``)
+- ``checkout/*`` und ``widgets/*`` (auch XHR/Fetch)
+
+Pro Seitentyp werden TTFB und Serverzeit (``Server-Timing``) als Histogramm,
+Cache-Status (HIT/MISS/PASS aus ``X-Cache``, ``X-Symfony-Cache``,
+``X-Varnish``, ``Age`` ...) und Antwortgröße erfasst. Damit lässt sich eine
+Regression auf Cache-Misses oder langsames PHP eingrenzen.
+"""
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional
+from urllib.parse import urlsplit
+
+from playwright.async_api import BrowserContext
+
+from playwright_tests.utils.latency_histogram import LatencyHistogram, LatencyHistogramSet
+from playwright_tests.utils.request_events import RequestEventListener
+
+
+class CacheStatus:
+    """Normalisierter Cache-Status einer Antwort."""
+    HIT = "hit"
+    MISS = "miss"
+    PASS = "pass"  # am Cache vorbei (z.B. Warenkorb, eingeloggte Kunden)
+    UNKNOWN = "unknown"
+
+
+# Header, deren Wert HIT/MISS/PASS direkt enthält (in dieser Reihenfolge geprüft)
+_CACHE_HEADERS = ("x-cache", "x-cache-status", "cf-cache-status", "x-varnish-cache", "x-symfony-cache")
+
+_SERVER_TIMING_ENTRY = re.compile(r"^\s*([^;,\s]+)")
+_SERVER_TIMING_DUR = re.compile(r";\s*dur=([0-9.]+)")
+
+
+def page_type(url: str, resource_type: str) -> Optional[str]:
+    """
+    Seitentyp einer Shop-Antwort oder None (nicht erfasst).
+
+    Beispiel:
+        page_type("https://shop.at/checkout/confirm", "document")  # -> "checkout/confirm"
+        page_type("https://shop.at/widgets/checkout/info", "fetch")  # -> "widgets/checkout"
+    """
+    segments = [s for s in urlsplit(url).path.split("/") if s]
+    if segments and segments[0] in ("checkout", "widgets"):
+        return "/".join(segments[:2])
+    if resource_type != "document":
+        return None
+    if not segments:
+        return "home"
+    if segments[0] == "p":
+        return "pdp"
+    if segments[0] == "account":
+        return "account"
+    return "page"
+
+
+def cache_status(headers: dict[str, str]) -> str:
+    """Ermittelt HIT/MISS/PASS aus den üblichen Cache-Headern (Namen in Kleinbuchstaben)."""
+    for name in _CACHE_HEADERS:
+        value = headers.get(name, "").lower()
+        if not value:
+            continue
+        if "hit" in value or "fresh" in value:
+            return CacheStatus.HIT
+        if "miss" in value or "stale" in value or "invalid" in value:
+            return CacheStatus.MISS
+        if "pass" in value or "bypass" in value or "dynamic" in value:
+            return CacheStatus.PASS
+    varnish = headers.get("x-varnish")
+    if varnish:
+        # Varnish: zwei Transaktions-IDs = aus dem Cache, eine = Backend
+        return CacheStatus.HIT if len(varnish.split()) > 1 else CacheStatus.MISS
+    age = headers.get("age", "")
+    if age.isdigit() and int(age) > 0:
+        return CacheStatus.HIT
+    return CacheStatus.UNKNOWN
+
+
+def parse_server_timing(value: str) -> dict[str, float]:
+    """
+    Liest ``Server-Timing`` in ``{name: dauer_ms}`` (Einträge ohne ``dur`` fehlen).
+
+    Beispiel:
+        parse_server_timing('db;dur=53, app;desc="PHP";dur=47.2')  # -> {"db": 53.0, "app": 47.2}
+    """
+    result = {}
+    for part in value.split(","):
+        name = _SERVER_TIMING_ENTRY.match(part)
+        dur = _SERVER_TIMING_DUR.search(part)
+        if name and dur:
+            result[name.group(1)] = float(dur.group(1))
+    return result
+
+
+def server_time_ms(timings: dict[str, float]) -> Optional[float]:
+    """Serverzeit einer Antwort: ``total`` falls vorhanden, sonst der längste Eintrag."""
+    if not timings:
+        return None
+    return timings.get("total", max(timings.values()))
+
+
+@dataclass
+class _PageTypeTotals:
+    count: int = 0
+    bytes: int = 0
+    sized: int = 0
+    cache: Counter = field(default_factory=Counter)
+    server_timing_ms: Counter = field(default_factory=Counter)  # Summe pro Server-Timing-Eintrag
+    server_timing_count: Counter = field(default_factory=Counter)
+
+
+@dataclass
+class ResponseMetrics:
+    """TTFB, Serverzeit, Cache-Status und Größe pro Seitentyp (über alle Bestellungen)."""
+    ttfb: LatencyHistogramSet = field(default_factory=LatencyHistogramSet)
+    server_time: LatencyHistogramSet = field(default_factory=LatencyHistogramSet)
+    totals: dict[str, _PageTypeTotals] = field(default_factory=dict)
+
+    def record(
+        self,
+        kind: str,
+        ttfb_ms: Optional[float],
+        headers: dict[str, str],
+    ) -> None:
+        """Übernimmt eine Antwort des Seitentyps ``kind``."""
+        totals = self.totals.setdefault(kind, _PageTypeTotals())
+        totals.count += 1
+        totals.cache[cache_status(headers)] += 1
+        length = headers.get("content-length", "")
+        if length.isdigit():
+            totals.bytes += int(length)
+            totals.sized += 1
+        if ttfb_ms is not None:
+            self.ttfb.record(kind, ttfb_ms / 1000)
+        timings = parse_server_timing(headers.get("server-timing", ""))
+        for name, ms in timings.items():
+            totals.server_timing_ms[name] += ms
+            totals.server_timing_count[name] += 1
+        server_ms = server_time_ms(timings)
+        if server_ms is not None:
+            self.server_time.record(kind, server_ms / 1000)
+
+    def merge(self, data: dict) -> None:
+        """Übernimmt ``to_dict()``-Daten (z.B. aus einem Shard-Prozess)."""
+        for kind, info in data.items():
+            totals = self.totals.setdefault(kind, _PageTypeTotals())
+            totals.count += info["count"]
+            totals.bytes += info["bytes"]
+            totals.sized += info["sized"]
+            totals.cache.update(info["cache"])
+            for name, timing in info["server_timing"].items():
+                totals.server_timing_ms[name] += timing["total_ms"]
+                totals.server_timing_count[name] += timing["count"]
+            for histograms, key in ((self.ttfb, "ttfb"), (self.server_time, "server_time")):
+                if info[key]:
+                    histograms.get(kind).merge(LatencyHistogram.from_dict(info[key]))
+
+    def __len__(self) -> int:
+        return len(self.totals)
+
+    def to_dict(self) -> dict[str, dict]:
+        """Konvertiert die Kennzahlen in ein Dictionary für JSON-Export (zusammenführbar)."""
+        result = {}
+        for kind, totals in sorted(self.totals.items()):
+            known = totals.cache[CacheStatus.HIT] + totals.cache[CacheStatus.MISS]
+            ttfb = self.ttfb.histograms.get(kind)
+            server = self.server_time.histograms.get(kind)
+            result[kind] = {
+                "count": totals.count,
+                "ttfb": ttfb.to_dict() if ttfb else None,
+                "server_time": server.to_dict() if server else None,
+                "cache": dict(totals.cache),
+                "cache_hit_rate": round(totals.cache[CacheStatus.HIT] / known, 3) if known else None,
+                "bytes": totals.bytes,
+                "sized": totals.sized,
+                "avg_bytes": round(totals.bytes / totals.sized) if totals.sized else None,
+                "server_timing": {
+                    name: {
+                        "count": totals.server_timing_count[name],
+                        "total_ms": round(ms, 1),
+                        "avg_ms": round(ms / totals.server_timing_count[name], 1),
+                    }
+                    for name, ms in totals.server_timing_ms.most_common()
+                },
+            }
+        return result
+
+
+def format_response_metrics(kind: str, info: dict) -> str:
+    """Einzeilige Zusammenfassung eines Seitentyps für Konsolen-Reports."""
+    parts = [f"{info['count']}x"]
+    if info["ttfb"]:
+        parts.append(f"TTFB p50 {info['ttfb']['p50'] * 1000:.0f}ms p95 {info['ttfb']['p95'] * 1000:.0f}ms")
+    if info["server_time"]:
+        parts.append(f"Server p50 {info['server_time']['p50'] * 1000:.0f}ms")
+    if info["cache_hit_rate"] is not None:
+        parts.append(f"Cache-HIT {info['cache_hit_rate']:.0%}")
+    if info["avg_bytes"] is not None:
+        parts.append(f"Ø {info['avg_bytes'] / 1024:.0f} KB")
+    return f"{kind:22} " + ", ".join(parts)
+
+
+class ResponseMetricsCollector(RequestEventListener):
+    """
+    Sammelt Backend-Kennzahlen der Shop-Origin aus beliebig vielen Kontexten.
+
+    Eine Instanz kann an mehrere Kontexte gleichzeitig gehängt werden; die
+    Kennzahlen werden über alle Kontexte summiert.
+
+    Beispiel:
+        collector = ResponseMetricsCollector("https://shop.at")
+        collector.attach(context)
+        try:
+            await run_order()
+        finally:
+            collector.detach(context)
+        collector.metrics.to_dict()
+    """
+
+    def __init__(self, base_url: str, enabled: bool = True):
+        super().__init__()
+        self.enabled = enabled
+        self.origin = urlsplit(base_url).netloc
+        self.metrics = ResponseMetrics()
+
+    def _accept(self, response) -> bool:
+        request = response.request
+        return urlsplit(request.url).netloc == self.origin and page_type(request.url, request.resource_type) is not None
+
+    def _complete(self, request, response, failure: Optional[str]) -> None:
+        if response is None or failure:
+            return
+        timing = request.timing or {}
+        start, first_byte = timing.get("requestStart", -1), timing.get("responseStart", -1)
+        ttfb_ms = first_byte - start if start >= 0 and first_byte >= 0 else None
+        self.metrics.record(page_type(request.url, request.resource_type), ttfb_ms, response.headers)
+
+    def attach(self, context: BrowserContext) -> None:
+        """Hängt den Collector an einen Kontext (alle Seiten des Kontexts)."""
+        if self.enabled:
+            self._listen(context)
+
+    def detach(self, context: BrowserContext) -> None:
+        """Entfernt die Listener von einem Kontext (wichtig bei Pool-Kontexten)."""
+        if self.enabled:
+            self._unlisten(context)
@@ -0,0 +1,278 @@
+"""
+Einzelergebnisse während des Laufs streamen und live auswerten.
+
+Der JSON-Report am Ende eines Massen- oder Performance-Tests enthält nur die
+Zusammenfassung - bricht ein 15-Minuten-Lauf ab, ist alles verloren. Dieses
+Modul schreibt jede abgeschlossene Bestellung sofort als eine Zeile in eine
+JSONL-Datei (nur anhängen, nach jeder Zeile geflusht):
+
+    {"type": "run", "run_id": "...", "started_at": "...", "meta": {...}}
+    {"type": "order", "seq": 0, "t": 12.34, "data": {...}}
+    ...
+    {"type": "end", "finished_at": "...", "summary": {...}}
+
+Fehlt die ``end``-Zeile, wurde der Lauf abgebrochen; ``read_stream()`` liest
+die Datei trotzdem (eine halb geschriebene letzte Zeile wird übersprungen).
+
+``LiveAggregator`` zählt parallel dazu mit und gibt alle ``interval`` Sekunden
+Durchsatz, Fehlerquote und Perzentile des letzten Zeitfensters aus.
+"""
+import asyncio
+import json
+import os
+import secrets
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+from playwright_tests.utils.latency_histogram import LatencyHistogram, format_percentiles
+
+
+def new_run_id(prefix: str) -> str:
+    """Eindeutige Lauf-ID, z.B. ``performance-20250101-120000-3f9a``."""
+    return f"{prefix}-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{secrets.token_hex(2)}"
+
+
+class ResultStream:
+    """
+    Append-only JSONL-Datei mit einer Zeile pro Bestellung.
+
+    Beispiel:
+        with ResultStream(Path("reports/stream/run.jsonl"), run_id) as stream:
+            stream.write(res.to_dict())
+            ...
+            stream.close(summary=result.to_dict())
+    """
+
+    def __init__(self, path: Path, run_id: str, meta: Optional[dict] = None, fsync: bool = False):
+        """
+        Args:
+            path: Zieldatei (wird angelegt bzw. fortgeschrieben)
+            run_id: Lauf-ID für Kopfzeile und spätere Zuordnung
+            meta: Zusatzinfos für die Kopfzeile (Profil, Parallelität, ...)
+            fsync: Nach jeder Zeile auf Platte erzwingen (langsamer, übersteht auch Systemabstürze)
+        """
+        self.path = Path(path)
+        self.run_id = run_id
+        self.meta = meta or {}
+        self.fsync = fsync
+        self.written = 0
+        self._start = time.monotonic()
+        self._file = None
+
+    def open(self) -> "ResultStream":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._write_line({
+            "type": "run",
+            "run_id": self.run_id,
+            "started_at": datetime.now().isoformat(),
+            "meta": self.meta,
+        })
+        return self
+
+    def _write_line(self, record: dict) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def write(self, data: dict) -> None:
+        """Schreibt ein Einzelergebnis."""
+        if self._file is None:
+            return
+        self._write_line({
+            "type": "order",
+            "seq": self.written,
+            "t": round(time.monotonic() - self._start, 3),
+            "data": data,
+        })
+        self.written += 1
+
+    def close(self, summary: Optional[dict] = None) -> None:
+        """Schließt die Datei; mit ``summary`` gilt der Lauf als vollständig."""
+        if self._file is None:
+            return
+        if summary is not None:
+            self._write_line({"type": "end", "finished_at": datetime.now().isoformat(), "summary": summary})
+        self._file.close()
+        self._file = None
+
+    def __enter__(self) -> "ResultStream":
+        return self.open()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+@dataclass
+class StreamContents:
+    """Inhalt einer Stream-Datei."""
+    run_id: str = ""
+    meta: dict = field(default_factory=dict)
+    orders: list[dict] = field(default_factory=list)
+    summary: Optional[dict] = None
+    skipped_lines: int = 0  # unlesbare (z.B. beim Absturz abgeschnittene) Zeilen
+
+    @property
+    def finished(self) -> bool:
+        return self.summary is not None
+
+
+def read_stream(path: Path) -> StreamContents:
+    """
+    Liest eine Stream-Datei, auch von abgebrochenen Läufen.
+
+    Wurde die Datei fortgeschrieben, gelten Lauf-ID und Meta der ersten
+    Kopfzeile; die Bestellungen aller Abschnitte werden zusammengeführt.
+    """
+    contents = StreamContents()
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                contents.skipped_lines += 1
+                continue
+            kind = record.get("type")
+            if kind == "run" and not contents.run_id:
+                contents.run_id = record.get("run_id", "")
+                contents.meta = record.get("meta", {})
+            elif kind == "order":
+                contents.orders.append(record["data"])
+            elif kind == "end":
+                contents.summary = record.get("summary")
+    return contents
+
+
+class LiveAggregator:
+    """
+    Rollierende Kennzahlen während des Laufs.
+
+    Gesamtzähler laufen über den ganzen Lauf; Durchsatz und Perzentile
+    beziehen sich auf das letzte Zeitfenster (``window_seconds``).
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = 10.0,
+        window_seconds: float = 60.0,
+        target: int = 0,
+        printer: Callable[[str], None] = print,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            interval_seconds: Abstand der Live-Ausgaben (0 = keine Ausgabe)
+            window_seconds: Zeitfenster für Durchsatz und Perzentile
+            target: Geplante Anzahl Bestellungen (für die Fortschrittsanzeige)
+            printer: Ausgabefunktion
+            clock: Zeitquelle (für Tests austauschbar)
+        """
+        self.interval_seconds = interval_seconds
+        self.window_seconds = window_seconds
+        self.target = target
+        self.printer = printer
+        self.clock = clock
+
+        self.started = clock()
+        self.completed = 0
+        self.failed = 0
+        self._window: deque[tuple[float, bool, float]] = deque()
+        self._last_report = self.started
+
+    def record(self, success: bool, duration_seconds: float) -> None:
+        """Erfasst ein Einzelergebnis und gibt bei Fälligkeit eine Live-Zeile aus."""
+        now = self.clock()
+        self.completed += 1
+        if not success:
+            self.failed += 1
+        self._window.append((now, success, duration_seconds))
+        self.maybe_report()
+
+    def _trim(self, now: float) -> None:
+        while self._window and self._window[0][0] < now - self.window_seconds:
+            self._window.popleft()
+
+    def snapshot(self) -> dict:
+        """Aktuelle Kennzahlen (gesamt und im Zeitfenster)."""
+        now = self.clock()
+        self._trim(now)
+        window_span = min(self.window_seconds, max(now - self.started, 1e-9))
+        hist = LatencyHistogram()
+        window_failed = 0
+        for _, success, duration in self._window:
+            if success:
+                hist.record(duration)
+            else:
+                window_failed += 1
+        return {
+            "elapsed_seconds": now - self.started,
+            "completed": self.completed,
+            "failed": self.failed,
+            "error_rate": self.failed / self.completed if self.completed else 0.0,
+            "window_orders": len(self._window),
+            "window_error_rate": window_failed / len(self._window) if self._window else 0.0,
+            "orders_per_minute": len(self._window) / window_span * 60,
+            "latency": hist,
+        }
+
+    def format(self, snapshot: dict) -> str:
+        progress = f"{snapshot['completed']}/{self.target}" if self.target else str(snapshot["completed"])
+        line = (f"   [live {snapshot['elapsed_seconds']:.0f}s] {progress} fertig, "
+                f"{snapshot['orders_per_minute']:.1f}/min, "
+                f"Fehler {snapshot['error_rate']:.1%} (Fenster {snapshot['window_error_rate']:.1%})")
+        if snapshot["latency"].count:
+            line += f" | {format_percentiles(snapshot['latency'])}"
+        return line
+
+    def report(self) -> None:
+        self._last_report = self.clock()
+        self.printer(self.format(self.snapshot()))
+
+    def maybe_report(self) -> None:
+        """Gibt eine Live-Zeile aus, wenn seit der letzten ``interval_seconds`` vergangen sind."""
+        if self.interval_seconds and self.clock() - self._last_report >= self.interval_seconds:
+            self.report()
+
+    async def run_periodic(self) -> None:
+        """
+        Gibt auch ohne neue Ergebnisse regelmäßig aus (zeigt hängende Läufe).
+
+        Als Task starten und am Ende abbrechen.
+        """
+        if not self.interval_seconds:
+            return
+        while True:
+            await asyncio.sleep(self.interval_seconds)  # readiness: allow-sleep (Ausgabe-Intervall)
+            self.maybe_report()
+
+
+def start_run_stream(
+    cfg,
+    prefix: str,
+    target: int,
+    meta: Optional[dict] = None,
+    run_id: Optional[str] = None,
+) -> tuple[ResultStream, LiveAggregator]:
+    """
+    Öffnet Stream und Live-Auswertung für einen Lauf.
+
+    Args:
+        cfg: ``ResultStreamConfig`` (Verzeichnis, fsync, Intervalle)
+        prefix: Präfix der Lauf-ID (z.B. "performance", "massentest")
+        target: Geplante Anzahl Bestellungen
+        meta: Zusatzinfos für die Kopfzeile
+        run_id: Vorhandene Lauf-ID (beim Fortsetzen wird die Datei fortgeschrieben)
+    """
+    run_id = run_id or new_run_id(prefix)
+    path = Path(cfg.directory) / f"{run_id}.jsonl"
+    stream = ResultStream(path, run_id, meta=meta, fsync=cfg.fsync).open()
+    live = LiveAggregator(interval_seconds=cfg.live_interval_seconds, window_seconds=cfg.window_seconds, target=target)
+    print(f"Ergebnis-Stream:   {path}")
+    return stream, live
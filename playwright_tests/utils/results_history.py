@@ -0,0 +1,536 @@
+"""
+Lauf-Historie für Massen-, Performance- und Web-Vitals-Läufe mit Regressionserkennung.
+
+Jeder Lauf schreibt bisher einen eigenen JSON-Report bzw. eine Markdown-
+Zusammenfassung nach ``reports/``; Vergleiche zwischen Läufen gingen nur
+von Hand. ``ResultsHistory`` legt die Kennzahlen aller Läufe in einer
+SQLite-Datenbank ab (eine Zeile pro Lauf, Gruppe und Kennzahl):
+
+- Performance: Durchsatz, p95 und Fehlerrate gesamt und pro ``OrderType``
+- Massentest: Durchsatz, p95 und Fehlerrate gesamt
+- Web Vitals: p75 von LCP, CLS, INP, TBT und FCP pro Seitentyp und Viewport
+- ``test_run_summary_*.md``: Anzahl bestanden/fehlgeschlagen und Fehlerrate
+
+``compare_run()`` vergleicht einen Lauf mit den letzten Läufen gleicher Art
+(gleitende Baseline) und meldet nur statistisch auffällige Änderungen:
+Fehlerraten per Zwei-Stichproben-z-Test, alle übrigen Kennzahlen per
+z-Wert gegen Mittelwert und Streuung der Baseline.
+
+Kommandozeile:
+    python -m playwright_tests.utils.results_history ingest reports/performance/*.json reports/test_run_summary_*.md
+    python -m playwright_tests.utils.results_history trend --kind performance
+    python -m playwright_tests.utils.results_history compare performance-20250101-120000-3f9a
+"""
+import argparse
+import json
+import math
+import re
+import sqlite3
+import statistics
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+
+class RunKind:
+    """Art eines Laufs (Baselines werden nur innerhalb gleicher Art und Name gebildet)."""
+    PERFORMANCE = "performance"
+    MASS = "mass"
+    WEB_VITALS = "web_vitals"
+    SUMMARY = "summary"
+
+
+# Gruppe für Kennzahlen über den ganzen Lauf
+TOTAL = "gesamt"
+
+# Kennzahl -> Richtung (+1: höher ist besser, -1: niedriger ist besser)
+METRICS = {
+    "throughput_per_min": 1,
+    "p95_seconds": -1,
+    "error_rate": -1,
+    "lcp_ms": -1,
+    "cls": -1,
+    "inp_ms": -1,
+    "tbt_ms": -1,
+    "fcp_ms": -1,
+    "passed": 1,
+    "failed": -1,
+}
+
+
+@dataclass
+class Metric:
+    """Eine Kennzahl eines Laufs; ``samples`` = Stichprobengröße (z.B. Bestellungen)."""
+    group: str
+    name: str
+    value: float
+    samples: int = 0
+
+
+# =============================================================================
+# Kennzahlen aus Reports
+# =============================================================================
+
+def _rate_metrics(group: str, total: int, failed: int, successful: int, duration: float, p95) -> list[Metric]:
+    metrics = [Metric(group, "error_rate", failed / total, total)] if total else []
+    if duration > 0:
+        metrics.append(Metric(group, "throughput_per_min", successful / duration * 60, total))
+    if p95 is not None:
+        metrics.append(Metric(group, "p95_seconds", p95, successful))
+    return metrics
+
+
+def performance_metrics(data: dict) -> list[Metric]:
+    """Kennzahlen aus ``PerformanceTestResult.to_dict()`` (gesamt und pro OrderType)."""
+    summary, duration = data["summary"], data["timing"]["total_duration_seconds"]
+    latency = data.get("latency") or {}
+    metrics = _rate_metrics(
+        TOTAL, summary["total_orders"], summary["failed_orders"], summary["successful_orders"],
+        duration, latency.get("p95") if latency.get("count") else None,
+    )
+    by_latency = data.get("latency_by_type") or {}
+    for order_type, stats in (data.get("by_type") or {}).items():
+        hist = by_latency.get(order_type) or {}
+        metrics += _rate_metrics(
+            order_type, stats["total"], stats["failed"], stats["successful"],
+            duration, hist.get("p95") if hist.get("count") else None,
+        )
+    return metrics
+
+
+def mass_metrics(data: dict) -> list[Metric]:
+    """Kennzahlen aus ``MassTestResult.to_dict()``."""
+    summary = data["summary"]
+    latency = data.get("latency") or {}
+    return _rate_metrics(
+        TOTAL, summary["total_orders"], summary["failed_orders"], summary["successful_orders"],
+        data["timing"]["total_duration_seconds"], latency.get("p95") if latency.get("count") else None,
+    )
+
+
+def _p75(values: list[float]) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, math.ceil(0.75 * len(ordered)) - 1)]
+
+
+def web_vitals_metrics(measurements) -> list[Metric]:
+    """p75 der Web Vitals pro Seitentyp und Viewport (``WebVitals``-Messungen eines Laufs)."""
+    groups: dict[str, list] = {}
+    for vitals in measurements:
+        groups.setdefault(f"{vitals.page_kind} {vitals.viewport}".strip(), []).append(vitals)
+    metrics = []
+    for group, items in sorted(groups.items()):
+        for name in ("lcp_ms", "cls", "inp_ms", "tbt_ms", "fcp_ms"):
+            values = [getattr(v, name) for v in items if getattr(v, name) is not None]
+            if values:
+                metrics.append(Metric(group, name, _p75(values), len(values)))
+    return metrics
+
+
+# "| ✅ PASSED | 23 | 8.8% |" oder "- **PASSED:** 23 Tests"
+_SUMMARY_COUNT = re.compile(
+    r"^(?:\|\s*\S+\s+(PASSED|FAILED|SKIPPED)\s*\|\s*~?|-\s*\*\*(PASSED|FAILED|SKIPPED):\*\*\s*)(\d+)",
+    re.MULTILINE,
+)
+_SUMMARY_DATE = re.compile(r"\*\*Datum:\*\*\s*(\d{2}\.\d{2}\.\d{4})(?:\s+(\d{2}:\d{2}))?")
+# Zeitstempel im Dateinamen: test_run_summary_20260126_214441 / test_run_summary_2026-01-26
+_FILE_STAMP = re.compile(r"(\d{4})-?(\d{2})-?(\d{2})(?:_(\d{2})(\d{2}))?")
+
+
+def summary_metrics(markdown: str) -> list[Metric]:
+    """Kennzahlen aus einer ``test_run_summary_*.md`` (Tabelle unter "Zusammenfassung")."""
+    counts: dict[str, int] = {}
+    for table_status, list_status, count in _SUMMARY_COUNT.findall(markdown):
+        counts.setdefault((table_status or list_status).lower(), int(count))
+    passed, failed = counts.get("passed", 0), counts.get("failed", 0)
+    metrics = [Metric(TOTAL, "passed", passed), Metric(TOTAL, "failed", failed)]
+    if passed + failed:
+        metrics.append(Metric(TOTAL, "error_rate", failed / (passed + failed), passed + failed))
+    return metrics
+
+
+def summary_date(markdown: str) -> Optional[datetime]:
+    """Datum einer ``test_run_summary_*.md`` (None: nicht angegeben)."""
+    match = _SUMMARY_DATE.search(markdown)
+    if not match:
+        return None
+    return datetime.strptime(f"{match.group(1)} {match.group(2) or '00:00'}", "%d.%m.%Y %H:%M")
+
+
+def file_date(path: Path) -> datetime:
+    """Zeitpunkt eines Reports aus dem Dateinamen, sonst Änderungszeit der Datei."""
+    match = _FILE_STAMP.search(path.stem)
+    if match:
+        year, month, day, hour, minute = (int(part) if part else 0 for part in match.groups())
+        return datetime(year, month, day, hour, minute)
+    return datetime.fromtimestamp(path.stat().st_mtime)
+
+
+# =============================================================================
+# Datenbank
+# =============================================================================
+
+class ResultsHistory:
+    """
+    SQLite-Ablage der Kennzahlen aller Läufe.
+
+    Beispiel:
+        history = ResultsHistory(Path("reports/history.sqlite"))
+        history.add_run(run_id, RunKind.PERFORMANCE, "performance", performance_metrics(data))
+        changes = compare_run(history, run_id)
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            run_id TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            name TEXT NOT NULL,
+            recorded_at TEXT NOT NULL,
+            source TEXT
+        );
+        CREATE TABLE IF NOT EXISTS metrics (
+            run_id TEXT NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+            grp TEXT NOT NULL,
+            metric TEXT NOT NULL,
+            value REAL NOT NULL,
+            samples INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (run_id, grp, metric)
+        );
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(self.SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Verbindung mit Commit am Ende des Blocks; wird immer geschlossen."""
+        conn = sqlite3.connect(self.path)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def add_run(
+        self,
+        run_id: str,
+        kind: str,
+        name: str,
+        metrics: list[Metric],
+        recorded_at: Optional[datetime] = None,
+        source: str = "",
+    ) -> None:
+        """Legt einen Lauf ab; ein erneutes Einlesen derselben Lauf-ID ersetzt ihn."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+            conn.execute(
+                "INSERT INTO runs (run_id, kind, name, recorded_at, source) VALUES (?, ?, ?, ?, ?)",
+                (run_id, kind, name, (recorded_at or datetime.now()).isoformat(), source),
+            )
+            conn.executemany(
+                "INSERT INTO metrics (run_id, grp, metric, value, samples) VALUES (?, ?, ?, ?, ?)",
+                [(run_id, m.group, m.name, m.value, m.samples) for m in metrics],
+            )
+
+    def run(self, run_id: str) -> Optional[dict]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+            return dict(row) if row else None
+
+    def runs(self, kind: Optional[str] = None, name: Optional[str] = None, limit: int = 50) -> list[dict]:
+        """Läufe in zeitlicher Reihenfolge (die letzten ``limit``)."""
+        query, params = "SELECT * FROM runs WHERE 1 = 1", []
+        for column, value in (("kind", kind), ("name", name)):
+            if value:
+                query += f" AND {column} = ?"
+                params.append(value)
+        query += " ORDER BY recorded_at DESC, rowid DESC LIMIT ?"
+        params.append(limit)
+        with self._connect() as conn:
+            return [dict(row) for row in reversed(conn.execute(query, params).fetchall())]
+
+    def baseline(self, run: dict, size: int) -> list[dict]:
+        """Die ``size`` Läufe gleicher Art und Name vor ``run`` (älteste zuerst)."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM runs WHERE kind = ? AND name = ? AND recorded_at < ? "
+                "ORDER BY recorded_at DESC LIMIT ?",
+                (run["kind"], run["name"], run["recorded_at"], size),
+            ).fetchall()
+        return [dict(row) for row in reversed(rows)]
+
+    def metrics(self, run_id: str) -> list[Metric]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT grp, metric, value, samples FROM metrics WHERE run_id = ? ORDER BY grp, metric", (run_id,)
+            ).fetchall()
+        return [Metric(row["grp"], row["metric"], row["value"], row["samples"]) for row in rows]
+
+
+# =============================================================================
+# Vergleich gegen die gleitende Baseline
+# =============================================================================
+
+@dataclass
+class MetricChange:
+    """Statistisch auffällige Änderung einer Kennzahl gegenüber der Baseline."""
+    group: str
+    metric: str
+    value: float
+    baseline: float
+    z_score: float
+    baseline_runs: int
+
+    @property
+    def relative_change(self) -> float:
+        return (self.value - self.baseline) / self.baseline if self.baseline else math.inf
+
+    @property
+    def regression(self) -> bool:
+        return METRICS.get(self.metric, -1) * (self.value - self.baseline) < 0
+
+
+def _proportion_z(value: float, samples: int, baseline: list[Metric]) -> Optional[float]:
+    """Zwei-Stichproben-z-Test für Anteile (aktueller Lauf gegen gepoolte Baseline)."""
+    base_samples = sum(m.samples for m in baseline)
+    if not samples or not base_samples:
+        return None
+    base_rate = sum(m.value * m.samples for m in baseline) / base_samples
+    pooled = (value * samples + base_rate * base_samples) / (samples + base_samples)
+    variance = pooled * (1 - pooled) * (1 / samples + 1 / base_samples)
+    if variance <= 0:
+        return None
+    return (value - base_rate) / math.sqrt(variance)
+
+
+def compare_metrics(
+    current: list[Metric],
+    baseline_runs: list[list[Metric]],
+    z_threshold: float = 3.0,
+    min_relative_change: float = 0.1,
+    min_error_rate_change: float = 0.01,
+    min_baseline_runs: int = 3,
+) -> list[MetricChange]:
+    """
+    Vergleicht die Kennzahlen eines Laufs mit denen früherer Läufe.
+
+    Gemeldet wird eine Kennzahl, wenn ``|z| >= z_threshold`` und sie sich um
+    mindestens ``min_relative_change`` vom Baseline-Mittel unterscheidet
+    (Fehlerraten: um ``min_error_rate_change`` Prozentpunkte, absolut).
+    Bei Baselines ohne Streuung (auch bei nur einem Baseline-Lauf) entscheidet
+    nur die relative Änderung.
+
+    Args:
+        current: Kennzahlen des Laufs
+        baseline_runs: Kennzahlen der Baseline-Läufe (ein Eintrag pro Lauf)
+        min_baseline_runs: Kennzahlen mit weniger Baseline-Werten werden übersprungen
+    """
+    history: dict[tuple[str, str], list[Metric]] = {}
+    for run_metrics in baseline_runs:
+        for metric in run_metrics:
+            history.setdefault((metric.group, metric.name), []).append(metric)
+
+    changes = []
+    for metric in current:
+        baseline = history.get((metric.group, metric.name), [])
+        if len(baseline) < min_baseline_runs:
+            continue
+        if metric.name == "error_rate":
+            base_samples = sum(m.samples for m in baseline)
+            mean = sum(m.value * m.samples for m in baseline) / base_samples if base_samples else 0.0
+            z = _proportion_z(metric.value, metric.samples, baseline)
+            large_enough = abs(metric.value - mean) >= min_error_rate_change
+        else:
+            values = [m.value for m in baseline]
+            mean = statistics.fmean(values)
+            spread = statistics.stdev(values) if len(values) > 1 else 0.0
+            z = (metric.value - mean) / spread if spread > 0 else None
+            large_enough = abs(metric.value - mean) >= min_relative_change * abs(mean)
+        if not large_enough:
+            continue
+        if z is None:
+            z = math.copysign(math.inf, metric.value - mean)
+        if abs(z) >= z_threshold:
+            changes.append(MetricChange(metric.group, metric.name, metric.value, mean, z, len(baseline)))
+    return changes
+
+
+def compare_run(
+    history: ResultsHistory,
+    run_id: str,
+    baseline_runs: int = 10,
+    **thresholds,
+) -> list[MetricChange]:
+    """Vergleicht einen gespeicherten Lauf mit den ``baseline_runs`` Läufen davor."""
+    run = history.run(run_id)
+    if run is None:
+        raise KeyError(f"Lauf {run_id} nicht in der Historie")
+    baseline = [history.metrics(r["run_id"]) for r in history.baseline(run, baseline_runs)]
+    return compare_metrics(history.metrics(run_id), baseline, **thresholds)
+
+
+def _format_value(metric: str, value: float) -> str:
+    if metric == "error_rate":
+        return f"{value:.1%}"
+    if metric == "p95_seconds":
+        return f"{value:.1f}s"
+    if metric.endswith("_ms"):
+        return f"{value:.0f}ms"
+    if metric == "cls":
+        return f"{value:.3f}"
+    if metric in ("passed", "failed"):
+        return f"{value:.0f}"
+    return f"{value:.1f}"
+
+
+def format_change(change: MetricChange) -> str:
+    """Einzeilige Beschreibung einer Änderung für Konsolen-Reports."""
+    label = "REGRESSION" if change.regression else "Verbesserung"
+    relative = f"{change.relative_change:+.0%}" if math.isfinite(change.relative_change) else "neu"
+    return (f"[{label}] {change.group}: {change.metric} {_format_value(change.metric, change.value)} "
+            f"(Baseline {_format_value(change.metric, change.baseline)}, {relative}, "
+            f"z={change.z_score:+.1f}, {change.baseline_runs} Läufe)")
+
+
+def record_run(cfg, run_id: str, kind: str, name: str, metrics: list[Metric]) -> list[MetricChange]:
+    """
+    Legt einen Lauf in der Historie ab und gibt die Änderungen gegenüber der Baseline aus.
+
+    Args:
+        cfg: ``ResultsHistoryConfig`` (None oder deaktiviert: nichts tun)
+    """
+    if cfg is None or not cfg.enabled or not metrics:
+        return []
+    history = ResultsHistory(Path(cfg.database))
+    history.add_run(run_id, kind, name, metrics)
+    changes = compare_run(
+        history, run_id,
+        baseline_runs=cfg.baseline_runs,
+        z_threshold=cfg.z_threshold,
+        min_relative_change=cfg.min_relative_change,
+        min_error_rate_change=cfg.min_error_rate_change,
+        min_baseline_runs=cfg.min_baseline_runs,
+    )
+    if changes:
+        print(f"\nVERGLEICH MIT DEN LETZTEN {cfg.baseline_runs} LÄUFEN ({name}):")
+        for change in changes:
+            print(f"  {format_change(change)}")
+    return changes
+
+
+# =============================================================================
+# Einlesen vorhandener Reports und Trend-Report
+# =============================================================================
+
+def ingest_file(history: ResultsHistory, path: Path) -> Optional[str]:
+    """
+    Liest einen vorhandenen Report ein und gibt die Lauf-ID zurück (None: Format unbekannt).
+
+    Unterstützt JSON-Reports (``save_json_report``), Ergebnis-Streams (``.jsonl``)
+    und ``test_run_summary_*.md``.
+    """
+    path = Path(path)
+    if path.suffix == ".md":
+        text = path.read_text(encoding="utf-8")
+        recorded_at = summary_date(text) or file_date(path)
+        history.add_run(path.stem, RunKind.SUMMARY, "test_run_summary", summary_metrics(text), recorded_at, str(path))
+        return path.stem
+
+    if path.suffix == ".jsonl":
+        from playwright_tests.utils.result_stream import read_stream
+
+        data = read_stream(path).summary
+    else:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    if not data or "summary" not in data:
+        return None
+
+    kind = RunKind.PERFORMANCE if "by_type" in data else RunKind.MASS
+    metrics = performance_metrics(data) if kind == RunKind.PERFORMANCE else mass_metrics(data)
+    run_id = data.get("run_id") or path.stem
+    # Name ohne Zeitstempel, z.B. "stress-20250101-120000.json" -> "stress"
+    name = re.sub(r"[-_]\d{8}.*$", "", path.stem) or kind
+    start = data["timing"].get("start_time")
+    history.add_run(run_id, kind, name, metrics, datetime.fromisoformat(start) if start else None, str(path))
+    return run_id
+
+
+def trend_report(
+    history: ResultsHistory,
+    kind: Optional[str] = None,
+    name: Optional[str] = None,
+    group: str = TOTAL,
+    limit: int = 20,
+) -> str:
+    """Markdown-Tabelle der Kennzahlen einer Gruppe über die letzten ``limit`` Läufe."""
+    lines = []
+    runs = history.runs(kind, name, limit)
+    for (run_kind, run_name) in dict.fromkeys((r["kind"], r["name"]) for r in runs):
+        selected = [r for r in runs if (r["kind"], r["name"]) == (run_kind, run_name)]
+        rows = [(r, {m.name: m.value for m in history.metrics(r["run_id"]) if m.group == group}) for r in selected]
+        columns = [m for m in METRICS if any(m in values for _, values in rows)]
+        if not columns:
+            continue
+        lines += [f"## {run_name} ({run_kind}, {group})", ""]
+        lines.append("| Lauf | Datum | " + " | ".join(columns) + " |")
+        lines.append("|" + "---|" * (len(columns) + 2))
+        for run, values in rows:
+            cells = [_format_value(c, values[c]) if c in values else "-" for c in columns]
+            lines.append(f"| {run['run_id']} | {run['recorded_at'][:16].replace('T', ' ')} | " + " | ".join(cells) + " |")
+        lines.append("")
+    return "\n".join(lines) if lines else "Keine Läufe in der Historie."
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Lauf-Historie: Reports einlesen, Trends und Regressionen anzeigen")
+    parser.add_argument("--database", default="reports/history.sqlite", help="SQLite-Datei der Historie")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest = commands.add_parser("ingest", help="JSON-Reports, Streams und test_run_summary_*.md einlesen")
+    ingest.add_argument("files", nargs="+", type=Path)
+
+    trend = commands.add_parser("trend", help="Trend-Report (Markdown) ausgeben")
+    trend.add_argument("--kind", choices=[RunKind.PERFORMANCE, RunKind.MASS, RunKind.WEB_VITALS, RunKind.SUMMARY])
+    trend.add_argument("--name", help="Lauf-Name, z.B. performance, stress, test_run_summary")
+    trend.add_argument("--group", default=TOTAL, help="Gruppe, z.B. gesamt oder ein OrderType")
+    trend.add_argument("--limit", type=int, default=20)
+    trend.add_argument("--output", type=Path, help="In Datei schreiben statt ausgeben")
+
+    compare = commands.add_parser("compare", help="Lauf mit der gleitenden Baseline vergleichen")
+    compare.add_argument("run_id")
+    compare.add_argument("--baseline-runs", type=int, default=10)
+    compare.add_argument("--z-threshold", type=float, default=3.0)
+
+    args = parser.parse_args(argv)
+    history = ResultsHistory(Path(args.database))
+
+    if args.command == "ingest":
+        for path in args.files:
+            run_id = ingest_file(history, path)
+            print(f"{path}: {run_id or 'übersprungen (kein bekanntes Format)'}")
+    elif args.command == "trend":
+        report = trend_report(history, args.kind, args.name, args.group, args.limit)
+        if args.output:
+            args.output.write_text(report, encoding="utf-8")
+            print(f"Trend-Report gespeichert: {args.output}")
+        else:
+            print(report)
+    else:
+        changes = compare_run(history, args.run_id, args.baseline_runs, z_threshold=args.z_threshold)
+        for change in changes:
+            print(format_change(change))
+        if not changes:
+            print("Keine auffälligen Änderungen gegenüber der Baseline.")
+        return 1 if any(c.regression for c in changes) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,253 @@
+"""
+Lauf-Manifest für lange Massen- und Performance-Läufe (Checkpoint und Fortsetzen).
+
+Ein unterbrochener Lauf (Absturz, Standby, abgebrochene CI) soll nicht von
+vorne beginnen. Das Manifest liegt unter ``<directory>/<run-id>/``:
+
+- ``manifest.json``: Lauf-ID, Art des Laufs, Seed und der vollständige Plan
+  (eine Zeile pro Bestellung mit Produkten, Zahlungsart, Bestelltyp ...).
+  Wird einmal atomar geschrieben.
+- ``progress.jsonl``: Ereignisse pro Bestellung, nur angehängt und nach jeder
+  Zeile auf Platte geschrieben:
+  ``started`` -> ``submitted`` (direkt vor "Zahlungspflichtig bestellen")
+  -> ``finished`` (mit Erfolg, Shopware-Bestellnummer und Einzelergebnis).
+
+Beim Fortsetzen (``--resume <run-id>``) werden nur Bestellungen erneut
+ausgeführt, die nie abgeschickt wurden. Abgeschickte Bestellungen ohne
+Bestätigung gelten als *unklar* und werden nicht wiederholt - sie könnten im
+Shop bereits angelegt sein (keine doppelten Bestellungen).
+"""
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+
+class OrderState:
+    """Zustand einer geplanten Bestellung laut Manifest."""
+    PENDING = "pending"
+    STARTED = "started"
+    SUBMITTED = "submitted"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"  # vor dem Absenden gescheitert - darf wiederholt werden
+    UNRESOLVED = "unresolved"  # abgeschickt, aber ohne Bestätigung
+
+
+class ManifestError(Exception):
+    """Manifest fehlt, ist unlesbar oder passt nicht zum Lauf."""
+
+
+def _write_atomic(path: Path, data: dict) -> None:
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+@dataclass
+class OrderProgress:
+    """Zusammengefasste Ereignisse einer Bestellung."""
+    attempts: int = 0
+    submitted: bool = False
+    succeeded: bool = False
+    finished: bool = False
+    order_number: Optional[str] = None
+    result: Optional[dict] = None  # letztes Einzelergebnis
+
+    @property
+    def state(self) -> str:
+        if self.succeeded:
+            return OrderState.SUCCEEDED
+        if self.submitted:
+            return OrderState.SUBMITTED if not self.finished else OrderState.UNRESOLVED
+        if self.finished:
+            return OrderState.FAILED
+        return OrderState.STARTED if self.attempts else OrderState.PENDING
+
+
+@dataclass
+class RunManifest:
+    """
+    Plan und Fortschritt eines Laufs.
+
+    Beispiel:
+        manifest = RunManifest.create(Path("reports/runs"), run_id, "massentest", seed, plan)
+        manifest.mark_started(7)
+        manifest.mark_submitted(7)
+        manifest.mark_finished(7, success=True, order_number="10042", result={...})
+
+        manifest = RunManifest.load(Path("reports/runs"), run_id)
+        to_run = manifest.orders_to_run()
+    """
+    directory: Path
+    run_id: str
+    kind: str
+    seed: Optional[int] = None
+    planned: list[dict] = field(default_factory=list)
+    meta: dict = field(default_factory=dict)
+    progress: dict[int, OrderProgress] = field(default_factory=dict)
+    attempt: int = 1  # Nummer des aktuellen Durchgangs (1 = erster Lauf)
+
+    @property
+    def path(self) -> Path:
+        return self.directory / self.run_id
+
+    @property
+    def progress_path(self) -> Path:
+        return self.path / "progress.jsonl"
+
+    @classmethod
+    def create(
+        cls,
+        directory: Path,
+        run_id: str,
+        kind: str,
+        seed: Optional[int],
+        planned: list[dict],
+        meta: Optional[dict] = None,
+    ) -> "RunManifest":
+        """
+        Legt ein neues Manifest an.
+
+        Args:
+            directory: Basisverzeichnis (z.B. ``reports/runs``)
+            run_id: Lauf-ID (auch Name des Unterverzeichnisses)
+            kind: Art des Laufs; beim Fortsetzen muss sie übereinstimmen
+            seed: Seed der Zufallsauswahl (zur Nachvollziehbarkeit)
+            planned: Plan, ein Dictionary pro Bestellung mit ``order_num``
+            meta: Zusatzinfos (Basis-URL, Parallelität, ...)
+        """
+        manifest = cls(Path(directory), run_id, kind, seed, planned, meta or {})
+        manifest.path.mkdir(parents=True, exist_ok=True)
+        _write_atomic(manifest.path / "manifest.json", {
+            "run_id": run_id,
+            "kind": kind,
+            "seed": seed,
+            "created_at": datetime.now().isoformat(),
+            "meta": manifest.meta,
+            "planned": planned,
+        })
+        manifest.progress_path.touch()
+        return manifest
+
+    @classmethod
+    def load(cls, directory: Path, run_id: str, kind: Optional[str] = None) -> "RunManifest":
+        """
+        Lädt ein Manifest samt Fortschritt; der neue Durchgang zählt ``attempt`` hoch.
+
+        Raises:
+            ManifestError: Wenn das Manifest fehlt oder ``kind`` nicht passt
+        """
+        path = Path(directory) / run_id / "manifest.json"
+        if not path.exists():
+            raise ManifestError(f"Kein Manifest für Lauf {run_id} unter {path.parent}")
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if kind and data["kind"] != kind:
+            raise ManifestError(f"Lauf {run_id} ist vom Typ '{data['kind']}', erwartet '{kind}'")
+
+        manifest = cls(Path(directory), run_id, data["kind"], data.get("seed"), data["planned"], data.get("meta", {}))
+        last_attempt = 0
+        with open(manifest.progress_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # beim Absturz abgeschnittene Zeile
+                manifest._apply(event)
+                last_attempt = max(last_attempt, event.get("attempt", 1))
+        manifest.attempt = last_attempt + 1
+        return manifest
+
+    # =========================================================================
+    # Fortschritt schreiben
+    # =========================================================================
+
+    def _apply(self, event: dict) -> None:
+        entry = self.progress.setdefault(event["order_num"], OrderProgress())
+        kind = event["event"]
+        if kind == "started":
+            entry.attempts += 1
+        elif kind == "submitted":
+            entry.submitted = True
+        elif kind == "finished":
+            entry.finished = True
+            entry.result = event.get("result")
+            if event.get("success"):
+                entry.succeeded = True
+                entry.order_number = event.get("order_number")
+
+    def _append(self, event: dict) -> None:
+        event = {**event, "attempt": self.attempt, "at": datetime.now().isoformat()}
+        with open(self.progress_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(event, ensure_ascii=False, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._apply(event)
+
+    def mark_started(self, order_num: int) -> None:
+        self._append({"event": "started", "order_num": order_num})
+
+    def mark_submitted(self, order_num: int) -> None:
+        """Direkt vor dem Absenden der Bestellung aufrufen."""
+        self._append({"event": "submitted", "order_num": order_num})
+
+    def mark_finished(self, order_num: int, success: bool, order_number: Optional[str], result: dict) -> None:
+        self._append({
+            "event": "finished",
+            "order_num": order_num,
+            "success": success,
+            "order_number": order_number,
+            "result": result,
+        })
+
+    # =========================================================================
+    # Auswerten
+    # =========================================================================
+
+    def state(self, order_num: int) -> str:
+        entry = self.progress.get(order_num)
+        return entry.state if entry else OrderState.PENDING
+
+    def orders_to_run(self) -> list[dict]:
+        """Geplante Bestellungen, die (erneut) ausgeführt werden dürfen."""
+        return [
+            entry for entry in self.planned
+            if self.state(entry["order_num"]) in (OrderState.PENDING, OrderState.STARTED, OrderState.FAILED)
+        ]
+
+    def carried_over(self) -> list[tuple[dict, str, Optional[dict]]]:
+        """
+        Bestellungen, die nicht erneut laufen: ``(Plan, Zustand, letztes Ergebnis)``.
+
+        Erfolgreiche liefern ihr Ergebnis; abgeschickte ohne Bestätigung
+        (auch solche, deren Durchgang abbrach) gelten als unklar.
+        """
+        to_run = {entry["order_num"] for entry in self.orders_to_run()}
+        carried = []
+        for entry in self.planned:
+            if entry["order_num"] in to_run:
+                continue
+            progress = self.progress[entry["order_num"]]
+            state = OrderState.SUCCEEDED if progress.succeeded else OrderState.UNRESOLVED
+            carried.append((entry, state, progress.result))
+        return carried
+
+    def summary(self) -> dict:
+        """Anzahl Bestellungen pro Zustand."""
+        counts: dict[str, int] = {}
+        for entry in self.planned:
+            state = self.state(entry["order_num"])
+            counts[state] = counts.get(state, 0) + 1
+        return counts
+
+    def order_numbers(self) -> dict[int, str]:
+        """Shopware-Bestellnummern erfolgreicher Bestellungen."""
+        return {
+            num: entry.order_number
+            for num, entry in self.progress.items()
+            if entry.succeeded and entry.order_number
+        }
@@ -0,0 +1,146 @@
+"""
+Verteilung von Lasttests auf mehrere Worker-Prozesse (Shards).
+
+Ein einzelner Python-Prozess mit einem Chromium begrenzt die erreichbare
+Last. Dieses Modul stellt die prozessübergreifende Infrastruktur bereit:
+
+- ``split_counts``: teilt eine Bestellverteilung gleichmäßig auf N Shards auf
+- ``split_weighted``: verteilt geplante Bestellungen gewichtet auf benannte
+  Gruppen (z.B. Browser- und Protokoll-Kohorte eines hybriden Laufs)
+- ``run_shards``: startet die Worker-Prozesse (spawn) und liefert deren
+  Nachrichten über eine gemeinsame Queue, sobald sie eintreffen
+
+Worker senden Tupel ``(art, shard_index, payload)`` mit den Arten aus
+``ShardMessage``. Jeder Worker muss zum Schluss ``DONE`` oder ``ERROR`` senden.
+"""
+import multiprocessing
+import queue
+import time
+from typing import Any, Callable, Iterator, Optional
+
+
+class ShardMessage:
+    """Nachrichtenarten zwischen Worker und Koordinator."""
+    STARTED = "started"  # payload: Startzeit (time.time())
+    RESULT = "result"  # payload: serialisiertes Einzelergebnis (dict)
+    DONE = "done"  # payload: None oder Zusatzdaten des Shards (dict)
+    ERROR = "error"  # payload: Fehlermeldung
+
+
+def split_counts(counts: dict[str, int], shards: int) -> list[dict[str, int]]:
+    """
+    Teilt Bestellmengen pro Typ gleichmäßig auf Shards auf.
+
+    Reste werden reihum verteilt, damit kein Shard systematisch mehr
+    Bestellungen eines Typs erhält.
+
+    Examples:
+        >>> split_counts({"guest_post": 5, "multi_product": 1}, 2)
+        [{'guest_post': 3, 'multi_product': 0}, {'guest_post': 2, 'multi_product': 1}]
+    """
+    if shards < 1:
+        raise ValueError("shards muss mindestens 1 sein")
+
+    result: list[dict[str, int]] = [{} for _ in range(shards)]
+    offset = 0
+    for key, total in counts.items():
+        base, remainder = divmod(total, shards)
+        for i in range(shards):
+            # Reste reihum verteilen (über alle Typen fortlaufend)
+            extra = 1 if (i - offset) % shards < remainder else 0
+            result[i][key] = base + extra
+        offset = (offset + remainder) % shards
+    return result
+
+
+def split_weighted(items: list, weights: dict[str, int]) -> dict[str, list]:
+    """
+    Verteilt Einträge gewichtet und gleichmäßig durchmischt auf benannte Gruppen.
+
+    Jeder Eintrag geht an die Gruppe, die gemessen an ihrem Gewicht am weitesten
+    zurückliegt (gewichtetes Round-Robin). Gruppen mit Gewicht 0 bleiben leer.
+
+    Examples:
+        >>> split_weighted(list(range(6)), {"browser": 1, "protocol": 2})
+        {'browser': [1, 4], 'protocol': [0, 2, 3, 5]}
+    """
+    total = sum(max(0, weight) for weight in weights.values())
+    if total <= 0:
+        raise ValueError("Mindestens ein Gewicht muss größer als 0 sein")
+
+    groups: dict[str, list] = {name: [] for name in weights}
+    current = {name: 0 for name in weights}
+    for item in items:
+        for name, weight in weights.items():
+            current[name] += max(0, weight)
+        name = max(current, key=current.get)
+        current[name] -= total
+        groups[name].append(item)
+    return groups
+
+
+def run_shards(
+    target: Callable[..., None],
+    shard_kwargs: list[dict[str, Any]],
+    timeout_seconds: Optional[float] = None,
+) -> Iterator[tuple[str, int, Any]]:
+    """
+    Startet einen Prozess pro Shard und liefert dessen Nachrichten.
+
+    ``target`` wird im Kindprozess als ``target(result_queue, shard_index, **kwargs)``
+    aufgerufen und muss auf Modulebene definiert sein (spawn/pickle).
+
+    Stirbt ein Prozess ohne ``DONE``/``ERROR``, wird ein ``ERROR`` erzeugt,
+    damit der Koordinator nicht hängen bleibt.
+
+    Args:
+        target: Worker-Funktion
+        shard_kwargs: Argumente pro Shard
+        timeout_seconds: Gesamt-Timeout; danach werden verbleibende Prozesse beendet
+
+    Yields:
+        (art, shard_index, payload)
+    """
+    ctx = multiprocessing.get_context("spawn")
+    result_queue = ctx.Queue()
+    processes = []
+    for index, kwargs in enumerate(shard_kwargs):
+        process = ctx.Process(
+            target=target,
+            args=(result_queue, index),
+            kwargs=kwargs,
+            name=f"shard-{index}",
+        )
+        process.start()
+        processes.append(process)
+
+    pending = set(range(len(processes)))
+    deadline = time.monotonic() + timeout_seconds if timeout_seconds else None
+
+    try:
+        while pending:
+            if deadline and time.monotonic() > deadline:
+                for index in sorted(pending):
+                    processes[index].terminate()
+                    yield ShardMessage.ERROR, index, f"Timeout nach {timeout_seconds:.0f}s"
+                break
+
+            try:
+                kind, index, payload = result_queue.get(timeout=1.0)
+            except queue.Empty:
+                # Abgestürzte Prozesse erkennen
+                for index in list(pending):
+                    process = processes[index]
+                    if not process.is_alive() and result_queue.empty():
+                        pending.discard(index)
+                        yield ShardMessage.ERROR, index, f"Prozess beendet (exitcode={process.exitcode})"
+                continue
+
+            if kind in (ShardMessage.DONE, ShardMessage.ERROR):
+                pending.discard(index)
+            yield kind, index, payload
+    finally:
+        for process in processes:
+            process.join(timeout=10)
+            if process.is_alive():
+                process.terminate()
@@ -0,0 +1,234 @@
+"""
+Zeitmessung pro Checkout-Schritt (Spans).
+
+Ein ``StepTimer`` wird an einen Browser-Kontext gehängt und misst für jeden
+Schritt (``async with timer.span("place_order")``):
+
+- Wall-Time des Schritts
+- Anzahl Requests (gesamt / fehlgeschlagen) und Hauptframe-Navigationen
+- Navigation-Timing (TTFB, DOMContentLoaded, Load) der letzten Navigation im Schritt
+
+Verschachtelte Spans werden nicht doppelt gezählt: Nur der äußerste Span
+wird erfasst. Ein deaktivierter Timer (``enabled=False``) ist ein No-op,
+damit Page Objects ohne Fallunterscheidung messen können.
+"""
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from typing import AsyncIterator, Callable, Optional
+
+from playwright.async_api import BrowserContext, Page
+
+
+# Liest das Navigation-Timing der aktuellen Seite (Millisekunden)
+NAVIGATION_TIMING_JS = """
+() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    if (!nav) return null;
+    return {
+        ttfb_ms: nav.responseStart - nav.requestStart,
+        dom_content_loaded_ms: nav.domContentLoadedEventEnd - nav.startTime,
+        load_ms: nav.loadEventEnd > 0 ? nav.loadEventEnd - nav.startTime : null,
+    };
+}
+"""
+
+
+@dataclass
+class StepSpan:
+    """Messwerte eines Checkout-Schritts."""
+    name: str
+    wall_seconds: float = 0.0
+    requests: int = 0
+    failed_requests: int = 0
+    navigations: int = 0
+    ttfb_ms: Optional[float] = None
+    dom_content_loaded_ms: Optional[float] = None
+    load_ms: Optional[float] = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class StepTimer:
+    """
+    Misst Checkout-Schritte eines Browser-Kontexts.
+
+    Beispiel:
+        timer = StepTimer()
+        timer.attach(context)
+        try:
+            async with timer.span("pdp_load"):
+                await page.goto(product_url)
+        finally:
+            timer.detach()
+        timer.apply_to(result)
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.spans: list[StepSpan] = []
+
+        self._context: Optional[BrowserContext] = None
+        self._pages: list[tuple[Page, Callable]] = []
+        self._requests = 0
+        self._failed_requests = 0
+        self._navigations = 0
+        self._last_navigated_page: Optional[Page] = None
+        self._depth = 0
+
+    # =========================================================================
+    # Event-Listener
+    # =========================================================================
+
+    def _on_request(self, _request) -> None:
+        self._requests += 1
+
+    def _on_request_failed(self, _request) -> None:
+        self._failed_requests += 1
+
+    def _watch_page(self, page: Page) -> None:
+        """Zählt Hauptframe-Navigationen einer Seite."""
+        def on_navigated(frame) -> None:
+            if frame == page.main_frame:
+                self._navigations += 1
+                self._last_navigated_page = page
+
+        page.on("framenavigated", on_navigated)
+        self._pages.append((page, on_navigated))
+
+    def attach(self, context: BrowserContext) -> None:
+        """Hängt den Timer an einen Kontext (alle bestehenden und neuen Seiten)."""
+        if not self.enabled:
+            return
+        self._context = context
+        context.on("request", self._on_request)
+        context.on("requestfailed", self._on_request_failed)
+        context.on("page", self._watch_page)
+        for page in context.pages:
+            self._watch_page(page)
+
+    def detach(self) -> None:
+        """Entfernt alle Listener (wichtig bei wiederverwendeten Pool-Kontexten)."""
+        if not self._context:
+            return
+        self._context.remove_listener("request", self._on_request)
+        self._context.remove_listener("requestfailed", self._on_request_failed)
+        self._context.remove_listener("page", self._watch_page)
+        for page, listener in self._pages:
+            try:
+                page.remove_listener("framenavigated", listener)
+            except Exception:
+                pass
+        self._pages = []
+        self._context = None
+
+    # =========================================================================
+    # Messen
+    # =========================================================================
+
+    async def _navigation_timing(self) -> Optional[dict]:
+        """Liest das Navigation-Timing der zuletzt navigierten Seite."""
+        page = self._last_navigated_page
+        if page is None or page.is_closed():
+            return None
+        try:
+            return await page.evaluate(NAVIGATION_TIMING_JS)
+        except Exception:
+            return None
+
+    @asynccontextmanager
+    async def span(self, name: str) -> AsyncIterator[None]:
+        """Misst einen Schritt; verschachtelte Spans zählen zum äußeren Schritt."""
+        if not self.enabled or self._depth > 0:
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+            return
+
+        self._depth += 1
+        requests, failed, navigations = self._requests, self._failed_requests, self._navigations
+        self._last_navigated_page = None
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            step = StepSpan(
+                name=name,
+                wall_seconds=time.perf_counter() - start,
+                requests=self._requests - requests,
+                failed_requests=self._failed_requests - failed,
+                navigations=self._navigations - navigations,
+            )
+            if step.navigations:
+                timing = await self._navigation_timing()
+                if timing:
+                    step.ttfb_ms = timing.get("ttfb_ms")
+                    step.dom_content_loaded_ms = timing.get("dom_content_loaded_ms")
+                    step.load_ms = timing.get("load_ms")
+            self.spans.append(step)
+
+    # =========================================================================
+    # Ergebnis
+    # =========================================================================
+
+    def durations(self) -> dict[str, float]:
+        """Dauer pro Schritt (mehrfach ausgeführte Schritte werden summiert)."""
+        result: dict[str, float] = {}
+        for step in self.spans:
+            result[step.name] = result.get(step.name, 0.0) + step.wall_seconds
+        return result
+
+    def apply_to(self, result) -> None:
+        """Überträgt die Messwerte in ein ``CheckoutResult``."""
+        if not self.enabled:
+            return
+        result.step_durations = self.durations()
+        result.steps = [step.to_dict() for step in self.spans]
+
+
+@dataclass
+class _StepTotals:
+    count: int = 0
+    requests: int = 0
+    failed_requests: int = 0
+    navigations: int = 0
+    ttfb_ms: float = 0.0
+    ttfb_count: int = 0
+
+
+@dataclass
+class StepStats:
+    """Aggregiert Request- und Navigationskennzahlen pro Schritt über viele Bestellungen."""
+    totals: dict[str, _StepTotals] = field(default_factory=dict)
+
+    def record(self, steps: list[dict]) -> None:
+        """Übernimmt die Spans einer Bestellung (``CheckoutResult.steps``)."""
+        for step in steps:
+            totals = self.totals.setdefault(step["name"], _StepTotals())
+            totals.count += 1
+            totals.requests += step.get("requests", 0)
+            totals.failed_requests += step.get("failed_requests", 0)
+            totals.navigations += step.get("navigations", 0)
+            if step.get("ttfb_ms") is not None:
+                totals.ttfb_ms += step["ttfb_ms"]
+                totals.ttfb_count += 1
+
+    def __len__(self) -> int:
+        return len(self.totals)
+
+    def summary(self) -> dict[str, dict]:
+        """Durchschnittswerte pro Schritt für Reports."""
+        return {
+            name: {
+                "count": t.count,
+                "avg_requests": round(t.requests / t.count, 1),
+                "failed_requests": t.failed_requests,
+                "avg_navigations": round(t.navigations / t.count, 2),
+                "avg_ttfb_ms": round(t.ttfb_ms / t.ttfb_count, 1) if t.ttfb_count else None,
+            }
+            for name, t in self.totals.items()
+        }
@@ -0,0 +1,169 @@
+"""
+Formulare und Fehlermeldungen aus dem HTML von Storefront-Seiten lesen.
+
+``StorefrontHtml`` sammelt Formulare mit ihren vorbelegten Feldern
+(``_csrf_token``, ``redirectTo`` ...), Auswahllisten, Radio-Buttons samt
+Beschriftung sowie die Texte von Flash-Meldungen und Feldfehlern. Genutzt vom
+HTTP-Checkout und von der Warenkorb-Befüllung per Request.
+"""
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Optional
+
+
+# Elemente, deren Text als Fehlermeldung gilt
+_ERROR_CLASSES = ("alert-danger", "invalid-feedback")
+# HTML-Elemente ohne End-Tag
+_VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"}
+
+
+@dataclass
+class Choice:
+    """Option einer Auswahlliste bzw. eines Radio-Buttons."""
+    value: str
+    label: str = ""
+    checked: bool = False
+
+
+@dataclass
+class HtmlForm:
+    """Formular mit seinen vorbelegten Feldern (versteckt, Text, angehakt, ausgewählt)."""
+    action: str
+    id: str = ""
+    fields: dict[str, str] = field(default_factory=dict)
+
+    def data(self, values: dict[str, str]) -> dict[str, str]:
+        """Vorbelegte Felder, überschrieben durch ``values``."""
+        return {**self.fields, **values}
+
+
+def _text(parts: list[str]) -> str:
+    return " ".join("".join(parts).split())
+
+
+class StorefrontHtml(HTMLParser):
+    """
+    Liest Formulare, Auswahllisten, Radio-Buttons und Fehlermeldungen einer Storefront-Seite.
+
+    Eingabefelder mit ``form="<id>"`` außerhalb des Formulars werden diesem
+    zugeordnet, sofern es davor steht.
+    """
+
+    def __init__(self, html: str):
+        super().__init__(convert_charrefs=True)
+        self.forms: list[HtmlForm] = []
+        self.selects: dict[str, list[Choice]] = {}
+        self.radios: dict[str, list[Choice]] = {}
+        self.labels: dict[str, str] = {}
+        self.errors: list[str] = []
+        self._forms_by_id: dict[str, HtmlForm] = {}
+        self._form: Optional[HtmlForm] = None
+        self._select: Optional[tuple[str, Optional[HtmlForm]]] = None
+        self._option: Optional[tuple[Choice, bool]] = None
+        self._label: Optional[str] = None
+        self._text: list[str] = []
+        self._error_depth = 0
+        self._error_text: list[str] = []
+        self._radio_ids: list[tuple[Choice, str]] = []
+        self.feed(html)
+        self.close()
+        for choice, radio_id in self._radio_ids:
+            choice.label = self.labels.get(radio_id, choice.label)
+
+    def _target_form(self, attrs: dict) -> Optional[HtmlForm]:
+        return self._forms_by_id.get(attrs.get("form") or "", self._form)
+
+    def handle_starttag(self, tag: str, attrs_list: list) -> None:
+        attrs = {name: value if value is not None else "" for name, value in attrs_list}
+        if self._error_depth and tag not in _VOID_TAGS:
+            self._error_depth += 1
+        elif any(cls in attrs.get("class", "").split() for cls in _ERROR_CLASSES):
+            self._error_depth = 1 if tag not in _VOID_TAGS else 0
+            self._error_text = []
+
+        if tag == "form":
+            self._form = HtmlForm(action=attrs.get("action", ""), id=attrs.get("id", ""))
+            self.forms.append(self._form)
+            if self._form.id:
+                self._forms_by_id[self._form.id] = self._form
+        elif tag == "input":
+            self._input(attrs)
+        elif tag == "select":
+            self._select = (attrs.get("name", ""), self._target_form(attrs))
+            self.selects.setdefault(self._select[0], [])
+        elif tag == "option" and self._select:
+            self._option = (Choice(value=attrs.get("value", ""), checked="selected" in attrs), "value" in attrs)
+            self._text = []
+        elif tag == "label":
+            self._label = attrs.get("for", "")
+            self._text = []
+
+    def _input(self, attrs: dict) -> None:
+        name = attrs.get("name")
+        if not name:
+            return
+        input_type = attrs.get("type", "text").lower()
+        form = self._target_form(attrs)
+        value = attrs.get("value", "")
+        checked = "checked" in attrs
+        if input_type == "radio":
+            choice = Choice(value=value, checked=checked)
+            self.radios.setdefault(name, []).append(choice)
+            if attrs.get("id"):
+                self._radio_ids.append((choice, attrs["id"]))
+        if input_type in ("submit", "button", "image", "reset", "file"):
+            return
+        if input_type in ("radio", "checkbox") and not checked:
+            return
+        if form is not None:
+            form.fields[name] = value if input_type not in ("radio", "checkbox") or value else "on"
+
+    def handle_endtag(self, tag: str) -> None:
+        if self._error_depth:
+            self._error_depth -= 1
+            if not self._error_depth and _text(self._error_text):
+                self.errors.append(_text(self._error_text))
+
+        if tag == "form":
+            self._form = None
+        elif tag == "select":
+            self._select = None
+        elif tag == "option" and self._select and self._option:
+            choice, has_value = self._option
+            choice.label = _text(self._text)
+            if not has_value:
+                choice.value = choice.label
+            name, form = self._select
+            self.selects[name].append(choice)
+            if choice.checked and form is not None:
+                form.fields[name] = choice.value
+            self._option = None
+        elif tag == "label" and self._label is not None:
+            self.labels[self._label] = _text(self._text)
+            self._label = None
+
+    def handle_data(self, data: str) -> None:
+        if self._option or self._label is not None:
+            self._text.append(data)
+        if self._error_depth:
+            self._error_text.append(data)
+
+    # =========================================================================
+    # Abfragen
+    # =========================================================================
+
+    def form(self, action: str) -> Optional[HtmlForm]:
+        """Erstes Formular, dessen ``action`` den Pfad enthält."""
+        return next((form for form in self.forms if action in form.action), None)
+
+    def choice(self, name: str, label: str) -> Optional[Choice]:
+        """Option einer Auswahlliste bzw. eines Radio-Buttons, deren Beschriftung ``label`` enthält."""
+        wanted = label.lower()
+        choices = self.selects.get(name) or self.radios.get(name) or []
+        exact = next((c for c in choices if c.label.lower() == wanted), None)
+        return exact or next((c for c in choices if wanted in c.label.lower()), None)
+
+    def checked(self, name: str) -> Optional[Choice]:
+        """Aktuell gewählte Option bzw. angehakter Radio-Button."""
+        choices = self.selects.get(name) or self.radios.get(name) or []
+        return next((c for c in choices if c.checked), None)
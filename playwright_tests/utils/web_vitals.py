@@ -0,0 +1,296 @@
+"""
+Core Web Vitals pro Seite (LCP, CLS, INP, TBT, FCP, Long Tasks, JS-Heap).
+
+Smoke- und Regressionstests prüfen bisher nur, ob Seiten laden. Ein per
+``add_init_script`` injiziertes Skript registriert vor dem ersten Shop-Skript
+``PerformanceObserver`` für Paint, LCP, Layout-Shifts, Long Tasks und
+Interaktionen und sammelt die Werte in ``window.__webVitals``:
+
+- LCP: letzter ``largest-contentful-paint``-Eintrag
+- CLS: größtes Session-Fenster (max. 5 s, Lücke < 1 s) ohne Shifts nach Eingaben
+- INP: längste Interaktion (``event``-Einträge mit ``interactionId``)
+- TBT: Summe der Long-Task-Anteile über 50 ms nach FCP
+- JS-Heap: ``performance.memory.usedJSHeapSize`` (nur Chromium)
+
+``collect_web_vitals()`` liest den Stand einer Seite aus. Ergebnisse werden
+mit URL, Seitentyp und Viewport in einer SQLite-Datenbank abgelegt
+(``WebVitalsStore``) und gegen Budgets aus ``config.yaml`` geprüft.
+"""
+import json
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+
+WEB_VITALS_INIT_SCRIPT = """
+(() => {
+    if (window.__webVitals || typeof PerformanceObserver === 'undefined') return;
+    const v = window.__webVitals = {
+        fcp: null, lcp: null, cls: 0, inp: null, tbt: 0, longTasks: 0,
+        _session: 0, _sessionStart: 0, _lastShift: 0,
+    };
+    const observe = (type, callback, options = {}) => {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(callback))
+                .observe({type, buffered: true, ...options});
+        } catch (e) { /* Eintragstyp vom Browser nicht unterstützt */ }
+    };
+    observe('paint', e => { if (e.name === 'first-contentful-paint') v.fcp = e.startTime; });
+    observe('largest-contentful-paint', e => { v.lcp = e.startTime; });
+    observe('layout-shift', e => {
+        if (e.hadRecentInput) return;
+        if (e.startTime - v._lastShift > 1000 || e.startTime - v._sessionStart > 5000) {
+            v._session = 0;
+            v._sessionStart = e.startTime;
+        }
+        v._session += e.value;
+        v._lastShift = e.startTime;
+        v.cls = Math.max(v.cls, v._session);
+    });
+    observe('longtask', e => {
+        v.longTasks += 1;
+        if (v.fcp !== null && e.startTime >= v.fcp) v.tbt += Math.max(0, e.duration - 50);
+    });
+    observe('event', e => {
+        if (e.interactionId) v.inp = Math.max(v.inp || 0, e.duration);
+    }, {durationThreshold: 16});
+})();
+"""
+
+COLLECT_WEB_VITALS_JS = """
+() => {
+    const v = window.__webVitals;
+    if (!v) return null;
+    const path = location.pathname;
+    let kind = 'page';
+    if (path.startsWith('/checkout')) kind = 'checkout';
+    else if (document.querySelector('.product-detail, .product-detail-content')) kind = 'pdp';
+    else if (document.querySelector('.cms-element-product-listing, .product-listing')) kind = 'listing';
+    else if (path === '/' || path === '') kind = 'home';
+    return {
+        url: location.href,
+        page_kind: kind,
+        fcp_ms: v.fcp,
+        lcp_ms: v.lcp,
+        cls: v.cls,
+        inp_ms: v.inp,
+        tbt_ms: v.tbt,
+        long_tasks: v.longTasks,
+        js_heap_bytes: performance.memory ? performance.memory.usedJSHeapSize : null,
+    };
+}
+"""
+
+
+@dataclass
+class WebVitals:
+    """Messwerte einer Seite."""
+    url: str
+    page_kind: str = "page"
+    viewport: str = ""
+    fcp_ms: Optional[float] = None
+    lcp_ms: Optional[float] = None
+    cls: Optional[float] = None
+    inp_ms: Optional[float] = None
+    tbt_ms: Optional[float] = None
+    long_tasks: int = 0
+    js_heap_bytes: Optional[int] = None
+    violations: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_snapshot(cls, data: dict, viewport: Optional[dict]) -> "WebVitals":
+        size = f"{viewport['width']}x{viewport['height']}" if viewport else ""
+        return cls(viewport=size, **data)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def install_web_vitals(context) -> None:
+    """Registriert das Messskript für alle Seiten eines Kontexts (sync API)."""
+    context.add_init_script(script=WEB_VITALS_INIT_SCRIPT)
+
+
+async def install_web_vitals_async(context) -> None:
+    """Registriert das Messskript für alle Seiten eines Kontexts (async API)."""
+    await context.add_init_script(script=WEB_VITALS_INIT_SCRIPT)
+
+
+def collect_web_vitals(page) -> Optional[WebVitals]:
+    """Liest die Messwerte einer Seite (None: Skript nicht aktiv, z.B. about:blank)."""
+    data = page.evaluate(COLLECT_WEB_VITALS_JS)
+    return WebVitals.from_snapshot(data, page.viewport_size) if data else None
+
+
+async def collect_web_vitals_async(page) -> Optional[WebVitals]:
+    """Liest die Messwerte einer Seite (async API)."""
+    data = await page.evaluate(COLLECT_WEB_VITALS_JS)
+    return WebVitals.from_snapshot(data, page.viewport_size) if data else None
+
+
+# =============================================================================
+# Budgets
+# =============================================================================
+
+# Messwert -> (Budget-Feld, Bezeichnung, Einheit, Umrechnung Messwert -> Budget-Einheit)
+_BUDGET_FIELDS = {
+    "lcp_ms": ("lcp_ms", "LCP", "ms", 1),
+    "cls": ("cls", "CLS", "", 1),
+    "inp_ms": ("inp_ms", "INP", "ms", 1),
+    "tbt_ms": ("tbt_ms", "TBT", "ms", 1),
+    "fcp_ms": ("fcp_ms", "FCP", "ms", 1),
+    "js_heap_bytes": ("js_heap_mb", "JS-Heap", "MB", 1 / (1024 * 1024)),
+}
+
+
+def budget_for(budgets: dict, page_kind: str) -> dict[str, float]:
+    """
+    Budget eines Seitentyps: ``default`` überschrieben durch die Werte des Typs.
+
+    Args:
+        budgets: ``{"default": WebVitalsBudget, "pdp": WebVitalsBudget, ...}``
+        page_kind: Seitentyp (``pdp``, ``listing``, ``checkout``, ``home``, ``page``)
+    """
+    merged: dict[str, float] = {}
+    for key in ("default", page_kind):
+        budget = budgets.get(key)
+        if budget is not None:
+            merged.update(budget.model_dump(exclude_none=True))
+    return merged
+
+
+def check_budget(vitals: WebVitals, budget: dict[str, float]) -> list[str]:
+    """Gibt eine Meldung pro überschrittenem Budget zurück (leer: alles im Budget)."""
+    violations = []
+    for attr, (key, label, unit, factor) in _BUDGET_FIELDS.items():
+        value = getattr(vitals, attr)
+        limit = budget.get(key)
+        if value is None or limit is None:
+            continue
+        value = value * factor
+        if value > limit:
+            violations.append(f"{label} {value:.4g}{unit} > {limit:g}{unit}")
+    return violations
+
+
+# =============================================================================
+# Lauf-Datenbank
+# =============================================================================
+
+class WebVitalsStore:
+    """
+    SQLite-Ablage aller Messungen (eine Zeile pro Seite und Viewport).
+
+    Beispiel:
+        store = WebVitalsStore(Path("reports/web_vitals.sqlite"))
+        store.add("smoke-20250101-120000-ab12", "test_homepage_loads", vitals)
+        store.history("https://shop.at/", "1920x1080")
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS web_vitals (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_id TEXT NOT NULL,
+            recorded_at TEXT NOT NULL,
+            test TEXT,
+            url TEXT NOT NULL,
+            page_kind TEXT,
+            viewport TEXT,
+            fcp_ms REAL,
+            lcp_ms REAL,
+            cls REAL,
+            inp_ms REAL,
+            tbt_ms REAL,
+            long_tasks INTEGER,
+            js_heap_bytes INTEGER,
+            violations TEXT
+        )
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(self.SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Verbindung mit Commit am Ende des Blocks; wird immer geschlossen."""
+        conn = sqlite3.connect(self.path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def add(self, run_id: str, test: str, vitals: WebVitals) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO web_vitals (run_id, recorded_at, test, url, page_kind, viewport, fcp_ms, lcp_ms, cls, "
+                "inp_ms, tbt_ms, long_tasks, js_heap_bytes, violations) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    run_id, datetime.now().isoformat(), test, vitals.url, vitals.page_kind, vitals.viewport,
+                    vitals.fcp_ms, vitals.lcp_ms, vitals.cls, vitals.inp_ms, vitals.tbt_ms, vitals.long_tasks,
+                    vitals.js_heap_bytes, json.dumps(vitals.violations, ensure_ascii=False),
+                ),
+            )
+
+    def history(self, url: str, viewport: Optional[str] = None, limit: int = 20) -> list[dict]:
+        """Letzte Messungen einer URL (neueste zuerst)."""
+        query = "SELECT * FROM web_vitals WHERE url = ?"
+        params: list = [url]
+        if viewport:
+            query += " AND viewport = ?"
+            params.append(viewport)
+        query += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            return [dict(row) for row in conn.execute(query, params)]
+
+
+class WebVitalsSession:
+    """
+    Sammelt Messungen eines pytest-Laufs: speichern, Budgets prüfen, Verstöße merken.
+
+    Beispiel:
+        vitals = session.capture(page, test="test_homepage_loads")
+        assert not vitals.violations
+    """
+
+    def __init__(self, store: Optional[WebVitalsStore], run_id: str, budgets: dict):
+        self.store = store
+        self.run_id = run_id
+        self.budgets = budgets
+        self.measurements: list[WebVitals] = []
+
+    def record(self, vitals: WebVitals, test: str = "") -> WebVitals:
+        """Prüft das Budget, legt die Messung ab und gibt sie (mit Verstößen) zurück."""
+        vitals.violations = check_budget(vitals, budget_for(self.budgets, vitals.page_kind))
+        self.measurements.append(vitals)
+        if self.store:
+            self.store.add(self.run_id, test, vitals)
+        return vitals
+
+    def capture(self, page, test: str = "") -> Optional[WebVitals]:
+        """Misst eine Seite (sync API) und erfasst das Ergebnis."""
+        vitals = collect_web_vitals(page)
+        return self.record(vitals, test) if vitals else None
+
+    @property
+    def violations(self) -> list[WebVitals]:
+        return [v for v in self.measurements if v.violations]
+
+
+def format_web_vitals(vitals: WebVitals) -> str:
+    """Einzeilige Zusammenfassung für Konsolen-Reports."""
+    def ms(value: Optional[float]) -> str:
+        return f"{value:.0f}ms" if value is not None else "-"
+
+    cls = f"{vitals.cls:.3f}" if vitals.cls is not None else "-"
+    heap = f"{vitals.js_heap_bytes / (1024 * 1024):.0f}MB" if vitals.js_heap_bytes else "-"
+    return (f"LCP {ms(vitals.lcp_ms)} | CLS {cls} | INP {ms(vitals.inp_ms)} | TBT {ms(vitals.tbt_ms)} | "
+            f"FCP {ms(vitals.fcp_ms)} | {vitals.long_tasks} Long Tasks | Heap {heap}")
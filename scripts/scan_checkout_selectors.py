@@ -8,6 +8,71 @@ import json
 from playwright.async_api import async_playwright
 
 
+# Liest alle relevanten Elemente einer Seite in einer Browser-Runde
+SCAN_SCRIPT = """
+() => {
+    const attr = (el, name, fallback = '') => el.getAttribute(name) || fallback;
+    const dataAttrs = (el) => Object.fromEntries(
+        [...el.attributes].filter(a => a.name.startsWith('data-')).map(a => [a.name, a.value])
+    );
+    const labelFor = (el) => {
+        const label = el.id && document.querySelector(`label[for="${CSS.escape(el.id)}"]`);
+        return label ? (label.textContent || '').trim().slice(0, 100) : '';
+    };
+    const all = (selector) => [...document.querySelectorAll(selector)];
+
+    const seenClasses = new Set();
+    const containers = [];
+    for (const el of all("[class*='checkout'], [class*='register'], [class*='payment'], [class*='shipping'], [class*='address'], [class*='cart'], [class*='confirm'], [class*='form-group'], [class*='billing'], [class*='guest']").slice(0, 80)) {
+        const cls = attr(el, 'class');
+        if (cls && !seenClasses.has(cls)) {
+            seenClasses.add(cls);
+            containers.push({class: cls, tag: el.tagName.toLowerCase()});
+        }
+    }
+
+    return {
+        inputs: all("input:not([type='hidden']):not([type='checkbox']):not([type='radio'])").map(el => ({
+            id: attr(el, 'id'),
+            name: attr(el, 'name'),
+            type: attr(el, 'type', 'text'),
+            class: attr(el, 'class'),
+            placeholder: attr(el, 'placeholder'),
+            data_attrs: dataAttrs(el),
+        })),
+        selects: all('select').map(el => ({
+            id: attr(el, 'id'),
+            name: attr(el, 'name'),
+            class: attr(el, 'class'),
+            options: [...el.querySelectorAll('option')].slice(0, 10)
+                .map(opt => (opt.textContent || '').trim()).filter(Boolean),
+        })),
+        buttons: all("button, input[type='submit'], a.btn").map(el => ({
+            text: (el.textContent || '').trim(),
+            id: attr(el, 'id'),
+            class: attr(el, 'class'),
+            type: attr(el, 'type'),
+            data_attrs: dataAttrs(el),
+        })),
+        checkboxes: all("input[type='checkbox']").map(el => ({
+            id: attr(el, 'id'),
+            name: attr(el, 'name'),
+            class: attr(el, 'class'),
+            label: labelFor(el),
+        })),
+        radios: all("input[type='radio']").map(el => ({
+            id: attr(el, 'id'),
+            name: attr(el, 'name'),
+            value: attr(el, 'value'),
+            class: attr(el, 'class'),
+            label: labelFor(el),
+        })),
+        containers,
+    };
+}
+"""
+
+
 async def scan_page(page, page_name: str) -> dict:
     """Scannt eine Seite und extrahiert relevante Selektoren."""
     url = page.url
@@ -31,108 +96,10 @@ async def scan_page(page, page_name: str) -> dict:
         "links": [],
     }
 
-    # Inputs
-    inputs = await page.locator("input:not([type='hidden']):not([type='checkbox']):not([type='radio'])").all()
-    for inp in inputs:
-        try:
-            selectors["inputs"].append({
-                "id": await inp.get_attribute("id") or "",
-                "name": await inp.get_attribute("name") or "",
-                "type": await inp.get_attribute("type") or "text",
-                "class": await inp.get_attribute("class") or "",
-                "placeholder": await inp.get_attribute("placeholder") or "",
-                "data_attrs": {k: v for k, v in (await inp.evaluate("el => Object.fromEntries([...el.attributes].filter(a => a.name.startsWith('data-')).map(a => [a.name, a.value]))")).items()},
-            })
-        except:
-            pass
-
-    # Selects
-    selects = await page.locator("select").all()
-    for sel in selects:
-        try:
-            options = await sel.locator("option").all()
-            option_texts = []
-            for opt in options[:10]:  # Limit
-                text = await opt.text_content()
-                if text:
-                    option_texts.append(text.strip())
-            selectors["selects"].append({
-                "id": await sel.get_attribute("id") or "",
-                "name": await sel.get_attribute("name") or "",
-                "class": await sel.get_attribute("class") or "",
-                "options": option_texts,
-            })
-        except:
-            pass
-
-    # Buttons
-    buttons = await page.locator("button, input[type='submit'], a.btn").all()
-    for btn in buttons:
-        try:
-            text = await btn.text_content()
-            selectors["buttons"].append({
-                "text": text.strip() if text else "",
-                "id": await btn.get_attribute("id") or "",
-                "class": await btn.get_attribute("class") or "",
-                "type": await btn.get_attribute("type") or "",
-                "data_attrs": {k: v for k, v in (await btn.evaluate("el => Object.fromEntries([...el.attributes].filter(a => a.name.startsWith('data-')).map(a => [a.name, a.value]))")).items()},
-            })
-        except:
-            pass
-
-    # Checkboxen
-    checkboxes = await page.locator("input[type='checkbox']").all()
-    for cb in checkboxes:
-        try:
-            label = ""
-            cb_id = await cb.get_attribute("id")
-            if cb_id:
-                label_el = page.locator(f"label[for='{cb_id}']")
-                if await label_el.count() > 0:
-                    label = await label_el.text_content() or ""
-            selectors["checkboxes"].append({
-                "id": cb_id or "",
-                "name": await cb.get_attribute("name") or "",
-                "class": await cb.get_attribute("class") or "",
-                "label": label.strip()[:100],
-            })
-        except:
-            pass
-
-    # Radio-Buttons
-    radios = await page.locator("input[type='radio']").all()
-    for radio in radios:
-        try:
-            label = ""
-            radio_id = await radio.get_attribute("id")
-            if radio_id:
-                label_el = page.locator(f"label[for='{radio_id}']")
-                if await label_el.count() > 0:
-                    label = await label_el.text_content() or ""
-            selectors["radios"].append({
-                "id": radio_id or "",
-                "name": await radio.get_attribute("name") or "",
-                "value": await radio.get_attribute("value") or "",
-                "class": await radio.get_attribute("class") or "",
-                "label": label.strip()[:100],
-            })
-        except:
-            pass
-
-    # Wichtige Container
-    containers = await page.locator("[class*='checkout'], [class*='register'], [class*='payment'], [class*='shipping'], [class*='address'], [class*='cart'], [class*='confirm'], [class*='form-group'], [class*='billing'], [class*='guest']").all()
-    seen_classes = set()
-    for cont in containers[:80]:  # Limit
-        try:
-            cls = await cont.get_attribute("class") or ""
-            if cls and cls not in seen_classes:
-                seen_classes.add(cls)
-                selectors["containers"].append({
-                    "class": cls,
-                    "tag": await cont.evaluate("el => el.tagName.toLowerCase()"),
-                })
-        except:
-            pass
+    # Alle Elemente in einem evaluate-Aufruf lesen (statt mehrerer Aufrufe pro Element)
+    found = await page.evaluate(SCAN_SCRIPT)
+    for key in ("inputs", "selects", "buttons", "checkboxes", "radios", "containers"):
+        selectors[key] = found[key]
 
     # Output
     print(f"\nGefunden:")